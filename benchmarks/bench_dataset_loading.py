@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""Benchmark evaluation-data loading on a synthetic large dataset.
+
+Compares three ways of turning an evaluation YAML into validated
+``EvaluationData`` objects:
+
+* ``pure-python``: ``yaml.safe_load`` (pure-Python loader) + validation,
+  i.e. the behaviour before libyaml support.
+* ``libyaml``: ``DataValidator`` with the libyaml ``CSafeLoader``, cache off.
+* ``libyaml-parallel``: as ``libyaml`` with ``core.validation_workers``.
+* ``cached``: ``DataValidator`` with ``core.dataset_cache_enabled`` and a warm
+  cache entry for the unchanged file.
+
+Usage:
+    uv run python benchmarks/bench_dataset_loading.py --conversations 20000
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, Optional
+
+import yaml
+
+from lightspeed_evaluation.core.models import CoreConfig, EvaluationData, SystemConfig
+from lightspeed_evaluation.core.system.validator import DataValidator
+from lightspeed_evaluation.core.system.yaml_io import has_libyaml, safe_dump_yaml
+
+
+def build_dataset(num_conversations: int, turns_per_conversation: int) -> list[dict]:
+    """Build a synthetic dataset resembling real evaluation data."""
+    context = "OpenShift is an enterprise Kubernetes platform. " * 8
+    conversations = []
+    for conv_idx in range(num_conversations):
+        turns = []
+        for turn_idx in range(turns_per_conversation):
+            turns.append(
+                {
+                    "turn_id": f"turn_{turn_idx}",
+                    "query": f"How do I scale deployment {conv_idx}-{turn_idx}?",
+                    "response": f"Run `oc scale deployment/app-{conv_idx} --replicas=3`.",
+                    "contexts": [context, context],
+                    "expected_response": "Use oc scale to change the replica count.",
+                    "expected_keywords": [["oc scale"], ["replicas"]],
+                    "expected_tool_calls": [
+                        [
+                            {
+                                "tool_name": "scale_deployment",
+                                "arguments": {"name": f"app-{conv_idx}", "replicas": 3},
+                            }
+                        ]
+                    ],
+                }
+            )
+        conversations.append(
+            {
+                "conversation_group_id": f"conv_{conv_idx}",
+                "tag": f"group_{conv_idx % 10}",
+                "turns": turns,
+            }
+        )
+    return conversations
+
+
+def load_pure_python(data_path: str) -> list[EvaluationData]:
+    """Load with the pure-Python YAML loader and per-item validation."""
+    with open(data_path, "r", encoding="utf-8") as f:
+        raw = yaml.load(f, Loader=yaml.SafeLoader)  # nosec B506 - safe loader
+    return [EvaluationData(**item) for item in raw]
+
+
+def make_validator_loader(
+    cache_dir: str, cache_enabled: bool, workers: Optional[int] = None
+) -> Callable[[str], list[EvaluationData]]:
+    """Return a loader backed by DataValidator."""
+    config = SystemConfig(
+        core=CoreConfig(
+            cache_base_dir=cache_dir,
+            dataset_cache_enabled=cache_enabled,
+            validation_workers=workers,
+        )
+    )
+
+    def _load(data_path: str) -> list[EvaluationData]:
+        validator = DataValidator(system_config=config)
+        return validator._load_and_parse_yaml(  # pylint: disable=protected-access
+            data_path
+        )
+
+    return _load
+
+
+def time_loader(
+    loader: Callable[[str], Any], data_path: str, repeats: int
+) -> list[float]:
+    """Run a loader several times and return wall-clock durations."""
+    durations = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        loader(data_path)
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def main() -> int:
+    """Run the benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--conversations", type=int, default=5000)
+    parser.add_argument("--turns", type=int, default=3)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        data_path = str(Path(tmp_dir) / "eval_data.yaml")
+        with open(data_path, "w", encoding="utf-8") as f:
+            safe_dump_yaml(build_dataset(args.conversations, args.turns), f)
+        size_mb = Path(data_path).stat().st_size / (1024 * 1024)
+
+        cache_dir = str(Path(tmp_dir) / "caches")
+        cached_loader = make_validator_loader(cache_dir, cache_enabled=True)
+        cached_loader(data_path)  # warm the cache
+
+        scenarios: list[tuple[str, Callable[[str], Any]]] = [
+            ("pure-python", load_pure_python),
+            ("libyaml", make_validator_loader(cache_dir, cache_enabled=False)),
+            (
+                "libyaml-parallel",
+                make_validator_loader(cache_dir, False, workers=args.workers),
+            ),
+            ("cached", cached_loader),
+        ]
+
+        print(
+            f"Dataset: {args.conversations} conversations x {args.turns} turns "
+            f"({size_mb:.1f} MB), libyaml available: {has_libyaml()}"
+        )
+        print(f"{'scenario':<18}{'median (s)':>12}{'best (s)':>12}{'speedup':>10}")
+        baseline = None
+        for name, loader in scenarios:
+            durations = time_loader(loader, data_path, args.repeats)
+            median = statistics.median(durations)
+            baseline = baseline or median
+            print(
+                f"{name:<18}{median:>12.3f}{min(durations):>12.3f}"
+                f"{baseline / median:>9.1f}x"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
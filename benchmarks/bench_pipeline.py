@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+"""Benchmark the end-to-end evaluation pipeline against local stand-in servers.
+
+Every network dependency is replaced by :mod:`mock_servers`: the agent under
+test answers on ``/v1/streaming_query`` and the judge LLM is an
+OpenAI-compatible endpoint that litellm reaches through ``OPENAI_BASE_URL``.
+No request leaves the machine.
+
+Scenarios (each on a synthetic dataset of ``--conversations`` single-turn
+conversations scored with ``custom:answer_correctness`` and
+``custom:keywords_eval``):
+
+* ``throughput``: conversations per second with fixed server latency.
+* ``tail_latency``: p50/p95/p99 conversation latency (from the pipeline's own
+  trace spans) with latency jitter, slow outliers and injected HTTP 429s.
+* ``memory``: peak traced Python allocation during the run.
+* ``cache``: a cold run followed by a warm run with ``core.cache_enabled``;
+  reports the share of agent and judge requests served from cache and the
+  speedup.
+
+Results are compared with ``benchmarks/baselines/pipeline_<N>.json``; a metric
+that is worse than its baseline by more than ``--threshold`` fails the run
+(exit code 1), and so does a cache scenario in which a cache served no
+request. Timings depend on the machine, so each baseline records the machine
+it was taken on. ``--update-baseline`` stores the current results instead.
+
+Usage:
+    uv run python benchmarks/bench_pipeline.py --conversations 1000
+    uv run python benchmarks/bench_pipeline.py --conversations 1000 10000 --check
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, Optional
+
+from mock_servers import MockAgentServer, MockLLMServer, MockSettings
+
+from lightspeed_evaluation.api import evaluate
+from lightspeed_evaluation.core.models import EvaluationData, SystemConfig
+from lightspeed_evaluation.core.models.system import TracingConfig
+from lightspeed_evaluation.core.system.loader import ConfigLoader
+from lightspeed_evaluation.core.system.tracer import (
+    SPAN_CONVERSATION,
+    Tracer,
+    tracing_session,
+)
+from lightspeed_evaluation.core.system.yaml_io import safe_dump_yaml
+
+BASELINE_DIR = Path(__file__).parent / "baselines"
+DEFAULT_THRESHOLD = 0.2
+METRICS = ["custom:answer_correctness", "custom:keywords_eval"]
+
+# Direction of each reported metric; only these are checked against baselines.
+HIGHER_IS_BETTER = {"conversations_per_second", "cache_speedup"}
+LOWER_IS_BETTER = {"p50_latency_s", "p95_latency_s", "p99_latency_s", "peak_memory_mb"}
+# Shares in [0, 1]; compared by absolute drop and must stay above zero, since
+# the cache scenario runs with caching enabled.
+CACHE_HIT_RATIOS = {"agent_cache_hit_ratio", "judge_cache_hit_ratio"}
+# Baseline key describing the machine the baseline was recorded on.
+MACHINE_KEY = "machine"
+
+Scenario = Callable[[argparse.Namespace, "Servers", Path], dict[str, float]]
+
+
+class Servers:
+    """The pair of stand-in servers shared by all scenarios."""
+
+    def __init__(self, llm: MockLLMServer, agent: MockAgentServer) -> None:
+        """Initialize with running servers."""
+        self.llm = llm
+        self.agent = agent
+
+    def configure(self, settings: MockSettings) -> None:
+        """Apply new behaviour to both servers and reset their counters."""
+        for server in (self.llm, self.agent):
+            server.settings.__dict__.update(settings.__dict__)
+            server.reset_counters()
+
+    def requests(self) -> tuple[int, int]:
+        """Agent and judge requests served since the last reset."""
+        return self.agent.requests, self.llm.requests
+
+
+def build_dataset(num_conversations: int) -> list[EvaluationData]:
+    """Build single-turn conversations that the stand-in agent answers."""
+    return [
+        EvaluationData(
+            conversation_group_id=f"conv_{idx}",
+            turns=[
+                {
+                    "turn_id": "turn_0",
+                    "query": f"How do I list the pods of app {idx}?",
+                    "expected_response": "Run oc get pods.",
+                    "expected_keywords": [["oc get pods"]],
+                    "turn_metrics": METRICS,
+                }
+            ],
+        )
+        for idx in range(num_conversations)
+    ]
+
+
+def build_config(
+    servers: Servers, work_dir: Path, max_threads: int, cache: bool = False
+) -> SystemConfig:
+    """Load a system config wired to the stand-in servers."""
+    config_data = {
+        "core": {
+            "max_threads": max_threads,
+            "cache_enabled": cache,
+            "cache_base_dir": str(work_dir / "caches"),
+        },
+        "llm_pool": {
+            "defaults": {"num_retries": 3, "parameters": {"temperature": 0.0}},
+            "models": {"bench_judge": {"provider": "openai", "model": "gpt-4o-mini"}},
+        },
+        "judge_panel": {"judges": ["bench_judge"]},
+        "agents": {
+            "enabled": True,
+            "default": {"agent": "bench_agent"},
+            "bench_agent": {
+                "type": "http_api",
+                "api_base": servers.agent.base_url,
+                "version": "v1",
+                "endpoint_type": "streaming",
+                "timeout": 60,
+                "num_retries": 3,
+            },
+        },
+        "storage": [{"type": "file", "output_dir": str(work_dir / "output")}],
+        "logging": {"source_level": "ERROR", "package_level": "ERROR"},
+    }
+    config_path = work_dir / "system.yaml"
+    with open(config_path, "w", encoding="utf-8") as f:
+        safe_dump_yaml(config_data, f)
+    return ConfigLoader().load_system_config(str(config_path))
+
+
+def run_pipeline(
+    args: argparse.Namespace, servers: Servers, work_dir: Path, cache: bool = False
+) -> float:
+    """Evaluate a fresh dataset and return the wall-clock duration."""
+    config = build_config(servers, work_dir, args.max_threads, cache=cache)
+    data = build_dataset(args.num_conversations)
+    start = time.perf_counter()
+    results = evaluate(config, data, output_dir=str(work_dir / "output"))
+    duration = time.perf_counter() - start
+    errors = sum(1 for r in results if r.result == "ERROR")
+    if errors:
+        logging.getLogger(__name__).warning("%d results ended in ERROR", errors)
+    return duration
+
+
+def scenario_throughput(
+    args: argparse.Namespace, servers: Servers, work_dir: Path
+) -> dict[str, float]:
+    """Conversations per second with fixed server latency."""
+    servers.configure(MockSettings(latency=args.latency))
+    duration = run_pipeline(args, servers, work_dir)
+    return {
+        "duration_s": duration,
+        "conversations_per_second": args.num_conversations / duration,
+    }
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def scenario_tail_latency(
+    args: argparse.Namespace, servers: Servers, work_dir: Path
+) -> dict[str, float]:
+    """Conversation latency percentiles under jitter, outliers and 429s."""
+    servers.configure(
+        MockSettings(
+            latency=args.latency,
+            jitter=args.latency,
+            tail_ratio=0.01,
+            tail_latency=args.latency * 10,
+            rate_limit_ratio=0.02,
+        )
+    )
+    tracer = Tracer(TracingConfig(enabled=True, include_io=False))
+    with tracing_session(tracer):
+        run_pipeline(args, servers, work_dir)
+    latencies = [
+        s.latency
+        for s in tracer.spans
+        if s.name == SPAN_CONVERSATION and s.latency is not None
+    ]
+    return {
+        "p50_latency_s": _percentile(latencies, 50),
+        "p95_latency_s": _percentile(latencies, 95),
+        "p99_latency_s": _percentile(latencies, 99),
+        "rate_limited_requests": float(
+            servers.llm.rate_limited + servers.agent.rate_limited
+        ),
+    }
+
+
+def scenario_memory(
+    args: argparse.Namespace, servers: Servers, work_dir: Path
+) -> dict[str, float]:
+    """Peak traced Python allocation of a run."""
+    servers.configure(MockSettings(latency=args.latency))
+    tracemalloc.start()
+    try:
+        run_pipeline(args, servers, work_dir)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"peak_memory_mb": peak / (1024 * 1024)}
+
+
+def scenario_cache(
+    args: argparse.Namespace, servers: Servers, work_dir: Path
+) -> dict[str, float]:
+    """Cold run then warm run with the agent and judge caches enabled."""
+    servers.configure(MockSettings(latency=args.latency))
+    cold = run_pipeline(args, servers, work_dir, cache=True)
+    cold_agent, cold_judge = servers.requests()
+    servers.configure(MockSettings(latency=args.latency))
+    warm = run_pipeline(args, servers, work_dir, cache=True)
+    warm_agent, warm_judge = servers.requests()
+    return {
+        "cold_duration_s": cold,
+        "warm_duration_s": warm,
+        "agent_cache_hit_ratio": 1 - warm_agent / max(1, cold_agent),
+        "judge_cache_hit_ratio": 1 - warm_judge / max(1, cold_judge),
+        "cache_speedup": cold / warm,
+    }
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "throughput": scenario_throughput,
+    "tail_latency": scenario_tail_latency,
+    "memory": scenario_memory,
+    "cache": scenario_cache,
+}
+
+
+def baseline_path(num_conversations: int) -> Path:
+    """Return the baseline file for a dataset size."""
+    return BASELINE_DIR / f"pipeline_{num_conversations}.json"
+
+
+def machine_info() -> dict[str, Any]:
+    """Describe the machine that runs the benchmark."""
+    return {
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+    }
+
+
+def find_regressions(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, Any]],
+    threshold: float,
+) -> list[str]:
+    """Return a description of every metric worse than baseline by > threshold.
+
+    Cache hit ratios are compared by absolute drop, and a ratio of zero is a
+    regression whatever the baseline says.
+    """
+    regressions = []
+    for scenario, metrics in results.items():
+        for name, value in metrics.items():
+            expected: Optional[float] = baseline.get(scenario, {}).get(name)
+            if name in CACHE_HIT_RATIOS:
+                if value <= 0:
+                    regressions.append(f"{scenario}.{name}: no request served")
+                elif expected is not None and expected - value > threshold:
+                    regressions.append(
+                        f"{scenario}.{name}: {value:.4g} vs baseline {expected:.4g}"
+                    )
+                continue
+            if expected is None or expected <= 0:
+                continue
+            if name in HIGHER_IS_BETTER:
+                change = (expected - value) / expected
+            elif name in LOWER_IS_BETTER:
+                change = (value - expected) / expected
+            else:
+                continue
+            if change > threshold:
+                regressions.append(
+                    f"{scenario}.{name}: {value:.4g} vs baseline {expected:.4g} "
+                    f"({change:+.0%} worse)"
+                )
+    return regressions
+
+
+def print_results(num_conversations: int, results: dict[str, dict[str, Any]]) -> None:
+    """Print a results table for one dataset size."""
+    print(f"\n{num_conversations} conversations")
+    print(f"{'scenario':<14}{'metric':<28}{'value':>12}")
+    for scenario, metrics in results.items():
+        for name, value in metrics.items():
+            print(f"{scenario:<14}{name:<28}{value:>12.4g}")
+
+
+def main() -> int:
+    """Run the selected scenarios and compare them with stored baselines."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--conversations", type=int, nargs="+", default=[1000])
+    parser.add_argument(
+        "--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS)
+    )
+    parser.add_argument("--max-threads", type=int, default=50)
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.02,
+        help="Base server latency in seconds",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed relative regression before --check fails",
+    )
+    parser.add_argument(
+        "--check", action="store_true", help="Fail when a baseline regresses"
+    )
+    parser.add_argument(
+        "--update-baseline", action="store_true", help="Store results as baseline"
+    )
+    args = parser.parse_args()
+
+    # Judge requests go to the stand-in server; no real credentials are used.
+    os.environ["OPENAI_API_KEY"] = "benchmark"
+    regressions: list[str] = []
+
+    with (
+        MockLLMServer() as llm,
+        MockAgentServer() as agent,
+    ):
+        os.environ["OPENAI_BASE_URL"] = f"{llm.base_url}/v1"
+        servers = Servers(llm, agent)
+        # Pay one-off import and client setup costs outside the measurements.
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            run_pipeline(
+                argparse.Namespace(**{**vars(args), "num_conversations": 10}),
+                servers,
+                Path(tmp_dir),
+            )
+        for num_conversations in args.conversations:
+            args.num_conversations = num_conversations
+            results: dict[str, dict[str, float]] = {}
+            for name in args.scenarios:
+                with tempfile.TemporaryDirectory() as tmp_dir:
+                    results[name] = SCENARIOS[name](args, servers, Path(tmp_dir))
+            print_results(num_conversations, results)
+
+            path = baseline_path(num_conversations)
+            if args.update_baseline:
+                BASELINE_DIR.mkdir(parents=True, exist_ok=True)
+                with open(path, "w", encoding="utf-8") as f:
+                    json.dump(
+                        {**results, MACHINE_KEY: machine_info()},
+                        f,
+                        indent=2,
+                        sort_keys=True,
+                    )
+                    f.write("\n")
+                print(f"Baseline written: {path}")
+            elif path.exists():
+                with open(path, "r", encoding="utf-8") as f:
+                    baseline = json.load(f)
+                if baseline.get(MACHINE_KEY) != machine_info():
+                    print(
+                        f"Baseline {path} was recorded on "
+                        f"{baseline.get(MACHINE_KEY, 'an unknown machine')}; "
+                        "timings are not comparable across machines"
+                    )
+                found = find_regressions(results, baseline, args.threshold)
+                regressions.extend(f"[{num_conversations}] {r}" for r in found)
+            else:
+                print(f"No baseline at {path}")
+
+    if regressions:
+        print(f"\nRegressions beyond {args.threshold:.0%}:")
+        for regression in regressions:
+            print(f"  {regression}")
+    return 1 if regressions and args.check else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""Benchmark parsing of streamed agent responses.
+
+Compares three parsers on the same SSE bodies:
+
+* ``line-by-line``: text lines from ``iter_lines`` with every event decoded
+  by ``json.loads``, i.e. the behaviour before the byte-level fast path.
+* ``fast-json``: the current parser with the standard library decoder.
+* ``fast-orjson``: the current parser with orjson (when installed).
+
+Streams are generated in the lightspeed-stack ``/streaming_query`` and the
+``/responses`` formats, or read from recorded SSE bodies, e.g. captured with
+``curl -N ... > answer.sse``.
+
+Usage:
+    uv run python benchmarks/bench_streaming_parser.py --tokens 5000
+    uv run python benchmarks/bench_streaming_parser.py --stream answer.sse
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from lightspeed_evaluation.core.api import streaming_parser
+from lightspeed_evaluation.core.api.streaming_parser import (
+    parse_responses_streaming,
+    parse_streaming_response,
+)
+
+# pylint: disable=protected-access
+
+Parser = Callable[[httpx.Response], dict[str, Any]]
+
+
+def _sse(events: list[Any]) -> bytes:
+    """Serialize events as an SSE body."""
+    return b"".join(
+        f"data: {e if isinstance(e, str) else json.dumps(e)}\n\n".encode()
+        for e in events
+    )
+
+
+def build_streaming_body(tokens: int) -> bytes:
+    """Build a /streaming_query body with one event per token."""
+    answer = "Scale the deployment with oc scale. " * (tokens // 6 + 1)
+    words = answer.split(" ")[:tokens]
+    events: list[Any] = [{"event": "start", "data": {"conversation_id": "conv-1"}}]
+    events += [
+        {"event": "token", "data": {"id": i, "token": f"{word} "}}
+        for i, word in enumerate(words)
+    ]
+    events += [
+        {
+            "event": "tool_call",
+            "data": {"id": "call_0", "name": "get_pods", "args": {"ns": "default"}},
+        },
+        {"event": "tool_result", "data": {"id": "call_0", "content": "pod-1"}},
+        {"event": "turn_complete", "data": {"token": " ".join(words)}},
+        {"event": "end", "data": {"input_tokens": 200, "output_tokens": tokens}},
+    ]
+    return _sse(events)
+
+
+def build_responses_body(tokens: int) -> bytes:
+    """Build a /responses body with one text delta per token."""
+    words = ("Scale the deployment with oc scale. " * (tokens // 6 + 1)).split(" ")
+    words = words[:tokens]
+    events: list[Any] = [
+        {"type": "response.created", "response": {"conversation": "conv-1"}}
+    ]
+    events += [
+        {
+            "type": "response.output_text.delta",
+            "item_id": "msg_1",
+            "output_index": 0,
+            "content_index": 0,
+            "sequence_number": i,
+            "delta": f"{word} ",
+        }
+        for i, word in enumerate(words)
+    ]
+    events += [
+        {
+            "type": "response.output_item.done",
+            "item": {
+                "type": "mcp_call",
+                "name": "get_pods",
+                "arguments": '{"ns": "default"}',
+                "output": "pod-1",
+            },
+        },
+        {
+            "type": "response.completed",
+            "response": {
+                "conversation": "conv-1",
+                "output_text": " ".join(words),
+                "usage": {"input_tokens": 200, "output_tokens": tokens},
+            },
+        },
+        "[DONE]",
+    ]
+    return _sse(events)
+
+
+class _ChunkedStream(httpx.SyncByteStream):
+    """Body delivered in fixed-size network chunks."""
+
+    def __init__(self, body: bytes, chunk_size: int) -> None:
+        self._body = body
+        self._chunk_size = chunk_size
+
+    def __iter__(self) -> Iterator[bytes]:
+        for start in range(0, len(self._body), self._chunk_size):
+            yield self._body[start : start + self._chunk_size]
+
+
+def _line_by_line_streaming(response: httpx.Response) -> dict[str, Any]:
+    """Parse /streaming_query text lines, decoding every event."""
+    ctx = streaming_parser.StreamingContext()
+    for line in response.iter_lines():
+        line = line.strip()
+        if not line.startswith(streaming_parser.DATA_PREFIX):
+            continue
+        data = json.loads(line[len(streaming_parser.DATA_PREFIX) :])
+        event, event_data = data.get("event", ""), data.get("data", {})
+        if event in streaming_parser.CONTENT_EVENTS:
+            ctx.perf.capture_ttft()
+        handler = streaming_parser._STREAMING_EVENT_HANDLERS.get(event)
+        if handler:
+            handler(ctx, event_data)
+    return ctx.to_response_dict()
+
+
+def _line_by_line_responses(response: httpx.Response) -> dict[str, Any]:
+    """Parse /responses text lines, decoding every event."""
+    ctx = streaming_parser.ResponsesStreamingContext()
+    for line in response.iter_lines():
+        line = line.strip()
+        if not line.startswith(streaming_parser.DATA_PREFIX):
+            continue
+        raw = line[len(streaming_parser.DATA_PREFIX) :]
+        if raw == "[DONE]":
+            break
+        data = json.loads(raw)
+        if data.get("type") in streaming_parser.RESPONSES_CONTENT_EVENTS:
+            ctx.perf.capture_ttft()
+        handler = streaming_parser._RESPONSES_EVENT_HANDLERS.get(data.get("type", ""))
+        if handler:
+            handler(ctx, data)
+    return ctx.to_response_dict()
+
+
+def _with_loads(parser: Parser, loads: Callable[[Any], Any]) -> Parser:
+    """Run a parser with the given JSON decoder."""
+
+    def parse(response: httpx.Response) -> dict[str, Any]:
+        original = streaming_parser._json_loads
+        streaming_parser._json_loads = loads
+        try:
+            return parser(response)
+        finally:
+            streaming_parser._json_loads = original
+
+    return parse
+
+
+def _kept_fields(result: dict[str, Any]) -> tuple[Any, ...]:
+    """Return the parsed fields, without timings, for a cross-parser check."""
+    return (
+        result["response"],
+        result["conversation_id"],
+        result["tool_calls"],
+        result["input_tokens"],
+        result["output_tokens"],
+    )
+
+
+def time_parser(
+    parser: Parser, body: bytes, chunk_size: int, repeats: int
+) -> list[float]:
+    """Parse a body several times and return wall-clock durations."""
+    durations = []
+    for _ in range(repeats):
+        response = httpx.Response(200, stream=_ChunkedStream(body, chunk_size))
+        start = time.perf_counter()
+        parser(response)
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def _scenarios(body: bytes) -> list[tuple[str, Parser]]:
+    """Return the parsers to compare for the format of a body."""
+    is_responses = b'"type"' in body.split(b"\n", 1)[0]
+    fast = parse_responses_streaming if is_responses else parse_streaming_response
+    scenarios: list[tuple[str, Parser]] = [
+        (
+            "line-by-line",
+            _line_by_line_responses if is_responses else _line_by_line_streaming,
+        ),
+        ("fast-json", _with_loads(fast, json.loads)),
+    ]
+    if streaming_parser.orjson is not None:
+        scenarios.append(("fast-orjson", fast))
+    return scenarios
+
+
+def bench_stream(name: str, body: bytes, chunk_size: int, repeats: int) -> bool:
+    """Time each parser on a body; return False when their results differ."""
+    events = body.count(b"\ndata: ") + 1
+    print(f"\n{name}: {events} events, {len(body) / 1024:.0f} KiB")
+    print(f"{'parser':<16}{'median (ms)':>13}{'events/s':>13}{'speedup':>10}")
+    expected = None
+    baseline = None
+    for label, parse in _scenarios(body):
+        response = httpx.Response(200, stream=_ChunkedStream(body, chunk_size))
+        fields = _kept_fields(parse(response))
+        if expected is not None and fields != expected:
+            print(f"{label}: parsed result differs from line-by-line")
+            return False
+        expected = fields
+
+        median = statistics.median(time_parser(parse, body, chunk_size, repeats))
+        baseline = baseline or median
+        print(
+            f"{label:<16}{median * 1000:>13.2f}{events / median:>13,.0f}"
+            f"{baseline / median:>9.1f}x"
+        )
+    return True
+
+
+def main() -> int:
+    """Run the benchmark and print a results table per stream."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tokens", type=int, default=5000)
+    parser.add_argument("--chunk-size", type=int, default=4096)
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument(
+        "--stream",
+        action="append",
+        type=Path,
+        default=[],
+        help="Recorded SSE body to parse (repeatable); format is auto-detected",
+    )
+    args = parser.parse_args()
+
+    streams: list[tuple[str, bytes]] = [
+        (str(path), path.read_bytes()) for path in args.stream
+    ] or [
+        (f"streaming_query, {args.tokens} tokens", build_streaming_body(args.tokens)),
+        (f"responses, {args.tokens} deltas", build_responses_body(args.tokens)),
+    ]
+
+    for name, body in streams:
+        if not bench_stream(name, body, args.chunk_size, args.repeats):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
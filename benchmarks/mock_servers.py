@@ -0,0 +1,426 @@
+#!/usr/bin/env python3
+"""Local stand-in servers for offline benchmarks.
+
+Two small stdlib HTTP servers replace every network dependency of an
+evaluation run:
+
+* :class:`MockLLMServer`: an OpenAI-compatible judge endpoint
+  (``/v1/chat/completions`` and ``/v1/embeddings``) with configurable latency,
+  token usage, HTTP 429 injection and SSE streaming. Point litellm at it with
+  ``OPENAI_BASE_URL``.
+* :class:`MockAgentServer`: a lightspeed-stack compatible agent exposing
+  ``/v1/query`` and ``/v1/streaming_query``.
+
+Both servers count the requests they serve so benchmarks can verify cache
+effectiveness. They can also be started by hand for manual testing:
+
+    uv run python benchmarks/mock_servers.py --llm-port 8100 --agent-port 8080
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+
+JUDGE_REPLY = "Score: 0.9\nReason: The response matches the expected answer."
+
+
+@dataclass
+class MockSettings:  # pylint: disable=too-many-instance-attributes
+    """Behaviour of a stand-in server."""
+
+    latency: float = 0.0
+    """Base delay in seconds before the response starts."""
+    jitter: float = 0.0
+    """Extra uniformly distributed delay in seconds (0..jitter)."""
+    tail_ratio: float = 0.0
+    """Share of requests delayed by ``tail_latency`` instead of ``latency``."""
+    tail_latency: float = 0.0
+    """Delay in seconds applied to the slow ``tail_ratio`` share."""
+    rate_limit_ratio: float = 0.0
+    """Share of requests rejected with HTTP 429."""
+    input_tokens: int = 250
+    """Prompt tokens reported in usage."""
+    output_tokens: int = 40
+    """Completion tokens reported in usage."""
+    stream_chunks: int = 8
+    """Number of content chunks in a streamed response."""
+    seed: Optional[int] = 0
+    """Seed for latency and 429 sampling (None for non-deterministic)."""
+
+
+class _Counters:
+    """Thread-safe request counters."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.rate_limited = 0
+
+    def add(self, rate_limited: bool) -> None:
+        """Count one request."""
+        with self._lock:
+            self.requests += 1
+            if rate_limited:
+                self.rate_limited += 1
+
+    def reset(self) -> None:
+        """Clear all counters."""
+        with self._lock:
+            self.requests = 0
+            self.rate_limited = 0
+
+
+class _Server(ThreadingHTTPServer):
+    """Threading server with a backlog sized for many concurrent workers."""
+
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, address: tuple[str, int], handler: type, settings: MockSettings):
+        super().__init__(address, handler)
+        self.settings = settings
+        self.counters = _Counters()
+        self.rng = random.Random(settings.seed)
+        self.rng_lock = threading.Lock()
+
+    def handle_error(self, request: Any, client_address: Any) -> None:
+        """Ignore clients hanging up on idle keep-alive connections."""
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Shared request plumbing for the stand-in servers."""
+
+    protocol_version = "HTTP/1.1"
+    server: _Server
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Silence per-request logging."""
+
+    def _read_json(self) -> dict[str, Any]:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b"{}"
+        return json.loads(body or b"{}")
+
+    def _send_json(self, status: int, payload: Any) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if status == 429:
+            self.send_header("Retry-After", "0")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _start_sse(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+    def _send_event(self, payload: Any) -> None:
+        data = payload if isinstance(payload, str) else json.dumps(payload)
+        self.wfile.write(f"data: {data}\n\n".encode("utf-8"))
+        self.wfile.flush()
+
+    def _admit(self) -> bool:
+        """Apply latency and 429 injection; return False when rejected."""
+        settings = self.server.settings
+        with self.server.rng_lock:
+            rejected = self.server.rng.random() < settings.rate_limit_ratio
+            slow = self.server.rng.random() < settings.tail_ratio
+            jitter = self.server.rng.uniform(0, settings.jitter)
+        self.server.counters.add(rejected)
+        if rejected:
+            self._send_json(
+                429, {"error": {"message": "Rate limit exceeded", "type": "rate_limit"}}
+            )
+            return False
+        delay = (settings.tail_latency if slow else settings.latency) + jitter
+        if delay > 0:
+            time.sleep(delay)
+        return True
+
+
+class _LLMHandler(_Handler):
+    """OpenAI-compatible chat completions and embeddings."""
+
+    def do_POST(self) -> None:  # pylint: disable=invalid-name
+        """Serve chat completions and embeddings."""
+        request = self._read_json()
+        if not self._admit():
+            return
+        if self.path.endswith("/chat/completions"):
+            if request.get("stream"):
+                self._stream_completion(request)
+            else:
+                self._send_json(200, self._completion(request))
+        elif self.path.endswith("/embeddings"):
+            self._send_json(200, self._embeddings(request))
+        else:
+            self._send_json(404, {"error": {"message": f"Unknown path {self.path}"}})
+
+    def _usage(self) -> dict[str, int]:
+        settings = self.server.settings
+        return {
+            "prompt_tokens": settings.input_tokens,
+            "completion_tokens": settings.output_tokens,
+            "total_tokens": settings.input_tokens + settings.output_tokens,
+        }
+
+    def _completion(self, request: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model", "mock"),
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": JUDGE_REPLY},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": self._usage(),
+        }
+
+    def _stream_completion(self, request: dict[str, Any]) -> None:
+        chunk_id = f"chatcmpl-{uuid.uuid4().hex}"
+        chunks = _split(JUDGE_REPLY, self.server.settings.stream_chunks)
+        self._start_sse()
+        for index, piece in enumerate(chunks):
+            delta: dict[str, Any] = {"content": piece}
+            if index == 0:
+                delta["role"] = "assistant"
+            self._send_event(
+                {
+                    "id": chunk_id,
+                    "object": "chat.completion.chunk",
+                    "created": int(time.time()),
+                    "model": request.get("model", "mock"),
+                    "choices": [{"index": 0, "delta": delta, "finish_reason": None}],
+                }
+            )
+        self._send_event(
+            {
+                "id": chunk_id,
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": request.get("model", "mock"),
+                "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+                "usage": self._usage(),
+            }
+        )
+        self._send_event("[DONE]")
+
+    def _embeddings(self, request: dict[str, Any]) -> dict[str, Any]:
+        inputs = request.get("input", [])
+        if isinstance(inputs, str):
+            inputs = [inputs]
+        data = []
+        for index, text in enumerate(inputs):
+            seed = sum(map(ord, str(text))) % 97
+            data.append(
+                {
+                    "object": "embedding",
+                    "index": index,
+                    "embedding": [((seed + i) % 10) / 10 for i in range(16)],
+                }
+            )
+        tokens = self.server.settings.input_tokens
+        return {
+            "object": "list",
+            "data": data,
+            "model": request.get("model", "mock"),
+            "usage": {"prompt_tokens": tokens, "total_tokens": tokens},
+        }
+
+
+class _AgentHandler(_Handler):
+    """Lightspeed-stack compatible ``/query`` and ``/streaming_query``."""
+
+    def do_POST(self) -> None:  # pylint: disable=invalid-name
+        """Serve standard and streaming queries."""
+        request = self._read_json()
+        if not self._admit():
+            return
+        conversation_id = request.get("conversation_id") or str(uuid.uuid4())
+        answer = f"To answer '{request.get('query', '')}', run `oc get pods`."
+        if self.path.endswith("/streaming_query"):
+            self._stream_query(conversation_id, answer)
+        elif self.path.endswith("/query"):
+            settings = self.server.settings
+            self._send_json(
+                200,
+                {
+                    "conversation_id": conversation_id,
+                    "response": answer,
+                    "tool_calls": [
+                        {"tool_name": "get_pods", "arguments": {"namespace": "default"}}
+                    ],
+                    "rag_chunks": [{"content": "Pods are listed with oc get pods."}],
+                    "input_tokens": settings.input_tokens,
+                    "output_tokens": settings.output_tokens,
+                },
+            )
+        else:
+            self._send_json(404, {"detail": f"Unknown path {self.path}"})
+
+    def _stream_query(self, conversation_id: str, answer: str) -> None:
+        settings = self.server.settings
+        self._start_sse()
+        self._send_event(
+            {"event": "start", "data": {"conversation_id": conversation_id}}
+        )
+        for index, piece in enumerate(_split(answer, settings.stream_chunks)):
+            self._send_event({"event": "token", "data": {"id": index, "token": piece}})
+        self._send_event(
+            {
+                "event": "tool_call",
+                "data": {
+                    "id": "call_0",
+                    "name": "get_pods",
+                    "args": {"namespace": "default"},
+                },
+            }
+        )
+        self._send_event(
+            {"event": "tool_result", "data": {"id": "call_0", "content": "pod-1"}}
+        )
+        self._send_event({"event": "turn_complete", "data": {"token": answer}})
+        self._send_event(
+            {
+                "event": "end",
+                "data": {
+                    "input_tokens": settings.input_tokens,
+                    "output_tokens": settings.output_tokens,
+                },
+            }
+        )
+
+
+def _split(text: str, parts: int) -> list[str]:
+    """Split text into at most ``parts`` contiguous chunks."""
+    size = max(1, -(-len(text) // max(1, parts)))
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+class MockServer:
+    """A stand-in server running on a background thread.
+
+    Use as a context manager; ``base_url`` is available once started.
+    """
+
+    handler: type[_Handler] = _Handler
+
+    def __init__(
+        self,
+        settings: Optional[MockSettings] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        """Initialize the server (port 0 picks a free port)."""
+        self.settings = settings or MockSettings()
+        self._host = host
+        self._server = _Server((host, port), self.handler, self.settings)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """Root URL of the server."""
+        return f"http://{self._host}:{self._server.server_port}"
+
+    @property
+    def requests(self) -> int:
+        """Requests received since the last reset (including rejected ones)."""
+        return self._server.counters.requests
+
+    @property
+    def rate_limited(self) -> int:
+        """Requests rejected with HTTP 429 since the last reset."""
+        return self._server.counters.rate_limited
+
+    def reset_counters(self) -> None:
+        """Clear the request counters."""
+        self._server.counters.reset()
+
+    def start(self) -> "MockServer":
+        """Start serving on a daemon thread."""
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name=type(self).__name__, daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "MockServer":
+        """Start the server."""
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Stop the server."""
+        self.stop()
+
+
+class MockLLMServer(MockServer):
+    """OpenAI-compatible judge/embedding endpoint; API root is ``{base_url}/v1``."""
+
+    handler = _LLMHandler
+
+
+class MockAgentServer(MockServer):
+    """Lightspeed-stack compatible agent; use ``base_url`` as ``api_base``."""
+
+    handler = _AgentHandler
+
+
+def main() -> int:
+    """Run both stand-in servers until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--llm-port", type=int, default=8100)
+    parser.add_argument("--agent-port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--rate-limit-ratio", type=float, default=0.0)
+    parser.add_argument("--input-tokens", type=int, default=250)
+    parser.add_argument("--output-tokens", type=int, default=40)
+    args = parser.parse_args()
+
+    settings = MockSettings(
+        latency=args.latency,
+        jitter=args.jitter,
+        rate_limit_ratio=args.rate_limit_ratio,
+        input_tokens=args.input_tokens,
+        output_tokens=args.output_tokens,
+    )
+    with (
+        MockLLMServer(settings, port=args.llm_port) as llm,
+        MockAgentServer(settings, port=args.agent_port) as agent,
+    ):
+        print(f"LLM:   OPENAI_BASE_URL={llm.base_url}/v1")
+        print(f"Agent: api_base={agent.base_url}")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,6 +14,42 @@ Example usage::
     )
     results = evaluate(config, [data])
 
+To see where the run's wall-clock time goes, pass ``profile=True``; a Chrome
+trace (and any configured cProfile/tracemalloc reports) is written to the
+output directory::
+
+    results = evaluate(config, [data], profile=True)
+
+To see which agent turn or judge call made a run slow, pass ``trace=True``;
+the run's own conversation/turn/metric/judge spans are written as an
+OTLP-JSON file to the output directory::
+
+    results = evaluate(config, [data], trace=True)
+
+For a fast smoke run, evaluate a seeded, stratified sample of the suite (a
+size or a fraction); pass rates extrapolated to the full suite are written to
+``sampling_report.json`` in the output directory::
+
+    summary = evaluate_with_summary(config, data, sample=0.05, sample_seed=7)
+    print(summary.sampling.overall.confidence_interval)
+
+For release gating, enable ``sequential_test`` with a baseline pass rate: the
+conversations are evaluated in random order and the run stops as soon as a
+sequential probability ratio test decides whether the pass rate dropped by
+more than ``max_drop``::
+
+    config.sequential_test = SequentialTestConfig(
+        enabled=True, baseline_pass_rate=92.0, max_drop=5.0
+    )
+    summary = evaluate_with_summary(config, data)
+    print(summary.sequential.decision, summary.sequential.conversations_consumed)
+
+To reproduce a run offline, record every agent and judge call into a cassette
+once and replay it later; a replayed run makes no network calls::
+
+    evaluate(config, [data], record="run.cassette.zip")
+    results = evaluate(config, [data], replay="run.cassette.zip")
+
 For structured results with computed statistics::
 
     from lightspeed_evaluation import evaluate_with_summary
@@ -25,26 +61,84 @@ For structured results with computed statistics::
 
 from typing import TYPE_CHECKING, Optional
 
+from lightspeed_evaluation.core.metrics.manager import MetricManager
 from lightspeed_evaluation.core.models import (
     EvaluationData,
     EvaluationResult,
+    SampledPassRates,
+    SamplingPlan,
     SystemConfig,
     TurnData,
 )
 from lightspeed_evaluation.core.models.summary import EvaluationSummary
+from lightspeed_evaluation.core.output.statistics import estimate_sampled_pass_rates
+from lightspeed_evaluation.core.storage import get_file_config
 from lightspeed_evaluation.core.system import ConfigLoader
+from lightspeed_evaluation.core.system.cassette import cassette_run
+from lightspeed_evaluation.core.system.profiler import profiled_run
+from lightspeed_evaluation.core.system.sampling import (
+    sample_conversations,
+    write_sampling_report,
+)
+from lightspeed_evaluation.core.system.sequential import load_sequential_report
+from lightspeed_evaluation.core.system.tracer import traced_run
 from lightspeed_evaluation.pipeline.evaluation import EvaluationPipeline
 
 if TYPE_CHECKING:
     from lightspeed_evaluation.core.models.data import DatasetMetadata
+    from lightspeed_evaluation.core.models.system import (
+        ProfilingConfig,
+        TracingConfig,
+    )
+
+
+def _profiling_config(config: SystemConfig, profile: bool) -> "ProfilingConfig":
+    """Return the profiling settings, force-enabled when ``profile`` is set."""
+    if profile and not config.profiling.enabled:
+        return config.profiling.model_copy(update={"enabled": True})
+    return config.profiling
 
 
-def evaluate(
+def _tracing_config(config: SystemConfig, trace: bool) -> "TracingConfig":
+    """Return the tracing settings, force-enabled when ``trace`` is set."""
+    if trace and not config.tracing.enabled:
+        return config.tracing.model_copy(update={"enabled": True})
+    return config.tracing
+
+
+def _draw_sample(
+    config: SystemConfig,
+    data: list[EvaluationData],
+    sample: Optional[int | float],
+    sample_seed: int,
+) -> tuple[list[EvaluationData], Optional[SamplingPlan]]:
+    """Return the stratified sample to evaluate, or all data when not sampling."""
+    if sample is None:
+        return data, None
+    return sample_conversations(data, sample, sample_seed, MetricManager(config))
+
+
+def _report_sample(
+    plan: SamplingPlan, results: list[EvaluationResult], output_dir: str
+) -> SampledPassRates:
+    """Extrapolate the sampled results and record them with the plan."""
+    report = estimate_sampled_pass_rates(results, plan)
+    write_sampling_report(report, output_dir)
+    return report
+
+
+def evaluate(  # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
     config: SystemConfig,
     data: list[EvaluationData],
     output_dir: Optional[str] = None,
     original_data_path: Optional[str] = None,
     dataset_metadata: Optional["DatasetMetadata"] = None,
+    profile: bool = False,
+    trace: bool = False,
+    record: Optional[str] = None,
+    replay: Optional[str] = None,
+    sample: Optional[int | float] = None,
+    sample_seed: int = 0,
 ) -> list[EvaluationResult]:
     """Run evaluation on the provided data using the given configuration.
 
@@ -60,6 +154,21 @@ def evaluate(
             Required for saving amended data when agents are enabled.
         dataset_metadata: Optional dataset-level metadata to preserve in
             amended output files.
+        profile: Record per-stage timings and write a Chrome trace to the
+            output directory. Also enabled by ``config.profiling.enabled``.
+        trace: Record the run's own execution spans and write them as an
+            OTLP-JSON trace to the output directory. Also enabled by
+            ``config.tracing.enabled``.
+        record: Path of a cassette archive to record every agent and
+            LLM/embedding call of the run into.
+        replay: Path of a recorded cassette archive to serve every agent and
+            LLM/embedding call from, without network access. A call missing
+            from the cassette fails with a CassetteMissError message.
+        sample: Evaluate only a stratified random sample of the conversations
+            (by tags and metric mix): an int sample size or a float fraction.
+            The plan and pass rates extrapolated to the full suite are written
+            to ``sampling_report.json`` in the output directory.
+        sample_seed: Random seed of the sample.
 
     Returns:
         List of EvaluationResult objects (one per metric per turn/conversation).
@@ -68,22 +177,38 @@ def evaluate(
         return []
 
     loader = ConfigLoader.from_config(config)
-    pipeline = EvaluationPipeline(loader, output_dir)
-    try:
-        return pipeline.run_evaluation(
-            data,
-            original_data_path=original_data_path,
-            dataset_metadata=dataset_metadata,
-        )
-    finally:
-        pipeline.close()
-
-
-def evaluate_with_summary(
+    profile_dir = output_dir or get_file_config(config.storage).output_dir
+    data, plan = _draw_sample(config, data, sample, sample_seed)
+    with (
+        profiled_run(_profiling_config(config, profile), profile_dir),
+        traced_run(_tracing_config(config, trace), profile_dir),
+        cassette_run(record=record, replay=replay),
+    ):
+        pipeline = EvaluationPipeline(loader, output_dir)
+        try:
+            results = pipeline.run_evaluation(
+                data,
+                original_data_path=original_data_path,
+                dataset_metadata=dataset_metadata,
+            )
+        finally:
+            pipeline.close()
+    if plan is not None:
+        _report_sample(plan, results, profile_dir)
+    return results
+
+
+def evaluate_with_summary(  # pylint: disable=too-many-arguments,too-many-positional-arguments
     config: SystemConfig,
     data: list[EvaluationData],
     output_dir: Optional[str] = None,
     compute_confidence_intervals: bool = False,
+    profile: bool = False,
+    trace: bool = False,
+    record: Optional[str] = None,
+    replay: Optional[str] = None,
+    sample: Optional[int | float] = None,
+    sample_seed: int = 0,
 ) -> EvaluationSummary:
     """Run evaluation and return structured results with computed statistics.
 
@@ -97,16 +222,44 @@ def evaluate_with_summary(
         output_dir: Optional override for the output directory.
         compute_confidence_intervals: Whether to compute bootstrap confidence
             intervals. Default False.
+        profile: Record per-stage timings into ``summary.timing_breakdown``
+            and write a Chrome trace. Also enabled by
+            ``config.profiling.enabled``.
+        trace: Write the run's own execution spans as an OTLP-JSON trace.
+            Also enabled by ``config.tracing.enabled``.
+        record: Path of a cassette archive to record the run into.
+        replay: Path of a recorded cassette archive to replay the run from.
+        sample: Evaluate a stratified sample (int size or float fraction);
+            extrapolated pass rates are set on ``summary.sampling``.
+        sample_seed: Random seed of the sample.
 
     Returns:
-        EvaluationSummary with results and computed statistics.
+        EvaluationSummary with results and computed statistics, plus the
+        sequential test outcome when ``config.sequential_test`` is enabled.
     """
-    results = evaluate(config, data, output_dir=output_dir)
-    return EvaluationSummary.from_results(
+    profile_dir = output_dir or get_file_config(config.storage).output_dir
+    data, plan = _draw_sample(config, data, sample, sample_seed)
+    with profiled_run(_profiling_config(config, profile), profile_dir) as profiler:
+        results = evaluate(
+            config,
+            data,
+            output_dir=output_dir,
+            trace=trace,
+            record=record,
+            replay=replay,
+        )
+    summary = EvaluationSummary.from_results(
         results,
         evaluation_data=data if data else None,
         compute_confidence_intervals=compute_confidence_intervals,
     )
+    if profiler is not None:
+        summary.timing_breakdown = profiler.timing_breakdown()
+    if plan is not None:
+        summary.sampling = _report_sample(plan, results, profile_dir)
+    if config.sequential_test.enabled:
+        summary.sequential = load_sequential_report(profile_dir)
+    return summary
 
 
 def evaluate_conversation(
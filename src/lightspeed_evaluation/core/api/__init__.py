@@ -6,10 +6,16 @@ from lightspeed_evaluation.core.system.lazy_import import create_lazy_getattr
 
 if TYPE_CHECKING:
     # ruff: noqa: F401
-    from lightspeed_evaluation.core.api.client import APIClient
+    from lightspeed_evaluation.core.api.client import (
+        APIClient,
+        APIConnectionPool,
+        AsyncAPIClient,
+    )
 
 _LAZY_IMPORTS = {
     "APIClient": ("lightspeed_evaluation.core.api.client", "APIClient"),
+    "APIConnectionPool": ("lightspeed_evaluation.core.api.client", "APIConnectionPool"),
+    "AsyncAPIClient": ("lightspeed_evaluation.core.api.client", "AsyncAPIClient"),
 }
 
 __getattr__ = create_lazy_getattr(_LAZY_IMPORTS, __name__)
@@ -1,9 +1,15 @@
+# pylint: disable=too-many-lines
 """API client for actual data generation."""
 
 import hashlib
+import importlib.util
 import json
 import logging
 import os
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
 from typing import Any, Optional, cast
 
 import httpx
@@ -18,6 +24,8 @@ from tenacity import (
 )
 
 from lightspeed_evaluation.core.api.streaming_parser import (
+    aparse_responses_streaming,
+    aparse_streaming_response,
     parse_responses_streaming,
     parse_streaming_response,
 )
@@ -25,8 +33,32 @@ from lightspeed_evaluation.core.constants import (
     SUPPORTED_ENDPOINT_TYPES,
 )
 from lightspeed_evaluation.core.models import APIConfig, APIRequest, APIResponse
-from lightspeed_evaluation.core.models.agents import HttpApiAgentConfig
-from lightspeed_evaluation.core.system.exceptions import APIError
+from lightspeed_evaluation.core.models.agents import (
+    HttpApiAgentConfig,
+    HttpApiBaseFields,
+)
+from lightspeed_evaluation.core.models.trace import SpanType
+from lightspeed_evaluation.core.system.cassette import (
+    KIND_AGENT,
+    agent_request,
+    arecorded_call,
+    recorded_call,
+)
+from lightspeed_evaluation.core.system.exceptions import (
+    APIError,
+    CassetteMissError,
+    ConfigurationError,
+)
+from lightspeed_evaluation.core.system.profiler import (
+    STAGE_AGENT_POOL_WAIT,
+    get_active_profiler,
+    record_span,
+)
+from lightspeed_evaluation.core.system.tracer import (
+    SPAN_API_QUERY,
+    SpanHandle,
+    trace_span,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -50,32 +82,271 @@ def _is_retryable_server_error(exception: BaseException) -> bool:
     return status in (429, 502, 503, 504)
 
 
-class APIClient:
-    """API client for actual data generation."""
+def build_api_request(
+    config: APIConfig | HttpApiAgentConfig,
+    query: str,
+    conversation_id: Optional[str] = None,
+    attachments: Optional[list[str]] = None,
+    extra_request_params: Optional[dict[str, Any]] = None,
+) -> APIRequest:
+    """Build the API request the client sends for a query."""
+    # Merge extra params: system defaults, then per-turn overrides
+    resolved_extra = {**(config.extra_request_params or {})}
+    if extra_request_params:
+        resolved_extra.update(extra_request_params)
+    return APIRequest.create(
+        query=query,
+        provider=config.provider,
+        model=config.model,
+        conversation_id=conversation_id,
+        system_prompt=config.system_prompt,
+        attachments=attachments,
+        extra_request_params=resolved_extra or None,
+    )
+
+
+def api_cache_key(request: APIRequest) -> str:
+    """Get the disk cache key of an API request (ignores the conversation ID)."""
+    # Note, python hash is initialized randomly so can't be used here
+    request_dict = request.model_dump()
+    keys_to_hash = [
+        "query",
+        "provider",
+        "model",
+        "system_prompt",
+        "attachments",
+    ]
+    parts = [str(request_dict[k]) for k in keys_to_hash]
+
+    # Add individual extra_request_params keys in sorted order
+    # for deterministic cache keys
+    extra = request_dict.get("extra_request_params")
+    if extra:
+        for key in sorted(extra):
+            parts.append(f"{key}={extra[key]}")
+
+    str_request = ",".join(parts)
+    return hashlib.sha256(str_request.encode()).hexdigest()
+
+
+_TransportKey = tuple[bool, int, int, float]
+
+
+def _transport_key(config: HttpApiBaseFields) -> _TransportKey:
+    """Return the connection settings a transport is built from."""
+    return (
+        config.http2,
+        config.max_connections,
+        config.max_keepalive_connections,
+        config.keepalive_expiry,
+    )
+
+
+def _transport_options(config: HttpApiBaseFields) -> dict[str, Any]:
+    """Return the keyword arguments of the HTTP transport of a config.
+
+    Raises:
+        ConfigurationError: If HTTP/2 is requested but 'h2' is not installed.
+    """
+    if config.http2 and importlib.util.find_spec("h2") is None:
+        raise ConfigurationError(
+            "http2 requires the 'h2' package. Add: pip install 'httpx[http2]'"
+        )
+    return {
+        # Enable verify, currently for eval it is set to False
+        "verify": False,
+        "http2": config.http2,
+        "limits": httpx.Limits(
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry=config.keepalive_expiry,
+        ),
+    }
+
+
+def create_transport(config: HttpApiBaseFields) -> httpx.BaseTransport:
+    """Create the HTTP transport for an API configuration.
+
+    Args:
+        config: API configuration with the connection pool settings.
+
+    Returns:
+        Transport with the configured HTTP version and connection limits that
+        reports connection pool waits to the active profiler.
+
+    Raises:
+        ConfigurationError: If HTTP/2 is requested but 'h2' is not installed.
+    """
+    return PoolWaitTransport(httpx.HTTPTransport(**_transport_options(config)))
+
+
+def create_async_transport(config: HttpApiBaseFields) -> httpx.AsyncBaseTransport:
+    """Create the async HTTP transport for an API configuration.
+
+    Async variant of :func:`create_transport`.
+    """
+    return AsyncPoolWaitTransport(
+        httpx.AsyncHTTPTransport(**_transport_options(config))
+    )
+
+
+def _pool_wait_recorder(start_ns: int) -> Callable[[], None]:
+    """Return a callable recording the pool wait started at ``start_ns`` once."""
+    waiting = True
+
+    def record() -> None:
+        nonlocal waiting
+        if waiting:
+            waiting = False
+            record_span(
+                STAGE_AGENT_POOL_WAIT,
+                start_ns,
+                time.perf_counter_ns() - start_ns,
+                "agent",
+            )
+
+    return record
+
+
+class PoolWaitTransport(httpx.BaseTransport):
+    """Transport recording how long requests wait for a pooled connection.
+
+    While a profiler is active, the time from handing a request to the
+    connection pool until it starts connecting or sending on a connection is
+    recorded as the ``agent_pool_wait`` stage. A large total means the agent
+    client needs more connections (``max_connections``).
+    """
+
+    def __init__(self, transport: httpx.BaseTransport) -> None:
+        """Initialize the transport.
+
+        Args:
+            transport: Transport sending the requests.
+        """
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request, timing its wait for a connection."""
+        if get_active_profiler() is None:
+            return self._transport.handle_request(request)
+
+        record_wait = _pool_wait_recorder(time.perf_counter_ns())
+        outer_trace = request.extensions.get("trace")
+
+        def trace(event_name: str, info: dict[str, Any]) -> None:
+            record_wait()
+            if outer_trace is not None:
+                outer_trace(event_name, info)
+
+        request.extensions = {**request.extensions, "trace": trace}
+        return self._transport.handle_request(request)
+
+    def close(self) -> None:
+        """Close the underlying transport."""
+        self._transport.close()
+
+
+class AsyncPoolWaitTransport(httpx.AsyncBaseTransport):
+    """Async variant of :class:`PoolWaitTransport`."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+        """Initialize the transport.
+
+        Args:
+            transport: Transport sending the requests.
+        """
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request, timing its wait for a connection."""
+        if get_active_profiler() is None:
+            return await self._transport.handle_async_request(request)
+
+        record_wait = _pool_wait_recorder(time.perf_counter_ns())
+        outer_trace = request.extensions.get("trace")
+
+        async def trace(event_name: str, info: dict[str, Any]) -> None:
+            record_wait()
+            if outer_trace is not None:
+                await outer_trace(event_name, info)
+
+        request.extensions = {**request.extensions, "trace": trace}
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        """Close the underlying transport."""
+        await self._transport.aclose()
+
+
+class APIConnectionPool:
+    """HTTP connections and disk caches shared by several API clients.
+
+    Clients created with a pool send their requests through a shared
+    transport per connection setting (HTTP version and connection limits),
+    so keep-alive connections (and their TLS sessions) are reused across
+    clients, and clients with the same cache directory share one diskcache
+    handle. The pool owns these resources and closes them in :meth:`close`;
+    closing a client leaves them open.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty pool; resources are created on first use."""
+        self._transports: dict[_TransportKey, httpx.BaseTransport] = {}
+        self._caches: dict[str, Cache] = {}
+        self._lock = threading.Lock()
+
+    def transport(self, config: HttpApiBaseFields) -> httpx.BaseTransport:
+        """Return the shared HTTP transport for the connection settings of a config."""
+        key = _transport_key(config)
+        with self._lock:
+            if key not in self._transports:
+                self._transports[key] = create_transport(config)
+            return self._transports[key]
+
+    def cache(self, cache_dir: Optional[str]) -> Cache:
+        """Return the shared disk cache of a directory."""
+        key = os.path.abspath(cache_dir) if cache_dir else ""
+        with self._lock:
+            if key not in self._caches:
+                self._caches[key] = Cache(cache_dir)
+            return self._caches[key]
+
+    def close(self) -> None:
+        """Close the shared transports and disk caches."""
+        with self._lock:
+            transports, self._transports = list(self._transports.values()), {}
+            caches, self._caches = list(self._caches.values()), {}
+        for transport in transports:
+            transport.close()
+        for cache in caches:
+            cache.close()
+
+
+class _APIClientBase:  # pylint: disable=too-few-public-methods
+    """Configuration, request building and response parsing shared by clients.
+
+    Subclasses own the HTTP client and implement the endpoint calls, either
+    blocking (:class:`APIClient`) or async (:class:`AsyncAPIClient`).
+    """
 
     def __init__(
         self,
         config: APIConfig | HttpApiAgentConfig,
+        cache: Optional[Cache] = None,
     ):
-        """Initialize the client with configuration."""
-        self.config = config
-
-        self.client: Optional[httpx.Client] = None
+        """Initialize the shared client state.
 
-        cache = None
-        if config.cache_enabled:
+        Args:
+            config: API configuration.
+            cache: Disk cache of API responses; opened from the config when
+                caching is enabled and None is given.
+        """
+        self.config = config
+        if cache is None and config.cache_enabled:
             cache = Cache(config.cache_dir)
-        self.cache = cache
+        self.cache = cache if config.cache_enabled else None
 
         self._validate_endpoint_type()
-        self._setup_client()
-
-        # Wrap methods with retry decorator for handling 429 Too Many Requests errors
-        retry_decorator = self._create_retry_decorator()
-        self._standard_query_with_retry = retry_decorator(self._standard_query)
-        self._streaming_query_with_retry = retry_decorator(self._streaming_query)
-        self._rlsapi_infer_query_with_retry = retry_decorator(self._rlsapi_infer_query)
-        self._responses_query_with_retry = retry_decorator(self._responses_query)
 
     def _create_retry_decorator(self) -> Any:
         return retry(
@@ -96,32 +367,28 @@ class APIClient:
                 f"Must be one of {SUPPORTED_ENDPOINT_TYPES}"
             )
 
-    def _setup_client(self) -> None:
-        """Initialize API client with authentication."""
-        try:
-            # Enable verify, currently for eval it is set to False
-            verify = False
-            self.client = httpx.Client(
-                base_url=self.config.api_base,
-                verify=verify,
-                timeout=self.config.timeout,
-            )
-            self.client.headers.update({"Content-Type": "application/json"})
+    def _client_timeout(self) -> httpx.Timeout:
+        """Build the HTTP client timeouts from the configuration."""
+        return httpx.Timeout(
+            self.config.timeout,
+            connect=self.config.connect_timeout or self.config.timeout,
+            read=self.config.read_timeout or self.config.timeout,
+        )
 
-            # Set up MCP headers based on configuration
-            mcp_headers_dict = self._build_mcp_headers()
-            if mcp_headers_dict:
-                self.client.headers.update(
-                    {"MCP-HEADERS": json.dumps(mcp_headers_dict)}
-                )
-            else:
-                # Use API_KEY environment variable for authentication (backward compatibility)
-                api_key = os.getenv("API_KEY")
-                if api_key and self.client:
-                    self.client.headers.update({"Authorization": f"Bearer {api_key}"})
+    def _client_headers(self) -> dict[str, str]:
+        """Build the content type and authentication headers of every request."""
+        headers = {"Content-Type": "application/json"}
 
-        except Exception as e:
-            raise APIError(f"Failed to setup API client: {e}") from e
+        # Set up MCP headers based on configuration
+        mcp_headers_dict = self._build_mcp_headers()
+        if mcp_headers_dict:
+            headers["MCP-HEADERS"] = json.dumps(mcp_headers_dict)
+        else:
+            # Use API_KEY environment variable for authentication (backward compatibility)
+            api_key = os.getenv("API_KEY")
+            if api_key:
+                headers["Authorization"] = f"Bearer {api_key}"
+        return headers
 
     def _build_mcp_headers(self) -> dict[str, dict[str, str]]:
         """Build MCP headers based on configuration.
@@ -170,55 +437,19 @@ class APIClient:
         # No MCP headers configured
         return {}
 
-    def query(
-        self,
-        query: str,
-        conversation_id: Optional[str] = None,
-        attachments: Optional[list[str]] = None,
-        extra_request_params: Optional[dict[str, Any]] = None,
-    ) -> APIResponse:
-        """Query the API using the configured endpoint type.
-
-        Args:
-            query: The question/query to ask
-            conversation_id: Optional conversation ID for context
-            attachments: Optional list of attachments
-            extra_request_params: Optional per-turn extra params (overrides system defaults)
+    def _cassette_request(self, api_request: APIRequest) -> dict[str, Any]:
+        """Describe an agent request for cassette recording and replay.
 
-        Returns:
-            APIResponse with Response, Tool calls, Conversation ID
+        Unlike the cache key this includes the conversation ID, so follow-up
+        turns replay the responses recorded for their own conversation.
         """
-        if not self.client:
-            raise APIError("API client not initialized")
-
-        try:
-            api_request = self._prepare_request(
-                query, conversation_id, attachments, extra_request_params
-            )
-            if self.config.cache_enabled:
-                cached_response = self._get_cached_response(api_request)
-                if cached_response is not None:
-                    logger.debug("Returning cached response for query: '%s'", query)
-                    return cached_response
-
-            if self.config.endpoint_type == "streaming":
-                response = self._streaming_query_with_retry(api_request)
-            elif self.config.endpoint_type == "infer":
-                response = self._rlsapi_infer_query_with_retry(api_request)
-            elif self.config.endpoint_type == "responses":
-                response = self._responses_query_with_retry(api_request)
-            else:
-                response = self._standard_query_with_retry(api_request)
-
-            if self.config.cache_enabled:
-                self._add_response_to_cache(api_request, response)
-
-            return response
-        except RetryError as e:
-            raise APIError(
-                f"Maximum retry attempts ({self.config.num_retries}) reached "
-                "due to retryable server errors (HTTP 429/5xx)."
-            ) from e
+        return agent_request(
+            {
+                "endpoint_type": self.config.endpoint_type,
+                "version": self.config.version,
+                "payload": self._serialize_request(api_request),
+            }
+        )
 
     def _prepare_request(
         self,
@@ -228,18 +459,8 @@ class APIClient:
         extra_request_params: Optional[dict[str, Any]] = None,
     ) -> APIRequest:
         """Prepare API request with common parameters."""
-        # Merge extra params: system defaults, then per-turn overrides
-        resolved_extra = {**(self.config.extra_request_params or {})}
-        if extra_request_params:
-            resolved_extra.update(extra_request_params)
-        return APIRequest.create(
-            query=query,
-            provider=self.config.provider,
-            model=self.config.model,
-            conversation_id=conversation_id,
-            system_prompt=self.config.system_prompt,
-            attachments=attachments,
-            extra_request_params=resolved_extra or None,
+        return build_api_request(
+            self.config, query, conversation_id, attachments, extra_request_params
         )
 
     @staticmethod
@@ -260,50 +481,21 @@ class APIClient:
             ) from e
         return payload
 
-    def _standard_query(self, api_request: APIRequest) -> APIResponse:
-        """Query the API using non-streaming endpoint with retry on 429."""
-        if not self.client:
-            raise APIError("HTTP client not initialized")
-        try:
-            response = self.client.post(
-                f"/{self.config.version}/query",
-                json=self._serialize_request(api_request),
-            )
-            response.raise_for_status()
-
-            response_data = response.json()
-            if "response" not in response_data:
-                raise APIError("API response missing 'response' field")
-
-            # Format tool calls to match streaming endpoint format
-            # Currently only compatible with OLS
-            if "tool_calls" in response_data and response_data["tool_calls"]:
-                raw_tool_calls = response_data["tool_calls"]
-                formatted_tool_calls = []
-
-                # Convert list[dict] to list[list[dict]] format
-                for tool_call in raw_tool_calls:
-                    if isinstance(tool_call, dict):
-                        formatted_tool: dict[str, object] = {
-                            "tool_name": tool_call.get("tool_name")
-                            or tool_call.get("name")  # Current OLS
-                            or "",
-                            "arguments": tool_call.get("arguments")
-                            or tool_call.get("args")  # Current OLS
-                            or {},
-                        }
-                        # Capture tool result if present (optional field)
-                        result = tool_call.get("result")
-                        if result is not None:
-                            formatted_tool["result"] = result
-                        formatted_tool_calls.append([formatted_tool])
-
-                response_data["tool_calls"] = formatted_tool_calls
+    @contextmanager
+    def _translate_errors(self, endpoint: str, operation: str) -> Iterator[None]:
+        """Convert errors raised by an endpoint call into APIError.
 
-            return APIResponse.from_raw_response(response_data)
+        Retryable HTTP status errors (429/5xx) propagate unchanged so the
+        retry policy can retry them.
 
+        Args:
+            endpoint: Endpoint name used in timeout messages.
+            operation: Operation name used in unexpected error messages.
+        """
+        try:
+            yield
         except httpx.TimeoutException as e:
-            raise self._handle_timeout_error("standard", self.config.timeout) from e
+            raise self._handle_timeout_error(endpoint, self.config.timeout) from e
         except httpx.HTTPStatusError as e:
             if _is_retryable_server_error(e):
                 raise
@@ -313,34 +505,58 @@ class APIClient:
         except APIError:
             raise
         except Exception as e:
-            raise self._handle_unexpected_error(e, "standard query") from e
+            raise self._handle_unexpected_error(e, operation) from e
+
+    def _lookup_cache(
+        self, api_request: APIRequest, span: SpanHandle
+    ) -> Optional[APIResponse]:
+        """Return the cached response of a request, if caching is enabled."""
+        if not self.config.cache_enabled:
+            return None
+        cached_response = self._get_cached_response(api_request)
+        span.set_attributes(cache_hit=cached_response is not None)
+        if cached_response is not None:
+            logger.debug("Returning cached response for query: '%s'", api_request.query)
+        return cached_response
 
-    def _streaming_query(self, api_request: APIRequest) -> APIResponse:
-        """Query the API using streaming endpoint."""
-        if not self.client:
-            raise APIError("HTTP client not initialized")
-        try:
-            with self.client.stream(
-                "POST",
-                f"/{self.config.version}/streaming_query",
-                json=self._serialize_request(api_request),
-            ) as response:
-                self._handle_response_errors(response)
-                raw_data = parse_streaming_response(response)
-                return APIResponse.from_raw_response(raw_data)
+    def _retry_exhausted_error(self) -> APIError:
+        """Create the error raised when all retry attempts failed."""
+        return APIError(
+            f"Maximum retry attempts ({self.config.num_retries}) reached "
+            "due to retryable server errors (HTTP 429/5xx)."
+        )
 
-        except httpx.TimeoutException as e:
-            raise self._handle_timeout_error("streaming", self.config.timeout) from e
-        except httpx.HTTPStatusError as e:
-            if _is_retryable_server_error(e):
-                raise
-            raise self._handle_http_error(e) from e
-        except ValueError as e:
-            raise self._handle_validation_error(e) from e
-        except APIError:
-            raise
-        except Exception as e:
-            raise self._handle_unexpected_error(e, "streaming query") from e
+    def _standard_response(self, response_data: dict[str, Any]) -> APIResponse:
+        """Build the response of the non-streaming query endpoint."""
+        if "response" not in response_data:
+            raise APIError("API response missing 'response' field")
+
+        # Format tool calls to match streaming endpoint format
+        # Currently only compatible with OLS
+        if "tool_calls" in response_data and response_data["tool_calls"]:
+            raw_tool_calls = response_data["tool_calls"]
+            formatted_tool_calls = []
+
+            # Convert list[dict] to list[list[dict]] format
+            for tool_call in raw_tool_calls:
+                if isinstance(tool_call, dict):
+                    formatted_tool: dict[str, object] = {
+                        "tool_name": tool_call.get("tool_name")
+                        or tool_call.get("name")  # Current OLS
+                        or "",
+                        "arguments": tool_call.get("arguments")
+                        or tool_call.get("args")  # Current OLS
+                        or {},
+                    }
+                    # Capture tool result if present (optional field)
+                    result = tool_call.get("result")
+                    if result is not None:
+                        formatted_tool["result"] = result
+                    formatted_tool_calls.append([formatted_tool])
+
+            response_data["tool_calls"] = formatted_tool_calls
+
+        return APIResponse.from_raw_response(response_data)
 
     def _build_infer_request(self, api_request: APIRequest) -> dict[str, object]:
         """Build request payload for the RLSAPI /infer endpoint.
@@ -453,55 +669,16 @@ class APIClient:
                 formatted_tool_calls.append([formatted_tool])
         response_data["tool_calls"] = formatted_tool_calls
 
-    def _rlsapi_infer_query(self, api_request: APIRequest) -> APIResponse:
-        """Query the RLSAPI /infer endpoint for tool call and RAG metadata.
-
-        The infer endpoint uses a different request/response format than
-        the standard query/streaming endpoints, converting "query" to
-        "question" and parsing tool_calls and rag_chunks from tool_results.
-
-        Args:
-            api_request: The prepared API request.
-
-        Returns:
-            APIResponse with response text, tool calls, and RAG contexts.
-
-        Raises:
-            APIError: If the request fails or response is invalid.
-        """
-        if not self.client:
-            raise APIError("HTTP client not initialized")
-        try:
-            infer_request = self._build_infer_request(api_request)
-
-            response = self.client.post(
-                f"/api/lightspeed/{self.config.version}/infer",
-                json=infer_request,
-            )
-            response.raise_for_status()
-
-            response_data = response.json()
-            self._extract_infer_data(response_data)
+    def _infer_response(self, response_data: dict[str, Any]) -> APIResponse:
+        """Build the response of the RLSAPI /infer endpoint."""
+        self._extract_infer_data(response_data)
 
-            if "response" not in response_data:
-                raise APIError("API response missing 'response' field")
+        if "response" not in response_data:
+            raise APIError("API response missing 'response' field")
 
-            self._format_infer_tool_calls(response_data)
+        self._format_infer_tool_calls(response_data)
 
-            return APIResponse.from_raw_response(response_data)
-
-        except httpx.TimeoutException as e:
-            raise self._handle_timeout_error("infer", self.config.timeout) from e
-        except httpx.HTTPStatusError as e:
-            if _is_retryable_server_error(e):
-                raise
-            raise self._handle_http_error(e) from e
-        except ValueError as e:
-            raise self._handle_validation_error(e) from e
-        except APIError:
-            raise
-        except Exception as e:
-            raise self._handle_unexpected_error(e, "infer query") from e
+        return APIResponse.from_raw_response(response_data)
 
     def _build_responses_request(self, api_request: APIRequest) -> dict[str, Any]:
         """Build request payload for the /responses endpoint.
@@ -610,62 +787,14 @@ class APIClient:
         if tool_calls:
             response_data["tool_calls"] = tool_calls
 
-    def _responses_query(self, api_request: APIRequest) -> APIResponse:
-        """Query the /responses endpoint.
-
-        Uses the OpenAI Responses API request/response format, adapting fields
-        to and from the internal APIRequest/APIResponse models.
-
-        Args:
-            api_request: The prepared API request.
-
-        Returns:
-            APIResponse with response text, token counts, and RAG contexts.
-
-        Raises:
-            APIError: If the request fails or response is invalid.
-        """
-        if not self.client:
-            raise APIError("HTTP client not initialized")
-        try:
-            responses_request = self._build_responses_request(api_request)
-
-            if responses_request.get("stream"):
-                with self.client.stream(
-                    "POST",
-                    f"/{self.config.version}/responses",
-                    json=responses_request,
-                ) as response:
-                    self._handle_response_errors(response)
-                    raw_data = parse_responses_streaming(response)
-                    return APIResponse.from_raw_response(raw_data)
-
-            response = self.client.post(
-                f"/{self.config.version}/responses",
-                json=responses_request,
-            )
-            response.raise_for_status()
-
-            response_data = response.json()
-            self._extract_responses_data(response_data)
-
-            if "response" not in response_data:
-                raise APIError("API response missing 'response' field")
+    def _responses_response(self, response_data: dict[str, Any]) -> APIResponse:
+        """Build the response of the non-streaming /responses endpoint."""
+        self._extract_responses_data(response_data)
 
-            return APIResponse.from_raw_response(response_data)
+        if "response" not in response_data:
+            raise APIError("API response missing 'response' field")
 
-        except httpx.TimeoutException as e:
-            raise self._handle_timeout_error("responses", self.config.timeout) from e
-        except httpx.HTTPStatusError as e:
-            if _is_retryable_server_error(e):
-                raise
-            raise self._handle_http_error(e) from e
-        except ValueError as e:
-            raise self._handle_validation_error(e) from e
-        except APIError:
-            raise
-        except Exception as e:
-            raise self._handle_unexpected_error(e, "responses query") from e
+        return APIResponse.from_raw_response(response_data)
 
     def _handle_response_errors(self, response: httpx.Response) -> None:
         """Handle HTTP response errors for streaming endpoint."""
@@ -718,26 +847,7 @@ class APIClient:
 
     def _get_cache_key(self, request: APIRequest) -> str:
         """Get cache key for the query."""
-        # Note, python hash is initialized randomly so can't be used here
-        request_dict = request.model_dump()
-        keys_to_hash = [
-            "query",
-            "provider",
-            "model",
-            "system_prompt",
-            "attachments",
-        ]
-        parts = [str(request_dict[k]) for k in keys_to_hash]
-
-        # Add individual extra_request_params keys in sorted order
-        # for deterministic cache keys
-        extra = request_dict.get("extra_request_params")
-        if extra:
-            for key in sorted(extra):
-                parts.append(f"{key}={extra[key]}")
-
-        str_request = ",".join(parts)
-        return hashlib.sha256(str_request.encode()).hexdigest()
+        return api_cache_key(request)
 
     def _add_response_to_cache(
         self, request: APIRequest, response: APIResponse
@@ -762,7 +872,419 @@ class APIClient:
 
         return cached_response
 
-    def close(self) -> None:
-        """Close API client."""
-        if self.client:
+
+class APIClient(_APIClientBase):
+    """API client for actual data generation."""
+
+    def __init__(
+        self,
+        config: APIConfig | HttpApiAgentConfig,
+        connection_pool: Optional[APIConnectionPool] = None,
+    ):
+        """Initialize the client with configuration.
+
+        Args:
+            config: API configuration.
+            connection_pool: Shared connections and disk caches; the client
+                opens its own when None.
+        """
+        super().__init__(
+            config,
+            (
+                connection_pool.cache(config.cache_dir)
+                if connection_pool and config.cache_enabled
+                else None
+            ),
+        )
+        self._connection_pool = connection_pool
+
+        self.client: Optional[httpx.Client] = None
+        self._setup_client()
+
+        # Wrap methods with retry decorator for handling 429 Too Many Requests errors
+        retry_decorator = self._create_retry_decorator()
+        self._standard_query_with_retry = retry_decorator(self._standard_query)
+        self._streaming_query_with_retry = retry_decorator(self._streaming_query)
+        self._rlsapi_infer_query_with_retry = retry_decorator(self._rlsapi_infer_query)
+        self._responses_query_with_retry = retry_decorator(self._responses_query)
+
+    def _setup_client(self) -> None:
+        """Initialize API client with authentication."""
+        try:
+            transport = (
+                self._connection_pool.transport(self.config)
+                if self._connection_pool is not None
+                else create_transport(self.config)
+            )
+            self.client = httpx.Client(
+                base_url=self.config.api_base,
+                timeout=self._client_timeout(),
+                transport=transport,
+            )
+            self.client.headers.update(self._client_headers())
+
+        except Exception as e:
+            raise APIError(f"Failed to setup API client: {e}") from e
+
+    def query(
+        self,
+        query: str,
+        conversation_id: Optional[str] = None,
+        attachments: Optional[list[str]] = None,
+        extra_request_params: Optional[dict[str, Any]] = None,
+    ) -> APIResponse:
+        """Query the API using the configured endpoint type.
+
+        Args:
+            query: The question/query to ask
+            conversation_id: Optional conversation ID for context
+            attachments: Optional list of attachments
+            extra_request_params: Optional per-turn extra params (overrides system defaults)
+
+        Returns:
+            APIResponse with Response, Tool calls, Conversation ID
+        """
+        if not self.client:
+            raise APIError("API client not initialized")
+
+        with trace_span(
+            SPAN_API_QUERY,
+            SpanType.AGENT,
+            endpoint_type=self.config.endpoint_type,
+            api_base=self.config.api_base,
+        ) as span:
+            response = self._query(
+                query, conversation_id, attachments, extra_request_params, span
+            )
+            span.set_llm(
+                input_tokens=response.input_tokens,
+                output_tokens=response.output_tokens,
+            )
+            return response
+
+    def _query(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        query: str,
+        conversation_id: Optional[str],
+        attachments: Optional[list[str]],
+        extra_request_params: Optional[dict[str, Any]],
+        span: SpanHandle,
+    ) -> APIResponse:
+        """Serve the query from a cassette, cache or the endpoint; see :meth:`query`."""
+        api_request = self._prepare_request(
+            query, conversation_id, attachments, extra_request_params
+        )
+        try:
+            return recorded_call(
+                KIND_AGENT,
+                lambda: self._cassette_request(api_request),
+                lambda: self._cached_or_live_query(api_request, span),
+                lambda response: response.model_dump(mode="json"),
+                APIResponse.model_validate,
+            )
+        except CassetteMissError as e:
+            raise APIError(str(e)) from e
+
+    def _cached_or_live_query(
+        self, api_request: APIRequest, span: SpanHandle
+    ) -> APIResponse:
+        """Serve the request from cache or the configured endpoint."""
+        try:
+            cached_response = self._lookup_cache(api_request, span)
+            if cached_response is not None:
+                return cached_response
+
+            if self.config.endpoint_type == "streaming":
+                response = self._streaming_query_with_retry(api_request)
+            elif self.config.endpoint_type == "infer":
+                response = self._rlsapi_infer_query_with_retry(api_request)
+            elif self.config.endpoint_type == "responses":
+                response = self._responses_query_with_retry(api_request)
+            else:
+                response = self._standard_query_with_retry(api_request)
+
+            if self.config.cache_enabled:
+                self._add_response_to_cache(api_request, response)
+
+            return response
+        except RetryError as e:
+            raise self._retry_exhausted_error() from e
+
+    def _standard_query(self, api_request: APIRequest) -> APIResponse:
+        """Query the API using non-streaming endpoint with retry on 429."""
+        if not self.client:
+            raise APIError("HTTP client not initialized")
+        with self._translate_errors("standard", "standard query"):
+            response = self.client.post(
+                f"/{self.config.version}/query",
+                json=self._serialize_request(api_request),
+            )
+            response.raise_for_status()
+            return self._standard_response(response.json())
+
+    def _streaming_query(self, api_request: APIRequest) -> APIResponse:
+        """Query the API using streaming endpoint."""
+        if not self.client:
+            raise APIError("HTTP client not initialized")
+        with self._translate_errors("streaming", "streaming query"):
+            with self.client.stream(
+                "POST",
+                f"/{self.config.version}/streaming_query",
+                json=self._serialize_request(api_request),
+            ) as response:
+                self._handle_response_errors(response)
+                raw_data = parse_streaming_response(response)
+                return APIResponse.from_raw_response(raw_data)
+
+    def _rlsapi_infer_query(self, api_request: APIRequest) -> APIResponse:
+        """Query the RLSAPI /infer endpoint for tool call and RAG metadata.
+
+        The infer endpoint uses a different request/response format than
+        the standard query/streaming endpoints, converting "query" to
+        "question" and parsing tool_calls and rag_chunks from tool_results.
+
+        Args:
+            api_request: The prepared API request.
+
+        Returns:
+            APIResponse with response text, tool calls, and RAG contexts.
+
+        Raises:
+            APIError: If the request fails or response is invalid.
+        """
+        if not self.client:
+            raise APIError("HTTP client not initialized")
+        with self._translate_errors("infer", "infer query"):
+            response = self.client.post(
+                f"/api/lightspeed/{self.config.version}/infer",
+                json=self._build_infer_request(api_request),
+            )
+            response.raise_for_status()
+            return self._infer_response(response.json())
+
+    def _responses_query(self, api_request: APIRequest) -> APIResponse:
+        """Query the /responses endpoint.
+
+        Uses the OpenAI Responses API request/response format, adapting fields
+        to and from the internal APIRequest/APIResponse models.
+
+        Args:
+            api_request: The prepared API request.
+
+        Returns:
+            APIResponse with response text, token counts, and RAG contexts.
+
+        Raises:
+            APIError: If the request fails or response is invalid.
+        """
+        if not self.client:
+            raise APIError("HTTP client not initialized")
+        with self._translate_errors("responses", "responses query"):
+            responses_request = self._build_responses_request(api_request)
+
+            if responses_request.get("stream"):
+                with self.client.stream(
+                    "POST",
+                    f"/{self.config.version}/responses",
+                    json=responses_request,
+                ) as response:
+                    self._handle_response_errors(response)
+                    raw_data = parse_responses_streaming(response)
+                    return APIResponse.from_raw_response(raw_data)
+
+            response = self.client.post(
+                f"/{self.config.version}/responses",
+                json=responses_request,
+            )
+            response.raise_for_status()
+            return self._responses_response(response.json())
+
+    def close(self) -> None:
+        """Close API client (shared connections stay open in their pool)."""
+        if self.client and self._connection_pool is None:
             self.client.close()
+
+
+class AsyncAPIClient(_APIClientBase):
+    """Async API client for high-concurrency data generation.
+
+    Mirrors :class:`APIClient` (endpoints, retry policy, caching, cassettes
+    and streaming metrics) on ``httpx.AsyncClient``, so many queries can be
+    in flight on one event loop instead of one OS thread each. Concurrency is
+    bounded by ``max_connections`` (or multiplexed with ``http2``).
+
+    The client must be used and closed from a single event loop.
+    """
+
+    def __init__(
+        self,
+        config: APIConfig | HttpApiAgentConfig,
+        cache: Optional[Cache] = None,
+    ):
+        """Initialize the client with configuration.
+
+        Args:
+            config: API configuration.
+            cache: Shared disk cache of API responses; opened from the config
+                when caching is enabled and None is given.
+        """
+        super().__init__(config, cache)
+
+        self.client: Optional[httpx.AsyncClient] = None
+        self._setup_client()
+
+        # Wrap methods with retry decorator for handling 429 Too Many Requests errors
+        retry_decorator = self._create_retry_decorator()
+        self._endpoint_queries: dict[
+            str, Callable[[APIRequest], Awaitable[APIResponse]]
+        ] = {
+            "query": retry_decorator(self._standard_query),
+            "streaming": retry_decorator(self._streaming_query),
+            "infer": retry_decorator(self._rlsapi_infer_query),
+            "responses": retry_decorator(self._responses_query),
+        }
+
+    def _setup_client(self) -> None:
+        """Initialize the async HTTP client with authentication."""
+        try:
+            self.client = httpx.AsyncClient(
+                base_url=self.config.api_base,
+                timeout=self._client_timeout(),
+                transport=create_async_transport(self.config),
+                headers=self._client_headers(),
+            )
+        except Exception as e:
+            raise APIError(f"Failed to setup API client: {e}") from e
+
+    async def query(
+        self,
+        query: str,
+        conversation_id: Optional[str] = None,
+        attachments: Optional[list[str]] = None,
+        extra_request_params: Optional[dict[str, Any]] = None,
+    ) -> APIResponse:
+        """Query the API using the configured endpoint type.
+
+        Async variant of :meth:`APIClient.query`.
+        """
+        if not self.client:
+            raise APIError("API client not initialized")
+
+        with trace_span(
+            SPAN_API_QUERY,
+            SpanType.AGENT,
+            endpoint_type=self.config.endpoint_type,
+            api_base=self.config.api_base,
+        ) as span:
+            api_request = self._prepare_request(
+                query, conversation_id, attachments, extra_request_params
+            )
+            try:
+                response = await arecorded_call(
+                    KIND_AGENT,
+                    lambda: self._cassette_request(api_request),
+                    lambda: self._cached_or_live_query(api_request, span),
+                    lambda response: response.model_dump(mode="json"),
+                    APIResponse.model_validate,
+                )
+            except CassetteMissError as e:
+                raise APIError(str(e)) from e
+            span.set_llm(
+                input_tokens=response.input_tokens,
+                output_tokens=response.output_tokens,
+            )
+            return response
+
+    async def _cached_or_live_query(
+        self, api_request: APIRequest, span: SpanHandle
+    ) -> APIResponse:
+        """Serve the request from cache or the configured endpoint."""
+        try:
+            cached_response = self._lookup_cache(api_request, span)
+            if cached_response is not None:
+                return cached_response
+
+            response = await self._endpoint_queries[self.config.endpoint_type](
+                api_request
+            )
+
+            if self.config.cache_enabled:
+                self._add_response_to_cache(api_request, response)
+
+            return response
+        except RetryError as e:
+            raise self._retry_exhausted_error() from e
+
+    async def _standard_query(self, api_request: APIRequest) -> APIResponse:
+        """Query the API using non-streaming endpoint."""
+        if not self.client:
+            raise APIError("HTTP client not initialized")
+        with self._translate_errors("standard", "standard query"):
+            response = await self.client.post(
+                f"/{self.config.version}/query",
+                json=self._serialize_request(api_request),
+            )
+            response.raise_for_status()
+            return self._standard_response(response.json())
+
+    async def _streaming_query(self, api_request: APIRequest) -> APIResponse:
+        """Query the API using streaming endpoint."""
+        if not self.client:
+            raise APIError("HTTP client not initialized")
+        with self._translate_errors("streaming", "streaming query"):
+            async with self.client.stream(
+                "POST",
+                f"/{self.config.version}/streaming_query",
+                json=self._serialize_request(api_request),
+            ) as response:
+                await self._ahandle_response_errors(response)
+                raw_data = await aparse_streaming_response(response)
+                return APIResponse.from_raw_response(raw_data)
+
+    async def _rlsapi_infer_query(self, api_request: APIRequest) -> APIResponse:
+        """Query the RLSAPI /infer endpoint for tool call and RAG metadata."""
+        if not self.client:
+            raise APIError("HTTP client not initialized")
+        with self._translate_errors("infer", "infer query"):
+            response = await self.client.post(
+                f"/api/lightspeed/{self.config.version}/infer",
+                json=self._build_infer_request(api_request),
+            )
+            response.raise_for_status()
+            return self._infer_response(response.json())
+
+    async def _responses_query(self, api_request: APIRequest) -> APIResponse:
+        """Query the /responses endpoint, streamed when requested."""
+        if not self.client:
+            raise APIError("HTTP client not initialized")
+        with self._translate_errors("responses", "responses query"):
+            responses_request = self._build_responses_request(api_request)
+
+            if responses_request.get("stream"):
+                async with self.client.stream(
+                    "POST",
+                    f"/{self.config.version}/responses",
+                    json=responses_request,
+                ) as response:
+                    await self._ahandle_response_errors(response)
+                    raw_data = await aparse_responses_streaming(response)
+                    return APIResponse.from_raw_response(raw_data)
+
+            response = await self.client.post(
+                f"/{self.config.version}/responses",
+                json=responses_request,
+            )
+            response.raise_for_status()
+            return self._responses_response(response.json())
+
+    async def _ahandle_response_errors(self, response: httpx.Response) -> None:
+        """Handle HTTP response errors of a streamed response."""
+        if response.status_code != 200:
+            # Load the error body so the shared handler can read it
+            await response.aread()
+        self._handle_response_errors(response)
+
+    async def aclose(self) -> None:
+        """Close the async HTTP client."""
+        if self.client:
+            await self.client.aclose()
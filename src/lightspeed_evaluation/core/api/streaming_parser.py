@@ -1,18 +1,43 @@
-"""Streaming parser for API client."""
+"""Streaming parser for API client.
+
+Streams are read as bytes and split into SSE lines without decoding them
+to text. An event whose type is the first key of its JSON payload is
+classified from that prefix, and only events the parser keeps data from
+are decoded (with orjson when installed), so the many small token and
+text delta events of a long answer cost a prefix check each.
+"""
 
 import json
 import logging
+import re
 import time
-from collections.abc import Callable
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable, Iterator
 from dataclasses import dataclass, field
 from typing import Any, Optional
 
 import httpx
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 DATA_PREFIX = "data: "
 CONTENT_EVENTS = frozenset(("token", "tool_call", "tool_result", "turn_complete"))
+RESPONSES_CONTENT_EVENTS = frozenset(("response.output_text.delta",))
+
+_DATA_PREFIX = DATA_PREFIX.encode()
+_DONE = b"[DONE]"
+# Data lines whose payload starts with the event type, serialized with or
+# without whitespace after the separator
+_STREAMING_EVENT_TYPE = re.compile(rb'data: \{"event": ?"([^"\\]*)"')
+_RESPONSES_EVENT_TYPE = re.compile(rb'data: \{"type": ?"([^"\\]*)"')
+
+_json_loads: Callable[[bytes | str], Any] = (
+    orjson.loads if orjson is not None else json.loads  # pylint: disable=no-member
+)
 
 
 @dataclass
@@ -145,6 +170,11 @@ _STREAMING_EVENT_HANDLERS: dict[
     "tool_result": _handle_tool_result,
     "end": _handle_end,
 }
+# Events whose payload is decoded; others only need their type
+_STREAMING_DECODED_EVENTS = frozenset(
+    event.encode() for event in (*_STREAMING_EVENT_HANDLERS, "error")
+)
+_STREAMING_CONTENT_EVENTS = frozenset(event.encode() for event in CONTENT_EVENTS)
 
 
 # Responses streaming event handlers
@@ -187,13 +217,6 @@ def _responses_handle_created(
         logger.debug("response.created event missing conversation field")
 
 
-def _responses_capture_ttft(
-    ctx: ResponsesStreamingContext, _data: dict[str, Any]
-) -> None:
-    """Capture time to first token on the first text delta event."""
-    ctx.perf.capture_ttft()
-
-
 def _responses_handle_output_item_done(
     ctx: ResponsesStreamingContext, data: dict[str, Any]
 ) -> None:
@@ -214,8 +237,8 @@ def _normalize_mcp_item(item: dict[str, Any]) -> dict[str, Any]:
     raw_args = item.get("arguments") or {}
     if isinstance(raw_args, str):
         try:
-            raw_args = json.loads(raw_args)
-        except json.JSONDecodeError:
+            raw_args = _json_loads(raw_args)
+        except ValueError:
             raw_args = {}
     normalized["arguments"] = raw_args
     if "output" in item:
@@ -266,10 +289,16 @@ _RESPONSES_EVENT_HANDLERS: dict[
     str, Callable[[ResponsesStreamingContext, dict[str, Any]], None]
 ] = {
     "response.created": _responses_handle_created,
-    "response.output_text.delta": _responses_capture_ttft,
     "response.output_item.done": _responses_handle_output_item_done,
     "response.completed": _responses_handle_completed,
 }
+# Events whose payload is decoded; others only need their type
+_RESPONSES_DECODED_EVENTS = frozenset(
+    event.encode() for event in _RESPONSES_EVENT_HANDLERS
+)
+_RESPONSES_CONTENT_EVENTS = frozenset(
+    event.encode() for event in RESPONSES_CONTENT_EVENTS
+)
 
 
 # Public parse functions
@@ -278,30 +307,17 @@ _RESPONSES_EVENT_HANDLERS: dict[
 def parse_streaming_response(response: httpx.Response) -> dict[str, Any]:
     """Parse a /streaming SSE response into a response dict with performance metrics."""
     ctx = StreamingContext()
+    for line in _iter_lines(response.iter_bytes()):
+        _process_streaming_line(ctx, line)
+    _validate_streaming_response(ctx)
+    return ctx.to_response_dict()
 
-    for line in response.iter_lines():
-        line = line.strip()
-        if not line or not line.startswith(DATA_PREFIX):
-            continue
-
-        parsed_data = _parse_sse_line(line.replace(DATA_PREFIX, ""))
-        if not parsed_data:
-            continue
-
-        event, event_data = parsed_data
-
-        if event == "error" and "token" in event_data:
-            error_message = event_data["token"]
-            logger.error("Received error event from streaming API: %s", error_message)
-            raise ValueError(f"Streaming API error: {error_message}")
-
-        if event in CONTENT_EVENTS:
-            ctx.perf.capture_ttft()
-
-        handler = _STREAMING_EVENT_HANDLERS.get(event)
-        if handler:
-            handler(ctx, event_data)
 
+async def aparse_streaming_response(response: httpx.Response) -> dict[str, Any]:
+    """Async variant of :func:`parse_streaming_response`."""
+    ctx = StreamingContext()
+    async for line in _aiter_lines(response.aiter_bytes()):
+        _process_streaming_line(ctx, line)
     _validate_streaming_response(ctx)
     return ctx.to_response_dict()
 
@@ -309,40 +325,146 @@ def parse_streaming_response(response: httpx.Response) -> dict[str, Any]:
 def parse_responses_streaming(response: httpx.Response) -> dict[str, Any]:
     """Parse a /responses SSE response into a response dict with performance metrics."""
     ctx = ResponsesStreamingContext()
-
-    for line in response.iter_lines():
-        line = line.strip()
-        if not line or not line.startswith(DATA_PREFIX):
-            continue
-        raw = line[len(DATA_PREFIX) :]
-        if raw == "[DONE]":
+    for line in _iter_lines(response.iter_bytes()):
+        if not _process_responses_line(ctx, line):
             break
-        try:
-            data = json.loads(raw)
-        except json.JSONDecodeError:
-            logger.debug("Failed to parse JSON from responses streaming: %s", raw)
-            continue
+    _validate_responses_response(ctx)
+    return ctx.to_response_dict()
 
-        handler = _RESPONSES_EVENT_HANDLERS.get(data.get("type", ""))
-        if handler:
-            handler(ctx, data)
 
+async def aparse_responses_streaming(response: httpx.Response) -> dict[str, Any]:
+    """Async variant of :func:`parse_responses_streaming`."""
+    ctx = ResponsesStreamingContext()
+    async for line in _aiter_lines(response.aiter_bytes()):
+        if not _process_responses_line(ctx, line):
+            break
     _validate_responses_response(ctx)
     return ctx.to_response_dict()
 
 
+def _process_streaming_line(ctx: StreamingContext, line: bytes) -> None:
+    """Apply one /streaming SSE line to the parsing context."""
+    match = _STREAMING_EVENT_TYPE.match(line)
+    if match is not None and match[1] not in _STREAMING_DECODED_EVENTS:
+        # Fast path: no data of this event is kept
+        if match[1] in _STREAMING_CONTENT_EVENTS:
+            ctx.perf.capture_ttft()
+        return
+
+    payload = _sse_payload(line)
+    if payload is None:
+        return
+
+    parsed_data = _parse_sse_line(payload)
+    if not parsed_data:
+        return
+
+    event, event_data = parsed_data
+
+    if event == "error" and "token" in event_data:
+        error_message = event_data["token"]
+        logger.error("Received error event from streaming API: %s", error_message)
+        raise ValueError(f"Streaming API error: {error_message}")
+
+    if event in CONTENT_EVENTS:
+        ctx.perf.capture_ttft()
+
+    handler = _STREAMING_EVENT_HANDLERS.get(event)
+    if handler:
+        handler(ctx, event_data)
+
+
+def _process_responses_line(ctx: ResponsesStreamingContext, line: bytes) -> bool:
+    """Apply one /responses SSE line to the parsing context.
+
+    Returns:
+        False once the stream signalled its end ("[DONE]"), True otherwise.
+    """
+    match = _RESPONSES_EVENT_TYPE.match(line)
+    if match is not None and match[1] not in _RESPONSES_DECODED_EVENTS:
+        # Fast path: no data of this event is kept
+        if match[1] in _RESPONSES_CONTENT_EVENTS:
+            ctx.perf.capture_ttft()
+        return True
+
+    payload = _sse_payload(line)
+    if payload is None:
+        return True
+    if payload == _DONE:
+        return False
+
+    try:
+        data = _json_loads(payload)
+    except ValueError:
+        logger.debug("Failed to parse JSON from responses streaming: %r", payload)
+        return True
+
+    event_type = data.get("type", "")
+    if event_type in RESPONSES_CONTENT_EVENTS:
+        ctx.perf.capture_ttft()
+    handler = _RESPONSES_EVENT_HANDLERS.get(event_type)
+    if handler:
+        handler(ctx, data)
+    return True
+
+
 # Shared helpers
 
 
-def _parse_sse_line(json_data: str) -> Optional[tuple[str, dict[str, Any]]]:
+def _iter_lines(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Split a byte stream into lines without decoding it to text."""
+    pending: list[bytes] = []
+    for chunk in chunks:
+        yield from _split_lines(pending, chunk)
+    if rest := b"".join(pending):
+        yield rest
+
+
+async def _aiter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    """Async variant of :func:`_iter_lines`."""
+    pending: list[bytes] = []
+    async for chunk in chunks:
+        for line in _split_lines(pending, chunk):
+            yield line
+    if rest := b"".join(pending):
+        yield rest
+
+
+def _split_lines(pending: list[bytes], chunk: bytes) -> list[bytes]:
+    """Return the lines completed by a chunk, buffering its unfinished end.
+
+    Lines end with ``\\r\\n``, ``\\r`` or ``\\n``, as in the SSE specification. A
+    ``\\r\\n`` split across two chunks yields an extra empty line, which carries
+    no data.
+    """
+    if b"\r" in chunk:
+        chunk = chunk.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    *lines, tail = chunk.split(b"\n")
+    if lines and pending:
+        pending.append(lines[0])
+        lines[0] = b"".join(pending)
+        pending.clear()
+    pending.append(tail)
+    return lines
+
+
+def _sse_payload(line: bytes) -> Optional[bytes]:
+    """Return the payload of an SSE data line, None for other lines."""
+    line = line.strip()
+    if not line.startswith(_DATA_PREFIX):
+        return None
+    return line[len(_DATA_PREFIX) :]
+
+
+def _parse_sse_line(json_data: bytes | str) -> Optional[tuple[str, dict[str, Any]]]:
     """Parse a SSE line and return event and data."""
     try:
-        data = json.loads(json_data)
+        data = _json_loads(json_data)
         event = data.get("event", "")
         event_data = data.get("data", {})
         return event, event_data
-    except json.JSONDecodeError:
-        logger.debug("Failed to parse JSON from streaming response: %s", json_data)
+    except ValueError:
+        logger.debug("Failed to parse JSON from streaming response: %r", json_data)
         return None
 
 
@@ -1,7 +1,5 @@
 """Common constants for evaluation framework."""
 
-from ragas.metrics.collections import DistanceMeasure
-
 DEFAULT_METRIC_THRESHOLD = 0.5
 
 # NLP Metrics Constants - BLEU
@@ -43,17 +41,48 @@ SUPPORTED_SIMILARITY_MEASURES = [
     SIMILARITY_JARO_WINKLER,
 ]
 
-DISTANCE_MEASURE_MAP = {
-    SIMILARITY_LEVENSHTEIN: DistanceMeasure.LEVENSHTEIN,
-    SIMILARITY_HAMMING: DistanceMeasure.HAMMING,
-    SIMILARITY_JARO: DistanceMeasure.JARO,
-    SIMILARITY_JARO_WINKLER: DistanceMeasure.JARO_WINKLER,
-}
-
 # Cache configuration
 DEFAULT_CACHE_BASE_DIR = ".caches"
 DEFAULT_AGENT_CACHE_SUBDIR = "agent"
 DEFAULT_LLM_CACHE_SUBDIR = "llm"
+DEFAULT_DATASET_CACHE_SUBDIR = "dataset"
+
+# Conversations per process-pool task when validating evaluation data
+DEFAULT_VALIDATION_CHUNK_SIZE = 256
+
+# Profiling
+DEFAULT_PROFILE_TOP_N = 30
+SUPPORTED_PROFILE_EXTRAS = ["cprofile", "tracemalloc"]
+
+# Self-tracing
+DEFAULT_TRACE_SERVICE_NAME = "lightspeed-evaluation"
+
+# Sequential (SPRT) regression testing
+DEFAULT_SEQUENTIAL_MAX_DROP = 5.0
+DEFAULT_SEQUENTIAL_ALPHA = 0.05
+DEFAULT_SEQUENTIAL_BETA = 0.1
+
+# Dry-run planning (--plan): token and latency estimates when nothing is measured
+PLAN_CHARS_PER_TOKEN = 4
+DEFAULT_PLAN_AGENT_LATENCY = 5.0
+DEFAULT_PLAN_JUDGE_LATENCY = 3.0
+DEFAULT_PLAN_RESPONSE_TOKENS = 300
+DEFAULT_PLAN_JUDGE_OUTPUT_TOKENS = 150
+# Prompt template tokens of judge frameworks whose prompts live in the library
+PLAN_PROMPT_TEMPLATE_TOKENS = {"ragas": 800, "deepeval": 600, "geval": 400}
+
+# Judge prompt caching: single-message prompts (Ragas, DeepEval) are split at
+# the prefix they share with one of the last PROMPT_CACHE_HISTORY prompts to the
+# same model once it is long enough to be cached (about 1024 tokens)
+PROMPT_CACHE_MIN_PREFIX_CHARS = 4096
+PROMPT_CACHE_HISTORY = 16
+
+# Batch-API judge mode: deferred judge requests are submitted as provider batches
+DEFAULT_BATCH_JUDGE_SUBDIR = "batch"
+DEFAULT_BATCH_POLL_INTERVAL = 30.0
+DEFAULT_BATCH_TIMEOUT = 86400.0
+DEFAULT_BATCH_MAX_ROUNDS = 10
+DEFAULT_BATCH_COMPLETION_WINDOW = "24h"
 
 # API Constants
 DEFAULT_API_BASE = "http://localhost:8080"
@@ -63,10 +92,16 @@ DEFAULT_ENDPOINT_TYPE = "streaming"
 SUPPORTED_ENDPOINT_TYPES = ["streaming", "query", "infer", "responses"]
 
 DEFAULT_API_NUM_RETRIES = 3
+# HTTP connection pool of the agent client (httpx defaults)
+DEFAULT_API_MAX_CONNECTIONS = 100
+DEFAULT_API_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_API_KEEPALIVE_EXPIRY = 5.0
 
 # Agent Constants
 DEFAULT_AGENT_TYPE = "http_api"
 SUPPORTED_AGENT_TYPES = ["http_api", "proposal"]
+# Drivers for per-conversation agent overrides kept open for reuse
+DEFAULT_AGENT_DRIVER_POOL_SIZE = 32
 
 # Frameworks that don't require judge LLM (NLP, script-based evaluations)
 NON_LLM_FRAMEWORKS = frozenset({"nlp", "script"})
@@ -79,6 +114,10 @@ DEFAULT_LLM_TEMPERATURE = 0.0
 DEFAULT_LLM_MAX_TOKENS = 512
 DEFAULT_LLM_RETRIES = 3
 
+# Turns scored at the same time by a metric handler's evaluate_batch, and
+# windows of a conversation metric scored at the same time
+DEFAULT_METRIC_BATCH_CONCURRENCY = 8
+
 DEFAULT_EMBEDDING_PROVIDER = "openai"
 DEFAULT_EMBEDDING_MODEL = "text-embedding-3-small"
 
@@ -2,8 +2,6 @@
 
 from typing import TYPE_CHECKING
 
-# Apply litellm patching globally before any litellm usage in this package
-import lightspeed_evaluation.core.llm.litellm_patch
 from lightspeed_evaluation.core.system.lazy_import import create_lazy_getattr
 
 if TYPE_CHECKING:
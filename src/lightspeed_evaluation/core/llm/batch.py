@@ -0,0 +1,478 @@
+"""Batch-API judge mode for large non-interactive runs.
+
+Provider batch APIs serve chat completions at a fraction of the interactive
+price and with much higher rate limits, in exchange for latency (up to the
+completion window). In batch mode a run is evaluated in rounds:
+
+1. Conversations are evaluated as usual, except that a judge completion
+   without a stored batch response is queued and fails with
+   :class:`BatchPendingError`; the results of such a round are discarded.
+2. The queued requests are submitted as JSONL batches, one per provider, and
+   polled until they finish. Their responses are stored in the state directory.
+3. The next round is served from the stored responses. Judge calls that
+   depend on an earlier answer (e.g. GEval scoring after step generation) are
+   queued in this round, so rounds repeat until nothing is queued.
+
+Requests are keyed like cassette interactions, so identical requests share
+one response. The state directory holds every response received and the
+batches still in flight; a run that is interrupted resumes polling those
+batches instead of submitting them again. Embedding calls stay interactive.
+
+A batch judge is activated for a run with :func:`batch_judge_session`; the
+litellm patch serves completions through :func:`get_active_batch_judge`.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, NamedTuple, Optional, Protocol
+
+from lightspeed_evaluation.core.constants import DEFAULT_BATCH_JUDGE_SUBDIR
+from lightspeed_evaluation.core.models import BatchJudgeConfig, SystemConfig
+from lightspeed_evaluation.core.system.cassette import KIND_COMPLETION, request_key
+from lightspeed_evaluation.core.system.exceptions import (
+    BatchJudgeError,
+    BatchPendingError,
+)
+from lightspeed_evaluation.core.system.session import ActiveSession
+
+logger = logging.getLogger(__name__)
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+RESPONSES_FILENAME = "responses.jsonl"
+BATCHES_FILENAME = "batches.json"
+
+# Batch statuses after which no more results will be written
+_FINISHED_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+class BatchStatus(NamedTuple):
+    """Status of a submitted batch and the files holding its results."""
+
+    status: str
+    output_file_id: Optional[str] = None
+    error_file_id: Optional[str] = None
+
+
+class BatchClient(Protocol):
+    """Batch endpoint of a provider (the litellm/OpenAI batch interface)."""
+
+    def submit(self, provider: str, requests: list[dict[str, Any]]) -> str:
+        """Upload JSONL batch requests, start the batch and return its ID."""
+
+    def status(self, provider: str, batch_id: str) -> BatchStatus:
+        """Return the current status of a batch."""
+
+    def output(self, provider: str, file_id: str) -> list[dict[str, Any]]:
+        """Return the JSONL result lines of a batch output or error file."""
+
+
+class LiteLLMBatchClient:
+    """Batch client using litellm's file and batch APIs."""
+
+    def __init__(self, completion_window: str, api_base: Optional[str] = None):
+        """Initialize the client.
+
+        Args:
+            completion_window: Completion window requested for each batch.
+            api_base: Base URL of the batch and file endpoints; the provider's
+                default (or its environment configuration) when None.
+        """
+        self.completion_window = completion_window
+        self.api_base = api_base
+
+    def _provider_kwargs(self, provider: str) -> dict[str, Any]:
+        """Return the provider arguments of a litellm file/batch call."""
+        kwargs: dict[str, Any] = {"custom_llm_provider": provider}
+        if self.api_base:
+            kwargs["api_base"] = self.api_base
+        return kwargs
+
+    def submit(self, provider: str, requests: list[dict[str, Any]]) -> str:
+        """Upload JSONL batch requests, start the batch and return its ID."""
+        import litellm  # pylint: disable=import-outside-toplevel
+
+        content = "\n".join(json.dumps(request) for request in requests)
+        input_file = litellm.create_file(
+            file=("judge_requests.jsonl", content.encode("utf-8")),
+            purpose="batch",
+            **self._provider_kwargs(provider),
+        )
+        batch = litellm.create_batch(
+            completion_window=self.completion_window,  # type: ignore[arg-type]
+            endpoint=BATCH_ENDPOINT,
+            input_file_id=input_file.id,  # type: ignore[union-attr]
+            **self._provider_kwargs(provider),
+        )
+        return str(batch.id)  # type: ignore[union-attr]
+
+    def status(self, provider: str, batch_id: str) -> BatchStatus:
+        """Return the current status of a batch."""
+        import litellm  # pylint: disable=import-outside-toplevel
+
+        batch = litellm.retrieve_batch(
+            batch_id=batch_id, **self._provider_kwargs(provider)
+        )
+        return BatchStatus(
+            status=str(batch.status),  # type: ignore[union-attr]
+            output_file_id=batch.output_file_id,  # type: ignore[union-attr]
+            error_file_id=batch.error_file_id,  # type: ignore[union-attr]
+        )
+
+    def output(self, provider: str, file_id: str) -> list[dict[str, Any]]:
+        """Return the JSONL result lines of a batch output or error file."""
+        import litellm  # pylint: disable=import-outside-toplevel
+
+        content = litellm.file_content(
+            file_id=file_id, **self._provider_kwargs(provider)
+        )
+        text = content.content.decode("utf-8")  # type: ignore[union-attr]
+        return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+
+def _jsonable(value: Any) -> Any:
+    """Convert a non-JSON request value (e.g. a pydantic message) for a batch."""
+    if hasattr(value, "model_dump"):
+        return value.model_dump()
+    raise TypeError(f"Cannot send {type(value).__name__} in a batch request")
+
+
+def batch_request_body(request: dict[str, Any]) -> tuple[str, dict[str, Any]]:
+    """Build the provider and request body of a batched judge completion.
+
+    Args:
+        request: Response-determining parameters of the litellm call (see
+            :func:`~lightspeed_evaluation.core.system.cassette.llm_request`).
+
+    Returns:
+        The litellm provider name and the chat completion request body.
+    """
+    # pylint: disable=import-outside-toplevel
+    import litellm
+    from litellm.utils import type_to_response_format_param
+
+    model, provider, _api_key, _api_base = litellm.get_llm_provider(request["model"])
+    body = {**request, "model": model}
+    response_format = body.get("response_format")
+    if isinstance(response_format, type):
+        body["response_format"] = type_to_response_format_param(response_format)
+    return provider, json.loads(json.dumps(body, default=_jsonable))
+
+
+def _error_message(line: dict[str, Any]) -> str:
+    """Return the error of a failed batch result line."""
+    error = line.get("error")
+    if not error:
+        response = line.get("response") or {}
+        error = (response.get("body") or {}).get("error") or (
+            f"status code {response.get('status_code')}"
+        )
+    if isinstance(error, dict):
+        return str(error.get("message") or error)
+    return str(error)
+
+
+class BatchJudge:  # pylint: disable=too-many-instance-attributes
+    """Defers judge completions to provider batches and serves their results.
+
+    Completions are served concurrently from the evaluation threads; batches
+    are submitted and polled between evaluation rounds.
+    """
+
+    def __init__(
+        self,
+        config: BatchJudgeConfig,
+        state_dir: str,
+        client: Optional[BatchClient] = None,
+    ) -> None:
+        """Initialize the batch judge and load the state of earlier runs.
+
+        Args:
+            config: Batch judge configuration.
+            state_dir: Directory of the stored responses and in-flight batches.
+            client: Batch endpoint; litellm's batch API when None.
+
+        Raises:
+            BatchJudgeError: If the state directory cannot be read.
+        """
+        self.config = config
+        self.state_dir = Path(state_dir)
+        self.client: BatchClient = client or LiteLLMBatchClient(
+            config.completion_window, config.api_base
+        )
+        self._responses: dict[str, Any] = {}
+        self._failures: dict[str, str] = {}
+        self._pending: dict[str, dict[str, Any]] = {}
+        self._batches: list[dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._load()
+
+    @classmethod
+    def from_system_config(cls, config: SystemConfig) -> Optional["BatchJudge"]:
+        """Create the batch judge of a run, or None when batch mode is off."""
+        if not config.batch_judge.enabled:
+            return None
+        state_dir = config.batch_judge.state_dir or os.path.join(
+            config.core.cache_base_dir, DEFAULT_BATCH_JUDGE_SUBDIR
+        )
+        return cls(config.batch_judge, state_dir)
+
+    @property
+    def pending(self) -> int:
+        """Number of distinct requests queued in the current round."""
+        with self._lock:
+            return len(self._pending)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of submitted batches that have not finished yet."""
+        with self._lock:
+            return len(self._batches)
+
+    def start_round(self) -> None:
+        """Forget the requests queued in the previous evaluation round."""
+        with self._lock:
+            self._pending.clear()
+
+    def completion(self, request: dict[str, Any]) -> Any:
+        """Return the batch response of a judge completion.
+
+        Args:
+            request: Response-determining parameters of the litellm call.
+
+        Returns:
+            The chat completion response body received for the request.
+
+        Raises:
+            BatchPendingError: If the request has no response yet; it is queued
+                for the next batch.
+            BatchJudgeError: If the request failed in its batch.
+        """
+        key = request_key(KIND_COMPLETION, request)
+        with self._lock:
+            if key in self._responses:
+                return self._responses[key]
+            failure = self._failures.get(key)
+            if failure is None:
+                self._pending.setdefault(key, request)
+        model = request.get("model")
+        if failure is not None:
+            raise BatchJudgeError(
+                f"Batch judge request for model {model!r} failed: {failure}"
+            )
+        raise BatchPendingError(
+            f"Judge request for model {model!r} deferred to a provider batch"
+        )
+
+    def run_batches(self) -> None:
+        """Submit the queued requests and wait for all in-flight batches.
+
+        Raises:
+            BatchJudgeError: If a batch cannot be submitted or polled, or the
+                batches do not finish within the configured timeout. Batches
+                already submitted are resumed by the next run.
+        """
+        self._submit()
+        self._wait()
+
+    def _submit(self) -> None:
+        """Submit the queued requests not already in flight, one batch per provider."""
+        with self._lock:
+            in_flight = {key for batch in self._batches for key in batch["keys"]}
+            queued = {k: r for k, r in self._pending.items() if k not in in_flight}
+
+        by_provider: dict[str, list[dict[str, Any]]] = {}
+        for key, request in queued.items():
+            provider, body = batch_request_body(request)
+            by_provider.setdefault(provider, []).append(
+                {
+                    "custom_id": key,
+                    "method": "POST",
+                    "url": BATCH_ENDPOINT,
+                    "body": body,
+                }
+            )
+
+        for provider, lines in by_provider.items():
+            try:
+                batch_id = self.client.submit(provider, lines)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                raise BatchJudgeError(
+                    f"Failed to submit {len(lines)} judge requests to the "
+                    f"{provider} batch API: {e}"
+                ) from e
+            with self._lock:
+                self._batches.append(
+                    {
+                        "id": batch_id,
+                        "provider": provider,
+                        "keys": [line["custom_id"] for line in lines],
+                    }
+                )
+            self._save_batches()
+            logger.info(
+                "Submitted judge batch %s: %d requests to %s",
+                batch_id,
+                len(lines),
+                provider,
+            )
+
+    def _wait(self) -> None:
+        """Poll the in-flight batches until they finish or the timeout passes."""
+        deadline = time.monotonic() + self.config.timeout
+        while True:
+            with self._lock:
+                batches = list(self._batches)
+            for batch in batches:
+                try:
+                    status = self.client.status(batch["provider"], batch["id"])
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    raise BatchJudgeError(
+                        f"Failed to poll judge batch {batch['id']}: {e}"
+                    ) from e
+                if status.status in _FINISHED_STATUSES:
+                    self._collect(batch, status)
+
+            remaining = deadline - time.monotonic()
+            if not self.in_flight:
+                return
+            if remaining <= 0:
+                raise BatchJudgeError(
+                    f"{self.in_flight} judge batches still running after "
+                    f"{self.config.timeout:g}s; run again to resume waiting for them"
+                )
+            time.sleep(min(self.config.poll_interval, remaining))
+
+    def _collect(self, batch: dict[str, Any], status: BatchStatus) -> None:
+        """Store the results of a finished batch."""
+        lines: list[dict[str, Any]] = []
+        for file_id in (status.output_file_id, status.error_file_id):
+            if not file_id:
+                continue
+            try:
+                lines.extend(self.client.output(batch["provider"], file_id))
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                raise BatchJudgeError(
+                    f"Failed to download results of judge batch {batch['id']}: {e}"
+                ) from e
+
+        responses: dict[str, Any] = {}
+        failures: dict[str, str] = {}
+        for line in lines:
+            key = line.get("custom_id")
+            if not isinstance(key, str):
+                continue
+            response = line.get("response") or {}
+            if (
+                not line.get("error")
+                and response.get("status_code") == 200
+                and response.get("body")
+            ):
+                responses[key] = response["body"]
+            else:
+                failures[key] = _error_message(line)
+        for key in batch["keys"]:
+            if key not in responses and key not in failures:
+                failures[key] = f"batch {batch['id']} {status.status} without a result"
+
+        self._append_responses(responses)
+        with self._lock:
+            self._responses.update(responses)
+            # Failures are kept for this run only, so a later run retries them
+            self._failures.update(failures)
+            self._batches = [b for b in self._batches if b["id"] != batch["id"]]
+        self._save_batches()
+        logger.info(
+            "Judge batch %s %s: %d responses, %d failed",
+            batch["id"],
+            status.status,
+            len(responses),
+            len(failures),
+        )
+
+    @property
+    def _responses_path(self) -> Path:
+        return self.state_dir / RESPONSES_FILENAME
+
+    @property
+    def _batches_path(self) -> Path:
+        return self.state_dir / BATCHES_FILENAME
+
+    def _load(self) -> None:
+        """Read the responses and in-flight batches of earlier runs."""
+        try:
+            if self._responses_path.exists():
+                with self._responses_path.open(encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            entry = json.loads(line)
+                        except json.JSONDecodeError:
+                            # Partial last line of an interrupted write
+                            continue
+                        self._responses[entry["key"]] = entry["response"]
+            if self._batches_path.exists():
+                self._batches = json.loads(
+                    self._batches_path.read_text(encoding="utf-8")
+                )
+        except (OSError, KeyError, TypeError, ValueError) as e:
+            raise BatchJudgeError(
+                f"Cannot read batch judge state in {self.state_dir}: {e}"
+            ) from e
+        if self._batches:
+            logger.info(
+                "Resuming %d in-flight judge batches from %s",
+                len(self._batches),
+                self.state_dir,
+            )
+
+    def _append_responses(self, responses: dict[str, Any]) -> None:
+        """Append received responses to the responses file."""
+        if not responses:
+            return
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        with self._responses_path.open("a", encoding="utf-8") as f:
+            for key, response in responses.items():
+                f.write(json.dumps({"key": key, "response": response}) + "\n")
+
+    def _save_batches(self) -> None:
+        """Atomically write the list of in-flight batches."""
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            content = json.dumps(self._batches, indent=2)
+        tmp_path = self._batches_path.with_suffix(".json.tmp")
+        tmp_path.write_text(content, encoding="utf-8")
+        os.replace(tmp_path, self._batches_path)
+
+
+_ACTIVE_BATCH_JUDGE: ActiveSession[BatchJudge] = ActiveSession(
+    "lightspeed_eval_active_batch_judge"
+)
+
+
+def get_active_batch_judge() -> Optional[BatchJudge]:
+    """Return the batch judge of the running evaluation, if any."""
+    return _ACTIVE_BATCH_JUDGE.get()
+
+
+@contextmanager
+def batch_judge_session(judge: BatchJudge) -> Iterator[BatchJudge]:
+    """Serve judge completions through ``judge`` in the enclosed block.
+
+    Args:
+        judge: Batch judge to activate.
+
+    Yields:
+        The active batch judge.
+
+    Raises:
+        BatchJudgeError: If another batch judge is already active.
+    """
+    if _ACTIVE_BATCH_JUDGE.get() is not None:
+        raise BatchJudgeError("Another batch judge session is already active")
+    with _ACTIVE_BATCH_JUDGE.activate(judge):
+        yield judge
@@ -1,12 +1,13 @@
 """Base Custom LLM class for evaluation framework."""
 
 import logging
-from typing import Any
+from typing import Any, Optional
 
 import litellm
 from litellm.exceptions import InternalServerError
 
 from lightspeed_evaluation.core.llm.litellm_patch import setup_litellm_ssl
+from lightspeed_evaluation.core.llm.prompt_cache import setup_prompt_caching
 from lightspeed_evaluation.core.system.exceptions import LLMError
 
 logger = logging.getLogger(__name__)
@@ -30,12 +31,14 @@ class BaseCustomLLM:  # pylint: disable=too-few-public-methods
         litellm.drop_params = True
 
         setup_litellm_ssl(llm_params)
+        setup_prompt_caching(model_name, llm_params)
 
     def call(
         self,
         prompt: str,
         n: int = 1,
         return_single: bool = True,
+        instructions: Optional[str] = None,
         **kwargs: Any,
     ) -> str | list[str]:
         """Make LLM call and return response(s).
@@ -44,15 +47,21 @@ class BaseCustomLLM:  # pylint: disable=too-few-public-methods
             prompt: Text prompt to send
             n: Number of responses to generate (default 1)
             return_single: If True and n=1, return single string. If False, always return list.
+            instructions: Static instructions sent before the prompt as the
+                system message, so that providers can cache them across calls
             **kwargs: Additional LLM parameters
 
         Returns:
             Single string if return_single=True and n=1, otherwise list of strings
         """
+        messages = [{"role": "user", "content": prompt}]
+        if instructions:
+            messages.insert(0, {"role": "system", "content": instructions})
+
         # Note: Forbidden keys are rejected at LLMParametersConfig load time
         call_params = {
             "model": self.model_name,
-            "messages": [{"role": "user", "content": prompt}],
+            "messages": messages,
             "n": n,
             "timeout": self.llm_params.get("timeout"),
             "num_retries": self.llm_params.get("num_retries"),
@@ -93,3 +102,14 @@ class BaseCustomLLM:  # pylint: disable=too-few-public-methods
 
         except Exception as e:
             raise LLMError(f"LLM call failed: {str(e)}") from e
+
+    def count_tokens(self, prompt: str) -> int:
+        """Count the input tokens of a prompt for the configured model.
+
+        Falls back to a rough four-characters-per-token estimate when no
+        tokenizer is known for the model.
+        """
+        try:
+            return int(litellm.token_counter(model=self.model_name, text=prompt))
+        except Exception:  # pylint: disable=broad-exception-caught
+            return len(prompt) // 4
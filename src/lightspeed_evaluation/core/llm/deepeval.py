@@ -1,7 +1,8 @@
 """DeepEval LLM Manager - DeepEval-specific LLM wrapper.
 
-Note: litellm patching is applied at package level (__init__.py) before any imports.
-This ensures DeepEval's LiteLLMModel uses the patched completion functions.
+Note: litellm patching is applied when core.llm.litellm_patch is first imported,
+which happens below, before DeepEval's LiteLLMModel is used. This ensures it calls
+the patched completion functions.
 """
 
 import asyncio
@@ -10,10 +11,12 @@ from typing import Any
 
 import litellm
 from deepeval.models import LiteLLMModel
-from tenacity import stop_after_attempt
+from tenacity import retry_if_exception, stop_after_attempt
 
 from lightspeed_evaluation.core.constants import DEFAULT_LLM_RETRIES
 from lightspeed_evaluation.core.llm.litellm_patch import setup_litellm_ssl
+from lightspeed_evaluation.core.llm.prompt_cache import setup_prompt_caching
+from lightspeed_evaluation.core.system.exceptions import BatchJudgeError
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +40,7 @@ class DeepEvalLLMManager:
         self.llm_params = llm_params
 
         self.setup_ssl_verify()
+        setup_prompt_caching(self.model_name, self.llm_params)
 
         # Always drop unsupported parameters for cross-provider compatibility
         litellm.drop_params = True
@@ -68,7 +72,8 @@ class DeepEvalLLMManager:
         """Monkey-patch DeepEval's retry decorators to use configured max_retries.
 
         DeepEval's @retry decorators capture MAX_RETRIES at import time.
-        We patch the 'stop' attribute on each retry decorator to use our value.
+        We patch the 'stop' attribute on each retry decorator to use our value,
+        and stop retrying batch judge errors, which a retry cannot resolve.
         """
         # Patch the stop condition on all retry-decorated methods
         for method_name in [
@@ -82,6 +87,10 @@ class DeepEvalLLMManager:
             method.retry.stop = stop_after_attempt(  # pylint: disable=no-member
                 max_retries
             )
+            method.retry.retry = retry_if_exception(  # pylint: disable=no-member
+                lambda e: isinstance(e, Exception)
+                and not isinstance(e, BatchJudgeError)
+            )
 
         logger.info(
             "Patched DeepEval retry logic: max_retries=%d",
@@ -5,7 +5,11 @@ This module configures litellm for two purposes:
 1. TOKEN TRACKING: Wraps litellm.completion, litellm.acompletion, litellm.embedding,
    and litellm.aembedding to track token usage for all LLM and embedding calls.
    We use function wrapping rather than litellm's callback system because callbacks
-   don't reliably capture tokens in all execution paths.
+   don't reliably capture tokens in all execution paths. The same wrappers record
+   calls to, or replay them from, an active cassette (see core.system.cassette),
+   serve completions from provider batches in batch judge mode (see
+   core.llm.batch) and add provider prompt-caching hints to live calls (see
+   core.llm.prompt_cache).
 
 2. RAGAS 0.4 COMPATIBILITY: Ragas 0.4's score() method internally uses
    asyncio.run() which creates a new event loop. LiteLLM's background
@@ -24,6 +28,8 @@ from functools import wraps
 from typing import Any
 
 import litellm
+from litellm.caching.caching import Cache
+from litellm.types.caching import CachingSupportedCallTypes, LiteLLMCacheType
 
 # Suppress coroutine warnings from litellm's async logging (cosmetic only)
 warnings.filterwarnings(
@@ -33,10 +39,19 @@ warnings.filterwarnings(
 )
 
 # pylint: disable=wrong-import-position
+from lightspeed_evaluation.core.llm.batch import get_active_batch_judge  # noqa: E402
+from lightspeed_evaluation.core.llm.prompt_cache import with_cache_hints  # noqa: E402
 from lightspeed_evaluation.core.llm.token_tracker import (  # noqa: E402
     track_embedding_tokens,
     track_judge_tokens,
 )
+from lightspeed_evaluation.core.system.cassette import (  # noqa: E402
+    KIND_COMPLETION,
+    KIND_EMBEDDING,
+    arecorded_call,
+    llm_request,
+    recorded_call,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -101,11 +116,87 @@ _original_embedding = litellm.embedding
 _original_aembedding = litellm.aembedding
 
 
+_COMPLETION_POSITIONAL = ("model", "messages")
+_EMBEDDING_POSITIONAL = ("model", "input")
+
+
+def _dump_response(response: Any) -> Any:
+    """Serialize a litellm response for a cassette."""
+    return response.model_dump()
+
+
+def _load_completion(data: Any) -> Any:
+    """Rebuild a completion response recorded in a cassette."""
+    return litellm.ModelResponse(**data)
+
+
+def _load_embedding(data: Any) -> Any:
+    """Rebuild an embedding response recorded in a cassette."""
+    return litellm.EmbeddingResponse(**data)
+
+
+def _hinted(
+    args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> tuple[tuple[Any, ...], dict[str, Any]]:
+    """Add prompt-caching hints to the arguments of a live completion call.
+
+    Hints are only added to the request sent to the provider, never to the
+    one keying cassettes. Prompts are not split at learned prefixes while the
+    litellm response cache is active, as that would make its keys unstable.
+    """
+    return with_cache_hints(args, kwargs, split_prompts=litellm.cache is None)
+
+
+def _batched_completion(args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+    """Serve a completion from the active batch judge, or None without one.
+
+    Raises:
+        BatchPendingError: If the request is deferred to the next batch.
+    """
+    batch_judge = get_active_batch_judge()
+    if batch_judge is None or kwargs.get("stream"):
+        return None
+    return _load_completion(
+        batch_judge.completion(llm_request(args, kwargs, _COMPLETION_POSITIONAL))
+    )
+
+
+def _live_completion(*args: Any, **kwargs: Any) -> Any:
+    """Call the original litellm.completion with prompt-caching hints."""
+    response = _batched_completion(args, kwargs)
+    if response is not None:
+        return response
+    args, kwargs = _hinted(args, kwargs)
+    return _original_completion(*args, **kwargs)
+
+
+async def _live_acompletion(*args: Any, **kwargs: Any) -> Any:
+    """Call the original litellm.acompletion with prompt-caching hints."""
+    response = _batched_completion(args, kwargs)
+    if response is not None:
+        return response
+    args, kwargs = _hinted(args, kwargs)
+    return await _original_acompletion(*args, **kwargs)
+
+
+def _call_completion(*args: Any, **kwargs: Any) -> Any:
+    """Call litellm.completion, through the active cassette unless streaming."""
+    if kwargs.get("stream"):
+        return _live_completion(*args, **kwargs)
+    return recorded_call(
+        KIND_COMPLETION,
+        lambda: llm_request(args, kwargs, _COMPLETION_POSITIONAL),
+        lambda: _live_completion(*args, **kwargs),
+        _dump_response,
+        _load_completion,
+    )
+
+
 # Patch litellm's completion functions to include token tracking
 @wraps(_original_completion)
 def _completion_with_token_tracking(*args: Any, **kwargs: Any) -> Any:
     """Wrapper around litellm.completion that tracks tokens."""
-    response = _original_completion(*args, **kwargs)
+    response = _call_completion(*args, **kwargs)
     try:
         track_judge_tokens(response)
     except Exception as e:  # pylint: disable=broad-exception-caught
@@ -116,7 +207,16 @@ def _completion_with_token_tracking(*args: Any, **kwargs: Any) -> Any:
 @wraps(_original_acompletion)
 async def _acompletion_with_token_tracking(*args: Any, **kwargs: Any) -> Any:
     """Wrapper around litellm.acompletion that tracks tokens."""
-    response = await _original_acompletion(*args, **kwargs)
+    if kwargs.get("stream"):
+        response = await _live_acompletion(*args, **kwargs)
+    else:
+        response = await arecorded_call(
+            KIND_COMPLETION,
+            lambda: llm_request(args, kwargs, _COMPLETION_POSITIONAL),
+            lambda: _live_acompletion(*args, **kwargs),
+            _dump_response,
+            _load_completion,
+        )
     try:
         track_judge_tokens(response)
     except Exception as e:  # pylint: disable=broad-exception-caught
@@ -128,7 +228,13 @@ async def _acompletion_with_token_tracking(*args: Any, **kwargs: Any) -> Any:
 @wraps(_original_embedding)
 def _embedding_with_token_tracking(*args: Any, **kwargs: Any) -> Any:
     """Wrapper around litellm.embedding that tracks tokens."""
-    response = _original_embedding(*args, **kwargs)
+    response = recorded_call(
+        KIND_EMBEDDING,
+        lambda: llm_request(args, kwargs, _EMBEDDING_POSITIONAL),
+        lambda: _original_embedding(*args, **kwargs),
+        _dump_response,
+        _load_embedding,
+    )
     try:
         track_embedding_tokens(response)
     except Exception as e:  # pylint: disable=broad-exception-caught
@@ -139,7 +245,13 @@ def _embedding_with_token_tracking(*args: Any, **kwargs: Any) -> Any:
 @wraps(_original_aembedding)
 async def _aembedding_with_token_tracking(*args: Any, **kwargs: Any) -> Any:
     """Wrapper around litellm.aembedding that tracks tokens."""
-    response = await _original_aembedding(*args, **kwargs)
+    response = await arecorded_call(
+        KIND_EMBEDDING,
+        lambda: llm_request(args, kwargs, _EMBEDDING_POSITIONAL),
+        lambda: _original_aembedding(*args, **kwargs),
+        _dump_response,
+        _load_embedding,
+    )
     try:
         track_embedding_tokens(response)
     except Exception as e:  # pylint: disable=broad-exception-caught
@@ -179,3 +291,37 @@ def setup_litellm_ssl(llm_params: dict[str, Any]) -> None:
             litellm.ssl_verify = os.environ.get("SSL_CERTIFI_BUNDLE", True)
         else:
             litellm.ssl_verify = False
+
+
+# =============================================================================
+# CACHE CONFIGURATION UTILITY
+# =============================================================================
+def setup_litellm_cache(
+    cache_dir: str, llm_cache_enabled: bool, embedding_cache_enabled: bool
+) -> None:
+    """Enable litellm's disk cache for judge completions and/or embeddings.
+
+    The cache is process-global; an existing cache is kept so concurrent
+    pipelines share it.
+
+    Args:
+        cache_dir: Directory of the disk cache
+        llm_cache_enabled: Cache completion calls
+        embedding_cache_enabled: Cache embedding calls
+    """
+    if not (llm_cache_enabled or embedding_cache_enabled):
+        return
+
+    supported_call_types: list[CachingSupportedCallTypes] = []
+    if llm_cache_enabled:
+        supported_call_types.extend(["completion", "acompletion"])
+    if embedding_cache_enabled:
+        supported_call_types.extend(["embedding", "aembedding"])
+
+    with litellm_state_lock:
+        if litellm.cache is None:
+            litellm.cache = Cache(
+                type=LiteLLMCacheType.DISK,
+                disk_cache_dir=cache_dir,
+                supported_call_types=supported_call_types,
+            )
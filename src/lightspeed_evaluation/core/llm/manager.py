@@ -218,6 +218,7 @@ class LLMManager:
             "timeout": self.config.timeout,
             "num_retries": self.config.num_retries,
             "ssl_verify": self.config.ssl_verify,
+            "prompt_caching": self.config.prompt_caching,
             "parameters": dict(self.config.parameters),
         }
 
@@ -0,0 +1,149 @@
+"""Provider prompt-caching hints for judge LLM calls.
+
+The judge prompts of a metric share a long static prefix (instructions,
+rubric, examples) and only differ in the turn data. OpenAI and compatible
+providers cache such prefixes automatically, so all that matters there is
+the ordering: the custom metrics send their static instructions first, as
+the system message. Anthropic models (including Claude on Bedrock and
+Vertex AI) only cache up to an explicit ``cache_control`` breakpoint, which
+is added here:
+
+- a leading system message is marked as cacheable
+- a single-message prompt, as sent by Ragas and DeepEval, is split after the
+  longest line-aligned prefix it shares with a recent prompt to the same
+  model, and that prefix is marked as cacheable
+
+Cached input tokens reported by the provider are recorded by the token
+tracker.
+"""
+
+import os
+import threading
+from collections import deque
+from typing import Any
+
+from lightspeed_evaluation.core.constants import (
+    PROMPT_CACHE_HISTORY,
+    PROMPT_CACHE_MIN_PREFIX_CHARS,
+)
+
+_CACHE_CONTROL = {"type": "ephemeral"}
+
+# Models registered by the LLM managers with prompt caching enabled
+_enabled_models: set[str] = set()
+_enabled_models_lock = threading.Lock()
+
+
+class _PromptHistory:  # pylint: disable=too-few-public-methods
+    """Recent single-message prompts per model, to find their shared prefix."""
+
+    def __init__(self, size: int) -> None:
+        """Keep the last ``size`` prompts of each model."""
+        self._size = size
+        self._prompts: dict[str, deque[str]] = {}
+        self._lock = threading.Lock()
+
+    def shared_prefix(self, model: str, prompt: str) -> str:
+        """Record a prompt and return its cacheable prefix ("" when too short)."""
+        with self._lock:
+            recent = self._prompts.setdefault(model, deque(maxlen=self._size))
+            longest = max(
+                (len(os.path.commonprefix([prompt, other])) for other in recent),
+                default=0,
+            )
+            recent.append(prompt)
+        # End the prefix on a line boundary so that it does not depend on how
+        # the following (dynamic) text happens to start
+        end = prompt.rfind("\n", 0, longest) + 1
+        return prompt[:end] if end >= PROMPT_CACHE_MIN_PREFIX_CHARS else ""
+
+
+_history = _PromptHistory(PROMPT_CACHE_HISTORY)
+
+
+def setup_prompt_caching(model_name: str, llm_params: dict[str, Any]) -> None:
+    """Enable or disable prompt-caching hints for a judge model.
+
+    Args:
+        model_name: Constructed model name (e.g., "anthropic/claude-sonnet-4")
+        llm_params: Dictionary containing LLM parameters including 'prompt_caching'
+    """
+    with _enabled_models_lock:
+        if llm_params.get("prompt_caching", True):
+            _enabled_models.add(model_name)
+        else:
+            _enabled_models.discard(model_name)
+
+
+def uses_cache_control(model: str) -> bool:
+    """Whether the model only caches prompts up to explicit breakpoints."""
+    return model.startswith("anthropic/") or "claude" in model.lower()
+
+
+def _text_block(text: str, cached: bool = False) -> dict[str, Any]:
+    """Build a text content block, optionally ending a cached prefix."""
+    block: dict[str, Any] = {"type": "text", "text": text}
+    if cached:
+        block["cache_control"] = dict(_CACHE_CONTROL)
+    return block
+
+
+def add_cache_hints(
+    model: str, messages: list[dict[str, Any]], split_prompts: bool = True
+) -> list[dict[str, Any]]:
+    """Return the messages with prompt-caching hints for the model.
+
+    The input is never modified; it is returned as is when no hint applies.
+
+    Args:
+        model: Model name of the call.
+        messages: Chat messages of the call.
+        split_prompts: Whether a single-message prompt may be split at a
+            prefix learned from earlier prompts. The split depends on the
+            order of calls, so it must be off while responses are cached by
+            request content.
+    """
+    if not messages or model not in _enabled_models or not uses_cache_control(model):
+        return messages
+    first = messages[0]
+    content = first.get("content")
+    if not isinstance(content, str) or not content:
+        return messages
+
+    if first.get("role") == "system":
+        blocks = [_text_block(content, cached=True)]
+    elif split_prompts and first.get("role") == "user" and len(messages) == 1:
+        prefix = _history.shared_prefix(model, content)
+        if not prefix:
+            return messages
+        blocks = [_text_block(prefix, cached=True)]
+        if len(prefix) < len(content):
+            blocks.append(_text_block(content[len(prefix) :]))
+    else:
+        return messages
+    return [{**first, "content": blocks}, *messages[1:]]
+
+
+def with_cache_hints(
+    args: tuple[Any, ...], kwargs: dict[str, Any], split_prompts: bool = True
+) -> tuple[tuple[Any, ...], dict[str, Any]]:
+    """Add prompt-caching hints to the arguments of a completion call.
+
+    Args:
+        args: Positional arguments of the call (model, messages, ...).
+        kwargs: Keyword arguments of the call.
+        split_prompts: See :func:`add_cache_hints`.
+
+    Returns:
+        The (args, kwargs) to send, unchanged when no hint applies.
+    """
+    model = kwargs.get("model", args[0] if args else None)
+    messages = kwargs.get("messages", args[1] if len(args) > 1 else None)
+    if not isinstance(model, str) or not isinstance(messages, list):
+        return args, kwargs
+    hinted = add_cache_hints(model, messages, split_prompts)
+    if hinted is messages:
+        return args, kwargs
+    if "messages" in kwargs:
+        return args, {**kwargs, "messages": hinted}
+    return (args[0], hinted, *args[2:]), kwargs
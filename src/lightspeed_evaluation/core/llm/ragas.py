@@ -8,6 +8,7 @@ from ragas.llms import llm_factory
 
 from lightspeed_evaluation.core.llm.litellm_patch import setup_litellm_ssl
 from lightspeed_evaluation.core.llm.manager import LLMManager
+from lightspeed_evaluation.core.llm.prompt_cache import setup_prompt_caching
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +42,7 @@ class RagasLLMManager:
 
         # Setup SSL verification for litellm
         setup_litellm_ssl(self.llm_params)
+        setup_prompt_caching(self.model_name, self.llm_params)
 
         # Build inference kwargs from parameters
         # Rename max_completion_tokens to max_tokens for ragas/instructor compatibility
@@ -2,18 +2,22 @@
 
 import logging
 import threading
+from contextvars import ContextVar
 from typing import Any, Optional
 
 logger = logging.getLogger(__name__)
 
-# Thread-local storage for active TokenTracker
-_active_tracker: threading.local = threading.local()
+# Active TokenTracker; a context variable so that it is isolated per thread
+# and still follows coroutines scheduled on a shared event loop.
+_active_tracker: ContextVar[Optional["TokenTracker"]] = ContextVar(
+    "lightspeed_eval_active_token_tracker", default=None
+)
 
 
 class TokenTracker:
     """Tracks token usage from LLM calls using direct response extraction.
 
-    Uses thread-local storage to track the active tracker. Tokens are captured
+    Uses a context variable to track the active tracker. Tokens are captured
     directly from litellm response in BaseCustomLLM.call() - no callbacks,
     no timeouts, no race conditions.
 
@@ -30,9 +34,13 @@ class TokenTracker:
         self.input_tokens = 0
         self.output_tokens = 0
         self.embedding_tokens = 0
+        self.cached_input_tokens = 0
+        self.cache_hits = 0
         self._lock = threading.Lock()  # Instance lock for token counter updates
 
-    def add_judge_tokens(self, prompt_tokens: int, completion_tokens: int) -> None:
+    def add_judge_tokens(
+        self, prompt_tokens: int, completion_tokens: int, cached_tokens: int = 0
+    ) -> None:
         """Add judge token counts (thread-safe).
 
         Called by the litellm patch (see litellm_patch.py) after each completions call.
@@ -40,10 +48,13 @@ class TokenTracker:
         Args:
             prompt_tokens: Number of input/prompt tokens.
             completion_tokens: Number of output/completion tokens.
+            cached_tokens: Number of the input tokens the provider read from
+                its prompt cache.
         """
         with self._lock:
             self.input_tokens += prompt_tokens
             self.output_tokens += completion_tokens
+            self.cached_input_tokens += cached_tokens
 
     def add_embedding_tokens(self, prompt_tokens: int) -> None:
         """Add embedding token counts (thread-safe).
@@ -56,14 +67,19 @@ class TokenTracker:
         with self._lock:
             self.embedding_tokens += prompt_tokens
 
+    def add_cache_hit(self) -> None:
+        """Count a judge LLM response served from the LLM cache (thread-safe)."""
+        with self._lock:
+            self.cache_hits += 1
+
     def start(self) -> None:
         """Set this tracker as active for the current thread."""
-        _active_tracker.tracker = self
+        _active_tracker.set(self)
 
     def stop(self) -> None:
         """Unset this tracker as active for the current thread."""
-        if getattr(_active_tracker, "tracker", None) is self:
-            _active_tracker.tracker = None
+        if _active_tracker.get() is self:
+            _active_tracker.set(None)
 
     def get_judge_counts(self) -> tuple[int, int]:
         """Get accumulated token counts.
@@ -83,12 +99,32 @@ class TokenTracker:
         with self._lock:
             return self.embedding_tokens
 
+    def get_cached_input_tokens(self) -> int:
+        """Get the judge input tokens read from provider prompt caches.
+
+        Returns:
+            cached_input_tokens (included in the judge input tokens)
+        """
+        with self._lock:
+            return self.cached_input_tokens
+
+    def get_cache_hits(self) -> int:
+        """Get the number of judge LLM responses served from cache.
+
+        Returns:
+            cache_hits
+        """
+        with self._lock:
+            return self.cache_hits
+
     def reset(self) -> None:
         """Reset token counts to zero."""
         with self._lock:
             self.input_tokens = 0
             self.output_tokens = 0
             self.embedding_tokens = 0
+            self.cached_input_tokens = 0
+            self.cache_hits = 0
 
     @staticmethod
     def get_active() -> Optional["TokenTracker"]:
@@ -97,33 +133,58 @@ class TokenTracker:
         Returns:
             The active TokenTracker, or None if no tracker is active.
         """
-        return getattr(_active_tracker, "tracker", None)
+        return _active_tracker.get()
 
 
-def _extract_tokens_if_not_cached(response: Any) -> tuple[int, int] | None:
-    """Extract tokens from response if not cached. Returns (prompt, completion) or None."""
-    cache_hit = getattr(
-        response, "_hidden_params", {}
-    ).get(  # pylint: disable=protected-access
-        "cache_hit", False
+def _is_cache_hit(response: Any) -> bool:
+    """Whether litellm served this response from its cache."""
+    return bool(
+        getattr(response, "_hidden_params", {}).get(  # pylint: disable=protected-access
+            "cache_hit", False
+        )
     )
 
+
+def _extract_tokens_if_not_cached(response: Any) -> tuple[int, int] | None:
+    """Extract tokens from response if not cached. Returns (prompt, completion) or None."""
     # Only add tokens if this response was not retrieved from cache
-    if not cache_hit and hasattr(response, "usage") and response.usage:
+    if not _is_cache_hit(response) and hasattr(response, "usage") and response.usage:
         prompt_tokens = int(getattr(response.usage, "prompt_tokens", 0))
         completion_tokens = int(getattr(response.usage, "completion_tokens", 0))
         return (prompt_tokens, completion_tokens)
     return None
 
 
+def _extract_cached_tokens(usage: Any) -> int:
+    """Extract the prompt tokens a provider served from its prompt cache.
+
+    OpenAI-style usage reports them in ``prompt_tokens_details.cached_tokens``;
+    Anthropic-style usage in ``cache_read_input_tokens``.
+    """
+    details = getattr(usage, "prompt_tokens_details", None)
+    for cached in (
+        getattr(details, "cached_tokens", None),
+        getattr(usage, "cache_read_input_tokens", None),
+    ):
+        if isinstance(cached, int) and cached > 0:
+            return cached
+    return 0
+
+
 def track_judge_tokens(response: Any) -> None:
     """Track JudgeLLM tokens if a tracker is active."""
     tracker = TokenTracker.get_active()
     if tracker and response is not None:
+        if _is_cache_hit(response):
+            tracker.add_cache_hit()
         tokens = _extract_tokens_if_not_cached(response)
         if tokens:
             prompt_tokens, completion_tokens = tokens
-            tracker.add_judge_tokens(prompt_tokens, completion_tokens)
+            tracker.add_judge_tokens(
+                prompt_tokens,
+                completion_tokens,
+                _extract_cached_tokens(response.usage),
+            )
 
 
 def track_embedding_tokens(response: Any) -> None:
@@ -8,7 +8,9 @@ from lightspeed_evaluation.core.metrics.custom.custom import CustomMetrics
 from lightspeed_evaluation.core.metrics.custom.keywords_eval import evaluate_keywords
 from lightspeed_evaluation.core.metrics.custom.mrr_eval import evaluate_mrr
 from lightspeed_evaluation.core.metrics.custom.prompts import (
+    ANSWER_CORRECTNESS_INSTRUCTIONS,
     ANSWER_CORRECTNESS_PROMPT,
+    INTENT_EVALUATION_INSTRUCTIONS,
     INTENT_EVALUATION_PROMPT,
 )
 from lightspeed_evaluation.core.metrics.custom.proposal_eval import (
@@ -25,6 +27,8 @@ __all__ = [
     "evaluate_tool_calls",
     "get_lhat",
     # Prompts
+    "ANSWER_CORRECTNESS_INSTRUCTIONS",
     "ANSWER_CORRECTNESS_PROMPT",
+    "INTENT_EVALUATION_INSTRUCTIONS",
     "INTENT_EVALUATION_PROMPT",
 ]
@@ -3,14 +3,22 @@
 import json
 import logging
 import re
-from typing import TYPE_CHECKING, Any, Optional
+import threading
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional
 
-from lightspeed_evaluation.core.llm.custom import BaseCustomLLM
 from lightspeed_evaluation.core.llm.manager import LLMManager
 from lightspeed_evaluation.core.metrics.custom.keywords_eval import evaluate_keywords
 from lightspeed_evaluation.core.metrics.custom.prompts import (
+    ANSWER_CORRECTNESS_INSTRUCTIONS,
     ANSWER_CORRECTNESS_PROMPT,
+    ANSWER_CORRECTNESS_RUBRIC,
+    FUSED_EVALUATION_INSTRUCTIONS,
+    FUSED_EVALUATION_PROMPT,
+    INTENT_EVALUATION_INSTRUCTIONS,
     INTENT_EVALUATION_PROMPT,
+    INTENT_EVALUATION_RUBRIC,
+    PROPOSAL_EVALUATION_CORRECTNESS_INSTRUCTIONS,
     PROPOSAL_EVALUATION_CORRECTNESS_PROMPT,
 )
 from lightspeed_evaluation.core.metrics.custom.proposal_eval import (
@@ -22,14 +30,47 @@ from lightspeed_evaluation.core.models import EvaluationScope, TurnData
 from lightspeed_evaluation.core.system.exceptions import LLMError
 
 if TYPE_CHECKING:
+    from lightspeed_evaluation.core.llm.custom import BaseCustomLLM
     from lightspeed_evaluation.core.metrics.manager import MetricManager
 
 logger = logging.getLogger(__name__)
 
 
-class CustomMetrics:  # pylint: disable=too-few-public-methods
+class _FusedRubric(NamedTuple):
+    """Prompt pieces of a metric that can share a fused judge call."""
+
+    # Standalone instructions and prompt, used to estimate the tokens fusing saves
+    instructions: str
+    prompt: str
+    rubric: str  # Section of FUSED_EVALUATION_PROMPT
+    required_field: str  # TurnData field the rubric compares against
+    reason_format: str  # Same reason layout as the standalone evaluation
+
+
+_FUSED_RUBRICS = {
+    "answer_correctness": _FusedRubric(
+        ANSWER_CORRECTNESS_INSTRUCTIONS,
+        ANSWER_CORRECTNESS_PROMPT,
+        ANSWER_CORRECTNESS_RUBRIC,
+        "expected_response",
+        "Custom answer correctness: {score:.2f} - {reason}",
+    ),
+    "intent_eval": _FusedRubric(
+        INTENT_EVALUATION_INSTRUCTIONS,
+        INTENT_EVALUATION_PROMPT,
+        INTENT_EVALUATION_RUBRIC,
+        "expected_intent",
+        "{reason}",
+    ),
+}
+
+
+class CustomMetrics:
     """Handles custom metrics using LLMManager for direct LLM calls."""
 
+    # Metrics whose rubrics can be scored together by evaluate_fused()
+    FUSABLE_METRICS = tuple(_FUSED_RUBRICS)
+
     def __init__(
         self,
         llm_manager: LLMManager,
@@ -41,9 +82,10 @@ class CustomMetrics:  # pylint: disable=too-few-public-methods
             llm_manager: Pre-configured LLMManager with validated parameters
             metric_manager: Optional MetricManager for reading system defaults
         """
-        self.llm = BaseCustomLLM(
-            llm_manager.get_model_name(), llm_manager.get_llm_params()
-        )
+        self._model_name = llm_manager.get_model_name()
+        self._llm_params = llm_manager.get_llm_params()
+        self._llm: Optional["BaseCustomLLM"] = None
+        self._llm_lock = threading.Lock()
         self.metric_manager = metric_manager
 
         self.supported_metrics = {
@@ -57,7 +99,19 @@ class CustomMetrics:  # pylint: disable=too-few-public-methods
             ),
         }
 
-        logger.info("Custom Metrics initialized: %s", self.llm.model_name)
+        logger.info("Custom Metrics initialized: %s", self._model_name)
+
+    @property
+    def llm(self) -> "BaseCustomLLM":
+        """LLM client, created on first use so non-LLM metrics never load litellm."""
+        if self._llm is None:
+            with self._llm_lock:
+                if self._llm is None:
+                    # pylint: disable=import-outside-toplevel
+                    from lightspeed_evaluation.core.llm.custom import BaseCustomLLM
+
+                    self._llm = BaseCustomLLM(self._model_name, self._llm_params)
+        return self._llm
 
     def evaluate(
         self,
@@ -76,9 +130,123 @@ class CustomMetrics:  # pylint: disable=too-few-public-methods
         except (ValueError, AttributeError, KeyError) as e:
             return None, f"Custom {metric_name} evaluation failed: {str(e)}"
 
-    def _call_llm(self, prompt: str) -> str:
-        """Make an LLM call with the configured parameters."""
-        result = self.llm.call(prompt, return_single=True)
+    def evaluate_fused(
+        self,
+        metric_names: Sequence[str],
+        _conv_data: Any,
+        scope: EvaluationScope,
+    ) -> tuple[dict[str, tuple[float, str]], int]:
+        """Score several LLM-judged metrics of one turn with a single judge call.
+
+        The query and response are sent once, followed by one rubric per
+        metric, and the judge answers with a JSON object keyed by metric name.
+        Metrics missing from the returned scores (not fusable, lacking the
+        data their rubric needs, or unparseable in the judge answer) must be
+        evaluated one by one with :meth:`evaluate`.
+
+        Args:
+            metric_names: Custom metric names requested for the turn.
+            _conv_data: Conversation data (unused; rubrics only depend on the turn).
+            scope: Turn scope to evaluate.
+
+        Returns:
+            Tuple of (score and reason by metric name, estimated judge input
+            tokens saved compared with one call per returned metric).
+        """
+        turn_data = scope.turn_data
+        if scope.is_conversation or turn_data is None:
+            return {}, 0
+
+        fields = {
+            "query": turn_data.query,
+            "response": turn_data.response or "",
+            "expected_response": turn_data.expected_response,
+            "expected_intent": turn_data.expected_intent,
+        }
+        rubrics = {
+            name: _FUSED_RUBRICS[name]
+            for name in metric_names
+            if name in _FUSED_RUBRICS
+            and isinstance(fields[_FUSED_RUBRICS[name].required_field], str)
+            and fields[_FUSED_RUBRICS[name].required_field]
+        }
+        if len(rubrics) < 2:
+            return {}, 0
+
+        prompt = FUSED_EVALUATION_PROMPT.format(
+            query=fields["query"],
+            response=fields["response"],
+            rubrics="\n\n".join(r.rubric.format(**fields) for r in rubrics.values()),
+        )
+        try:
+            llm_response = self._call_llm(prompt, FUSED_EVALUATION_INSTRUCTIONS)
+        except LLMError as e:
+            logger.warning(
+                "Fused custom metric call failed, using per-metric calls: %s", e
+            )
+            return {}, 0
+
+        results = self._parse_fused_response(llm_response, rubrics)
+        if len(results) < len(rubrics):
+            logger.warning(
+                "Could not parse fused scores for %s, using per-metric calls",
+                ", ".join(name for name in rubrics if name not in results),
+            )
+        if not results:
+            return {}, 0
+
+        separate_tokens = sum(
+            self.llm.count_tokens(rubrics[name].instructions)
+            + self.llm.count_tokens(rubrics[name].prompt.format(**fields))
+            for name in results
+        )
+        fused_tokens = self.llm.count_tokens(
+            FUSED_EVALUATION_INSTRUCTIONS
+        ) + self.llm.count_tokens(prompt)
+        return results, max(0, separate_tokens - fused_tokens)
+
+    def _parse_fused_response(
+        self, response: str, rubrics: dict[str, _FusedRubric]
+    ) -> dict[str, tuple[float, str]]:
+        """Parse the JSON answer of a fused call into per-metric scores.
+
+        Expected JSON schema::
+
+            {"<metric name>": {"score": float, "reason": "string"}, ...}
+        """
+        # Tolerate code fences or chatter around the JSON object
+        match = re.search(r"\{.*\}", response, re.DOTALL)
+        try:
+            data = json.loads(match.group() if match else response)
+        except json.JSONDecodeError:
+            return {}
+        if not isinstance(data, dict):
+            return {}
+
+        results: dict[str, tuple[float, str]] = {}
+        for name, rubric in rubrics.items():
+            entry = data.get(name)
+            if not isinstance(entry, dict):
+                continue
+            score = self._normalize_score(self._try_parse_float(entry.get("score")))
+            if score is None or not 0.0 <= score <= 1.0:
+                continue
+            reason = str(entry.get("reason") or "")
+            results[name] = (
+                score,
+                rubric.reason_format.format(score=score, reason=reason),
+            )
+        return results
+
+    def _call_llm(self, prompt: str, instructions: str) -> str:
+        """Make an LLM call with the configured parameters.
+
+        Args:
+            prompt: Turn data of the evaluation.
+            instructions: Static instructions of the metric, sent first so
+                that providers can cache them across calls.
+        """
+        result = self.llm.call(prompt, return_single=True, instructions=instructions)
         if isinstance(result, list):
             return result[0] if result else ""
         return result
@@ -114,14 +282,17 @@ class CustomMetrics:  # pylint: disable=too-few-public-methods
         if score is None:
             score = self._extract_score_from_text(response)
 
-        # Normalize score to 0-1 range if needed
+        return self._normalize_score(score), reason
+
+    @staticmethod
+    def _normalize_score(score: Optional[float]) -> Optional[float]:
+        """Normalize a score to the 0-1 range if it looks like a 0-10 or 0-100 scale."""
         if score is not None and score > 1.0:
             if score <= 10.0:  # Assume 0-10 scale
                 score = score / 10.0
             elif score <= 100.0:  # Assume 0-100 scale
                 score = score / 100.0
-
-        return score, reason
+        return score
 
     def _extract_score_from_text(self, text: str) -> Optional[float]:
         """Extract numeric score from text using various patterns."""
@@ -181,7 +352,7 @@ class CustomMetrics:  # pylint: disable=too-few-public-methods
 
         # Make LLM call and parse response
         try:
-            llm_response = self._call_llm(prompt)
+            llm_response = self._call_llm(prompt, ANSWER_CORRECTNESS_INSTRUCTIONS)
             score, reason = self._parse_score_response(llm_response)
 
             if score is None:
@@ -291,7 +462,7 @@ class CustomMetrics:  # pylint: disable=too-few-public-methods
 
         # Make LLM call and parse response
         try:
-            llm_response = self._call_llm(prompt)
+            llm_response = self._call_llm(prompt, INTENT_EVALUATION_INSTRUCTIONS)
             score, reason = self._parse_score_response(llm_response)
 
             if score is None:
@@ -407,7 +578,9 @@ class CustomMetrics:  # pylint: disable=too-few-public-methods
         )
 
         try:
-            llm_response = self._call_llm(prompt)
+            llm_response = self._call_llm(
+                prompt, PROPOSAL_EVALUATION_CORRECTNESS_INSTRUCTIONS
+            )
             score, reason = self._parse_proposal_eval_response(llm_response)
 
             if score is None:
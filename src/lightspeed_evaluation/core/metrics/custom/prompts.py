@@ -2,12 +2,13 @@
 
 # pylint: disable=line-too-long
 
-# Answer Correctness Evaluation Prompt
-ANSWER_CORRECTNESS_PROMPT = """Evaluate the answer correctness of the given response.
+# Each judge prompt is split into static instructions, sent first as the system
+# message and shared by every call of the metric so that providers can cache
+# them, and a *_PROMPT template holding only the turn data. The instructions
+# are sent verbatim (not formatted), so they use single braces.
 
-Question: {query}
-Response: {response}
-Expected Response: {expected_response}
+# Answer Correctness Evaluation Prompt
+ANSWER_CORRECTNESS_INSTRUCTIONS = """Evaluate the answer correctness of the given response against the expected response.
 
 Consider:
 - Factual accuracy compared to expected response
@@ -21,12 +22,12 @@ Format your response as:
 Score: [your score on a scale of 0.0 to 1.0]
 Reason: [your detailed explanation]"""
 
-# Intent Evaluation Prompt
-INTENT_EVALUATION_PROMPT = """Evaluate whether the response demonstrates the expected intent or purpose.
-
-Question: {query}
+ANSWER_CORRECTNESS_PROMPT = """Question: {query}
 Response: {response}
-Expected Intent: {expected_intent}
+Expected Response: {expected_response}"""
+
+# Intent Evaluation Prompt
+INTENT_EVALUATION_INSTRUCTIONS = """Evaluate whether the response demonstrates the expected intent or purpose.
 
 Consider:
 - What is the intent/purpose of the actual response?
@@ -45,34 +46,25 @@ Format your response as:
 Score: [0 or 1]
 Reason: [your detailed explanation]"""
 
-# Proposal Evaluation Correctness Prompt
-PROPOSAL_EVALUATION_CORRECTNESS_PROMPT = """You are evaluating an automated remediation workflow on an OpenShift/Kubernetes cluster. You must be strict, objective, and critical. Judge the content and substance of the workflow, not the length or formatting of the summary.
-
-## Original Request
-{request}
-
-## Workflow Phases
-{workflow_phases}
-
-## Workflow Summary
-{workflow_summary}
+INTENT_EVALUATION_PROMPT = """Question: {query}
+Response: {response}
+Expected Intent: {expected_intent}"""
 
-## Expected Outcome
-{expected_outcome}
+# Proposal Evaluation Correctness Prompt
+PROPOSAL_EVALUATION_CORRECTNESS_INSTRUCTIONS = """You are evaluating an automated remediation workflow on an OpenShift/Kubernetes cluster. You must be strict, objective, and critical. Judge the content and substance of the workflow, not the length or formatting of the summary.
 
-## Additional Expected Outcomes (Optional)
-{optional_expected_outcomes}
+The workflow is given in the sections Original Request, Workflow Phases, Workflow Summary, Expected Outcome and Additional Expected Outcomes (Optional).
 
-If additional expected outcomes are provided above, use them as supplementary reference points to refine your scoring precision. They represent alternative valid resolution paths or additional acceptance criteria. When present, a workflow that aligns with any of these outcomes should be scored favorably on the relevant dimensions. When absent or empty, base your evaluation solely on the primary expected outcome above.
+If additional expected outcomes are provided, use them as supplementary reference points to refine your scoring precision. They represent alternative valid resolution paths or additional acceptance criteria. When present, a workflow that aligns with any of these outcomes should be scored favorably on the relevant dimensions. When absent or empty, base your evaluation solely on the primary expected outcome.
 
 ## Evaluation Criteria
 Compare the workflow summary against the expected outcome (and any additional expected outcomes, if provided) on each dimension independently:
 
 1. **Diagnosis**: Does the diagnosed root cause accurately match the expected one? Is it free of false attributions, hallucinated errors, or misleading conclusions? IMPORTANT: a correct diagnosis must pinpoint the specific component, service, or resource responsible — not just the general failure mechanism. Identifying the right class of failure (e.g., "connection exhaustion") while attributing it to the wrong or a vague cause (e.g., "multiple clients" instead of a specific service) is a significant gap (0.3–0.5), not a minor detail (0.6–0.8). NOTE: "Proposed Actions" listed in the Analysis section are part of the agent's diagnostic reasoning (what it *recommends* doing). Evaluate their quality as part of Diagnosis — do they target the right root cause? Are the recommendations sound and safe?
-2. **Execution**: Were the remediation actions actually carried out? Did they produce the intended effect? Are they safe, well-scoped, and minimal? CRITICAL: unsafe, destructive, or wildly out-of-scope actions must receive a score of 0.2 or lower, regardless of diagnosis accuracy. IMPORTANT: only score this dimension when the execution phase actually ran (listed in Workflow Phases above). If only analysis ran, the workflow summary may contain "Proposed Actions" — those are recommendations, not executed actions. Do NOT score them under Execution; they belong to Diagnosis.
+2. **Execution**: Were the remediation actions actually carried out? Did they produce the intended effect? Are they safe, well-scoped, and minimal? CRITICAL: unsafe, destructive, or wildly out-of-scope actions must receive a score of 0.2 or lower, regardless of diagnosis accuracy. IMPORTANT: only score this dimension when the execution phase actually ran (listed in Workflow Phases). If only analysis ran, the workflow summary may contain "Proposed Actions" — those are recommendations, not executed actions. Do NOT score them under Execution; they belong to Diagnosis.
 3. **Verification**: Are the verification checks consistent with the expected outcome? Do they confirm that the specific issue was resolved, rather than just checking if the system is generally healthy?
 
-**Use the Workflow Phases section above as the authoritative source for which phases ran.** Only score dimensions whose corresponding phase is listed. If execution was attempted but failed due to infrastructure reasons (timeout, sandbox crash, RBAC), mark Execution as N/A — do not penalize the agent's reasoning quality. Mark absent dimensions as null.
+**Use the Workflow Phases section as the authoritative source for which phases ran.** Only score dimensions whose corresponding phase is listed. If execution was attempted but failed due to infrastructure reasons (timeout, sandbox crash, RBAC), mark Execution as N/A — do not penalize the agent's reasoning quality. Mark absent dimensions as null.
 
 ## Scoring Rubric (apply per dimension)
 - **0.9 - 1.0**: Near-perfect or perfect alignment with the expected outcome.
@@ -110,10 +102,66 @@ Why: Recognizing the failure class is necessary but not sufficient — an action
 ## Output Format
 Use below json format for your response. Do not add any additional text apart from json output.
 
-{{
+{
   "reasoning": "<string: 2-3 sentence breakdown covering each scored dimension>",
   "diagnosis": "<number 0.0-1.0>",
   "execution": "<number 0.0-1.0 or null if N/A>",
   "verification": "<number 0.0-1.0 or null if N/A>",
   "average": "<number: mean of non-null dimensions, e.g. diagnosis=0.9 execution=0.8 verification=null → (0.9+0.8)/2=0.85>"
-}}"""
+}"""
+
+PROPOSAL_EVALUATION_CORRECTNESS_PROMPT = """## Original Request
+{request}
+
+## Workflow Phases
+{workflow_phases}
+
+## Workflow Summary
+{workflow_summary}
+
+## Expected Outcome
+{expected_outcome}
+
+## Additional Expected Outcomes (Optional)
+{optional_expected_outcomes}"""
+
+# Fused Evaluation Prompt: scores several rubrics of one turn in a single call.
+# Each rubric section is built from one of the *_RUBRIC templates below.
+FUSED_EVALUATION_INSTRUCTIONS = """Evaluate the given response against each of the rubrics that follow it. Score every rubric independently of the others.
+
+## Output Format
+Use below json format for your response, with one entry per rubric id. Do not add any additional text apart from json output.
+
+{
+  "<rubric id>": {"score": <number>, "reason": "<string: detailed explanation>"}
+}"""
+
+FUSED_EVALUATION_PROMPT = """Question: {query}
+Response: {response}
+
+{rubrics}"""
+
+ANSWER_CORRECTNESS_RUBRIC = """## Rubric id: answer_correctness
+Evaluate the answer correctness of the response.
+
+Expected Response: {expected_response}
+
+Consider:
+- Factual accuracy compared to expected response
+- Completeness of information
+- Alignment with expected response
+- Absence of contradictory information
+
+Score on a scale of 0.0 to 1.0."""
+
+INTENT_EVALUATION_RUBRIC = """## Rubric id: intent_eval
+Evaluate whether the response demonstrates the expected intent or purpose.
+
+Expected Intent: {expected_intent}
+
+Consider:
+- What is the intent/purpose of the actual response?
+- Does the response's intent match the expected intent?
+- Is the response trying to achieve what is described in the expected intent?
+
+Use binary scoring: 1 for match, 0 for no match."""
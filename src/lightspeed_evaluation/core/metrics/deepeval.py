@@ -3,12 +3,18 @@
 This module provides integration with DeepEval metrics including:
 1. Standard DeepEval metrics (conversation completeness, relevancy, knowledge retention)
 2. GEval integration for configurable custom evaluation criteria
+
+Standard conversation metrics can be evaluated over sliding windows of turns
+(``window`` in the metric metadata) so long conversations stay within the
+judge's context and the windows are scored concurrently.
 """
 
+import asyncio
 import logging
+import statistics
+from collections.abc import Callable, Sequence
 from typing import Any, Optional
 
-import litellm
 from deepeval.metrics import (
     ConversationCompletenessMetric,
     KnowledgeRetentionMetric,
@@ -16,20 +22,31 @@ from deepeval.metrics import (
 )
 from deepeval.test_case import ConversationalTestCase
 from deepeval.test_case import Turn as DeepEvalTurn
-from litellm.caching.caching import Cache
-from litellm.types.caching import LiteLLMCacheType
+from pydantic import ValidationError
 
+from lightspeed_evaluation.core.constants import DEFAULT_METRIC_BATCH_CONCURRENCY
 from lightspeed_evaluation.core.llm.deepeval import DeepEvalLLMManager
-from lightspeed_evaluation.core.llm.litellm_patch import litellm_state_lock
 from lightspeed_evaluation.core.llm.manager import LLMManager
 from lightspeed_evaluation.core.metrics.geval import GEvalHandler
-from lightspeed_evaluation.core.metrics.manager import MetricManager
-from lightspeed_evaluation.core.models import EvaluationScope, TurnData
+from lightspeed_evaluation.core.metrics.geval_steps import GEvalStepsCache
+from lightspeed_evaluation.core.metrics.manager import MetricLevel, MetricManager
+from lightspeed_evaluation.core.models import (
+    ConversationWindowConfig,
+    EvaluationScope,
+    TurnData,
+)
 
 logger = logging.getLogger(__name__)
 
+_WINDOW_REDUCERS: dict[str, Callable[[list[float]], float]] = {
+    "mean": statistics.fmean,
+    "min": min,
+    "max": max,
+    "median": statistics.median,
+}
 
-class DeepEvalMetrics:  # pylint: disable=too-few-public-methods
+
+class DeepEvalMetrics:
     """Handles DeepEval metrics evaluation using LLM Manager.
 
     This class provides a unified interface for both standard DeepEval metrics
@@ -41,22 +58,16 @@ class DeepEvalMetrics:  # pylint: disable=too-few-public-methods
         self,
         llm_manager: LLMManager,
         metric_manager: MetricManager,
+        geval_steps_cache: Optional[GEvalStepsCache] = None,
     ):
         """Initialize with LLM Manager.
 
         Args:
             llm_manager: Pre-configured LLMManager with validated parameters
             metric_manager: MetricManager for accessing metric metadata
+            geval_steps_cache: Cache of generated GEval evaluation steps
         """
-        # litellm.cache is process-global; serialize setup with the shared lock
-        # so that concurrent pipelines don't race.
-        if llm_manager.get_config().cache_enabled:
-            with litellm_state_lock:
-                if litellm.cache is None:
-                    cache_dir = llm_manager.get_config().cache_dir
-                    litellm.cache = Cache(
-                        type=LiteLLMCacheType.DISK, disk_cache_dir=cache_dir
-                    )
+        self.metric_manager = metric_manager
 
         # Create shared LLM Manager for all DeepEval metrics (standard + GEval)
         self.llm_manager = DeepEvalLLMManager(
@@ -67,6 +78,7 @@ class DeepEvalMetrics:  # pylint: disable=too-few-public-methods
         self.geval_handler = GEvalHandler(
             deepeval_llm_manager=self.llm_manager,
             metric_manager=metric_manager,
+            steps_cache=geval_steps_cache,
         )
 
         # Standard DeepEval metrics routing
@@ -76,10 +88,21 @@ class DeepEvalMetrics:  # pylint: disable=too-few-public-methods
             "knowledge_retention": self._evaluate_knowledge_retention,
         }
 
-    def _build_conversational_test_case(self, conv_data: Any) -> ConversationalTestCase:
-        """Build ConversationalTestCase from conversation data."""
+    def _build_conversational_test_case(
+        self, conv_data: Any, turn_range: Optional[tuple[int, int]] = None
+    ) -> ConversationalTestCase:
+        """Build ConversationalTestCase from conversation data.
+
+        Args:
+            conv_data: Conversation data object
+            turn_range: Optional [start, end) slice of turns to include
+        """
+        conv_turns = conv_data.turns
+        if turn_range is not None:
+            conv_turns = conv_turns[turn_range[0] : turn_range[1]]
+
         turns = []
-        for turn_data in conv_data.turns:
+        for turn_data in conv_turns:
             # Add user turn
             turns.append(DeepEvalTurn(role="user", content=turn_data.query))
             # Add assistant turn
@@ -91,7 +114,11 @@ class DeepEvalMetrics:  # pylint: disable=too-few-public-methods
         """Evaluate and get result."""
         metric.measure(test_case)
         self.llm_manager.flush_deepevals_pending_tasks()
+        return self._read_result(metric)
 
+    @staticmethod
+    def _read_result(metric: Any) -> tuple[float | None, str]:
+        """Extract score and reason from a measured metric."""
         score = metric.score
         reason = (
             metric.reason
@@ -147,19 +174,160 @@ class DeepEvalMetrics:  # pylint: disable=too-few-public-methods
                 return None, f"DeepEval {metric_name} evaluation failed: {str(e)}"
 
         # Otherwise, assume it's a GEval metric
-        normalized_metric_name = (
-            metric_name.split(":", 1)[1]
-            if metric_name.startswith("geval:")
-            else metric_name
-        )
         return self.geval_handler.evaluate(
-            metric_name=normalized_metric_name,
+            metric_name=self._geval_metric_name(metric_name),
             conv_data=conv_data,
             _turn_idx=scope.turn_idx,
             turn_data=scope.turn_data,
             is_conversation=scope.is_conversation,
         )
 
+    def evaluate_batch(
+        self,
+        metric_name: str,
+        conv_data: Any,
+        scopes: Sequence[EvaluationScope],
+        max_concurrency: int = DEFAULT_METRIC_BATCH_CONCURRENCY,
+    ) -> list[tuple[Optional[float], str]]:
+        """Evaluate a metric for many scopes at once.
+
+        Turn-level GEval metrics are scored concurrently with ``a_measure``;
+        other metrics fall back to evaluating each scope in turn.
+
+        Args:
+            metric_name: Name of metric (GEval names may carry the "geval:" prefix)
+            conv_data: Conversation data object
+            scopes: Evaluation scope of each turn
+            max_concurrency: Maximum number of turns scored at the same time
+
+        Returns:
+            One (score, reason) tuple per scope, in the same order.
+        """
+        if metric_name in self.supported_metrics or any(
+            scope.is_conversation for scope in scopes
+        ):
+            return [self.evaluate(metric_name, conv_data, scope) for scope in scopes]
+
+        return self.geval_handler.evaluate_batch(
+            self._geval_metric_name(metric_name),
+            conv_data,
+            [scope.turn_data for scope in scopes],
+            max_concurrency=max_concurrency,
+        )
+
+    @staticmethod
+    def _geval_metric_name(metric_name: str) -> str:
+        """Strip the optional "geval:" prefix from a GEval metric name."""
+        return (
+            metric_name.split(":", 1)[1]
+            if metric_name.startswith("geval:")
+            else metric_name
+        )
+
+    def _window_config(
+        self, metric_name: str, conv_data: Any
+    ) -> Optional[ConversationWindowConfig]:
+        """Return the window configuration of a conversation metric, if any.
+
+        Raises:
+            ValueError: If the configured window is invalid.
+        """
+        metadata = self.metric_manager.get_metric_metadata(
+            metric_identifier=f"deepeval:{metric_name}",
+            level=MetricLevel.CONVERSATION,
+            conv_data=conv_data,
+        )
+        raw_window = metadata.get("window") if isinstance(metadata, dict) else None
+        if raw_window is None:
+            return None
+        try:
+            return ConversationWindowConfig.model_validate(raw_window)
+        except ValidationError as e:
+            raise ValueError(f"Invalid window configuration: {e}") from e
+
+    def _evaluate_conversation_metric(
+        self,
+        metric_name: str,
+        metric_cls: Callable[..., Any],
+        conv_data: Any,
+        window: Optional[ConversationWindowConfig],
+    ) -> tuple[Optional[float], str]:
+        """Score a conversation metric, over windows of turns when configured."""
+        bounds = window.bounds(len(conv_data.turns)) if window is not None else []
+        if window is None or len(bounds) == 1:
+            test_case = self._build_conversational_test_case(conv_data)
+            metric = metric_cls(model=self.llm_manager.get_llm())
+            return self._evaluate_metric(metric, test_case)
+
+        test_cases = [
+            self._build_conversational_test_case(conv_data, b) for b in bounds
+        ]
+        outcomes = asyncio.run(
+            self._a_measure_windows(metric_cls, test_cases, window.max_concurrency)
+        )
+        self.llm_manager.flush_deepevals_pending_tasks()
+
+        return self._reduce_windows(metric_name, window, bounds, outcomes)
+
+    def _reduce_windows(
+        self,
+        metric_name: str,
+        window: ConversationWindowConfig,
+        bounds: list[tuple[int, int]],
+        outcomes: list[Any],
+    ) -> tuple[Optional[float], str]:
+        """Combine per-window results into one score and a per-window report."""
+        window_scores: list[tuple[str, float, str]] = []
+        for (start, end), outcome in zip(bounds, outcomes):
+            label = f"turns {start + 1}-{end}"
+            if isinstance(outcome, BaseException):
+                return None, (
+                    f"DeepEval {metric_name} evaluation failed for window "
+                    f"{label}: {outcome}"
+                )
+            score, reason = self._read_result(outcome)
+            if score is None:
+                return None, f"Window {label} returned no score: {reason}"
+            window_scores.append((label, score, reason))
+
+        combined = _WINDOW_REDUCERS[window.reducer]([s for _, s, _ in window_scores])
+        lowest = min(window_scores, key=lambda item: item[1])
+        per_window = "; ".join(
+            f"{label}: {score:.2f}" for label, score, _ in window_scores
+        )
+        return combined, (
+            f"{window.reducer} of {len(window_scores)} windows "
+            f"(size {window.size}, stride {window.stride or window.size}): "
+            f"{combined:.2f}. Window scores: {per_window}. "
+            f"Lowest window ({lowest[0]}, {lowest[1]:.2f}): {lowest[2]}"
+        )
+
+    async def _a_measure_windows(
+        self,
+        metric_cls: Callable[..., Any],
+        test_cases: list[ConversationalTestCase],
+        max_concurrency: int,
+    ) -> list[Any]:
+        """Measure one metric instance per window concurrently.
+
+        Returns:
+            The measured metric, or the exception raised, for each window.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _measure(test_case: ConversationalTestCase) -> Any:
+            metric = metric_cls(model=self.llm_manager.get_llm())
+            async with semaphore:
+                await metric.a_measure(test_case, _show_indicator=False)
+            return metric
+
+        return list(
+            await asyncio.gather(
+                *(_measure(test_case) for test_case in test_cases),
+                return_exceptions=True,
+            )
+        )
+
     def _evaluate_conversation_completeness(
         self,
         conv_data: Any,
@@ -171,10 +339,12 @@ class DeepEvalMetrics:  # pylint: disable=too-few-public-methods
         if not is_conversation:
             return None, "Conversation completeness is a conversation-level metric"
 
-        test_case = self._build_conversational_test_case(conv_data)
-        metric = ConversationCompletenessMetric(model=self.llm_manager.get_llm())
-
-        return self._evaluate_metric(metric, test_case)
+        return self._evaluate_conversation_metric(
+            "conversation_completeness",
+            ConversationCompletenessMetric,
+            conv_data,
+            self._window_config("conversation_completeness", conv_data),
+        )
 
     def _evaluate_conversation_relevancy(
         self,
@@ -190,11 +360,12 @@ class DeepEvalMetrics:  # pylint: disable=too-few-public-methods
         if not conv_data.turns:
             return None, "No conversation turns available for relevancy evaluation"
 
-        # Use common helper methods
-        test_case = self._build_conversational_test_case(conv_data)
-        metric = TurnRelevancyMetric(model=self.llm_manager.get_llm())
-
-        return self._evaluate_metric(metric, test_case)
+        return self._evaluate_conversation_metric(
+            "conversation_relevancy",
+            TurnRelevancyMetric,
+            conv_data,
+            self._window_config("conversation_relevancy", conv_data),
+        )
 
     def _evaluate_knowledge_retention(
         self,
@@ -210,7 +381,10 @@ class DeepEvalMetrics:  # pylint: disable=too-few-public-methods
         if len(conv_data.turns) < 2:
             return None, "Knowledge retention requires at least 2 turns"
 
-        test_case = self._build_conversational_test_case(conv_data)
-        metric = KnowledgeRetentionMetric(model=self.llm_manager.get_llm())
+        window = self._window_config("knowledge_retention", conv_data)
+        if window is not None and window.size < 2:
+            return None, "Knowledge retention windows require at least 2 turns"
 
-        return self._evaluate_metric(metric, test_case)
+        return self._evaluate_conversation_metric(
+            "knowledge_retention", KnowledgeRetentionMetric, conv_data, window
+        )
@@ -12,9 +12,15 @@ YAML configuration.
   Confines the judge's score output to those ranges. Works alongside
   evaluation_steps: steps define how to evaluate, rubrics define score boundaries.
 - **Final score**: DeepEval normalizes GEval output to [0, 1].
+
+When ``evaluation_steps`` are not configured, the steps DeepEval generates are
+kept in a :class:`~lightspeed_evaluation.core.metrics.geval_steps.GEvalStepsCache`
+and reused for every later turn with the same criteria, params and judge.
 """
 
+import asyncio
 import logging
+from collections.abc import Sequence
 from typing import Any
 
 from deepeval.metrics import GEval
@@ -22,7 +28,13 @@ from deepeval.metrics.g_eval import Rubric
 from deepeval.test_case import LLMTestCase, LLMTestCaseParams
 from pydantic import ValidationError
 
+from lightspeed_evaluation.core.constants import DEFAULT_METRIC_BATCH_CONCURRENCY
 from lightspeed_evaluation.core.llm.deepeval import DeepEvalLLMManager
+from lightspeed_evaluation.core.metrics.geval_steps import (
+    GEvalStepsCache,
+    StepsKey,
+    steps_key,
+)
 from lightspeed_evaluation.core.metrics.manager import MetricLevel, MetricManager
 from lightspeed_evaluation.core.models import GEvalConfig
 from lightspeed_evaluation.core.system.exceptions import ConfigurationError
@@ -30,7 +42,7 @@ from lightspeed_evaluation.core.system.exceptions import ConfigurationError
 logger = logging.getLogger(__name__)
 
 
-class GEvalHandler:  # pylint: disable=R0903
+class GEvalHandler:
     """Handler for configurable GEval metrics.
 
     This class integrates with the lightspeed-evaluation framework
@@ -45,6 +57,7 @@ class GEvalHandler:  # pylint: disable=R0903
         self,
         deepeval_llm_manager: DeepEvalLLMManager,
         metric_manager: MetricManager,
+        steps_cache: GEvalStepsCache | None = None,
     ) -> None:
         """Initialize GEval handler.
 
@@ -52,9 +65,12 @@ class GEvalHandler:  # pylint: disable=R0903
             deepeval_llm_manager: Shared DeepEvalLLMManager instance
             metric_manager: MetricManager for accessing metric metadata
             with proper priority hierarchy
+            steps_cache: Cache of generated evaluation steps, shared across
+            handlers of a run; a private cache is used when omitted
         """
         self.deepeval_llm_manager = deepeval_llm_manager
         self.metric_manager = metric_manager
+        self.steps_cache = steps_cache if steps_cache is not None else GEvalStepsCache()
 
     def evaluate(  # pylint: disable=R0913,R0917
         self,
@@ -99,28 +115,10 @@ class GEvalHandler:  # pylint: disable=R0903
         4. Delegate to `_evaluate_conversation()` or `_evaluate_turn()` depending
            on the `is_conversation` flag.
         """
-        # Extract GEval configuration from metadata (runtime or system registry)
-        raw_config = self._get_geval_config(
-            metric_name, conv_data, turn_data, is_conversation
-        )
-        if not raw_config:
-            return None, f"GEval configuration not found for metric '{metric_name}'"
-
-        # Load/validate GEval config from raw metadata: after override the dict may be
-        # system-only, level-only, or combined. We need a single validated
-        # GEvalConfig (criteria, rubrics, threshold, etc.) for evaluation.
-        try:
-            config = GEvalConfig.from_metadata(raw_config)
-        except (ValueError, ValidationError, ConfigurationError) as e:
-            return None, f"Invalid GEval configuration: {e!s}"
-
-        # Convert validated rubrics to DeepEval Rubric objects
-        rubrics: list[Rubric] | None = None
-        if config.rubrics:
-            rubrics = [
-                Rubric(score_range=r.score_range, expected_outcome=r.expected_outcome)
-                for r in config.rubrics
-            ]
+        config = self._load_config(metric_name, conv_data, turn_data, is_conversation)
+        if isinstance(config, str):
+            return None, config
+        rubrics = self._convert_rubrics(config)
 
         # Perform evaluation based on level (turn or conversation)
         if is_conversation:
@@ -141,6 +139,274 @@ class GEvalHandler:  # pylint: disable=R0903
             rubrics,
         )
 
+    def evaluate_batch(
+        self,
+        metric_name: str,
+        conv_data: Any,
+        turns: Sequence[Any],
+        max_concurrency: int = DEFAULT_METRIC_BATCH_CONCURRENCY,
+    ) -> list[tuple[float | None, str]]:
+        """Evaluate a turn-level GEval metric for many turns concurrently.
+
+        Turns are scored with concurrent ``a_measure`` calls on one event
+        loop. Steps that still have to be generated are generated by a single
+        turn first, and the remaining turns reuse them.
+
+        Args:
+            metric_name: The GEval metric name (without the "geval:" prefix).
+            conv_data: Conversation data the turns belong to.
+            turns: Turn data objects to evaluate.
+            max_concurrency: Maximum number of turns scored at the same time.
+
+        Returns:
+            One (score, reason) tuple per turn, in the same order.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        results: list[tuple[float | None, str] | None] = [None] * len(turns)
+        pending: list[tuple[int, dict[str, Any], LLMTestCase]] = []
+        for idx, turn_data in enumerate(turns):
+            if not turn_data:
+                results[idx] = (None, "Turn data required for turn-level GEval")
+                continue
+            config = self._load_config(metric_name, conv_data, turn_data, False)
+            if isinstance(config, str):
+                results[idx] = (None, config)
+                continue
+            metric_kwargs = self._build_metric_kwargs(
+                "GEval Turn Metric",
+                config.criteria,
+                config.evaluation_params,
+                config.evaluation_steps,
+                config.threshold,
+                self._convert_rubrics(config),
+            )
+            pending.append((idx, metric_kwargs, self._build_turn_test_case(turn_data)))
+
+        if pending:
+            outcomes = asyncio.run(self._a_measure_all(pending, max_concurrency))
+            self.deepeval_llm_manager.flush_deepevals_pending_tasks()
+            for (idx, _, _), outcome in zip(pending, outcomes):
+                if isinstance(outcome, BaseException):
+                    logger.error(
+                        "GEval turn-level evaluation failed: %s: %s",
+                        type(outcome).__name__,
+                        str(outcome),
+                    )
+                    results[idx] = (None, f"GEval evaluation error: {str(outcome)}")
+                else:
+                    results[idx] = self._read_result(outcome, "turn-level")
+
+        return [result for result in results if result is not None]
+
+    async def _a_measure_all(
+        self,
+        pending: list[tuple[int, dict[str, Any], LLMTestCase]],
+        max_concurrency: int,
+    ) -> list[GEval | BaseException]:
+        """Measure prepared turns concurrently, generating missing steps once."""
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _measure(
+            metric_kwargs: dict[str, Any], test_case: LLMTestCase
+        ) -> GEval:
+            key = self._steps_key(metric_kwargs)
+            if key is not None and (steps := self.steps_cache.get(key)):
+                metric_kwargs = {**metric_kwargs, "evaluation_steps": steps}
+            metric = GEval(**metric_kwargs)
+            async with semaphore:
+                await metric.a_measure(test_case, _show_indicator=False)
+            if key is not None:
+                self.steps_cache.put(key, metric.evaluation_steps)
+            return metric
+
+        # One turn per uncached key generates the steps the others then reuse
+        first_per_key: dict[StepsKey, int] = {}
+        for position, (_, metric_kwargs, _) in enumerate(pending):
+            key = self._steps_key(metric_kwargs)
+            if key is not None and self.steps_cache.get(key) is None:
+                first_per_key.setdefault(key, position)
+        leaders = set(first_per_key.values())
+
+        outcomes: dict[int, GEval | BaseException] = {}
+        for batch in (
+            sorted(leaders),
+            [position for position in range(len(pending)) if position not in leaders],
+        ):
+            measured = await asyncio.gather(
+                *(_measure(pending[p][1], pending[p][2]) for p in batch),
+                return_exceptions=True,
+            )
+            outcomes.update(zip(batch, measured))
+        return [outcomes[position] for position in range(len(pending))]
+
+    def _load_config(
+        self,
+        metric_name: str,
+        conv_data: Any,
+        turn_data: Any | None,
+        is_conversation: bool,
+    ) -> GEvalConfig | str:
+        """Resolve and validate the GEval configuration of a metric.
+
+        Returns:
+            The validated configuration, or an error message when it is
+            missing or invalid.
+        """
+        # Extract GEval configuration from metadata (runtime or system registry)
+        raw_config = self._get_geval_config(
+            metric_name, conv_data, turn_data, is_conversation
+        )
+        if not raw_config:
+            return f"GEval configuration not found for metric '{metric_name}'"
+
+        # Load/validate GEval config from raw metadata: after override the dict may be
+        # system-only, level-only, or combined. We need a single validated
+        # GEvalConfig (criteria, rubrics, threshold, etc.) for evaluation.
+        try:
+            return GEvalConfig.from_metadata(raw_config)
+        except (ValueError, ValidationError, ConfigurationError) as e:
+            return f"Invalid GEval configuration: {e!s}"
+
+    @staticmethod
+    def _convert_rubrics(config: GEvalConfig) -> list[Rubric] | None:
+        """Convert validated rubrics to DeepEval Rubric objects."""
+        if not config.rubrics:
+            return None
+        return [
+            Rubric(score_range=r.score_range, expected_outcome=r.expected_outcome)
+            for r in config.rubrics
+        ]
+
+    def _build_metric_kwargs(  # pylint: disable=R0913,R0917
+        self,
+        name: str,
+        criteria: str,
+        evaluation_params: list[str],
+        evaluation_steps: list[str] | None,
+        threshold: float,
+        rubrics: list[Rubric] | None,
+    ) -> dict[str, Any]:
+        """Build the GEval constructor arguments for a runtime configuration."""
+        # Convert evaluation_params to enum values if valid, otherwise use defaults
+        converted_params = self._convert_evaluation_params(evaluation_params)
+
+        metric_kwargs: dict[str, Any] = {
+            "name": name,
+            "criteria": criteria,
+            "evaluation_params": converted_params,
+            "model": self.deepeval_llm_manager.get_llm(),
+            "threshold": threshold,
+            "top_logprobs": 5,  # Vertex/Gemini throws an error if over 20.
+        }
+
+        # Only set evaluation_params if we have valid enum conversions
+        # or if no params were provided at all (then use defaults)
+        if converted_params is None:
+            if not evaluation_params:
+                metric_kwargs["evaluation_params"] = [
+                    LLMTestCaseParams.INPUT,
+                    LLMTestCaseParams.ACTUAL_OUTPUT,
+                ]
+            # else: leave unset so GEval can auto-detect from custom strings
+        else:
+            metric_kwargs["evaluation_params"] = converted_params
+
+        # Add evaluation steps if provided
+        if evaluation_steps:
+            metric_kwargs["evaluation_steps"] = evaluation_steps
+
+        # Add rubrics if provided (confine score ranges; works alongside criteria)
+        if rubrics:
+            metric_kwargs["rubric"] = rubrics
+
+        return metric_kwargs
+
+    def _steps_key(self, metric_kwargs: dict[str, Any]) -> StepsKey | None:
+        """Cache key of the steps GEval would generate, or None if steps are set."""
+        if metric_kwargs.get("evaluation_steps"):
+            return None
+        params = metric_kwargs.get("evaluation_params")
+        return steps_key(
+            self.deepeval_llm_manager.model_name,
+            metric_kwargs["criteria"],
+            [param.value for param in params] if params is not None else None,
+        )
+
+    def _measure(self, metric_kwargs: dict[str, Any], test_case: LLMTestCase) -> GEval:
+        """Build a GEval metric and measure a test case, reusing cached steps.
+
+        The first evaluation of uncached criteria holds the key's generation
+        lock, so concurrent turns wait for its steps instead of generating
+        their own.
+        """
+        key = self._steps_key(metric_kwargs)
+        if key is None:
+            metric = GEval(**metric_kwargs)
+            metric.measure(test_case)
+            return metric
+
+        steps = self.steps_cache.get(key)
+        if steps is None:
+            with self.steps_cache.generating(key):
+                steps = self.steps_cache.get(key)
+                if steps is None:
+                    metric = GEval(**metric_kwargs)
+                    metric.measure(test_case)
+                    self.steps_cache.put(key, metric.evaluation_steps)
+                    return metric
+
+        metric = GEval(**{**metric_kwargs, "evaluation_steps": steps})
+        metric.measure(test_case)
+        return metric
+
+    @staticmethod
+    def _read_result(metric: GEval, level: str) -> tuple[float | None, str]:
+        """Extract score and reason from a measured GEval metric."""
+        score = metric.score
+        reason = (
+            str(metric.reason)
+            if hasattr(metric, "reason") and metric.reason
+            else "No reason provided"
+        )
+
+        # CRITICAL: Warn if score is None (indicates evaluation failure)
+        # None scores indicate evaluation failures that need investigation:
+        # - Rate limiting (429 errors after all retries exhausted)
+        # - LLM judge returning malformed JSON that fails parsing
+        # - Timeout errors from LLM provider
+        # - API quota/credits exhausted
+        # Warning helps identify these failures for debugging.
+        if score is None:
+            logger.warning(
+                "GEval %s metric returned None score. "
+                "This typically indicates LLM judge failure (rate limiting, timeout, "
+                "invalid JSON response, or quota exhausted). Reason: %s",
+                level,
+                reason,
+            )
+
+        return score, reason
+
+    @staticmethod
+    def _build_turn_test_case(turn_data: Any) -> LLMTestCase:
+        """Build the test case for a single turn."""
+        # Prepare test case arguments, only including non-None optional fields
+        test_case_kwargs = {
+            "input": turn_data.query,
+            "actual_output": turn_data.response or "",
+        }
+
+        # Add optional fields only if they have values
+        if turn_data.expected_response:
+            test_case_kwargs["expected_output"] = turn_data.expected_response
+
+        if turn_data.contexts:
+            test_case_kwargs["context"] = turn_data.contexts
+
+        return LLMTestCase(**test_case_kwargs)
+
     def _convert_evaluation_params(
         self, params: list[str]
     ) -> list[LLMTestCaseParams] | None:
@@ -240,87 +506,23 @@ class GEvalHandler:  # pylint: disable=R0903
         if not turn_data:
             return None, "Turn data required for turn-level GEval"
 
-        # Convert evaluation_params to enum values if valid, otherwise use defaults
-        converted_params = self._convert_evaluation_params(evaluation_params)
-
-        # Create GEval metric with runtime configuration
-        metric_kwargs: dict[str, Any] = {
-            "name": "GEval Turn Metric",
-            "criteria": criteria,
-            "evaluation_params": converted_params,
-            "model": self.deepeval_llm_manager.get_llm(),
-            "threshold": threshold,
-            "top_logprobs": 5,
-        }
-
-        # Only set evaluation_params if we have valid enum conversions
-        # or if no params were provided at all (then use defaults)
-        if converted_params is None:
-            if not evaluation_params:
-                metric_kwargs["evaluation_params"] = [
-                    LLMTestCaseParams.INPUT,
-                    LLMTestCaseParams.ACTUAL_OUTPUT,
-                ]
-            # else: leave unset so GEval can auto-detect from custom strings
-        else:
-            metric_kwargs["evaluation_params"] = converted_params
-
-        # Add evaluation steps if provided
-        if evaluation_steps:
-            metric_kwargs["evaluation_steps"] = evaluation_steps
-
-        # Add rubrics if provided (confine score ranges; works alongside criteria)
-        if rubrics:
-            metric_kwargs["rubric"] = rubrics
-
-        # Instantiate the GEval metric object
-        metric = GEval(**metric_kwargs)
-
-        # Prepare test case arguments, only including non-None optional fields
-        test_case_kwargs = {
-            "input": turn_data.query,
-            "actual_output": turn_data.response or "",
-        }
-
-        # Add optional fields only if they have values
-        if turn_data.expected_response:
-            test_case_kwargs["expected_output"] = turn_data.expected_response
-
-        if turn_data.contexts:
-            test_case_kwargs["context"] = turn_data.contexts
+        metric_kwargs = self._build_metric_kwargs(
+            "GEval Turn Metric",
+            criteria,
+            evaluation_params,
+            evaluation_steps,
+            threshold,
+            rubrics,
+        )
 
         # Create test case for a single turn
-        test_case = LLMTestCase(**test_case_kwargs)
+        test_case = self._build_turn_test_case(turn_data)
 
         # Evaluate with retry (DeepEval normalizes score to [0, 1]; pass through as-is)
         try:
-            metric.measure(test_case)
+            metric = self._measure(metric_kwargs, test_case)
             self.deepeval_llm_manager.flush_deepevals_pending_tasks()
-
-            # Extract score and reason
-            score = metric.score
-            reason = (
-                str(metric.reason)
-                if hasattr(metric, "reason") and metric.reason
-                else "No reason provided"
-            )
-
-            # CRITICAL: Warn if score is None (indicates evaluation failure)
-            # None scores indicate evaluation failures that need investigation:
-            # - Rate limiting (429 errors after all retries exhausted)
-            # - LLM judge returning malformed JSON that fails parsing
-            # - Timeout errors from LLM provider
-            # - API quota/credits exhausted
-            # Warning helps identify these failures for debugging.
-            if score is None:
-                logger.warning(
-                    "GEval turn-level metric returned None score. "
-                    "This typically indicates LLM judge failure (rate limiting, timeout, "
-                    "invalid JSON response, or quota exhausted). Reason: %s",
-                    reason,
-                )
-
-            return score, reason
+            return self._read_result(metric, "turn-level")
         except Exception as e:  # pylint: disable=W0718
             logger.error(
                 "GEval turn-level evaluation failed: %s: %s", type(e).__name__, str(e)
@@ -374,38 +576,14 @@ class GEvalHandler:  # pylint: disable=R0903
             tuple[float | None, str]:
                 Tuple of (score, reason). Score is in [0, 1] (per DeepEval). None on error.
         """
-        # Convert evaluation_params to enum values if valid, otherwise use defaults
-        converted_params = self._convert_evaluation_params(evaluation_params)
-
-        # Configure the GEval metric for conversation-level evaluation
-        metric_kwargs: dict[str, Any] = {
-            "name": "GEval Conversation Metric",
-            "criteria": criteria,
-            "evaluation_params": converted_params,
-            "model": self.deepeval_llm_manager.get_llm(),
-            "threshold": threshold,
-            "top_logprobs": 5,  # Vertex/Gemini throws an error if over 20.
-        }
-
-        if converted_params is None:
-            if not evaluation_params:
-                metric_kwargs["evaluation_params"] = [
-                    LLMTestCaseParams.INPUT,
-                    LLMTestCaseParams.ACTUAL_OUTPUT,
-                ]
-        else:
-            metric_kwargs["evaluation_params"] = converted_params
-
-        # Add evaluation steps if provided
-        if evaluation_steps:
-            metric_kwargs["evaluation_steps"] = evaluation_steps
-
-        # Add rubrics if provided (confine score ranges; works alongside criteria)
-        if rubrics:
-            metric_kwargs["rubric"] = rubrics
-
-        # Instantiate the GEval metric object
-        metric = GEval(**metric_kwargs)
+        metric_kwargs = self._build_metric_kwargs(
+            "GEval Conversation Metric",
+            criteria,
+            evaluation_params,
+            evaluation_steps,
+            threshold,
+            rubrics,
+        )
 
         # GEval only accepts LLMTestCase, not ConversationalTestCase
         # Aggregate conversation turns into a single test case
@@ -424,28 +602,9 @@ class GEvalHandler:  # pylint: disable=R0903
 
         # Evaluate with retry (DeepEval normalizes score to [0, 1]; pass through as-is)
         try:
-            metric.measure(test_case)
+            metric = self._measure(metric_kwargs, test_case)
             self.deepeval_llm_manager.flush_deepevals_pending_tasks()
-
-            # Extract score and reason
-            score = metric.score
-            reason = (
-                str(metric.reason)
-                if hasattr(metric, "reason") and metric.reason
-                else "No reason provided"
-            )
-
-            # CRITICAL: Warn if score is None (indicates evaluation failure)
-            # See turn-level evaluation for detailed explanation of why this matters
-            if score is None:
-                logger.warning(
-                    "GEval conversation-level metric returned None score. "
-                    "This typically indicates LLM judge failure (rate limiting, timeout, "
-                    "invalid JSON response, or quota exhausted). Reason: %s",
-                    reason,
-                )
-
-            return score, reason
+            return self._read_result(metric, "conversation-level")
         except Exception as e:  # pylint: disable=W0718
             logger.error(
                 "GEval conversation-level evaluation failed: %s: %s",
@@ -0,0 +1,165 @@
+"""Cache of the evaluation steps DeepEval generates for GEval criteria.
+
+A GEval metric configured with ``criteria`` but no ``evaluation_steps`` asks
+the judge LLM to write the steps before it scores anything. The steps only
+depend on the judge model, the criteria and the evaluation params, so one
+generation can serve every turn of a run and, once persisted next to the run
+output, later runs as well.
+
+This module is deliberately free of DeepEval imports so the pipeline can own
+the cache without loading the framework.
+"""
+
+import json
+import logging
+import threading
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+GEVAL_STEPS_FILENAME = "geval_steps.json"
+GEVAL_STEPS_VERSION = 1
+
+StepsKey = tuple[str, str, Optional[tuple[str, ...]]]
+
+
+def steps_key(
+    model: str, criteria: str, evaluation_params: Optional[Sequence[str]]
+) -> StepsKey:
+    """Build the cache key of a step generation.
+
+    Args:
+        model: Judge model name.
+        criteria: GEval criteria text.
+        evaluation_params: Names of the test case fields GEval evaluates, in
+            order, or None when GEval detects them itself.
+
+    Returns:
+        Hashable key identifying the generation prompt.
+    """
+    params = tuple(evaluation_params) if evaluation_params is not None else None
+    return (model, criteria, params)
+
+
+class GEvalStepsCache:
+    """Thread-safe store of generated GEval evaluation steps.
+
+    Concurrent evaluations of the same uncached criteria are serialized with
+    :meth:`generating`, so the steps are generated once rather than once per
+    worker thread.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._steps: dict[StepsKey, list[str]] = {}
+        self._key_locks: dict[StepsKey, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+
+    def __len__(self) -> int:
+        """Number of cached step lists."""
+        with self._lock:
+            return len(self._steps)
+
+    def get(self, key: StepsKey) -> Optional[list[str]]:
+        """Return the cached steps for a key, if any."""
+        with self._lock:
+            steps = self._steps.get(key)
+        return list(steps) if steps is not None else None
+
+    def put(self, key: StepsKey, steps: Any) -> bool:
+        """Store generated steps; anything but a non-empty list of strings is ignored.
+
+        Args:
+            key: Key from :func:`steps_key`.
+            steps: Steps read back from the GEval metric.
+
+        Returns:
+            True if the steps were stored.
+        """
+        if not (
+            isinstance(steps, list)
+            and steps
+            and all(isinstance(step, str) for step in steps)
+        ):
+            return False
+        with self._lock:
+            if self._steps.get(key) != steps:
+                self._steps[key] = list(steps)
+                self._dirty = True
+        return True
+
+    @contextmanager
+    def generating(self, key: StepsKey) -> Iterator[None]:
+        """Hold the generation lock of a key for the enclosed block."""
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            yield
+
+    def load(self, path: Path) -> int:
+        """Merge steps persisted by an earlier run.
+
+        A missing file is not an error; an unreadable one is logged and
+        skipped so a corrupt cache never fails a run.
+
+        Args:
+            path: Steps file written by :meth:`save`.
+
+        Returns:
+            Number of entries loaded.
+        """
+        if not path.is_file():
+            return 0
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            entries = (
+                data["entries"] if data.get("version") == GEVAL_STEPS_VERSION else []
+            )
+            loaded = 0
+            for entry in entries:
+                key = steps_key(
+                    entry["model"], entry["criteria"], entry["evaluation_params"]
+                )
+                if self.put(key, entry["steps"]):
+                    loaded += 1
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.warning("Ignoring unreadable GEval steps file %s: %s", path, e)
+            return 0
+        with self._lock:
+            self._dirty = False
+        if loaded:
+            logger.info("Loaded %d cached GEval evaluation step lists", loaded)
+        return loaded
+
+    def save(self, path: Path) -> bool:
+        """Write the cache if anything was generated since it was loaded.
+
+        Args:
+            path: Destination file (parent directory is created if missing).
+
+        Returns:
+            True if the file was written.
+        """
+        with self._lock:
+            if not self._dirty:
+                return False
+            entries = [
+                {
+                    "model": model,
+                    "criteria": criteria,
+                    "evaluation_params": list(params) if params is not None else None,
+                    "steps": steps,
+                }
+                for (model, criteria, params), steps in self._steps.items()
+            ]
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"version": GEVAL_STEPS_VERSION, "entries": entries}, f, indent=2)
+        with self._lock:
+            self._dirty = False
+        return True
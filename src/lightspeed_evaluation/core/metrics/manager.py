@@ -47,6 +47,30 @@ class MetricManager:
         # Use specified metrics as-is
         return metrics
 
+    def resolve_frameworks(self, evaluation_data: list[EvaluationData]) -> set[str]:
+        """Collect the metric frameworks used anywhere in the evaluation data.
+
+        Args:
+            evaluation_data: Conversations to be evaluated
+
+        Returns:
+            Framework names (e.g. "ragas", "nlp") of all resolved metrics
+        """
+        frameworks: set[str] = set()
+        for conv_data in evaluation_data:
+            metric_lists = [
+                self.resolve_metrics(turn.turn_metrics, MetricLevel.TURN)
+                for turn in conv_data.turns
+            ]
+            metric_lists.append(
+                self.resolve_metrics(
+                    conv_data.conversation_metrics, MetricLevel.CONVERSATION
+                )
+            )
+            for metrics in metric_lists:
+                frameworks.update(metric.split(":", 1)[0] for metric in metrics)
+        return frameworks
+
     def get_metric_metadata(
         self,
         metric_identifier: str,
@@ -112,6 +136,79 @@ class MetricManager:
         )
         return metadata.get("threshold") if metadata else None
 
+    def get_metric_gates(
+        self,
+        metric_identifier: str,
+        level: MetricLevel,
+        conv_data: Optional[EvaluationData] = None,
+        turn_data: Optional[TurnData] = None,
+    ) -> list[str]:
+        """Get the metrics that must pass before a metric is evaluated.
+
+        Gates come from the ``gated_by`` key of the effective metadata and
+        may be a single metric identifier or a list of them.
+
+        Args:
+            metric_identifier: The gated metric
+            level: Whether this is TURN or CONVERSATION level
+            conv_data: Conversation data for conversation-level metadata
+            turn_data: Turn data for turn-specific metadata
+
+        Returns:
+            Gate metric identifiers (empty when the metric is not gated)
+        """
+        metadata = self.get_metric_metadata(
+            metric_identifier, level, conv_data, turn_data
+        )
+        gates = metadata.get("gated_by") if isinstance(metadata, dict) else None
+        if isinstance(gates, str):
+            gates = [gates]
+        if not isinstance(gates, list):
+            return []
+        return [
+            gate
+            for gate in gates
+            if isinstance(gate, str) and gate and gate != metric_identifier
+        ]
+
+    def order_by_gates(
+        self,
+        metrics: list[str],
+        level: MetricLevel,
+        conv_data: Optional[EvaluationData] = None,
+        turn_data: Optional[TurnData] = None,
+    ) -> list[str]:
+        """Order metrics so every gate is evaluated before the metrics it gates.
+
+        The configured order is kept wherever the gates allow it. Metrics
+        caught in a gating cycle keep their configured order.
+
+        Args:
+            metrics: Metrics to evaluate, in configured order
+            level: Whether this is TURN or CONVERSATION level
+            conv_data: Conversation data for conversation-level metadata
+            turn_data: Turn data for turn-specific metadata
+
+        Returns:
+            The same metrics, gates first
+        """
+        pending = {
+            metric: set(
+                self.get_metric_gates(metric, level, conv_data, turn_data)
+            ).intersection(metrics)
+            for metric in metrics
+        }
+        ordered: list[str] = []
+        while pending:
+            ready = [metric for metric in pending if not pending[metric] - set(ordered)]
+            if not ready:
+                ordered.extend(pending)
+                break
+            for metric in ready:
+                ordered.append(metric)
+                del pending[metric]
+        return ordered
+
     def _get_level_metadata(
         self,
         level: MetricLevel,
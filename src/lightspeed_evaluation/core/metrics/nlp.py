@@ -10,17 +10,23 @@ This module provides text comparison metrics that don't require LLM calls:
 import logging
 from typing import Any, Optional
 
-from ragas.metrics.collections import NonLLMStringSimilarity, RougeScore
+from ragas.metrics.collections import (
+    DistanceMeasure,
+    NonLLMStringSimilarity,
+    RougeScore,
+)
 
 from lightspeed_evaluation.core.constants import (
     DEFAULT_BLEU_MAX_NGRAM,
-    DISTANCE_MEASURE_MAP,
     MAX_BLEU_NGRAM,
     MIN_BLEU_NGRAM,
     ROUGE_MODE_FMEASURE,
     ROUGE_MODE_PRECISION,
     ROUGE_MODE_RECALL,
     ROUGE_TYPE_ROUGEL,
+    SIMILARITY_HAMMING,
+    SIMILARITY_JARO,
+    SIMILARITY_JARO_WINKLER,
     SIMILARITY_LEVENSHTEIN,
     SUPPORTED_SIMILARITY_MEASURES,
 )
@@ -32,6 +38,13 @@ logger = logging.getLogger(__name__)
 
 _DEFAULT_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
 
+DISTANCE_MEASURE_MAP = {
+    SIMILARITY_LEVENSHTEIN: DistanceMeasure.LEVENSHTEIN,
+    SIMILARITY_HAMMING: DistanceMeasure.HAMMING,
+    SIMILARITY_JARO: DistanceMeasure.JARO,
+    SIMILARITY_JARO_WINKLER: DistanceMeasure.JARO_WINKLER,
+}
+
 
 class NLPMetrics:  # pylint: disable=too-few-public-methods
     """Handles NLP-based metrics evaluation using Ragas non-LLM metrics.
@@ -1,14 +1,14 @@
 """Ragas metrics evaluation using LLM Manager with Ragas 0.4+ API."""
 
+import asyncio
+import contextvars
 import errno
 import logging
 import math
 import threading
-from typing import Any, Optional
+from collections.abc import Callable, Coroutine, Sequence
+from typing import Any, Optional, TypeVar
 
-import litellm
-from litellm.caching.caching import Cache
-from litellm.types.caching import CachingSupportedCallTypes, LiteLLMCacheType
 from ragas.metrics.collections import (
     AnswerRelevancy,
     ContextPrecision,
@@ -18,12 +18,12 @@ from ragas.metrics.collections import (
     Faithfulness,
 )
 
+from lightspeed_evaluation.core.constants import DEFAULT_METRIC_BATCH_CONCURRENCY
 from lightspeed_evaluation.core.embedding.manager import (
     EmbeddingError,
     EmbeddingManager,
 )
 from lightspeed_evaluation.core.embedding.ragas import RagasEmbeddingManager
-from lightspeed_evaluation.core.llm.litellm_patch import litellm_state_lock
 from lightspeed_evaluation.core.llm.manager import LLMManager
 from lightspeed_evaluation.core.llm.ragas import RagasLLMManager
 from lightspeed_evaluation.core.models import EvaluationScope, TurnData
@@ -31,6 +31,8 @@ from lightspeed_evaluation.core.system.exceptions import EvaluationError
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 _DEPRECATED_RAGAS_METRICS: dict[str, str] = {
     "context_precision_with_reference": "context_precision",
     "context_precision_without_reference": "context_utilization",
@@ -46,11 +48,82 @@ def _clamp_score(score: float) -> float:
     return max(0.0, min(1.0, score))
 
 
-class RagasMetrics:  # pylint: disable=too-few-public-methods
+class _ScoringLoop:
+    """Long-lived event loop on a daemon thread for Ragas ``ascore`` calls.
+
+    Ragas' synchronous ``score()`` wraps ``ascore()`` in ``asyncio.run()``,
+    creating and tearing down an event loop for every metric of every turn.
+    Submitting to one persistent loop avoids that churn and lets batches of
+    turns be scored concurrently. Coroutines run in a copy of the caller's
+    context, so the token tracker and active trace span still apply.
+    """
+
+    def __init__(self) -> None:
+        """Initialize without starting the loop; it starts on first use."""
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def _ensure_running(self) -> asyncio.AbstractEventLoop:
+        """Return the running loop, starting its thread if needed."""
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever,
+                    name="ragas-scoring-loop",
+                    daemon=True,
+                )
+                thread.start()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    def run(self, coro: Coroutine[Any, Any, _T]) -> _T:
+        """Run a coroutine on the loop and block until it completes.
+
+        Args:
+            coro: Coroutine to run.
+
+        Returns:
+            The coroutine's result.
+
+        Raises:
+            RuntimeError: If called from the loop's own thread.
+        """
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("Cannot block on the Ragas scoring loop from itself")
+        loop = self._ensure_running()
+        context = contextvars.copy_context()
+
+        async def _in_caller_context() -> _T:
+            return await asyncio.get_running_loop().create_task(coro, context=context)
+
+        return asyncio.run_coroutine_threadsafe(_in_caller_context(), loop).result()
+
+    def close(self) -> None:
+        """Stop the loop and wait for its thread to exit.
+
+        Only call when no scoring is in flight; the loop restarts on next use.
+        """
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or thread is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+class RagasMetrics:  # pylint: disable=too-many-instance-attributes
     """Handles Ragas metrics evaluation using LLM Manager with Ragas 0.4+ API.
 
-    Ragas 0.4+ uses collections-based metrics with direct .score() calls.
-    We use the synchronous score() method since litellm.completion is synchronous.
+    Ragas 0.4+ uses collections-based metrics. Metric objects are built once
+    per handler (one handler per judge LLM) and reused, and their ``ascore()``
+    coroutines run on the handler's long-lived event loop rather than through
+    the synchronous ``score()``, which starts a new loop for every call. Call
+    :meth:`close` to stop the loop once the handler is no longer used.
     """
 
     def __init__(self, llm_manager: LLMManager, embedding_manager: EmbeddingManager):
@@ -61,35 +134,24 @@ class RagasMetrics:  # pylint: disable=too-few-public-methods
             embedding_manager: EmbeddingManager; validation is deferred until
                 a metric requiring embeddings is evaluated.
         """
-        # litellm.cache is process-global; serialize setup with the shared lock
-        # so that concurrent pipelines don't race.
-        llm_cache_enabled = llm_manager.get_config().cache_enabled
-        embedding_cache_enabled = embedding_manager.config.cache_enabled
-        if llm_cache_enabled or embedding_cache_enabled:
-            with litellm_state_lock:
-                if litellm.cache is None:
-                    # Build supported call types based on individual cache flags
-                    supported_call_types: list[CachingSupportedCallTypes] = []
-                    if llm_cache_enabled:
-                        supported_call_types.extend(["completion", "acompletion"])
-                    if embedding_cache_enabled:
-                        supported_call_types.extend(["embedding", "aembedding"])
-
-                    cache_dir = llm_manager.get_config().cache_dir
-                    litellm.cache = Cache(
-                        type=LiteLLMCacheType.DISK,
-                        disk_cache_dir=cache_dir,
-                        supported_call_types=supported_call_types,
-                    )
-
         # Create Ragas LLM Manager for metric configuration
         self.llm_manager = RagasLLMManager(llm_manager)
         # Store base embedding manager for lazy initialization of RagasEmbeddingManager
         self._embedding_manager = embedding_manager
         self._ragas_embedding_manager: Optional[RagasEmbeddingManager] = None
         self._embedding_lock = threading.Lock()
-
-        self.supported_metrics = {
+        # Metric instances keyed by metric class, built on first use
+        self._metrics: dict[type, Any] = {}
+        self._metrics_lock = threading.Lock()
+        self._scoring_loop = _ScoringLoop()
+
+        self.supported_metrics: dict[
+            str,
+            Callable[
+                [Any, Optional[int], Optional[TurnData], bool],
+                Coroutine[Any, Any, tuple[Optional[float], str]],
+            ],
+        ] = {
             # Response evaluation metrics
             "faithfulness": self._evaluate_faithfulness,
             "response_relevancy": self._evaluate_response_relevancy,
@@ -120,6 +182,22 @@ class RagasMetrics:  # pylint: disable=too-few-public-methods
                     )
         return self._ragas_embedding_manager
 
+    def _get_metric(self, metric_cls: type, factory: Callable[[], Any]) -> Any:
+        """Return the cached instance of a Ragas metric, building it once.
+
+        Args:
+            metric_cls: Metric class, used as the cache key.
+            factory: Builds the metric on first use.
+        """
+        metric = self._metrics.get(metric_cls)
+        if metric is None:
+            with self._metrics_lock:
+                metric = self._metrics.get(metric_cls)
+                if metric is None:
+                    metric = factory()
+                    self._metrics[metric_cls] = metric
+        return metric
+
     def _extract_turn_data(
         self, turn_data: Optional[TurnData]
     ) -> tuple[str, str, list[str]]:
@@ -142,6 +220,53 @@ class RagasMetrics:  # pylint: disable=too-few-public-methods
         scope: EvaluationScope,
     ) -> tuple[Optional[float], str]:
         """Evaluate a Ragas metric."""
+        if not self._check_metric(metric_name):
+            return None, f"Unsupported Ragas metric: {metric_name}"
+
+        return self._scoring_loop.run(self._ascore(metric_name, conv_data, scope))
+
+    def evaluate_batch(
+        self,
+        metric_name: str,
+        conv_data: Any,
+        scopes: Sequence[EvaluationScope],
+        max_concurrency: int = DEFAULT_METRIC_BATCH_CONCURRENCY,
+    ) -> list[tuple[Optional[float], str]]:
+        """Evaluate a Ragas metric for many turns concurrently.
+
+        Args:
+            metric_name: Ragas metric name.
+            conv_data: Conversation data the turns belong to.
+            scopes: Evaluation scope of each turn.
+            max_concurrency: Maximum number of turns scored at the same time.
+
+        Returns:
+            One (score, reason) tuple per scope, in the same order.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if not self._check_metric(metric_name):
+            return [(None, f"Unsupported Ragas metric: {metric_name}")] * len(scopes)
+        if not scopes:
+            return []
+
+        async def _score_all() -> list[tuple[Optional[float], str]]:
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def _score(scope: EvaluationScope) -> tuple[Optional[float], str]:
+                async with semaphore:
+                    return await self._ascore(metric_name, conv_data, scope)
+
+            return list(await asyncio.gather(*(_score(scope) for scope in scopes)))
+
+        return self._scoring_loop.run(_score_all())
+
+    def close(self) -> None:
+        """Stop the scoring loop; it restarts if the handler is used again."""
+        self._scoring_loop.close()
+
+    def _check_metric(self, metric_name: str) -> bool:
+        """Warn about deprecated names and report whether a metric is supported."""
         if metric_name in _DEPRECATED_RAGAS_METRICS:
             new_name = _DEPRECATED_RAGAS_METRICS[metric_name]
             logger.warning(
@@ -149,12 +274,17 @@ class RagasMetrics:  # pylint: disable=too-few-public-methods
                 metric_name,
                 new_name,
             )
+        return metric_name in self.supported_metrics
 
-        if metric_name not in self.supported_metrics:
-            return None, f"Unsupported Ragas metric: {metric_name}"
-
+    async def _ascore(
+        self,
+        metric_name: str,
+        conv_data: Any,
+        scope: EvaluationScope,
+    ) -> tuple[Optional[float], str]:
+        """Score one supported metric, converting failures into a reason."""
         try:
-            result = self.supported_metrics[metric_name](
+            result = await self.supported_metrics[metric_name](
                 conv_data, scope.turn_idx, scope.turn_data, scope.is_conversation
             )
         except BrokenPipeError as e:
@@ -190,45 +320,50 @@ class RagasMetrics:  # pylint: disable=too-few-public-methods
 
         return result
 
-    def _evaluate_response_relevancy(
+    async def _evaluate_response_relevancy(
         self,
         _conv_data: Any,
         _turn_idx: Optional[int],
         turn_data: Optional[TurnData],
         is_conversation: bool,
     ) -> tuple[Optional[float], str]:
-        """Evaluate response relevancy using Ragas 0.4+ score()."""
+        """Evaluate response relevancy using Ragas 0.4+ ascore()."""
         if is_conversation:
             return None, "Response relevancy is a turn-level metric"
 
         query, response, _ = self._extract_turn_data(turn_data)
 
-        metric = AnswerRelevancy(
-            llm=self.llm_manager.get_llm(),
-            embeddings=self.embedding_manager.embeddings,
+        metric = self._get_metric(
+            AnswerRelevancy,
+            lambda: AnswerRelevancy(
+                llm=self.llm_manager.get_llm(),
+                embeddings=self.embedding_manager.embeddings,
+            ),
         )
 
-        result = metric.score(user_input=query, response=response)
+        result = await metric.ascore(user_input=query, response=response)
 
         score = _clamp_score(float(result.value))
         return score, f"Ragas response relevancy: {score:.2f}"
 
-    def _evaluate_faithfulness(
+    async def _evaluate_faithfulness(
         self,
         _conv_data: Any,
         _turn_idx: Optional[int],
         turn_data: Optional[TurnData],
         is_conversation: bool,
     ) -> tuple[Optional[float], str]:
-        """Evaluate faithfulness using Ragas 0.4+ score()."""
+        """Evaluate faithfulness using Ragas 0.4+ ascore()."""
         if is_conversation:
             return None, "Faithfulness is a turn-level metric"
 
         query, response, contexts = self._extract_turn_data(turn_data)
 
-        metric = Faithfulness(llm=self.llm_manager.get_llm())
+        metric = self._get_metric(
+            Faithfulness, lambda: Faithfulness(llm=self.llm_manager.get_llm())
+        )
 
-        result = metric.score(
+        result = await metric.ascore(
             user_input=query,
             response=response,
             retrieved_contexts=contexts,
@@ -237,7 +372,7 @@ class RagasMetrics:  # pylint: disable=too-few-public-methods
         score = _clamp_score(float(result.value))
         return score, f"Ragas faithfulness: {score:.2f}"
 
-    def _evaluate_context_utilization(
+    async def _evaluate_context_utilization(
         self,
         _conv_data: Any,
         _turn_idx: Optional[int],
@@ -250,9 +385,12 @@ class RagasMetrics:  # pylint: disable=too-few-public-methods
 
         query, response, contexts = self._extract_turn_data(turn_data)
 
-        metric = ContextUtilization(llm=self.llm_manager.get_llm())
+        metric = self._get_metric(
+            ContextUtilization,
+            lambda: ContextUtilization(llm=self.llm_manager.get_llm()),
+        )
 
-        result = metric.score(
+        result = await metric.ascore(
             user_input=query,
             response=response,
             retrieved_contexts=contexts,
@@ -261,7 +399,7 @@ class RagasMetrics:  # pylint: disable=too-few-public-methods
         score = _clamp_score(float(result.value))
         return score, f"Ragas context utilization: {score:.2f}"
 
-    def _evaluate_context_precision(
+    async def _evaluate_context_precision(
         self,
         _conv_data: Any,
         _turn_idx: Optional[int],
@@ -277,9 +415,11 @@ class RagasMetrics:  # pylint: disable=too-few-public-methods
 
         query, _, contexts = self._extract_turn_data(turn_data)
 
-        metric = ContextPrecision(llm=self.llm_manager.get_llm())
+        metric = self._get_metric(
+            ContextPrecision, lambda: ContextPrecision(llm=self.llm_manager.get_llm())
+        )
 
-        result = metric.score(
+        result = await metric.ascore(
             user_input=query,
             reference=turn_data.expected_response or "",
             retrieved_contexts=contexts,
@@ -288,14 +428,14 @@ class RagasMetrics:  # pylint: disable=too-few-public-methods
         score = _clamp_score(float(result.value))
         return score, f"Ragas context precision: {score:.2f}"
 
-    def _evaluate_context_recall(
+    async def _evaluate_context_recall(
         self,
         _conv_data: Any,
         _turn_idx: Optional[int],
         turn_data: Optional[TurnData],
         is_conversation: bool,
     ) -> tuple[Optional[float], str]:
-        """Evaluate context recall using Ragas 0.4+ score()."""
+        """Evaluate context recall using Ragas 0.4+ ascore()."""
         if is_conversation:
             return None, "Context recall is a turn-level metric"
 
@@ -304,9 +444,11 @@ class RagasMetrics:  # pylint: disable=too-few-public-methods
 
         query, _, contexts = self._extract_turn_data(turn_data)
 
-        metric = ContextRecall(llm=self.llm_manager.get_llm())
+        metric = self._get_metric(
+            ContextRecall, lambda: ContextRecall(llm=self.llm_manager.get_llm())
+        )
 
-        result = metric.score(
+        result = await metric.ascore(
             user_input=query,
             retrieved_contexts=contexts,
             reference=turn_data.expected_response or "",
@@ -315,22 +457,24 @@ class RagasMetrics:  # pylint: disable=too-few-public-methods
         score = _clamp_score(float(result.value))
         return score, f"Ragas context recall: {score:.2f}"
 
-    def _evaluate_context_relevance(
+    async def _evaluate_context_relevance(
         self,
         _conv_data: Any,
         _turn_idx: Optional[int],
         turn_data: Optional[TurnData],
         is_conversation: bool,
     ) -> tuple[Optional[float], str]:
-        """Evaluate context relevance using Ragas 0.4+ score()."""
+        """Evaluate context relevance using Ragas 0.4+ ascore()."""
         if is_conversation:
             return None, "Context relevance is a turn-level metric"
 
         query, _, contexts = self._extract_turn_data(turn_data)
 
-        metric = ContextRelevance(llm=self.llm_manager.get_llm())
+        metric = self._get_metric(
+            ContextRelevance, lambda: ContextRelevance(llm=self.llm_manager.get_llm())
+        )
 
-        result = metric.score(
+        result = await metric.ascore(
             user_input=query,
             retrieved_contexts=contexts,
         )
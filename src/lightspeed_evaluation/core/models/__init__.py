@@ -25,14 +25,24 @@ from lightspeed_evaluation.core.models.data import (
     TurnData,
 )
 from lightspeed_evaluation.core.models.llm import (
+    ConversationWindowConfig,
     EmbeddingConfig,
     GEvalConfig,
     GEvalRubricConfig,
+    JudgeEscalationConfig,
     JudgePanelConfig,
     LLMConfig,
     LLMPoolConfig,
 )
 from lightspeed_evaluation.core.models.mixins import StreamingMetricsMixin
+from lightspeed_evaluation.core.models.plan import MetricPlan, PlannedCalls, RunPlan
+from lightspeed_evaluation.core.models.sampling import (
+    PassRateEstimate,
+    SampledPassRates,
+    SamplingPlan,
+    SamplingStratum,
+)
+from lightspeed_evaluation.core.models.sequential import SequentialTestResult
 from lightspeed_evaluation.core.models.statistics import (
     AgentTokenUsage,
     ConfidenceInterval,
@@ -42,14 +52,21 @@ from lightspeed_evaluation.core.models.statistics import (
     NumericStats,
     OverallStats,
     ScoreStatistics,
+    StageTiming,
     StreamingStats,
     TagStats,
 )
 from lightspeed_evaluation.core.models.system import (
     APIConfig,
+    BatchJudgeConfig,
+    BudgetConfig,
+    BudgetLimitConfig,
     CoreConfig,
     LoggingConfig,
+    ProfilingConfig,
+    SequentialTestConfig,
     SystemConfig,
+    TracingConfig,
     VisualizationConfig,
 )
 from lightspeed_evaluation.core.models.trace import (
@@ -85,17 +102,25 @@ __all__ = [
     "EvaluationResult",
     "EvaluationScope",
     # Metric metadata models (GEval config, etc.)
+    "ConversationWindowConfig",
     "GEvalConfig",
     "GEvalRubricConfig",
     # System config models
     "CoreConfig",
+    "JudgeEscalationConfig",
     "JudgePanelConfig",
     "LLMConfig",
     "LLMPoolConfig",
     "EmbeddingConfig",
     "APIConfig",
+    "BatchJudgeConfig",
+    "BudgetConfig",
+    "BudgetLimitConfig",
     "LoggingConfig",
+    "ProfilingConfig",
+    "SequentialTestConfig",
     "SystemConfig",
+    "TracingConfig",
     "VisualizationConfig",
     # Stats models
     "NumericStats",
@@ -108,6 +133,18 @@ __all__ = [
     "AgentTokenUsage",
     "ConfidenceInterval",
     "DetailedStats",
+    "StageTiming",
+    # Sampling models
+    "SamplingPlan",
+    "SamplingStratum",
+    "PassRateEstimate",
+    "SampledPassRates",
+    # Sequential test models
+    "SequentialTestResult",
+    # Dry-run plan models
+    "PlannedCalls",
+    "MetricPlan",
+    "RunPlan",
     # API models
     "APIRequest",
     "APIResponse",
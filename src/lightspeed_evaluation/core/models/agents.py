@@ -15,6 +15,9 @@ from pydantic import (
 
 from lightspeed_evaluation.core.constants import (
     DEFAULT_API_BASE,
+    DEFAULT_API_KEEPALIVE_EXPIRY,
+    DEFAULT_API_MAX_CONNECTIONS,
+    DEFAULT_API_MAX_KEEPALIVE_CONNECTIONS,
     DEFAULT_API_NUM_RETRIES,
     DEFAULT_API_TIMEOUT,
     DEFAULT_API_VERSION,
@@ -102,6 +105,39 @@ class HttpApiBaseFields(BaseModel):
     timeout: int = Field(
         default=DEFAULT_API_TIMEOUT, ge=1, description="Request timeout in seconds"
     )
+    connect_timeout: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Connection timeout in seconds (defaults to timeout)",
+    )
+    read_timeout: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Timeout between received chunks in seconds (defaults to timeout)",
+    )
+    http2: bool = Field(
+        default=False,
+        description="Use HTTP/2 when the server supports it (requires 'h2')",
+    )
+    max_connections: int = Field(
+        default=DEFAULT_API_MAX_CONNECTIONS,
+        ge=1,
+        description="Maximum concurrent connections to the API",
+    )
+    max_keepalive_connections: int = Field(
+        default=DEFAULT_API_MAX_KEEPALIVE_CONNECTIONS,
+        ge=0,
+        description="Maximum idle connections kept open for reuse",
+    )
+    keepalive_expiry: float = Field(
+        default=DEFAULT_API_KEEPALIVE_EXPIRY,
+        ge=0,
+        description="Seconds an idle connection is kept open",
+    )
+    async_client: bool = Field(
+        default=False,
+        description="Query the agent with the async API client on one event loop",
+    )
     provider: Optional[str] = Field(default=None, description="LLM provider for API")
     model: Optional[str] = Field(default=None, description="LLM model for API")
     no_tools: Optional[bool] = Field(
@@ -653,7 +653,16 @@ class JudgeScore(BaseModel):
     reason: str = Field(default="", description="Explanation from this judge")
     judge_input_tokens: int = Field(default=0, ge=0, description="Input tokens used")
     judge_output_tokens: int = Field(default=0, ge=0, description="Output tokens used")
+    judge_cached_input_tokens: int = Field(
+        default=0,
+        ge=0,
+        description="Input tokens read from the provider's prompt cache",
+    )
     embedding_tokens: int = Field(default=0, ge=0, description="Embedding tokens used")
+    consulted: bool = Field(
+        default=True,
+        description="False when the judge was not called (e.g. no escalation needed)",
+    )
 
 
 class MetricResult(BaseModel):
@@ -676,11 +685,29 @@ class MetricResult(BaseModel):
     judge_llm_output_tokens: int = Field(
         default=0, ge=0, description="Judge LLM output tokens used"
     )
+    judge_llm_input_tokens_saved: int = Field(
+        default=0,
+        ge=0,
+        description="Estimated judge LLM input tokens saved by a fused judge call",
+    )
+    judge_llm_cached_input_tokens: int = Field(
+        default=0,
+        ge=0,
+        description="Judge LLM input tokens read from the provider's prompt cache",
+    )
     embedding_tokens: int = Field(default=0, ge=0, description="Embedding tokens used")
     judge_scores: Optional[list[JudgeScore]] = Field(
         default=None,
         description="Per-judge scores when using judge panel (for transparency)",
     )
+    expected_responses_evaluated: Optional[int] = Field(
+        default=None,
+        ge=0,
+        description=(
+            "Number of expected_response alternatives scored, when the turn "
+            "lists several"
+        ),
+    )
 
     @field_validator("result")
     @classmethod
@@ -2,7 +2,7 @@
 
 import logging
 import os
-from typing import Any, Optional
+from typing import Any, Literal, Optional
 
 from pydantic import (
     BaseModel,
@@ -21,6 +21,7 @@ from lightspeed_evaluation.core.constants import (
     DEFAULT_LLM_PROVIDER,
     DEFAULT_LLM_RETRIES,
     DEFAULT_LLM_TEMPERATURE,
+    DEFAULT_METRIC_BATCH_CONCURRENCY,
     DEFAULT_SSL_CERT_FILE,
     DEFAULT_SSL_VERIFY,
 )
@@ -43,6 +44,7 @@ FORBIDDEN_PARAMETER_KEYS = frozenset(
         "ssl_cert_file",
         "cache_enabled",
         "cache_dir",
+        "prompt_caching",
         # Provider/client fields
         "provider",
         "client",
@@ -121,6 +123,20 @@ class LLMConfig(BaseModel):
     cache_enabled: bool = Field(
         default=True, description="Is caching of 'LLM as a judge' queries enabled?"
     )
+    prompt_caching: bool = Field(
+        default=True,
+        description="Send provider prompt-caching hints for static prompt prefixes",
+    )
+    input_cost_per_million_tokens: Optional[float] = Field(
+        default=None,
+        ge=0,
+        description="Price of one million input tokens (for cost budgets)",
+    )
+    output_cost_per_million_tokens: Optional[float] = Field(
+        default=None,
+        ge=0,
+        description="Price of one million output tokens (for cost budgets)",
+    )
     parameters: dict[str, Any] = Field(
         default_factory=dict,
         description="Internal: dynamic LLM parameters for API calls",
@@ -262,6 +278,10 @@ class LLMDefaultsConfig(BaseModel):
         default=None,
         description="Base cache directory",
     )
+    prompt_caching: bool = Field(
+        default=True,
+        description="Send provider prompt-caching hints for static prompt prefixes",
+    )
 
     timeout: int = Field(
         default=DEFAULT_API_TIMEOUT,
@@ -349,6 +369,22 @@ class LLMProviderConfig(BaseModel):
         ge=1,
         description="Override timeout for this model",
     )
+    prompt_caching: Optional[bool] = Field(
+        default=None,
+        description="Override prompt-caching hints for this model",
+    )
+
+    # Prices, used to enforce cost budgets
+    input_cost_per_million_tokens: Optional[float] = Field(
+        default=None,
+        ge=0,
+        description="Price of one million input tokens",
+    )
+    output_cost_per_million_tokens: Optional[float] = Field(
+        default=None,
+        ge=0,
+        description="Price of one million output tokens",
+    )
 
 
 class LLMPoolConfig(BaseModel):
@@ -431,11 +467,46 @@ class LLMPoolConfig(BaseModel):
             ssl_cert_file=entry.ssl_cert_file,
             cache_enabled=self.defaults.cache_enabled,
             cache_dir=cache_dir,
+            prompt_caching=(
+                entry.prompt_caching
+                if entry.prompt_caching is not None
+                else self.defaults.prompt_caching
+            ),
+            input_cost_per_million_tokens=entry.input_cost_per_million_tokens,
+            output_cost_per_million_tokens=entry.output_cost_per_million_tokens,
             # Note: api_base and api_key_path are not propagated yet - requires LLMConfig extension
         )
         return config.model_copy(update={"parameters": merged_params})
 
 
+class JudgeEscalationConfig(BaseModel):
+    """Cost-aware escalation within a judge panel.
+
+    The leading judges of the panel are asked first; the remaining judges
+    are only consulted when that first opinion is uncertain.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    initial_judges: int = Field(
+        default=1,
+        ge=1,
+        description=(
+            "Number of leading panel judges asked first "
+            "(list the cheapest judges first in judge_panel.judges)"
+        ),
+    )
+    margin: float = Field(
+        default=0.1,
+        ge=0.0,
+        le=1.0,
+        description=(
+            "Escalate when an initial judge scores within this distance "
+            "of the metric threshold"
+        ),
+    )
+
+
 class JudgePanelConfig(BaseModel):
     """Judge panel configuration for multi-LLM evaluation.
 
@@ -465,6 +536,20 @@ class JudgePanelConfig(BaseModel):
             "'majority_vote' (average reported; PASS if a strict majority vote)."
         ),
     )
+    early_stopping: bool = Field(
+        default=True,
+        description=(
+            "Stop calling judges once the remaining ones cannot change the "
+            "outcome ('majority_vote' decided, or 'max' already at 1.0)"
+        ),
+    )
+    escalation: Optional[JudgeEscalationConfig] = Field(
+        default=None,
+        description=(
+            "Ask the leading judges first and only consult the rest when "
+            "their scores are near the threshold, disagree or fail"
+        ),
+    )
 
     @field_validator("enabled_metrics")
     @classmethod
@@ -494,6 +579,18 @@ class JudgePanelConfig(BaseModel):
             )
         return v
 
+    @model_validator(mode="after")
+    def validate_escalation(self) -> "JudgePanelConfig":
+        """Validate that escalation leaves judges to escalate to."""
+        if self.escalation is not None and self.escalation.initial_judges >= len(
+            self.judges
+        ):
+            raise ValueError(
+                f"escalation.initial_judges ({self.escalation.initial_judges}) "
+                f"must be less than the number of judges ({len(self.judges)})"
+            )
+        return self
+
 
 class GEvalRubricConfig(BaseModel):
     """Single rubric entry: score range 0-10 and expected outcome text."""
@@ -608,3 +705,53 @@ class GEvalConfig(BaseModel):
         else:
             data["rubrics"] = None
         return cls.model_validate(data)
+
+
+class ConversationWindowConfig(BaseModel):
+    """Sliding-window evaluation of a conversation-level metric.
+
+    Set as ``window`` in the metadata of a DeepEval conversation metric. The
+    conversation is split into windows of ``size`` turns starting every
+    ``stride`` turns (the last window is aligned to the final turn), each
+    window is scored separately, and the window scores are combined with
+    ``reducer``.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    size: int = Field(..., ge=1, description="Turns per window")
+    stride: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Turns between window starts (defaults to size)",
+    )
+    reducer: Literal["mean", "min", "max", "median"] = Field(
+        default="mean", description="How window scores are combined"
+    )
+    max_concurrency: int = Field(
+        default=DEFAULT_METRIC_BATCH_CONCURRENCY,
+        ge=1,
+        description="Maximum number of windows scored at the same time",
+    )
+
+    @model_validator(mode="after")
+    def validate_stride(self) -> "ConversationWindowConfig":
+        """Reject strides that would leave turns outside every window."""
+        if self.stride is not None and self.stride > self.size:
+            raise ValueError(
+                f"window stride ({self.stride}) must not exceed size ({self.size})"
+            )
+        return self
+
+    def bounds(self, turn_count: int) -> list[tuple[int, int]]:
+        """Return the [start, end) turn index range of each window.
+
+        A conversation no longer than one window yields a single window.
+        """
+        if turn_count <= self.size:
+            return [(0, turn_count)]
+        stride = self.stride or self.size
+        starts = list(range(0, turn_count - self.size + 1, stride))
+        if starts[-1] + self.size < turn_count:
+            starts.append(turn_count - self.size)
+        return [(start, start + self.size) for start in starts]
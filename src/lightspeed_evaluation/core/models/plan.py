@@ -0,0 +1,63 @@
+"""Pydantic models for dry-run planning of an evaluation run."""
+
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class PlannedCalls(BaseModel):
+    """Calls of one kind a run is expected to make, with their token estimate."""
+
+    calls: int = Field(default=0, ge=0, description="Calls expected")
+    likely_cached: int = Field(
+        default=0, ge=0, description="Calls likely served from a cache"
+    )
+    input_tokens: int = Field(
+        default=0, ge=0, description="Estimated input tokens of uncached calls"
+    )
+    output_tokens: int = Field(
+        default=0, ge=0, description="Estimated output tokens of uncached calls"
+    )
+
+
+class MetricPlan(PlannedCalls):
+    """Judge calls planned for one metric."""
+
+    metric_identifier: str = Field(description="Metric identifier")
+    evaluations: int = Field(default=0, ge=0, description="Metric evaluations")
+
+
+class RunPlan(BaseModel):
+    """Estimate of the calls, tokens, cost and duration of an evaluation run."""
+
+    conversations: int = Field(ge=0, description="Conversations to evaluate")
+    turns: int = Field(ge=0, description="Turns across all conversations")
+    evaluations: int = Field(ge=0, description="Metric evaluations (results)")
+    agent: PlannedCalls = Field(
+        default_factory=PlannedCalls, description="Agent API calls"
+    )
+    judge: PlannedCalls = Field(
+        default_factory=PlannedCalls,
+        description="Judge LLM calls, counting each panel judge separately",
+    )
+    geval_step_generations: int = Field(
+        default=0,
+        ge=0,
+        description="GEval step generations (also counted in judge calls)",
+    )
+    metrics: list[MetricPlan] = Field(
+        default_factory=list, description="Judge calls per metric"
+    )
+    workers: int = Field(ge=1, description="Conversations evaluated concurrently")
+    agent_latency: float = Field(ge=0, description="Seconds per agent call")
+    judge_latency: float = Field(ge=0, description="Seconds per judge call")
+    latency_source: str = Field(
+        description="Profile trace the latencies were measured from, or 'default'"
+    )
+    estimated_cost: Optional[float] = Field(
+        default=None,
+        description="Judge LLM cost of uncached calls; None when no judge is priced",
+    )
+    estimated_duration: float = Field(
+        ge=0, description="Projected wall-clock seconds of the evaluation"
+    )
@@ -0,0 +1,71 @@
+"""Pydantic models for sampled (smoke) evaluation runs."""
+
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+from lightspeed_evaluation.core.models.statistics import ConfidenceInterval
+
+
+class SamplingStratum(BaseModel):
+    """One stratum of the suite: conversations sharing tags and metric mix."""
+
+    key: str = Field(description="Stratum identifier (tags | metrics)")
+    tags: list[str] = Field(default_factory=list, description="Conversation tags")
+    metrics: list[str] = Field(
+        default_factory=list, description="Turn and conversation metrics evaluated"
+    )
+    population: int = Field(ge=1, description="Conversations in the full suite")
+    conversation_ids: list[str] = Field(
+        default_factory=list, description="Sampled conversation group IDs"
+    )
+
+    @property
+    def sampled(self) -> int:
+        """Number of sampled conversations."""
+        return len(self.conversation_ids)
+
+
+class SamplingPlan(BaseModel):
+    """Reproducible description of a stratified conversation sample."""
+
+    seed: int = Field(description="Random seed used to draw the sample")
+    size: Optional[int] = Field(default=None, description="Requested sample size")
+    fraction: Optional[float] = Field(
+        default=None, description="Requested fraction of the suite"
+    )
+    population: int = Field(ge=0, description="Conversations in the full suite")
+    strata: list[SamplingStratum] = Field(
+        default_factory=list, description="Strata with their sampled conversations"
+    )
+
+    @property
+    def sampled(self) -> int:
+        """Number of sampled conversations across all strata."""
+        return sum(stratum.sampled for stratum in self.strata)
+
+    def conversation_ids(self) -> set[str]:
+        """Return the IDs of all sampled conversations."""
+        return {cid for stratum in self.strata for cid in stratum.conversation_ids}
+
+
+class PassRateEstimate(BaseModel):
+    """Pass rate of the full suite extrapolated from a stratified sample."""
+
+    pass_rate: float = Field(description="Estimated pass rate in percent")
+    confidence_interval: ConfidenceInterval = Field(
+        description="Confidence interval of the estimated pass rate (percent)"
+    )
+    results: int = Field(ge=0, description="Sampled results the estimate is based on")
+
+
+class SampledPassRates(BaseModel):
+    """Sampling plan of a run with its extrapolated pass rates."""
+
+    plan: SamplingPlan = Field(description="Sampling plan of the run")
+    overall: Optional[PassRateEstimate] = Field(
+        default=None, description="Estimated overall pass rate"
+    )
+    by_metric: dict[str, PassRateEstimate] = Field(
+        default_factory=dict, description="Estimated pass rate per metric"
+    )
@@ -0,0 +1,49 @@
+"""Pydantic models for sequential (SPRT) regression testing."""
+
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+
+class SequentialTestResult(BaseModel):
+    """Outcome of a sequential probability ratio test against a baseline."""
+
+    decision: Literal["regression", "no_regression", "inconclusive"] = Field(
+        description=(
+            "regression: the pass rate dropped by at least max_drop; "
+            "no_regression: it did not; inconclusive: the suite ran out first"
+        )
+    )
+    baseline_pass_rate: float = Field(description="Baseline pass rate (percent)")
+    regression_pass_rate: float = Field(
+        description="Pass rate (percent) tested as the regression hypothesis"
+    )
+    alpha: float = Field(
+        description="Bound on the probability of a false regression verdict"
+    )
+    beta: float = Field(
+        description="Bound on the probability of missing a regression of max_drop"
+    )
+    log_likelihood_ratio: float = Field(
+        description="Final log-likelihood ratio of regression vs baseline"
+    )
+    lower_bound: float = Field(
+        description="Log-likelihood ratio at or below which no regression is accepted"
+    )
+    upper_bound: float = Field(
+        description="Log-likelihood ratio at or above which a regression is accepted"
+    )
+    seed: int = Field(description="Random seed of the evaluation order")
+    conversations_consumed: int = Field(
+        ge=0, description="Conversations whose results entered the test"
+    )
+    conversations_total: int = Field(ge=0, description="Conversations in the suite")
+    results_consumed: int = Field(ge=0, description="Results that entered the test")
+    passed: int = Field(ge=0, description="Passing results among those consumed")
+
+    @property
+    def observed_pass_rate(self) -> float:
+        """Pass rate (percent) of the consumed results."""
+        if self.results_consumed == 0:
+            return 0.0
+        return self.passed / self.results_consumed * 100
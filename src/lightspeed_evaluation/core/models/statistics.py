@@ -68,6 +68,14 @@ class OverallStats(BaseModel):
         default=0, description="Total judge LLM output tokens"
     )
     total_judge_llm_tokens: int = Field(default=0, description="Total judge LLM tokens")
+    total_judge_llm_input_tokens_saved: int = Field(
+        default=0,
+        description="Estimated judge LLM input tokens saved by fused judge calls",
+    )
+    total_judge_llm_cached_input_tokens: int = Field(
+        default=0,
+        description="Total judge LLM input tokens read from provider prompt caches",
+    )
     total_embedding_tokens: int = Field(default=0, description="Total embedding tokens")
 
 
@@ -141,3 +149,17 @@ class AgentTokenUsage(BaseModel):
     statistics: Optional[AgentTokenStats] = Field(
         default=None, description="Agent token usage statistics with percentiles"
     )
+
+
+class StageTiming(BaseModel):
+    """Aggregated wall-clock time spent in one profiled pipeline stage."""
+
+    stage: str = Field(description="Stage name (e.g. agent_call, metric:ragas)")
+    category: str = Field(description="Stage category (e.g. setup, metric, io)")
+    count: int = Field(default=0, description="Number of recorded spans")
+    total_seconds: float = Field(
+        default=0.0,
+        description="Summed span durations; may exceed wall time when threaded",
+    )
+    mean_seconds: float = Field(default=0.0, description="Mean span duration")
+    max_seconds: float = Field(default=0.0, description="Longest span duration")
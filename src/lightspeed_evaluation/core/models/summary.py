@@ -9,12 +9,15 @@ from lightspeed_evaluation.core.models.data import (
     EvaluationData,
     EvaluationResult,
 )
+from lightspeed_evaluation.core.models.sampling import SampledPassRates
+from lightspeed_evaluation.core.models.sequential import SequentialTestResult
 from lightspeed_evaluation.core.models.statistics import (
     AgentTokenUsage,
     ConversationStats,
     MetricStats,
     NumericStats,
     OverallStats,
+    StageTiming,
     StreamingStats,
     TagStats,
 )
@@ -61,6 +64,17 @@ class EvaluationSummary(BaseModel):
     streaming: Optional[StreamingStats] = Field(
         default=None, description="Streaming performance stats (when available)"
     )
+    timing_breakdown: Optional[list[StageTiming]] = Field(
+        default=None, description="Per-stage wall-clock timings (when profiling)"
+    )
+    sampling: Optional[SampledPassRates] = Field(
+        default=None,
+        description="Sampling plan and extrapolated pass rates (sampled runs)",
+    )
+    sequential: Optional[SequentialTestResult] = Field(
+        default=None,
+        description="Sequential regression test outcome (sequential runs)",
+    )
 
     @classmethod
     def from_results(
@@ -16,12 +16,22 @@ from pydantic import (
 
 from lightspeed_evaluation.core.constants import (
     DEFAULT_AGENT_CACHE_SUBDIR,
+    DEFAULT_BATCH_COMPLETION_WINDOW,
+    DEFAULT_BATCH_MAX_ROUNDS,
+    DEFAULT_BATCH_POLL_INTERVAL,
+    DEFAULT_BATCH_TIMEOUT,
     DEFAULT_CACHE_BASE_DIR,
+    DEFAULT_DATASET_CACHE_SUBDIR,
     DEFAULT_LLM_CACHE_SUBDIR,
     DEFAULT_LOG_FORMAT,
     DEFAULT_LOG_PACKAGE_LEVEL,
     DEFAULT_LOG_SHOW_TIMESTAMPS,
     DEFAULT_LOG_SOURCE_LEVEL,
+    DEFAULT_PROFILE_TOP_N,
+    DEFAULT_SEQUENTIAL_ALPHA,
+    DEFAULT_SEQUENTIAL_BETA,
+    DEFAULT_SEQUENTIAL_MAX_DROP,
+    DEFAULT_TRACE_SERVICE_NAME,
     DEFAULT_VISUALIZATION_DPI,
     DEFAULT_VISUALIZATION_FIGSIZE,
     SUPPORTED_GRAPH_TYPES,
@@ -32,6 +42,7 @@ from lightspeed_evaluation.core.models.agents import (
     MCPHeadersConfig,
 )
 from lightspeed_evaluation.core.models.llm import (
+    ConversationWindowConfig,
     EmbeddingConfig,
     GEvalConfig,
     JudgePanelConfig,
@@ -122,6 +133,28 @@ class CoreConfig(BaseModel):
         default=False,
         description="Skip remaining turns in conversation when a turn evaluation fails",
     )
+    expected_response_concurrency: int = Field(
+        default=1,
+        ge=1,
+        description=(
+            "Expected response alternatives of a turn scored in parallel; "
+            "1 scores them one by one, stopping at the first PASS"
+        ),
+    )
+    order_expected_responses: bool = Field(
+        default=False,
+        description=(
+            "Score the expected response alternatives most similar to the "
+            "actual response first"
+        ),
+    )
+    fuse_custom_metrics: bool = Field(
+        default=False,
+        description=(
+            "Score the LLM-judged custom metrics of a turn with one judge call, "
+            "falling back to per-metric calls when the answer cannot be parsed"
+        ),
+    )
     cache_enabled: bool = Field(
         default=True,
         description="Global caching toggle for embeddings, API, and LLM as a judge queries",
@@ -131,6 +164,224 @@ class CoreConfig(BaseModel):
         min_length=1,
         description="Base directory for all evaluation caches (embeddings, API, LLM judge)",
     )
+    dataset_cache_enabled: bool = Field(
+        default=False,
+        description=(
+            "Cache parsed and validated evaluation data under cache_base_dir, "
+            "keyed by file content and framework version"
+        ),
+    )
+
+    validation_workers: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description=(
+            "Processes used to validate evaluation data in chunks; "
+            "None or 1 validates in the main process"
+        ),
+    )
+
+    @property
+    def dataset_cache_dir(self) -> str:
+        """Directory holding the parsed-dataset cache."""
+        return os.path.join(self.cache_base_dir, DEFAULT_DATASET_CACHE_SUBDIR)
+
+
+class ProfilingConfig(BaseModel):
+    """Built-in profiling of where a run's wall-clock time goes."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    enabled: bool = Field(
+        default=False,
+        description=(
+            "Record per-stage timing spans, add a timing breakdown to the "
+            "summary reports and write a Chrome trace file"
+        ),
+    )
+    cprofile: bool = Field(
+        default=False,
+        description="Also capture a cProfile of the main thread",
+    )
+    tracemalloc: bool = Field(
+        default=False,
+        description="Also capture a tracemalloc snapshot of top allocations",
+    )
+    top_n: int = Field(
+        default=DEFAULT_PROFILE_TOP_N,
+        gt=0,
+        description="Entries listed in the cProfile and tracemalloc reports",
+    )
+
+
+class TracingConfig(BaseModel):
+    """Self-tracing of the evaluation pipeline as OTLP-JSON spans."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    enabled: bool = Field(
+        default=False,
+        description=(
+            "Record conversation, turn, agent call, metric and judge call "
+            "spans and write them as an OTLP-JSON trace file"
+        ),
+    )
+    service_name: str = Field(
+        default=DEFAULT_TRACE_SERVICE_NAME,
+        min_length=1,
+        description="service.name resource attribute of the exported trace",
+    )
+    include_io: bool = Field(
+        default=True,
+        description="Attach queries, responses and judge reasons to spans",
+    )
+
+
+class SequentialTestConfig(BaseModel):
+    """Sequential regression test of the pass rate against a baseline."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    enabled: bool = Field(
+        default=False,
+        description=(
+            "Evaluate conversations in random order and stop as soon as a "
+            "sequential probability ratio test reaches a verdict"
+        ),
+    )
+    baseline_pass_rate: Optional[float] = Field(
+        default=None,
+        gt=0,
+        lt=100,
+        description="Pass rate (percent) of the baseline run",
+    )
+    max_drop: float = Field(
+        default=DEFAULT_SEQUENTIAL_MAX_DROP,
+        gt=0,
+        lt=100,
+        description="Drop below the baseline (percentage points) that is a regression",
+    )
+    alpha: float = Field(
+        default=DEFAULT_SEQUENTIAL_ALPHA,
+        gt=0,
+        lt=0.5,
+        description="Probability of reporting a regression when there is none",
+    )
+    beta: float = Field(
+        default=DEFAULT_SEQUENTIAL_BETA,
+        gt=0,
+        lt=0.5,
+        description="Probability of missing a drop of max_drop",
+    )
+    seed: int = Field(default=0, description="Random seed of the evaluation order")
+
+    @model_validator(mode="after")
+    def validate_baseline(self) -> "SequentialTestConfig":
+        """Require a baseline the regression threshold can be tested against."""
+        if not self.enabled:
+            return self
+        if self.baseline_pass_rate is None:
+            raise ValueError("sequential_test requires baseline_pass_rate when enabled")
+        if self.baseline_pass_rate - self.max_drop <= 0:
+            raise ValueError(
+                f"sequential_test max_drop ({self.max_drop}) must be smaller than "
+                f"baseline_pass_rate ({self.baseline_pass_rate})"
+            )
+        return self
+
+
+class BudgetLimitConfig(BaseModel):
+    """Token and cost limits of one budget scope."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    max_tokens: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Maximum judge, embedding and agent tokens",
+    )
+    max_cost: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Maximum judge LLM cost, from the model prices",
+    )
+
+    @property
+    def limited(self) -> bool:
+        """Whether any limit is set."""
+        return self.max_tokens is not None or self.max_cost is not None
+
+
+class BudgetConfig(BaseModel):
+    """Token and cost budgets that stop new judge and agent calls when spent."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    run: BudgetLimitConfig = Field(
+        default_factory=BudgetLimitConfig, description="Budget of the whole run"
+    )
+    conversation: BudgetLimitConfig = Field(
+        default_factory=BudgetLimitConfig, description="Budget of each conversation"
+    )
+    metric: BudgetLimitConfig = Field(
+        default_factory=BudgetLimitConfig,
+        description="Budget of each metric across the run",
+    )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any budget is limited."""
+        return self.run.limited or self.conversation.limited or self.metric.limited
+
+
+class BatchJudgeConfig(BaseModel):
+    """Offline judge mode that sends judge requests through provider batch APIs."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    enabled: bool = Field(
+        default=False,
+        description=(
+            "Collect the judge requests of the run, submit them as provider "
+            "batches and evaluate again once the batches have completed"
+        ),
+    )
+    state_dir: Optional[str] = Field(
+        default=None,
+        min_length=1,
+        description=(
+            "Directory of the batch responses and in-flight batches, used to "
+            "resume an interrupted run (default: <core.cache_base_dir>/batch)"
+        ),
+    )
+    api_base: Optional[str] = Field(
+        default=None,
+        min_length=1,
+        description="Base URL of the batch and file endpoints (default: provider's)",
+    )
+    completion_window: str = Field(
+        default=DEFAULT_BATCH_COMPLETION_WINDOW,
+        min_length=1,
+        description="Completion window requested for each batch",
+    )
+    poll_interval: float = Field(
+        default=DEFAULT_BATCH_POLL_INTERVAL,
+        gt=0,
+        description="Seconds between batch status checks",
+    )
+    timeout: float = Field(
+        default=DEFAULT_BATCH_TIMEOUT,
+        gt=0,
+        description="Seconds to wait for submitted batches before giving up",
+    )
+    max_rounds: int = Field(
+        default=DEFAULT_BATCH_MAX_ROUNDS,
+        ge=1,
+        description=(
+            "Evaluation rounds; judge calls that depend on an earlier judge "
+            "answer (e.g. GEval steps) need one round each"
+        ),
+    )
 
 
 class QualityScoreConfig(BaseModel):
@@ -216,6 +467,22 @@ class SystemConfig(BaseModel):
     visualization: VisualizationConfig = Field(
         default_factory=VisualizationConfig, description="Visualization configuration"
     )
+    profiling: ProfilingConfig = Field(
+        default_factory=ProfilingConfig, description="Profiling configuration"
+    )
+    tracing: TracingConfig = Field(
+        default_factory=TracingConfig, description="Self-tracing configuration"
+    )
+    sequential_test: SequentialTestConfig = Field(
+        default_factory=SequentialTestConfig,
+        description="Sequential regression test configuration",
+    )
+    budget: BudgetConfig = Field(
+        default_factory=BudgetConfig, description="Token and cost budgets"
+    )
+    batch_judge: BatchJudgeConfig = Field(
+        default_factory=BatchJudgeConfig, description="Batch-API judge mode"
+    )
 
     # Quality score configuration
     quality_score: Optional[QualityScoreConfig] = Field(
@@ -303,6 +570,60 @@ class SystemConfig(BaseModel):
                     ) from e
         return v
 
+    @field_validator("default_conversation_metrics_metadata")
+    @classmethod
+    def validate_conversation_metric_windows(
+        cls, v: dict[str, dict[str, Any]]
+    ) -> dict[str, dict[str, Any]]:
+        """Validate ``window`` settings of DeepEval conversation metrics at load.
+
+        Raises:
+            ConfigurationError: When a deepeval:* entry has an invalid window.
+        """
+        for metric_id, meta in (v or {}).items():
+            if (
+                metric_id.startswith("deepeval:")
+                and isinstance(meta, dict)
+                and meta.get("window") is not None
+            ):
+                try:
+                    ConversationWindowConfig.model_validate(meta["window"])
+                except ValidationError as e:
+                    raise ConfigurationError(
+                        f"Invalid window config for '{metric_id}': {e!s}"
+                    ) from e
+        return v
+
+    @field_validator(
+        "default_turn_metrics_metadata", "default_conversation_metrics_metadata"
+    )
+    @classmethod
+    def validate_metric_gates(
+        cls, v: dict[str, dict[str, Any]]
+    ) -> dict[str, dict[str, Any]]:
+        """Validate ``gated_by`` rules at load.
+
+        Raises:
+            ConfigurationError: When a gate is not a 'framework:metric'
+                identifier (or list of them) or a metric gates itself.
+        """
+        for metric_id, meta in (v or {}).items():
+            if not isinstance(meta, dict) or meta.get("gated_by") is None:
+                continue
+            gates = meta["gated_by"]
+            if isinstance(gates, str):
+                gates = [gates]
+            if not isinstance(gates, list) or not all(
+                isinstance(gate, str) and ":" in gate for gate in gates
+            ):
+                raise ConfigurationError(
+                    f"Invalid gated_by for '{metric_id}': expected a "
+                    "'framework:metric' identifier or a list of them"
+                )
+            if metric_id in gates:
+                raise ConfigurationError(f"Metric '{metric_id}' cannot gate itself")
+        return v
+
     @model_validator(mode="after")
     def validate_quality_score_metrics(self) -> "SystemConfig":
         """Validate quality_score metrics exist in metrics_metadata.
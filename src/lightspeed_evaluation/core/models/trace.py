@@ -3,10 +3,10 @@
 This module defines the contract between platform-specific trace ingestion
 (MLflow, Langfuse, OpenTelemetry) and platform-agnostic trace evaluation.
 
-These models are intentionally unused by the evaluation pipeline today.
 Ingestion adapters convert already-fetched platform payloads into this shape;
 evaluation code can consume ``Trace`` / ``TraceSession`` without knowing the
-source platform.
+source platform. The pipeline also describes its own execution with these
+models when self-tracing is enabled (see ``core.system.tracer``).
 """
 
 from __future__ import annotations
@@ -2,7 +2,8 @@
 
 These helpers assume platform-specific ingestion (API / SDK fetch) is already
 done. They only normalize dict-shaped payloads into :class:`Trace` /
-:class:`TraceSession`. They are not wired into the evaluation pipeline.
+:class:`TraceSession`. :func:`trace_to_otel` goes the other way and is used to
+export the framework's own execution trace (see ``core.system.tracer``).
 """
 
 from __future__ import annotations
@@ -686,6 +687,140 @@ def trace_from_otel(raw: dict[str, Any]) -> Trace:
     )
 
 
+_OTEL_STATUS_CODES = {
+    SpanStatus.UNSET: "STATUS_CODE_UNSET",
+    SpanStatus.OK: "STATUS_CODE_OK",
+    SpanStatus.ERROR: "STATUS_CODE_ERROR",
+}
+
+
+def _otel_any_value(  # pylint: disable=too-many-return-statements
+    value: Any,
+) -> dict[str, Any]:
+    """Wrap a plain Python value as an OTLP/JSON AnyValue object."""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    if isinstance(value, str):
+        return {"stringValue": value}
+    if isinstance(value, (list, tuple)):
+        return {"arrayValue": {"values": [_otel_any_value(v) for v in value]}}
+    if isinstance(value, dict):
+        return {
+            "kvlistValue": {
+                "values": [
+                    {"key": str(k), "value": _otel_any_value(v)}
+                    for k, v in value.items()
+                ]
+            }
+        }
+    return {"stringValue": json.dumps(value, default=str)}
+
+
+def _otel_attributes(attributes: dict[str, Any]) -> list[dict[str, Any]]:
+    """Convert a plain dict into an OTLP attribute list, dropping None values."""
+    return [
+        {"key": key, "value": _otel_any_value(value)}
+        for key, value in attributes.items()
+        if value is not None
+    ]
+
+
+def _unix_nano(value: Optional[datetime]) -> Optional[str]:
+    """Convert a datetime to OTLP/JSON unix nanoseconds (string-encoded int)."""
+    if value is None:
+        return None
+    return str(int(_ensure_utc(value).timestamp() * 1_000_000) * 1000)
+
+
+def span_to_otel(span: Span) -> dict[str, Any]:
+    """Convert an internal :class:`Span` into an OTLP/JSON span dict.
+
+    The result round-trips through :func:`span_from_otel`: the span type,
+    latency, inputs/outputs, tags and LLM fields are stored under the
+    attribute keys that adapter reads back.
+    """
+    attributes: dict[str, Any] = dict(span.metadata)
+    attributes["span.type"] = span.span_type.value
+    if span.latency is not None:
+        attributes["latency"] = span.latency
+    if span.inputs is not None:
+        attributes["input.value"] = json.dumps(span.inputs, default=str)
+    if span.outputs is not None:
+        attributes["output.value"] = json.dumps(span.outputs, default=str)
+    if span.tags:
+        attributes["tags"] = list(span.tags)
+    if span.llm is not None:
+        if span.llm.model is not None:
+            attributes["gen_ai.request.model"] = span.llm.model.name
+            attributes["gen_ai.system"] = span.llm.model.provider
+            attributes["gen_ai.request.temperature"] = span.llm.model.temperature
+        if span.llm.token_usage is not None:
+            usage = span.llm.token_usage
+            attributes["gen_ai.usage.input_tokens"] = usage.input_tokens
+            attributes["gen_ai.usage.output_tokens"] = usage.output_tokens
+            attributes["gen_ai.usage.total_tokens"] = usage.total_tokens
+        attributes["gen_ai.usage.cost"] = span.llm.cost_usd
+
+    raw: dict[str, Any] = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "attributes": _otel_attributes(attributes),
+        "status": {"code": _OTEL_STATUS_CODES[span.status]},
+    }
+    if span.parent_span_id:
+        raw["parentSpanId"] = span.parent_span_id
+    if span.status_message:
+        raw["status"]["message"] = span.status_message
+    start, end = _unix_nano(span.start_time), _unix_nano(span.end_time)
+    if start is not None:
+        raw["startTimeUnixNano"] = start
+    if end is not None:
+        raw["endTimeUnixNano"] = end
+    return raw
+
+
+def trace_to_otel(
+    trace: Trace, *, service_name: str = "lightspeed-evaluation"
+) -> dict[str, Any]:
+    """Convert a :class:`Trace` into an OTLP/JSON ``resourceSpans`` payload.
+
+    The payload is readable by :func:`trace_from_otel` and by OTLP-aware
+    trace viewers.
+
+    Args:
+        trace: Trace to export.
+        service_name: Value of the ``service.name`` resource attribute.
+
+    Returns:
+        OTLP/JSON export request with a single resource and scope.
+    """
+    resource_attributes: dict[str, Any] = {"service.name": service_name}
+    if trace.session_id:
+        resource_attributes["session.id"] = trace.session_id
+    return {
+        "name": trace.name,
+        "traceId": trace.trace_id,
+        "metadata": dict(trace.metadata),
+        "tags": list(trace.tags),
+        "resourceSpans": [
+            {
+                "resource": {"attributes": _otel_attributes(resource_attributes)},
+                "scopeSpans": [
+                    {
+                        "scope": {"name": service_name},
+                        "spans": [span_to_otel(span) for span in trace.spans],
+                    }
+                ],
+            }
+        ],
+    }
+
+
 def session_from_traces(
     session_id: str,
     traces: list[Trace],
@@ -10,6 +10,7 @@ import yaml
 from lightspeed_evaluation.core.constants import DEFAULT_OUTPUT_DIR
 from lightspeed_evaluation.core.models import EvaluationData
 from lightspeed_evaluation.core.models.data import DatasetMetadata
+from lightspeed_evaluation.core.system.yaml_io import safe_dump_yaml
 
 logger = logging.getLogger(__name__)
 
@@ -56,14 +57,7 @@ def save_evaluation_data(
 
         # Save amended data to output directory
         with open(amended_data_path, "w", encoding="utf-8") as f:
-            yaml.dump(
-                output_data,
-                f,
-                default_flow_style=False,
-                sort_keys=False,
-                allow_unicode=True,
-                indent=2,
-            )
+            safe_dump_yaml(output_data, f)
 
         logger.info("Amended evaluation data saved to: %s", amended_data_path)
         return str(amended_data_path)
@@ -21,6 +21,7 @@ from lightspeed_evaluation.core.models.quality import QualityReport
 from lightspeed_evaluation.core.models.statistics import (
     AgentTokenStats,
     NumericStats,
+    StageTiming,
 )
 from lightspeed_evaluation.core.models.summary import (
     EvaluationSummary,
@@ -37,6 +38,13 @@ from lightspeed_evaluation.core.output.serializers import (
 )
 from lightspeed_evaluation.core.output.visualization import GraphGenerator
 from lightspeed_evaluation.core.storage import FileBackendConfig, get_file_config
+from lightspeed_evaluation.core.system.profiler import (
+    STAGE_GRAPH_RENDERING,
+    STAGE_REPORT_GENERATION,
+    format_timing_table,
+    get_active_profiler,
+    profile_span,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -95,6 +103,11 @@ class OutputHandler:
             compute_confidence_intervals=True,
         )
 
+        # Include the timing breakdown recorded so far when profiling
+        profiler = get_active_profiler()
+        if profiler is not None:
+            summary.timing_breakdown = profiler.timing_breakdown()
+
         # Generate QualityReport separately if quality score metrics are configured
         quality_report = None
         if quality_score_metrics:
@@ -123,16 +136,18 @@ class OutputHandler:
         logger.info("Generating reports: %s", base_filename)
 
         # Generate individual reports based on configuration
-        self._generate_individual_reports(
-            results, base_filename, enabled_outputs, summary, quality_report
-        )
+        with profile_span(STAGE_REPORT_GENERATION, "output"):
+            self._generate_individual_reports(
+                results, base_filename, enabled_outputs, summary, quality_report
+            )
 
         # Generate graphs if enabled
         if results and (
             self.system_config is not None
             and self.system_config.visualization.enabled_graphs
         ):
-            self._create_graphs(results, base_filename, summary)
+            with profile_span(STAGE_GRAPH_RENDERING, "output"):
+                self._create_graphs(results, base_filename, summary)
 
     def save(
         self,
@@ -319,6 +334,10 @@ class OutputHandler:
             "configuration": self._build_config_dict(),
             "results": [result_to_json_dict(r) for r in summary.results],
         }
+        if summary.timing_breakdown is not None:
+            output["timing_breakdown"] = [
+                timing.model_dump() for timing in summary.timing_breakdown
+            ]
 
         with open(json_file, "w", encoding="utf-8") as f:
             json.dump(output, f, indent=2)
@@ -482,11 +501,22 @@ class OutputHandler:
                 f, "By Tag", detailed_stats.get("by_tag", {}), include_scores=True
             )
 
+            # Profiling timing breakdown
+            if summary.timing_breakdown:
+                self._write_timing_breakdown(f, summary.timing_breakdown)
+
             # Configuration parameters
             self._write_config_params(f)
 
         return txt_file
 
+    def _write_timing_breakdown(self, f: Any, timings: list[StageTiming]) -> None:
+        """Write per-stage profiling timings section."""
+        f.write("Timing Breakdown:\n")
+        f.write("-" * 20 + "\n")
+        f.write(format_timing_table(timings))
+        f.write("\n")
+
     def _write_overall_stats(self, f: Any, stats: dict[str, Any]) -> None:
         """Write overall statistics section."""
         f.write("Overall Statistics:\n")
@@ -504,7 +534,14 @@ class OutputHandler:
         f.write("-" * 20 + "\n")
         f.write(f"Input Tokens: {basic_stats['total_judge_llm_input_tokens']:,}\n")
         f.write(f"Output Tokens: {basic_stats['total_judge_llm_output_tokens']:,}\n")
-        f.write(f"Total Tokens: {basic_stats['total_judge_llm_tokens']:,}\n\n")
+        f.write(f"Total Tokens: {basic_stats['total_judge_llm_tokens']:,}\n")
+        saved = basic_stats.get("total_judge_llm_input_tokens_saved", 0)
+        if saved:
+            f.write(f"Input Tokens Saved (fused custom metrics): {saved:,}\n")
+        cached = basic_stats.get("total_judge_llm_cached_input_tokens", 0)
+        if cached:
+            f.write(f"Cached Input Tokens (provider prompt cache): {cached:,}\n")
+        f.write("\n")
 
         f.write("Token Usage (Embeddings):\n")
         f.write("-" * 20 + "\n")
@@ -37,9 +37,12 @@ def result_to_json_dict(r: EvaluationResult) -> dict[str, Any]:
         "evaluation_latency": r.evaluation_latency,
         "judge_llm_input_tokens": r.judge_llm_input_tokens,
         "judge_llm_output_tokens": r.judge_llm_output_tokens,
+        "judge_llm_input_tokens_saved": r.judge_llm_input_tokens_saved,
+        "judge_llm_cached_input_tokens": r.judge_llm_cached_input_tokens,
         "judge_scores": (
             [js.model_dump() for js in r.judge_scores] if r.judge_scores else None
         ),
+        "expected_responses_evaluated": r.expected_responses_evaluated,
         "time_to_first_token": r.time_to_first_token,
         "streaming_duration": r.streaming_duration,
         "agent_latency": r.agent_latency,
@@ -71,6 +74,12 @@ def overall_to_basic_stats_dict(
         "total_judge_llm_input_tokens": overall.total_judge_llm_input_tokens,
         "total_judge_llm_output_tokens": overall.total_judge_llm_output_tokens,
         "total_judge_llm_tokens": overall.total_judge_llm_tokens,
+        "total_judge_llm_input_tokens_saved": (
+            overall.total_judge_llm_input_tokens_saved
+        ),
+        "total_judge_llm_cached_input_tokens": (
+            overall.total_judge_llm_cached_input_tokens
+        ),
         "total_embedding_tokens": overall.total_embedding_tokens,
     }
 
@@ -1,5 +1,6 @@
 """Shared utilities for output and evaluation."""
 
+import math
 import statistics
 from typing import Optional
 
@@ -10,6 +11,11 @@ from lightspeed_evaluation.core.models.data import (
     EvaluationData,
     EvaluationResult,
 )
+from lightspeed_evaluation.core.models.sampling import (
+    PassRateEstimate,
+    SampledPassRates,
+    SamplingPlan,
+)
 from lightspeed_evaluation.core.models.statistics import (
     AgentTokenStats,
     AgentTokenUsage,
@@ -126,6 +132,8 @@ def compute_overall_stats(results: list[EvaluationResult]) -> OverallStats:
 
     total_judge_input = sum(r.judge_llm_input_tokens for r in results)
     total_judge_output = sum(r.judge_llm_output_tokens for r in results)
+    total_judge_saved = sum(r.judge_llm_input_tokens_saved for r in results)
+    total_judge_cached = sum(r.judge_llm_cached_input_tokens for r in results)
     total_embedding = sum(r.embedding_tokens for r in results)
 
     return OverallStats(
@@ -141,10 +149,116 @@ def compute_overall_stats(results: list[EvaluationResult]) -> OverallStats:
         total_judge_llm_input_tokens=total_judge_input,
         total_judge_llm_output_tokens=total_judge_output,
         total_judge_llm_tokens=total_judge_input + total_judge_output,
+        total_judge_llm_input_tokens_saved=total_judge_saved,
+        total_judge_llm_cached_input_tokens=total_judge_cached,
         total_embedding_tokens=total_embedding,
     )
 
 
+def _stratified_total_variance(
+    populations: list[int], residuals: list[list[float]]
+) -> float:
+    """Variance of a stratified estimated total, with finite population correction."""
+    spread = [d for d in residuals if len(d) > 1]
+    if spread:
+        pooled = sum(statistics.variance(d) * (len(d) - 1) for d in spread) / sum(
+            len(d) - 1 for d in spread
+        )
+    else:
+        all_residuals = [v for d in residuals for v in d]
+        pooled = statistics.variance(all_residuals) if len(all_residuals) > 1 else 0.0
+    return sum(
+        n_pop**2
+        * (1 - len(d) / n_pop)
+        * (statistics.variance(d) if len(d) > 1 else pooled)
+        / len(d)
+        for n_pop, d in zip(populations, residuals)
+    )
+
+
+def _stratified_pass_rate(
+    results: list[EvaluationResult], plan: SamplingPlan, confidence_level: float
+) -> Optional[PassRateEstimate]:
+    """Extrapolate the pass rate of sampled results to the full suite.
+
+    Conversations are the sampling units and each contributes its passed and
+    total result counts. The suite pass rate is estimated with the stratified
+    combined ratio estimator; its normal-approximation interval uses the
+    linearized variance with finite population correction. Strata drawn with
+    a single conversation borrow the pooled within-stratum variance.
+    """
+    counts: dict[str, tuple[int, int]] = {}
+    for r in results:
+        passed, total = counts.get(r.conversation_group_id, (0, 0))
+        counts[r.conversation_group_id] = (
+            passed + (r.result == "PASS"),
+            total + 1,
+        )
+
+    strata = [
+        (stratum.population, [counts.get(cid, (0, 0)) for cid in ids])
+        for stratum in plan.strata
+        if (ids := stratum.conversation_ids)
+    ]
+    est_passed = sum(n_pop * statistics.mean(y for y, _ in u) for n_pop, u in strata)
+    est_total = sum(n_pop * statistics.mean(x for _, x in u) for n_pop, u in strata)
+    if est_total == 0:
+        return None
+    rate = est_passed / est_total
+
+    variance = _stratified_total_variance(
+        [n_pop for n_pop, _ in strata],
+        [[y - rate * x for y, x in units] for _, units in strata],
+    ) / (est_total**2)
+    half_width = statistics.NormalDist().inv_cdf(
+        0.5 + confidence_level / 200
+    ) * math.sqrt(variance)
+
+    return PassRateEstimate(
+        pass_rate=rate * 100,
+        confidence_interval=ConfidenceInterval(
+            low=max(0.0, rate - half_width) * 100,
+            mean=rate * 100,
+            high=min(1.0, rate + half_width) * 100,
+            confidence_level=confidence_level,
+        ),
+        results=len(results),
+    )
+
+
+def estimate_sampled_pass_rates(
+    results: list[EvaluationResult],
+    plan: SamplingPlan,
+    confidence_level: float = 95.0,
+) -> SampledPassRates:
+    """Estimate full-suite pass rates, overall and per metric, from a sampled run.
+
+    Args:
+        results: Results of the sampled conversations.
+        plan: Sampling plan the conversations were drawn with.
+        confidence_level: Confidence level of the intervals, in percent.
+
+    Returns:
+        The plan with its extrapolated pass rates.
+    """
+    if not 0 < confidence_level < 100:
+        raise ValueError("Invalid confidence, must be between 0 and 100")
+    by_metric: dict[str, PassRateEstimate] = {}
+    for metric in sorted({r.metric_identifier for r in results}):
+        estimate = _stratified_pass_rate(
+            [r for r in results if r.metric_identifier == metric],
+            plan,
+            confidence_level,
+        )
+        if estimate is not None:
+            by_metric[metric] = estimate
+    return SampledPassRates(
+        plan=plan,
+        overall=_stratified_pass_rate(results, plan, confidence_level),
+        by_metric=by_metric,
+    )
+
+
 def compute_score_statistics(
     scores: list[float],
     compute_ci: bool = False,
@@ -359,7 +359,12 @@ class SQLStorageBackend(BaseStorageBackend):
             return None
         try:
             scores_data = [
-                {"judge_id": s.judge_id, "score": s.score, "reason": s.reason}
+                {
+                    "judge_id": s.judge_id,
+                    "score": s.score,
+                    "reason": s.reason,
+                    "consulted": s.consulted,
+                }
                 for s in judge_scores
             ]
             return json.dumps(scores_data)
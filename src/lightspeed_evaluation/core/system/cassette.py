@@ -0,0 +1,418 @@
+"""Record/replay cassettes for full evaluation runs.
+
+A :class:`Cassette` captures every agent API exchange and every LLM /
+embedding call of a run into one portable zip archive. Replaying the archive
+serves those calls from disk, so a run can be reproduced offline and
+deterministically (e.g. to debug a report or tune a metric threshold).
+
+Interactions are content-addressed: each archive entry is named by the SHA-256
+of its canonical request, and holds the responses recorded for that request
+in call order. Agent requests additionally carry the conversation they belong
+to (see :func:`cassette_scope`) because identical first-turn queries in
+different conversations return different conversation IDs.
+
+A cassette is activated for a run with :func:`cassette_run`; interception
+points call :func:`recorded_call` / :func:`arecorded_call`, which fall
+straight through to the real call when no cassette is active.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import zipfile
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Literal, Optional, TypeVar
+
+from lightspeed_evaluation.core.system.exceptions import CassetteMissError
+from lightspeed_evaluation.core.system.session import ActiveSession
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_FORMAT = "lightspeed-evaluation-cassette"
+CASSETTE_VERSION = 1
+CASSETTE_BASE_FILENAME = "cassette"
+_MANIFEST = "manifest.json"
+_INTERACTIONS_DIR = "interactions"
+
+# Interaction kinds
+KIND_AGENT = "agent"
+KIND_COMPLETION = "completion"
+KIND_EMBEDDING = "embedding"
+
+CassetteMode = Literal["record", "replay"]
+
+# LLM call parameters that determine the response; connection settings,
+# retries and callbacks are left out so a cassette replays across environments.
+_LLM_KEY_PARAMS = (
+    "model",
+    "messages",
+    "input",
+    "temperature",
+    "top_p",
+    "n",
+    "max_tokens",
+    "max_completion_tokens",
+    "stop",
+    "seed",
+    "response_format",
+    "tools",
+    "tool_choice",
+    "logprobs",
+    "top_logprobs",
+    "dimensions",
+    "encoding_format",
+)
+
+T = TypeVar("T")
+
+_scope: ContextVar[Optional[str]] = ContextVar(
+    "lightspeed_eval_cassette_scope", default=None
+)
+
+
+def _canonical(value: Any) -> Any:
+    """Return a JSON-friendly, deterministic form of a request value."""
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, type) and hasattr(value, "model_json_schema"):
+        return value.model_json_schema()  # pydantic response_format
+    if hasattr(value, "model_dump"):
+        return _canonical(value.model_dump())
+    return f"{type(value).__module__}.{type(value).__qualname__}"
+
+
+def request_key(kind: str, request: dict[str, Any]) -> str:
+    """Return the content address of a request."""
+    payload = json.dumps(
+        {"kind": kind, "request": _canonical(request)},
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def llm_request(
+    args: tuple[Any, ...], kwargs: dict[str, Any], positional: tuple[str, ...]
+) -> dict[str, Any]:
+    """Build the recorded request of a litellm call.
+
+    Args:
+        args: Positional call arguments.
+        kwargs: Keyword call arguments.
+        positional: Names of the positional parameters, in order.
+
+    Returns:
+        The response-determining parameters of the call.
+    """
+    params = dict(zip(positional, args))
+    params.update(kwargs)
+    return {k: params[k] for k in _LLM_KEY_PARAMS if params.get(k) is not None}
+
+
+class Cassette:
+    """Recorded agent and LLM interactions of one evaluation run.
+
+    Recording and replay are thread-safe; conversations run concurrently.
+    """
+
+    def __init__(self, path: str, mode: CassetteMode) -> None:
+        """Initialize the cassette.
+
+        Args:
+            path: Archive path (written on :meth:`save` when recording, read
+                immediately when replaying).
+            mode: ``"record"`` or ``"replay"``.
+
+        Raises:
+            CassetteMissError: If a replay archive is missing or unreadable.
+        """
+        self.path = Path(path)
+        self.mode = mode
+        self._interactions: dict[str, dict[str, Any]] = {}
+        self._replayed: dict[str, int] = {}
+        self._misses: list[str] = []
+        self._lock = threading.Lock()
+        if mode == "replay":
+            self._load()
+
+    @property
+    def replaying(self) -> bool:
+        """Whether calls are served from the cassette."""
+        return self.mode == "replay"
+
+    @property
+    def misses(self) -> list[str]:
+        """Descriptions of requests that had no recorded response."""
+        with self._lock:
+            return list(self._misses)
+
+    def __len__(self) -> int:
+        """Number of distinct recorded requests."""
+        return len(self._interactions)
+
+    def record(self, kind: str, request: dict[str, Any], response: Any) -> None:
+        """Store a response for a request.
+
+        Args:
+            kind: Interaction kind (``agent``, ``completion``, ``embedding``).
+            request: Response-determining request data.
+            response: JSON-serializable response data.
+        """
+        key = request_key(kind, request)
+        with self._lock:
+            interaction = self._interactions.setdefault(
+                key, {"kind": kind, "request": _canonical(request), "responses": []}
+            )
+            interaction["responses"].append(response)
+
+    def replay(self, kind: str, request: dict[str, Any]) -> Any:
+        """Return the next recorded response for a request.
+
+        Repeated identical requests are served in recording order; once the
+        recorded responses are exhausted the last one is reused.
+
+        Raises:
+            CassetteMissError: If the request was never recorded.
+        """
+        key = request_key(kind, request)
+        with self._lock:
+            interaction = self._interactions.get(key)
+            if interaction is None:
+                summary = _describe(kind, request)
+                self._misses.append(summary)
+                raise CassetteMissError(
+                    f"No recorded {kind} response in cassette {self.path} for "
+                    f"{summary} (key {key[:12]}); re-record the cassette after "
+                    "changing evaluation data, metrics or judge settings"
+                )
+            index = self._replayed.get(key, 0)
+            self._replayed[key] = index + 1
+            responses = interaction["responses"]
+            return responses[min(index, len(responses) - 1)]
+
+    def save(self) -> Path:
+        """Write the recorded interactions as a zip archive.
+
+        Returns:
+            Path of the archive written.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            interactions = dict(self._interactions)
+        counts: dict[str, int] = {}
+        for interaction in interactions.values():
+            counts[interaction["kind"]] = counts.get(interaction["kind"], 0) + len(
+                interaction["responses"]
+            )
+        manifest = {
+            "format": CASSETTE_FORMAT,
+            "version": CASSETTE_VERSION,
+            "created": datetime.now(UTC).isoformat(),
+            "interactions": counts,
+        }
+        with zipfile.ZipFile(self.path, "w", zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr(_MANIFEST, json.dumps(manifest, indent=2))
+            for key in sorted(interactions):
+                archive.writestr(
+                    f"{_INTERACTIONS_DIR}/{key}.json", json.dumps(interactions[key])
+                )
+        return self.path
+
+    def _load(self) -> None:
+        """Read a recorded archive for replay."""
+        try:
+            with zipfile.ZipFile(self.path) as archive:
+                manifest = json.loads(archive.read(_MANIFEST))
+                if manifest.get("format") != CASSETTE_FORMAT:
+                    raise CassetteMissError(f"{self.path} is not a cassette archive")
+                if manifest.get("version") != CASSETTE_VERSION:
+                    raise CassetteMissError(
+                        f"Unsupported cassette version {manifest.get('version')} "
+                        f"in {self.path}"
+                    )
+                for name in archive.namelist():
+                    if name.startswith(f"{_INTERACTIONS_DIR}/"):
+                        key = Path(name).stem
+                        self._interactions[key] = json.loads(archive.read(name))
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile) as e:
+            raise CassetteMissError(f"Cannot read cassette {self.path}: {e}") from e
+
+
+def _describe(kind: str, request: dict[str, Any]) -> str:
+    """Return a short human-readable description of a request."""
+    if kind == KIND_AGENT:
+        payload = request.get("payload", {})
+        return f"conversation {request.get('scope')!r} query {payload.get('query')!r}"
+    return f"model {request.get('model')!r}"
+
+
+_ACTIVE_CASSETTE: ActiveSession[Cassette] = ActiveSession(
+    "lightspeed_eval_active_cassette"
+)
+
+
+def get_active_cassette() -> Optional[Cassette]:
+    """Return the cassette of the running session, if any."""
+    return _ACTIVE_CASSETTE.get()
+
+
+def is_replaying() -> bool:
+    """Whether the running session serves calls from a cassette."""
+    cassette = _ACTIVE_CASSETTE.get()
+    return cassette is not None and cassette.replaying
+
+
+@contextmanager
+def cassette_session(cassette: Cassette) -> Iterator[Cassette]:
+    """Make ``cassette`` the active cassette for the enclosed block.
+
+    A nested session reuses the already-active cassette.
+
+    Args:
+        cassette: Cassette to activate.
+
+    Yields:
+        The active cassette.
+    """
+    with _ACTIVE_CASSETTE.activate(cassette) as active:
+        yield active
+
+
+@contextmanager
+def cassette_scope(scope: str) -> Iterator[None]:
+    """Attribute agent requests in the enclosed block to ``scope``.
+
+    Args:
+        scope: Conversation identifier included in agent request keys.
+    """
+    token = _scope.set(scope)
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+
+
+def agent_request(request: dict[str, Any]) -> dict[str, Any]:
+    """Attach the current conversation scope to an agent request."""
+    return {"scope": _scope.get(), **request}
+
+
+def recorded_call(
+    kind: str,
+    request: Callable[[], dict[str, Any]],
+    call: Callable[[], T],
+    encode: Callable[[T], Any],
+    decode: Callable[[Any], T],
+) -> T:
+    """Run ``call`` through the active cassette.
+
+    Args:
+        kind: Interaction kind.
+        request: Builds the response-determining request data (only invoked
+            when a cassette is active).
+        call: Performs the real call.
+        encode: Converts a response to JSON-serializable data.
+        decode: Rebuilds a response from recorded data.
+
+    Returns:
+        The real or replayed response.
+
+    Raises:
+        CassetteMissError: When replaying a request that was never recorded.
+    """
+    cassette = _ACTIVE_CASSETTE.get()
+    if cassette is None:
+        return call()
+    if cassette.replaying:
+        return decode(cassette.replay(kind, request()))
+    response = call()
+    cassette.record(kind, request(), encode(response))
+    return response
+
+
+async def arecorded_call(
+    kind: str,
+    request: Callable[[], dict[str, Any]],
+    call: Callable[[], Awaitable[T]],
+    encode: Callable[[T], Any],
+    decode: Callable[[Any], T],
+) -> T:
+    """Async variant of :func:`recorded_call`."""
+    cassette = _ACTIVE_CASSETTE.get()
+    if cassette is None:
+        return await call()
+    if cassette.replaying:
+        return decode(cassette.replay(kind, request()))
+    response = await call()
+    cassette.record(kind, request(), encode(response))
+    return response
+
+
+def default_cassette_path(output_dir: str) -> str:
+    """Return a timestamped cassette path in ``output_dir``."""
+    timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
+    return str(Path(output_dir) / f"{CASSETTE_BASE_FILENAME}_{timestamp}.zip")
+
+
+@contextmanager
+def cassette_run(
+    record: Optional[str] = None, replay: Optional[str] = None
+) -> Iterator[Optional[Cassette]]:
+    """Record the enclosed run to, or replay it from, a cassette archive.
+
+    Only the outermost run owns the cassette; a nested run (e.g. the pipeline
+    inside a recording CLI invocation) uses the active one.
+
+    Args:
+        record: Archive to write the run's interactions to.
+        replay: Archive to serve the run's interactions from.
+
+    Yields:
+        The active cassette, or None when neither option is set.
+
+    Raises:
+        ValueError: If both ``record`` and ``replay`` are given.
+        CassetteMissError: If the replay archive cannot be read.
+    """
+    if record and replay:
+        raise ValueError("Cannot record and replay a cassette in the same run")
+    if not (record or replay):
+        yield None
+        return
+
+    outer = get_active_cassette()
+    if outer is not None:
+        yield outer
+        return
+
+    cassette = Cassette(record, "record") if record else Cassette(str(replay), "replay")
+    if cassette.replaying:
+        logger.info("Replaying %d recorded requests from %s", len(cassette), replay)
+    try:
+        with cassette_session(cassette):
+            yield cassette
+    finally:
+        if cassette.replaying:
+            misses = cassette.misses
+            if misses:
+                logger.warning(
+                    "%d requests were not found in cassette %s; first: %s",
+                    len(misses),
+                    cassette.path,
+                    misses[0],
+                )
+        else:
+            try:
+                path = cassette.save()
+                logger.info("Cassette: %s (%d requests)", path, len(cassette))
+            except OSError as e:
+                logger.warning("Failed to write cassette: %s", e)
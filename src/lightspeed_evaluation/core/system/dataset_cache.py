@@ -0,0 +1,130 @@
+"""On-disk cache of parsed and validated evaluation datasets."""
+
+import hashlib
+import logging
+import os
+import pickle  # nosec B403 - cache files are written and read by this module only
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+import pydantic
+
+from lightspeed_evaluation.core.models import EvaluationData
+from lightspeed_evaluation.core.models.data import DatasetMetadata
+
+logger = logging.getLogger(__name__)
+
+CachedDataset = tuple[list[EvaluationData], Optional[DatasetMetadata]]
+
+
+def _framework_version() -> str:
+    """Return the installed framework version without importing the package root."""
+    # pylint: disable=import-outside-toplevel
+    from lightspeed_evaluation import __version__
+
+    return __version__
+
+
+class DatasetCache:
+    """Content-addressed cache of validated evaluation data.
+
+    Entries are keyed by the SHA-256 of the raw dataset bytes combined with the
+    framework and Pydantic versions, so any edit to the file or an upgrade that
+    may change model validation invalidates the entry automatically. Unreadable
+    or stale entries are treated as misses and overwritten.
+    """
+
+    def __init__(self, cache_dir: str) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding cache entries (created on first store).
+        """
+        self.cache_dir = Path(cache_dir)
+
+    @staticmethod
+    def compute_key(content: bytes) -> str:
+        """Compute the cache key for raw dataset content.
+
+        Args:
+            content: Raw bytes of the evaluation data file.
+
+        Returns:
+            Hex digest identifying the content and framework version.
+        """
+        digest = hashlib.sha256()
+        digest.update(content)
+        digest.update(b"\0")
+        digest.update(_framework_version().encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(pydantic.VERSION.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        """Return the file path for a cache key."""
+        return self.cache_dir / f"{key}.pkl"
+
+    def load(self, key: str) -> Optional[CachedDataset]:
+        """Load a cached dataset.
+
+        Args:
+            key: Cache key from ``compute_key``.
+
+        Returns:
+            Tuple of (evaluation data, dataset metadata), or None on a miss.
+        """
+        path = self._entry_path(key)
+        if not path.is_file():
+            return None
+        try:
+            with open(path, "rb") as f:
+                cached = pickle.load(f)  # nosec B301 - trusted local cache
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError) as e:
+            logger.warning("Ignoring unreadable dataset cache entry %s: %s", path, e)
+            return None
+
+        if (
+            not isinstance(cached, tuple)
+            or len(cached) != 2
+            or not isinstance(cached[0], list)
+        ):
+            logger.warning("Ignoring malformed dataset cache entry %s", path)
+            return None
+
+        logger.debug("Dataset cache hit: %s", path)
+        return cached[0], cached[1]
+
+    def store(
+        self,
+        key: str,
+        evaluation_data: list[EvaluationData],
+        dataset_metadata: Optional[DatasetMetadata],
+    ) -> None:
+        """Persist a validated dataset.
+
+        The entry is written to a temporary file and atomically renamed so a
+        concurrent reader never observes a partial entry. Failures are logged
+        and otherwise ignored; caching is an optimization only.
+
+        Args:
+            key: Cache key from ``compute_key``.
+            evaluation_data: Validated conversations.
+            dataset_metadata: Optional dataset-level metadata.
+        """
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(
+                        (evaluation_data, dataset_metadata),
+                        f,
+                        protocol=pickle.HIGHEST_PROTOCOL,
+                    )
+                os.replace(tmp_path, self._entry_path(key))
+            except BaseException:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
+        except (OSError, pickle.PicklingError) as e:
+            logger.warning("Failed to write dataset cache entry: %s", e)
@@ -2,6 +2,7 @@
 
 import os
 
+from lightspeed_evaluation.core.system.cassette import is_replaying
 from lightspeed_evaluation.core.system.exceptions import LLMError
 
 
@@ -77,9 +78,15 @@ def validate_provider_env(provider: str) -> None:
     Args:
         provider: The LLM provider name
 
+    Validation is skipped while replaying a cassette, which needs no
+    provider credentials.
+
     Raises:
         LLMError: If required environment variables are missing
     """
+    if is_replaying():
+        return
+
     validators = {
         "hosted_vllm": validate_hosted_vllm_env,
         "openai": validate_openai_env,
@@ -55,3 +55,15 @@ class StorageError(EvaluationError):
         """Initialize storage error."""
         super().__init__(message)
         self.backend_name = backend_name
+
+
+class CassetteMissError(EvaluationError):
+    """Exception raised when a replayed request is not in the cassette."""
+
+
+class BatchJudgeError(EvaluationError):
+    """Exception raised when batch-API judge requests cannot be completed."""
+
+
+class BatchPendingError(BatchJudgeError):
+    """Exception raised for a judge request deferred to the next provider batch."""
@@ -7,12 +7,17 @@ import yaml
 
 from lightspeed_evaluation.core.models import (
     APIConfig,
+    BatchJudgeConfig,
+    BudgetConfig,
     CoreConfig,
     EmbeddingConfig,
     EvaluationData,
     LLMConfig,
     LoggingConfig,
+    ProfilingConfig,
+    SequentialTestConfig,
     SystemConfig,
+    TracingConfig,
     VisualizationConfig,
 )
 from lightspeed_evaluation.core.models.system import (
@@ -32,6 +37,7 @@ from lightspeed_evaluation.core.system.setup import (
     setup_environment_variables,
     setup_logging,
 )
+from lightspeed_evaluation.core.system.yaml_io import safe_load_yaml
 
 logger = logging.getLogger(__name__)
 
@@ -104,7 +110,7 @@ class ConfigLoader:  # pylint: disable=too-few-public-methods
         """Load system configuration from YAML file."""
         try:
             with open(config_path, "r", encoding="utf-8") as f:
-                config_data = yaml.safe_load(f)
+                config_data = safe_load_yaml(f)
         except FileNotFoundError as exc:
             raise ValueError(f"Configuration file not found: {config_path}") from exc
         except yaml.YAMLError as e:
@@ -171,6 +177,13 @@ class ConfigLoader:  # pylint: disable=too-few-public-methods
             storage=storage_backends,
             logging=LoggingConfig(**config_data.get("logging", {})),
             visualization=VisualizationConfig(**config_data.get("visualization", {})),
+            profiling=ProfilingConfig(**config_data.get("profiling") or {}),
+            tracing=TracingConfig(**config_data.get("tracing") or {}),
+            sequential_test=SequentialTestConfig(
+                **config_data.get("sequential_test") or {}
+            ),
+            budget=BudgetConfig(**config_data.get("budget") or {}),
+            batch_judge=BatchJudgeConfig(**config_data.get("batch_judge") or {}),
             llm_pool=llm_pool,
             judge_panel=judge_panel,
             quality_score=quality_score_config,
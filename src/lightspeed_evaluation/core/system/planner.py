@@ -0,0 +1,618 @@
+"""Dry-run planning: estimate the calls, tokens, cost and duration of a run.
+
+Metrics are resolved per turn with :class:`MetricManager`, the same way the
+pipeline resolves them, and judge calls are counted without importing a
+metric framework or touching the network:
+
+- a panel metric is scored by every panel judge (escalation and early
+  stopping can only lower this)
+- a list of expected responses is scored once per alternative when a single
+  judge scores a metric that compares against it (an upper bound when
+  alternatives stop at the first PASS)
+- GEval criteria without evaluation steps add one step generation per judge
+  model unless ``geval_steps.json`` in the output directory already has them
+- with ``core.fuse_custom_metrics`` the fusable custom metrics of a turn share
+  one judge call
+
+Prompt tokens are estimated from the metric's prompt template and the turn
+data. An agent call is a cache hit when its request is in the API cache. A
+judge call is a likely cache hit when its judge's cache is populated and its
+inputs are fixed, i.e. the response comes from the data or a cached agent
+call. Per-call latency is measured from the newest profile trace in the
+output directory when there is one.
+"""
+
+import json
+import logging
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Optional
+
+from diskcache import Cache
+
+from lightspeed_evaluation.core.api.client import api_cache_key, build_api_request
+from lightspeed_evaluation.core.constants import (
+    DEFAULT_PLAN_AGENT_LATENCY,
+    DEFAULT_PLAN_JUDGE_LATENCY,
+    DEFAULT_PLAN_JUDGE_OUTPUT_TOKENS,
+    DEFAULT_PLAN_RESPONSE_TOKENS,
+    NON_LLM_FRAMEWORKS,
+    PLAN_CHARS_PER_TOKEN,
+    PLAN_PROMPT_TEMPLATE_TOKENS,
+)
+from lightspeed_evaluation.core.metrics.custom.prompts import (
+    ANSWER_CORRECTNESS_INSTRUCTIONS,
+    ANSWER_CORRECTNESS_PROMPT,
+    ANSWER_CORRECTNESS_RUBRIC,
+    FUSED_EVALUATION_INSTRUCTIONS,
+    FUSED_EVALUATION_PROMPT,
+    INTENT_EVALUATION_INSTRUCTIONS,
+    INTENT_EVALUATION_PROMPT,
+    INTENT_EVALUATION_RUBRIC,
+    PROPOSAL_EVALUATION_CORRECTNESS_INSTRUCTIONS,
+    PROPOSAL_EVALUATION_CORRECTNESS_PROMPT,
+)
+from lightspeed_evaluation.core.metrics.geval_steps import (
+    GEVAL_STEPS_FILENAME,
+    GEVAL_STEPS_VERSION,
+)
+from lightspeed_evaluation.core.metrics.manager import MetricLevel, MetricManager
+from lightspeed_evaluation.core.models import (
+    APIConfig,
+    EvaluationData,
+    LLMConfig,
+    MetricPlan,
+    PlannedCalls,
+    RunPlan,
+    SystemConfig,
+    TurnData,
+)
+from lightspeed_evaluation.core.models.agents import HttpApiAgentConfig
+from lightspeed_evaluation.core.system.profiler import (
+    PROFILE_BASE_FILENAME,
+    STAGE_AGENT_CALL,
+    STAGE_JUDGE_CALL,
+    STAGE_METRIC_PREFIX,
+)
+from lightspeed_evaluation.core.system.validator import METRIC_REQUIREMENTS
+
+logger = logging.getLogger(__name__)
+
+RUN_PLAN_FILENAME = "run_plan.json"
+
+# Prompt templates (instructions and data) of the LLM-judged custom metrics
+_CUSTOM_PROMPTS = {
+    "custom:answer_correctness": (
+        ANSWER_CORRECTNESS_INSTRUCTIONS + ANSWER_CORRECTNESS_PROMPT
+    ),
+    "custom:intent_eval": INTENT_EVALUATION_INSTRUCTIONS + INTENT_EVALUATION_PROMPT,
+    "custom:proposal_evaluation_correctness": (
+        PROPOSAL_EVALUATION_CORRECTNESS_INSTRUCTIONS
+        + PROPOSAL_EVALUATION_CORRECTNESS_PROMPT
+    ),
+}
+# Rubrics of the custom metrics that can share a fused judge call
+_FUSED_RUBRICS = {
+    "custom:answer_correctness": ANSWER_CORRECTNESS_RUBRIC,
+    "custom:intent_eval": INTENT_EVALUATION_RUBRIC,
+}
+FUSED_METRIC = "custom:fused"
+
+
+def estimate_tokens(*texts: Any) -> int:
+    """Estimate the tokens of some text fields (lists are joined)."""
+    chars = 0
+    for text in texts:
+        if isinstance(text, list):
+            chars += sum(len(str(item)) for item in text)
+        elif text:
+            chars += len(str(text))
+    return chars // PLAN_CHARS_PER_TOKEN
+
+
+def load_measured_latencies(output_dir: str) -> tuple[dict[str, float], str]:
+    """Read mean per-call latencies from the newest profile trace.
+
+    Args:
+        output_dir: Output directory of earlier profiled runs.
+
+    Returns:
+        Tuple of (mean seconds by span name, trace path). Both are empty when
+        no readable trace exists.
+    """
+    traces = sorted(Path(output_dir).glob(f"{PROFILE_BASE_FILENAME}_*_trace.json"))
+    if not traces:
+        return {}, ""
+    try:
+        with open(traces[-1], encoding="utf-8") as f:
+            events = json.load(f)["traceEvents"]
+    except (OSError, KeyError, TypeError, json.JSONDecodeError) as e:
+        logger.warning("Ignoring unreadable profile trace %s: %s", traces[-1], e)
+        return {}, ""
+
+    durations: dict[str, list[float]] = {}
+    for event in events:
+        if event.get("ph") == "X":
+            durations.setdefault(event["name"], []).append(event["dur"] / 1e6)
+    latencies = {name: sum(values) / len(values) for name, values in durations.items()}
+    return latencies, str(traces[-1])
+
+
+def _judge_latency(latencies: dict[str, float]) -> float:
+    """Pick the measured judge latency: judge calls, then LLM metric spans."""
+    if STAGE_JUDGE_CALL in latencies:
+        return latencies[STAGE_JUDGE_CALL]
+    metric_latencies = [
+        seconds
+        for name, seconds in latencies.items()
+        if name.startswith(STAGE_METRIC_PREFIX)
+        and name[len(STAGE_METRIC_PREFIX) :] not in NON_LLM_FRAMEWORKS
+    ]
+    if metric_latencies:
+        return sum(metric_latencies) / len(metric_latencies)
+    return DEFAULT_PLAN_JUDGE_LATENCY
+
+
+def _cached_geval_criteria(output_dir: str) -> set[tuple[str, str]]:
+    """Return the (model, criteria) pairs with persisted GEval steps."""
+    path = Path(output_dir) / GEVAL_STEPS_FILENAME
+    if not path.is_file():
+        return set()
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != GEVAL_STEPS_VERSION:
+            return set()
+        return {(entry["model"], entry["criteria"]) for entry in data["entries"]}
+    except (OSError, KeyError, TypeError, AttributeError, json.JSONDecodeError):
+        return set()
+
+
+@contextmanager
+def _open_cache(cache_dir: Optional[str]) -> Iterator[Optional[Cache]]:
+    """Open an existing disk cache, or yield None without creating one."""
+    if not cache_dir or not os.path.isdir(cache_dir):
+        yield None
+        return
+    cache = Cache(cache_dir)
+    try:
+        yield cache
+    finally:
+        cache.close()
+
+
+def _warm_judges(judge_configs: dict[str, LLMConfig]) -> set[str]:
+    """Return the judges whose response cache already holds entries."""
+    warm = set()
+    for judge_id, llm_config in judge_configs.items():
+        with _open_cache(
+            llm_config.cache_dir if llm_config.cache_enabled else None
+        ) as cache:
+            if cache is not None and len(cache) > 0:
+                warm.add(judge_id)
+    return warm
+
+
+class RunPlanner:  # pylint: disable=too-many-instance-attributes,too-few-public-methods
+    """Count the calls and tokens of a run from its configuration and data."""
+
+    def __init__(self, system_config: SystemConfig, output_dir: str) -> None:
+        """Initialize the planner.
+
+        Args:
+            system_config: Loaded system configuration.
+            output_dir: Run output directory (profile traces, GEval steps).
+        """
+        self.config = system_config
+        self.output_dir = output_dir
+        self.metric_manager = MetricManager(system_config)
+        self.judge_configs: dict[str, LLMConfig] = dict(
+            system_config.get_judge_configs()
+        )
+        self.primary_judge = next(iter(self.judge_configs))
+        self.agent_enabled = (
+            system_config.agents is not None and system_config.agents.enabled
+        )
+        self._geval_cached = _cached_geval_criteria(output_dir)
+        self._geval_planned: set[tuple[str, str]] = set()
+        self._warm_judges = _warm_judges(self.judge_configs)
+        self._metrics: dict[str, MetricPlan] = {}
+        self._agent = PlannedCalls()
+        self._judge = PlannedCalls()
+        self._cost: dict[str, float] = {}
+
+    def plan(self, evaluation_data: list[EvaluationData]) -> RunPlan:
+        """Estimate the calls, tokens, cost and duration of evaluating the data."""
+        latencies, trace = load_measured_latencies(self.output_dir)
+        agent_latency = latencies.get(STAGE_AGENT_CALL, DEFAULT_PLAN_AGENT_LATENCY)
+        judge_latency = _judge_latency(latencies)
+
+        conversation_seconds = []
+        evaluations = 0
+        for conv_data in evaluation_data:
+            agent_before = self._agent.calls - self._agent.likely_cached
+            judge_before = self._judge.calls - self._judge.likely_cached
+            evaluations += self._plan_conversation(conv_data)
+            conversation_seconds.append(
+                (self._agent.calls - self._agent.likely_cached - agent_before)
+                * agent_latency
+                + (self._judge.calls - self._judge.likely_cached - judge_before)
+                * judge_latency
+            )
+
+        workers = self.config.core.max_threads or min(32, (os.cpu_count() or 1) + 4)
+        priced = any(
+            llm_config.input_cost_per_million_tokens is not None
+            or llm_config.output_cost_per_million_tokens is not None
+            for llm_config in self.judge_configs.values()
+        )
+        return RunPlan(
+            conversations=len(evaluation_data),
+            turns=sum(len(conv_data.turns) for conv_data in evaluation_data),
+            evaluations=evaluations,
+            agent=self._agent,
+            judge=self._judge,
+            geval_step_generations=len(self._geval_planned),
+            metrics=sorted(self._metrics.values(), key=lambda m: m.metric_identifier),
+            workers=workers,
+            agent_latency=agent_latency,
+            judge_latency=judge_latency,
+            latency_source=trace or "default",
+            estimated_cost=sum(self._cost.values()) if priced else None,
+            estimated_duration=max(
+                sum(conversation_seconds) / workers,
+                max(conversation_seconds, default=0.0),
+            ),
+        )
+
+    def _plan_conversation(self, conv_data: EvaluationData) -> int:
+        """Plan one conversation's agent and judge calls; return its evaluations."""
+        api_config = self._agent_api_config(conv_data)
+        evaluations = 0
+        all_fixed = True
+        with _open_cache(
+            api_config.cache_dir if api_config and api_config.cache_enabled else None
+        ) as cache:
+            for turn_data in conv_data.turns:
+                fixed = True
+                if self.agent_enabled:
+                    fixed = self._plan_agent_call(turn_data, api_config, cache)
+                all_fixed = all_fixed and fixed
+                metrics = self.metric_manager.resolve_metrics(
+                    turn_data.turn_metrics, MetricLevel.TURN
+                )
+                evaluations += len(metrics)
+                self._plan_turn(conv_data, turn_data, metrics, fixed)
+
+        metrics = self.metric_manager.resolve_metrics(
+            conv_data.conversation_metrics, MetricLevel.CONVERSATION
+        )
+        evaluations += len(metrics)
+        transcript_tokens = sum(
+            estimate_tokens(turn_data.query) + self._response_tokens(turn_data)
+            for turn_data in conv_data.turns
+        )
+        for metric_identifier in metrics:
+            self._plan_metric(
+                metric_identifier,
+                MetricLevel.CONVERSATION,
+                conv_data,
+                None,
+                transcript_tokens,
+                all_fixed,
+            )
+        return evaluations
+
+    def _agent_api_config(self, conv_data: EvaluationData) -> Optional[APIConfig]:
+        """Resolve the HTTP API configuration of the conversation's agent.
+
+        Mirrors the pipeline's driver selection by agent name; returns None
+        when agents are disabled or the agent is not an HTTP API agent.
+        """
+        agents = self.config.agents
+        if agents is None or not agents.enabled:
+            return None
+        agent_name = conv_data.agent[0] if conv_data.agent else None
+        if agent_name is None and agents.default.agent is None:
+            agent_config: dict[str, Any] = {"type": "http_api"}
+        else:
+            _name, agent_config = agents.resolve_agent_config(agent_name=agent_name)
+        if agent_config.get("type") != "http_api":
+            return None
+        return APIConfig.model_validate(
+            HttpApiAgentConfig.model_validate(agent_config).model_dump(exclude={"type"})
+        )
+
+    def _plan_agent_call(
+        self,
+        turn_data: TurnData,
+        api_config: Optional[APIConfig],
+        cache: Optional[Cache],
+    ) -> bool:
+        """Plan a turn's agent call; return whether its response is fixed."""
+        agent = self._agent
+        agent.calls += 1
+        if api_config is not None and cache is not None:
+            request = build_api_request(
+                api_config,
+                turn_data.query,
+                attachments=turn_data.attachments,
+                extra_request_params=turn_data.extra_request_params,
+            )
+            if api_cache_key(request) in cache:
+                agent.likely_cached += 1
+                return True
+        agent.input_tokens += estimate_tokens(turn_data.query)
+        agent.output_tokens += self._response_tokens(turn_data)
+        return False
+
+    def _response_tokens(self, turn_data: TurnData) -> int:
+        """Estimate the tokens of a turn's response."""
+        if turn_data.response:
+            return estimate_tokens(turn_data.response)
+        return DEFAULT_PLAN_RESPONSE_TOKENS if self.agent_enabled else 0
+
+    def _plan_turn(
+        self,
+        conv_data: EvaluationData,
+        turn_data: TurnData,
+        metrics: list[str],
+        fixed: bool,
+    ) -> None:
+        """Plan the judge calls of a turn's metrics."""
+        data_tokens = estimate_tokens(
+            turn_data.query, turn_data.contexts, turn_data.expected_intent
+        ) + self._response_tokens(turn_data)
+        fused = self._fused_metrics(turn_data, metrics)
+        if fused:
+            template = (
+                FUSED_EVALUATION_INSTRUCTIONS
+                + FUSED_EVALUATION_PROMPT
+                + "".join(_FUSED_RUBRICS[m] for m in fused)
+            )
+            self._add_judge_calls(
+                FUSED_METRIC,
+                [self.primary_judge],
+                estimate_tokens(template, turn_data.expected_response) + data_tokens,
+                fixed,
+            )
+            for metric_identifier in fused:
+                self._metric(metric_identifier).evaluations += 1
+
+        for metric_identifier in metrics:
+            if metric_identifier in fused:
+                continue
+            self._plan_metric(
+                metric_identifier,
+                MetricLevel.TURN,
+                conv_data,
+                turn_data,
+                data_tokens,
+                fixed,
+            )
+
+    def _fused_metrics(self, turn_data: TurnData, metrics: list[str]) -> list[str]:
+        """Return the turn metrics a fused custom call scores (at least two)."""
+        if not self.config.core.fuse_custom_metrics or isinstance(
+            turn_data.expected_response, list
+        ):
+            return []
+        fused = [
+            m
+            for m in metrics
+            if m in _FUSED_RUBRICS and self._judges(m) == [self.primary_judge]
+        ]
+        return fused if len(fused) >= 2 else []
+
+    def _plan_metric(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        metric_identifier: str,
+        level: MetricLevel,
+        conv_data: EvaluationData,
+        turn_data: Optional[TurnData],
+        data_tokens: int,
+        fixed: bool,
+    ) -> None:
+        """Plan the judge calls of one metric evaluation."""
+        metric = self._metric(metric_identifier)
+        metric.evaluations += 1
+        judges = self._judges(metric_identifier)
+        if not judges:
+            return
+
+        template_tokens = estimate_tokens(_CUSTOM_PROMPTS.get(metric_identifier))
+        framework = metric_identifier.split(":", 1)[0]
+        template_tokens = template_tokens or PLAN_PROMPT_TEMPLATE_TOKENS.get(
+            framework, 0
+        )
+        if framework == "geval":
+            template_tokens += self._plan_geval_steps(
+                metric_identifier, level, conv_data, turn_data, judges, fixed
+            )
+
+        expected = turn_data.expected_response if turn_data else None
+        alternatives = [expected] if not isinstance(expected, list) else expected
+        if (
+            len(alternatives) > 1
+            and len(judges) == 1
+            and "expected_response"
+            in METRIC_REQUIREMENTS.get(metric_identifier, {}).get("required_fields", [])
+        ):
+            for alternative in alternatives:
+                self._add_judge_calls(
+                    metric_identifier,
+                    judges,
+                    template_tokens + data_tokens + estimate_tokens(alternative),
+                    fixed,
+                )
+            return
+        self._add_judge_calls(
+            metric_identifier,
+            judges,
+            template_tokens + data_tokens + estimate_tokens(alternatives[0]),
+            fixed,
+        )
+
+    def _plan_geval_steps(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        metric_identifier: str,
+        level: MetricLevel,
+        conv_data: EvaluationData,
+        turn_data: Optional[TurnData],
+        judges: list[str],
+        fixed: bool,
+    ) -> int:
+        """Plan GEval step generations; return the criteria and steps tokens."""
+        metadata = (
+            self.metric_manager.get_metric_metadata(
+                metric_identifier, level, conv_data, turn_data
+            )
+            or {}
+        )
+        criteria = metadata.get("criteria") or ""
+        steps = metadata.get("evaluation_steps")
+        if criteria and not steps:
+            for judge_id in judges:
+                model = self.judge_configs[judge_id].model
+                key = (model, criteria)
+                if key in self._geval_planned or any(
+                    cached_criteria == criteria
+                    and (cached_model == model or cached_model.endswith(f"/{model}"))
+                    for cached_model, cached_criteria in self._geval_cached
+                ):
+                    continue
+                self._geval_planned.add(key)
+                self._add_judge_calls(
+                    metric_identifier,
+                    [judge_id],
+                    PLAN_PROMPT_TEMPLATE_TOKENS["geval"] + estimate_tokens(criteria),
+                    fixed,
+                )
+        return estimate_tokens(criteria, steps)
+
+    def _judges(self, metric_identifier: str) -> list[str]:
+        """Return the judges scoring a metric (none for non-LLM metrics)."""
+        framework = metric_identifier.split(":", 1)[0]
+        if framework in NON_LLM_FRAMEWORKS:
+            return []
+        if framework == "custom" and metric_identifier not in _CUSTOM_PROMPTS:
+            return []
+        panel = self.config.judge_panel
+        if panel is not None and (
+            panel.enabled_metrics is None or metric_identifier in panel.enabled_metrics
+        ):
+            return list(panel.judges)
+        return [self.primary_judge]
+
+    def _metric(self, metric_identifier: str) -> MetricPlan:
+        """Return the plan of a metric, creating it on first use."""
+        if metric_identifier not in self._metrics:
+            self._metrics[metric_identifier] = MetricPlan(
+                metric_identifier=metric_identifier
+            )
+        return self._metrics[metric_identifier]
+
+    def _add_judge_calls(
+        self,
+        metric_identifier: str,
+        judges: list[str],
+        input_tokens: int,
+        fixed: bool,
+    ) -> None:
+        """Add one call per judge to the metric and run totals."""
+        metric = self._metric(metric_identifier)
+        for judge_id in judges:
+            for planned in (metric, self._judge):
+                planned.calls += 1
+                if fixed and judge_id in self._warm_judges:
+                    planned.likely_cached += 1
+                else:
+                    planned.input_tokens += input_tokens
+                    planned.output_tokens += DEFAULT_PLAN_JUDGE_OUTPUT_TOKENS
+            if fixed and judge_id in self._warm_judges:
+                continue
+            llm_config = self.judge_configs[judge_id]
+            self._cost[judge_id] = (
+                self._cost.get(judge_id, 0.0)
+                + (
+                    input_tokens * (llm_config.input_cost_per_million_tokens or 0.0)
+                    + DEFAULT_PLAN_JUDGE_OUTPUT_TOKENS
+                    * (llm_config.output_cost_per_million_tokens or 0.0)
+                )
+                / 1_000_000
+            )
+
+
+def plan_run(
+    evaluation_data: list[EvaluationData],
+    system_config: SystemConfig,
+    output_dir: str,
+) -> RunPlan:
+    """Estimate the calls, tokens, cost and duration of a run without running it.
+
+    Args:
+        evaluation_data: Conversations the run would evaluate.
+        system_config: Loaded system configuration.
+        output_dir: Run output directory (profile traces, GEval steps).
+
+    Returns:
+        The run plan.
+    """
+    return RunPlanner(system_config, output_dir).plan(evaluation_data)
+
+
+def format_run_plan(plan: RunPlan) -> str:
+    """Format a run plan as a text report."""
+    lines = [
+        f"Conversations: {plan.conversations}, turns: {plan.turns}, "
+        f"metric evaluations: {plan.evaluations}",
+        "",
+        f"{'Calls':<40}{'Total':>8}{'Cached':>8}{'In tokens':>12}{'Out tokens':>12}",
+        "-" * 80,
+    ]
+    rows = [("Agent", plan.agent), ("Judge (all metrics)", plan.judge)]
+    rows.extend((f"  {m.metric_identifier}", m) for m in plan.metrics if m.calls)
+    for label, calls in rows:
+        lines.append(
+            f"{label:<40}{calls.calls:>8}{calls.likely_cached:>8}"
+            f"{calls.input_tokens:>12}{calls.output_tokens:>12}"
+        )
+    lines.append("")
+    if plan.geval_step_generations:
+        lines.append(
+            f"GEval step generations: {plan.geval_step_generations} "
+            "(included in judge calls)"
+        )
+    lines.append(
+        "Estimated judge cost: "
+        + (
+            f"{plan.estimated_cost:.4f}"
+            if plan.estimated_cost is not None
+            else "unknown (no judge model prices configured)"
+        )
+    )
+    lines.append(
+        f"Estimated duration: {plan.estimated_duration:.0f}s with {plan.workers} "
+        f"workers ({plan.agent_latency:.2f}s per agent call, "
+        f"{plan.judge_latency:.2f}s per judge call; latency: {plan.latency_source})"
+    )
+    return "\n".join(lines) + "\n"
+
+
+def write_run_plan(plan: RunPlan, output_dir: str) -> Path:
+    """Write a run plan to the output directory.
+
+    Args:
+        plan: Run plan.
+        output_dir: Run output directory (created if missing).
+
+    Returns:
+        Path of the written plan.
+    """
+    path = Path(output_dir) / RUN_PLAN_FILENAME
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(plan.model_dump(mode="json"), f, indent=2)
+    return path
@@ -0,0 +1,396 @@
+"""Built-in profiling: per-stage timing spans, Chrome traces and optional snapshots.
+
+A :class:`Profiler` is activated for the duration of a run with
+:func:`profiling_session`. Instrumented code marks stages with
+:func:`profile_span`, which is a cheap no-op when no profiler is active, so
+the pipeline does not need to thread a profiler through every component.
+"""
+
+import cProfile
+import io
+import json
+import logging
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Optional
+
+from lightspeed_evaluation.core.models.statistics import StageTiming
+from lightspeed_evaluation.core.models.system import ProfilingConfig
+from lightspeed_evaluation.core.system.session import ActiveSession
+
+logger = logging.getLogger(__name__)
+
+# Stage names recorded by the framework
+STAGE_CONFIG_LOAD = "config_load"
+STAGE_DATA_VALIDATION = "data_validation"
+STAGE_HANDLER_SETUP = "handler_setup"
+STAGE_EVALUATION = "evaluation"
+STAGE_SETUP_SCRIPT = "setup_script"
+STAGE_CLEANUP_SCRIPT = "cleanup_script"
+STAGE_AGENT_CALL = "agent_call"
+STAGE_AGENT_POOL_WAIT = "agent_pool_wait"
+STAGE_METRIC_PREFIX = "metric:"
+STAGE_JUDGE_CALL = "judge_call"
+STAGE_STORAGE_WRITE = "storage_write"
+STAGE_STORAGE_FINALIZE = "storage_finalize"
+STAGE_REPORT_GENERATION = "report_generation"
+STAGE_GRAPH_RENDERING = "graph_rendering"
+
+PROFILE_BASE_FILENAME = "profile"
+
+
+@dataclass(frozen=True)
+class ProfileSpan:
+    """One completed timing span."""
+
+    name: str
+    category: str
+    start_ns: int
+    duration_ns: int
+    thread_id: int
+    thread_name: str
+    args: dict[str, Any] = field(default_factory=dict)
+
+
+class Profiler:
+    """Collects timing spans and optional cProfile/tracemalloc data for a run.
+
+    Span recording is thread-safe; evaluation threads record concurrently.
+    cProfile only observes the thread that called :meth:`start`.
+    """
+
+    def __init__(self, config: Optional[ProfilingConfig] = None) -> None:
+        """Initialize the profiler.
+
+        Args:
+            config: Profiling options; defaults to spans only.
+        """
+        self.config = config or ProfilingConfig(enabled=True)
+        self._origin_ns = time.perf_counter_ns()
+        self._spans: list[ProfileSpan] = []
+        self._lock = threading.Lock()
+        self._cprofile: Optional[cProfile.Profile] = None
+        self._memory_snapshot: Optional[tracemalloc.Snapshot] = None
+        self._started_tracemalloc = False
+
+    def start(self) -> None:
+        """Start the optional cProfile and tracemalloc collectors."""
+        if self.config.cprofile and self._cprofile is None:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        if self.config.tracemalloc and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def stop(self) -> None:
+        """Stop the optional collectors, keeping their results."""
+        if self._cprofile is not None:
+            self._cprofile.disable()
+        if self.config.tracemalloc and tracemalloc.is_tracing():
+            self._memory_snapshot = tracemalloc.take_snapshot()
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+                self._started_tracemalloc = False
+
+    @contextmanager
+    def span(self, name: str, category: str = "stage", **args: Any) -> Iterator[None]:
+        """Record the wall-clock duration of the enclosed block.
+
+        Args:
+            name: Stage name, aggregated in the timing breakdown.
+            category: Coarse grouping shown in the trace viewer.
+            **args: Extra details attached to the trace event.
+        """
+        start_ns = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.record(
+                name, start_ns, time.perf_counter_ns() - start_ns, category, **args
+            )
+
+    def record(
+        self,
+        name: str,
+        start_ns: int,
+        duration_ns: int,
+        category: str = "stage",
+        **args: Any,
+    ) -> None:
+        """Record a span measured by the caller on the current thread.
+
+        Args:
+            name: Stage name, aggregated in the timing breakdown.
+            start_ns: Start time from ``time.perf_counter_ns()``.
+            duration_ns: Duration in nanoseconds.
+            category: Coarse grouping shown in the trace viewer.
+            **args: Extra details attached to the trace event.
+        """
+        thread = threading.current_thread()
+        span = ProfileSpan(
+            name=name,
+            category=category,
+            start_ns=start_ns - self._origin_ns,
+            duration_ns=duration_ns,
+            thread_id=thread.ident or 0,
+            thread_name=thread.name,
+            args=args,
+        )
+        with self._lock:
+            self._spans.append(span)
+
+    @property
+    def spans(self) -> list[ProfileSpan]:
+        """Snapshot of the spans recorded so far."""
+        with self._lock:
+            return list(self._spans)
+
+    def timing_breakdown(self) -> list[StageTiming]:
+        """Aggregate spans per stage, longest total first."""
+        grouped: dict[str, list[ProfileSpan]] = {}
+        for span in self.spans:
+            grouped.setdefault(span.name, []).append(span)
+
+        breakdown = []
+        for name, spans in grouped.items():
+            durations = [s.duration_ns / 1e9 for s in spans]
+            total = sum(durations)
+            breakdown.append(
+                StageTiming(
+                    stage=name,
+                    category=spans[0].category,
+                    count=len(durations),
+                    total_seconds=total,
+                    mean_seconds=total / len(durations),
+                    max_seconds=max(durations),
+                )
+            )
+        breakdown.sort(key=lambda t: t.total_seconds, reverse=True)
+        return breakdown
+
+    def chrome_trace(self) -> dict[str, Any]:
+        """Return the spans in Chrome trace-event format.
+
+        The result loads in ``chrome://tracing`` and Perfetto.
+        """
+        pid = os.getpid()
+        events: list[dict[str, Any]] = []
+        thread_names: dict[int, str] = {}
+        for span in self.spans:
+            thread_names[span.thread_id] = span.thread_name
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": span.start_ns / 1000,
+                    "dur": span.duration_ns / 1000,
+                    "pid": pid,
+                    "tid": span.thread_id,
+                    "args": {k: str(v) for k, v in span.args.items()},
+                }
+            )
+        for tid, name in thread_names.items():
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {"name": name},
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def cprofile_report(self) -> Optional[str]:
+        """Return the top functions by cumulative time, if cProfile ran."""
+        if self._cprofile is None:
+            return None
+        stream = io.StringIO()
+        stats = pstats.Stats(self._cprofile, stream=stream)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.config.top_n)
+        return stream.getvalue()
+
+    def memory_report(self) -> Optional[str]:
+        """Return the top allocation sites, if tracemalloc ran."""
+        if self._memory_snapshot is None:
+            return None
+        top = self._memory_snapshot.statistics("lineno")[: self.config.top_n]
+        lines = [f"Top {len(top)} allocation sites (by size):"]
+        lines.extend(str(stat) for stat in top)
+        return "\n".join(lines) + "\n"
+
+    def write_artifacts(self, output_dir: str, base_filename: str) -> list[Path]:
+        """Write the Chrome trace and any cProfile/tracemalloc reports.
+
+        Args:
+            output_dir: Directory for the profile files (created if missing).
+            base_filename: Filename prefix for all profile files.
+
+        Returns:
+            Paths of the files written.
+        """
+        out = Path(output_dir)
+        out.mkdir(parents=True, exist_ok=True)
+        written: list[Path] = []
+
+        trace_file = out / f"{base_filename}_trace.json"
+        with open(trace_file, "w", encoding="utf-8") as f:
+            json.dump(self.chrome_trace(), f)
+        written.append(trace_file)
+
+        if self._cprofile is not None:
+            prof_file = out / f"{base_filename}_cprofile.prof"
+            self._cprofile.dump_stats(str(prof_file))
+            written.append(prof_file)
+            cprofile_file = out / f"{base_filename}_cprofile.txt"
+            cprofile_file.write_text(self.cprofile_report() or "", encoding="utf-8")
+            written.append(cprofile_file)
+
+        memory_report = self.memory_report()
+        if memory_report is not None:
+            memory_file = out / f"{base_filename}_tracemalloc.txt"
+            memory_file.write_text(memory_report, encoding="utf-8")
+            written.append(memory_file)
+
+        return written
+
+
+def format_timing_table(timings: list[StageTiming]) -> str:
+    """Format a timing breakdown as a fixed-width text table."""
+    lines = [
+        f"{'Stage':<32}{'Count':>8}{'Total (s)':>12}{'Mean (s)':>12}{'Max (s)':>12}",
+        "-" * 76,
+    ]
+    for timing in timings:
+        lines.append(
+            f"{timing.stage:<32}{timing.count:>8}{timing.total_seconds:>12.3f}"
+            f"{timing.mean_seconds:>12.3f}{timing.max_seconds:>12.3f}"
+        )
+    return "\n".join(lines) + "\n"
+
+
+_ACTIVE_PROFILER: ActiveSession[Profiler] = ActiveSession(
+    "lightspeed_eval_active_profiler"
+)
+
+
+def get_active_profiler() -> Optional[Profiler]:
+    """Return the profiler of the running session, if any."""
+    return _ACTIVE_PROFILER.get()
+
+
+@contextmanager
+def profiling_session(profiler: Profiler) -> Iterator[Profiler]:
+    """Make ``profiler`` the active profiler for the enclosed block.
+
+    A nested session reuses the already-active profiler so an API call made
+    from a profiled CLI run records into the same trace.
+
+    Args:
+        profiler: Profiler to activate.
+
+    Yields:
+        The active profiler.
+    """
+    with _ACTIVE_PROFILER.activate(profiler) as active:
+        if active is not profiler:
+            yield active
+            return
+
+        profiler.start()
+        try:
+            yield profiler
+        finally:
+            profiler.stop()
+
+
+@contextmanager
+def profile_span(name: str, category: str = "stage", **args: Any) -> Iterator[None]:
+    """Record a span on the active profiler; no-op when profiling is off.
+
+    Args:
+        name: Stage name.
+        category: Coarse grouping shown in the trace viewer.
+        **args: Extra details attached to the trace event.
+    """
+    profiler = _ACTIVE_PROFILER.get()
+    if profiler is None:
+        yield
+        return
+    with profiler.span(name, category, **args):
+        yield
+
+
+def record_span(
+    name: str,
+    start_ns: int,
+    duration_ns: int,
+    category: str = "stage",
+    **args: Any,
+) -> None:
+    """Record a caller-measured span on the active profiler, if any.
+
+    Args:
+        name: Stage name.
+        start_ns: Start time from ``time.perf_counter_ns()``.
+        duration_ns: Duration in nanoseconds.
+        category: Coarse grouping shown in the trace viewer.
+        **args: Extra details attached to the trace event.
+    """
+    profiler = _ACTIVE_PROFILER.get()
+    if profiler is not None:
+        profiler.record(name, start_ns, duration_ns, category, **args)
+
+
+@contextmanager
+def profiled_run(
+    config: ProfilingConfig,
+    output_dir: str,
+    profiler: Optional[Profiler] = None,
+) -> Iterator[Optional[Profiler]]:
+    """Profile the enclosed run when enabled and write its profile files.
+
+    Profile files are only written by the outermost run; a nested run (e.g.
+    the pipeline inside a profiled CLI invocation) records into the active
+    profiler and leaves writing to its owner.
+
+    Args:
+        config: Profiling options; nothing is recorded unless enabled.
+        output_dir: Directory for the trace and snapshot files.
+        profiler: Optional pre-created profiler (to include earlier spans).
+
+    Yields:
+        The active profiler, or None when profiling is disabled.
+    """
+    if not config.enabled:
+        yield None
+        return
+
+    outer = get_active_profiler()
+    if outer is not None:
+        yield outer
+        return
+
+    profiler = profiler or Profiler(config)
+    profiler.config = config
+    try:
+        with profiling_session(profiler):
+            yield profiler
+    finally:
+        timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
+        try:
+            paths = profiler.write_artifacts(
+                output_dir, f"{PROFILE_BASE_FILENAME}_{timestamp}"
+            )
+            logger.info("Profile: %s", ", ".join(str(p) for p in paths))
+        except OSError as e:
+            logger.warning("Failed to write profile files: %s", e)
@@ -0,0 +1,187 @@
+"""Stratified sampling of conversations for fast smoke runs.
+
+Conversations are grouped into strata by their tags and the metrics they
+evaluate, and a seeded random subset is drawn from every stratum in
+proportion to its size. The resulting :class:`SamplingPlan` records exactly
+which conversations were drawn so a sampled run can be reproduced, and lets
+pass rates be extrapolated to the full suite.
+"""
+
+import json
+import logging
+import random
+from pathlib import Path
+from typing import Optional
+
+from lightspeed_evaluation.core.metrics.manager import MetricLevel, MetricManager
+from lightspeed_evaluation.core.models import (
+    EvaluationData,
+    SampledPassRates,
+    SamplingPlan,
+    SamplingStratum,
+)
+
+logger = logging.getLogger(__name__)
+
+SAMPLING_REPORT_FILENAME = "sampling_report.json"
+
+
+def parse_sample_spec(value: str | int | float) -> int | float:
+    """Parse a sample size ("40"), fraction ("0.05") or percentage ("5%").
+
+    Args:
+        value: Command-line or API value.
+
+    Returns:
+        An int sample size or a float fraction in (0, 1].
+
+    Raises:
+        ValueError: When the value is not a positive size or a fraction in (0, 1].
+    """
+    if isinstance(value, str):
+        text = value.strip()
+        if text.endswith("%"):
+            value = float(text[:-1]) / 100
+        elif text.isdigit():
+            value = int(text)
+        else:
+            value = float(text)
+    if isinstance(value, bool):
+        raise ValueError(f"Invalid sample: {value!r}")
+    if isinstance(value, int):
+        if value < 1:
+            raise ValueError(f"Sample size must be at least 1, got {value}")
+        return value
+    if not 0 < value <= 1:
+        raise ValueError(f"Sample fraction must be in (0, 1], got {value}")
+    return float(value)
+
+
+def _conversation_metrics(
+    conv_data: EvaluationData, metric_manager: Optional[MetricManager]
+) -> list[str]:
+    """Return the sorted turn and conversation metrics a conversation evaluates."""
+    metrics: set[str] = set()
+    for turn_data in conv_data.turns:
+        metrics.update(
+            metric_manager.resolve_metrics(turn_data.turn_metrics, MetricLevel.TURN)
+            if metric_manager
+            else turn_data.turn_metrics or []
+        )
+    metrics.update(
+        metric_manager.resolve_metrics(
+            conv_data.conversation_metrics, MetricLevel.CONVERSATION
+        )
+        if metric_manager
+        else conv_data.conversation_metrics or []
+    )
+    return sorted(metrics)
+
+
+def _allocate(populations: list[int], size: int) -> list[int]:
+    """Split a sample size across strata proportionally (largest remainder).
+
+    Every stratum gets at least one conversation when the sample is large
+    enough to cover all of them.
+    """
+    if size >= sum(populations):
+        return list(populations)
+    minimum = 1 if size >= len(populations) else 0
+    quotas = [population * size / sum(populations) for population in populations]
+    allocation = [
+        min(population, max(minimum, int(quota)))
+        for population, quota in zip(populations, quotas)
+    ]
+    while sum(allocation) < size:
+        idx = max(
+            (i for i, n in enumerate(allocation) if n < populations[i]),
+            key=lambda i: quotas[i] - allocation[i],
+        )
+        allocation[idx] += 1
+    while sum(allocation) > size:
+        idx = min(
+            (i for i, n in enumerate(allocation) if n > minimum),
+            key=lambda i: quotas[i] - allocation[i],
+        )
+        allocation[idx] -= 1
+    return allocation
+
+
+def sample_conversations(
+    data: list[EvaluationData],
+    sample: int | float,
+    seed: int = 0,
+    metric_manager: Optional[MetricManager] = None,
+) -> tuple[list[EvaluationData], SamplingPlan]:
+    """Draw a stratified random sample of conversations.
+
+    Args:
+        data: Full suite of conversations.
+        sample: Sample size (int) or fraction of the suite (float), see
+            :func:`parse_sample_spec`.
+        seed: Random seed; the same seed and data give the same sample.
+        metric_manager: Resolves default metrics for the metric mix; without
+            it only explicitly listed metrics are considered.
+
+    Returns:
+        Tuple of (sampled conversations in their original order, plan).
+    """
+    sample = parse_sample_spec(sample)
+    if isinstance(sample, int):
+        size, fraction = min(sample, len(data)), None
+    else:
+        size, fraction = max(1, round(sample * len(data))), sample
+
+    groups: dict[tuple[tuple[str, ...], tuple[str, ...]], list[str]] = {}
+    for conv_data in data:
+        key = (
+            tuple(sorted(conv_data.tag)),
+            tuple(_conversation_metrics(conv_data, metric_manager)),
+        )
+        groups.setdefault(key, []).append(conv_data.conversation_group_id)
+
+    rng = random.Random(seed)
+    allocation = _allocate([len(ids) for ids in groups.values()], size if data else 0)
+    strata = [
+        SamplingStratum(
+            key=f"{','.join(tags)} | {','.join(metrics)}",
+            tags=list(tags),
+            metrics=list(metrics),
+            population=len(ids),
+            conversation_ids=sorted(rng.sample(ids, count)),
+        )
+        for ((tags, metrics), ids), count in zip(groups.items(), allocation)
+    ]
+    plan = SamplingPlan(
+        seed=seed,
+        size=sample if isinstance(sample, int) else None,
+        fraction=fraction,
+        population=len(data),
+        strata=strata,
+    )
+    selected = plan.conversation_ids()
+    logger.info(
+        "Sampled %d of %d conversations from %d strata (seed %d)",
+        len(selected),
+        len(data),
+        len(strata),
+        seed,
+    )
+    return [c for c in data if c.conversation_group_id in selected], plan
+
+
+def write_sampling_report(report: SampledPassRates, output_dir: str) -> Path:
+    """Write the sampling plan and extrapolated pass rates of a run.
+
+    Args:
+        report: Sampling plan with its estimates.
+        output_dir: Run output directory (created if missing).
+
+    Returns:
+        Path of the written report.
+    """
+    path = Path(output_dir) / SAMPLING_REPORT_FILENAME
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report.model_dump(mode="json"), f, indent=2)
+    return path
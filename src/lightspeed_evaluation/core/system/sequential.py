@@ -0,0 +1,142 @@
+"""Sequential probability ratio test (SPRT) of the pass rate against a baseline.
+
+Every evaluation result is a Bernoulli trial (PASS or not, as in the overall
+pass rate). Wald's SPRT weighs the baseline pass rate ``p0`` against the
+regressed rate ``p1 = p0 - max_drop`` after each result and stops as soon as
+the log-likelihood ratio leaves ``(log(beta / (1 - alpha)),
+log((1 - beta) / alpha))``: a regression is then reported with error
+probability at most ``alpha`` and a drop of ``max_drop`` is missed with
+probability at most ``beta``. Results within a conversation are treated as
+independent trials, like the pass rate itself does.
+"""
+
+import json
+import math
+from pathlib import Path
+from typing import Optional
+
+from lightspeed_evaluation.core.models import (
+    EvaluationResult,
+    SequentialTestConfig,
+    SequentialTestResult,
+)
+
+SEQUENTIAL_REPORT_FILENAME = "sequential_report.json"
+
+
+def parse_baseline(value: str) -> float:
+    """Parse a baseline pass rate (percent) or read it from a summary JSON.
+
+    Args:
+        value: A pass rate in percent ("92.5") or the path of a previous
+            run's ``*_summary.json`` report.
+
+    Returns:
+        Baseline pass rate in percent.
+
+    Raises:
+        ValueError: When the value is neither a number nor a readable summary.
+    """
+    path = Path(value)
+    if not path.is_file():
+        return float(value)
+    try:
+        with open(path, encoding="utf-8") as f:
+            return float(json.load(f)["summary_stats"]["overall"]["pass_rate"])
+    except (OSError, KeyError, TypeError, json.JSONDecodeError) as e:
+        raise ValueError(f"Cannot read baseline pass rate from {value}: {e}") from e
+
+
+class SequentialProbabilityRatioTest:  # pylint: disable=too-many-instance-attributes
+    """Wald's SPRT deciding whether the pass rate regressed below a baseline."""
+
+    def __init__(self, config: SequentialTestConfig, conversations_total: int = 0):
+        """Initialize the test from an enabled sequential test configuration."""
+        if config.baseline_pass_rate is None:
+            raise ValueError("Sequential test requires a baseline pass rate")
+        self.config = config
+        self.conversations_total = conversations_total
+        self._p0 = config.baseline_pass_rate / 100
+        self._p1 = (config.baseline_pass_rate - config.max_drop) / 100
+        self._pass_weight = math.log(self._p1 / self._p0)
+        self._fail_weight = math.log((1 - self._p1) / (1 - self._p0))
+        self.lower_bound = math.log(config.beta / (1 - config.alpha))
+        self.upper_bound = math.log((1 - config.beta) / config.alpha)
+
+        self.log_likelihood_ratio = 0.0
+        self.conversations = 0
+        self.results = 0
+        self.passed = 0
+        self.decision: Optional[str] = None
+
+    def update(self, results: list[EvaluationResult]) -> Optional[str]:
+        """Add the results of one conversation, stopping at the first verdict.
+
+        Args:
+            results: Results of the next conversation in evaluation order.
+
+        Returns:
+            The decision once reached ("regression" or "no_regression"),
+            otherwise None.
+        """
+        if self.decision is not None:
+            return self.decision
+        self.conversations += 1
+        for result in results:
+            passed = result.result == "PASS"
+            self.results += 1
+            self.passed += passed
+            self.log_likelihood_ratio += (
+                self._pass_weight if passed else self._fail_weight
+            )
+            if self.log_likelihood_ratio >= self.upper_bound:
+                self.decision = "regression"
+                break
+            if self.log_likelihood_ratio <= self.lower_bound:
+                self.decision = "no_regression"
+                break
+        return self.decision
+
+    def outcome(self) -> SequentialTestResult:
+        """Return the decision, its error bounds and the consumption so far."""
+        return SequentialTestResult(
+            decision=self.decision or "inconclusive",
+            baseline_pass_rate=self._p0 * 100,
+            regression_pass_rate=self._p1 * 100,
+            alpha=self.config.alpha,
+            beta=self.config.beta,
+            log_likelihood_ratio=self.log_likelihood_ratio,
+            lower_bound=self.lower_bound,
+            upper_bound=self.upper_bound,
+            seed=self.config.seed,
+            conversations_consumed=self.conversations,
+            conversations_total=self.conversations_total,
+            results_consumed=self.results,
+            passed=self.passed,
+        )
+
+
+def write_sequential_report(result: SequentialTestResult, output_dir: str) -> Path:
+    """Write the outcome of a sequential test run.
+
+    Args:
+        result: Outcome of the sequential test.
+        output_dir: Run output directory (created if missing).
+
+    Returns:
+        Path of the written report.
+    """
+    path = Path(output_dir) / SEQUENTIAL_REPORT_FILENAME
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(result.model_dump(mode="json"), f, indent=2)
+    return path
+
+
+def load_sequential_report(output_dir: str) -> Optional[SequentialTestResult]:
+    """Load the sequential test outcome written to an output directory, if any."""
+    path = Path(output_dir) / SEQUENTIAL_REPORT_FILENAME
+    if not path.is_file():
+        return None
+    with open(path, encoding="utf-8") as f:
+        return SequentialTestResult.model_validate(json.load(f))
@@ -0,0 +1,53 @@
+"""Context-local slot for the object of a running session."""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class ActiveSession(Generic[T]):
+    """Holds the active object (profiler, tracer, cassette, ...) of a session.
+
+    Backed by a context variable, like the active TokenTracker, so worker
+    threads see the session when started with ``contextvars.copy_context()``
+    as the pipeline does, and coroutines follow it on a shared event loop.
+    """
+
+    def __init__(self, name: str) -> None:
+        """Create an empty slot.
+
+        Args:
+            name: Context variable name, for debugging.
+        """
+        self._active: ContextVar[Optional[T]] = ContextVar(name, default=None)
+
+    def get(self) -> Optional[T]:
+        """Return the object of the running session, if any."""
+        return self._active.get()
+
+    @contextmanager
+    def activate(self, value: T) -> Iterator[T]:
+        """Make ``value`` active for the enclosed block.
+
+        A nested session reuses the already-active object, so callers can tell
+        whether they own the session by comparing it with ``value``.
+
+        Args:
+            value: Object to activate.
+
+        Yields:
+            The active object.
+        """
+        outer = self._active.get()
+        if outer is not None:
+            yield outer
+            return
+
+        token = self._active.set(value)
+        try:
+            yield value
+        finally:
+            self._active.reset(token)
@@ -0,0 +1,342 @@
+"""Self-tracing: describe the pipeline's own execution with the Trace/Span models.
+
+A :class:`Tracer` is activated for the duration of a run with
+:func:`traced_run`. Instrumented code opens spans with :func:`trace_span`,
+which is a cheap no-op when no tracer is active. Nesting follows the calling
+code (run → conversation → turn → agent call / metric → judge call); work
+handed to a thread pool keeps its parent when submitted through
+``contextvars.copy_context().run``.
+
+The finished trace is exported as an OTLP-JSON file that
+:func:`~lightspeed_evaluation.core.models.trace_adapters.trace_from_otel`
+and OTLP-aware trace viewers can read.
+"""
+
+import json
+import logging
+import secrets
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Optional
+
+from lightspeed_evaluation.core.models.system import TracingConfig
+from lightspeed_evaluation.core.models.trace import (
+    LLMSpanData,
+    ModelInfo,
+    Span,
+    SpanStatus,
+    SpanType,
+    TokenUsage,
+    Trace,
+)
+from lightspeed_evaluation.core.models.trace_adapters import trace_to_otel
+from lightspeed_evaluation.core.system.session import ActiveSession
+
+logger = logging.getLogger(__name__)
+
+# Span names emitted by the framework
+SPAN_EVALUATION_RUN = "evaluation_run"
+SPAN_CONVERSATION = "conversation"
+SPAN_TURN = "turn"
+SPAN_AGENT_CALL = "agent_call"
+SPAN_API_QUERY = "api_query"
+SPAN_METRIC = "metric"
+SPAN_JUDGE_CALL = "judge_call"
+
+TRACE_BASE_FILENAME = "trace"
+
+_current_span_id: ContextVar[Optional[str]] = ContextVar(
+    "lightspeed_eval_current_span_id", default=None
+)
+
+
+class SpanHandle:  # pylint: disable=too-many-instance-attributes
+    """Mutable view of an open span; instrumented code fills in its details.
+
+    The handle returned when tracing is disabled accepts the same calls and
+    discards them, so call sites never need to check whether tracing is on.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        span_type: SpanType,
+        span_id: str = "",
+        parent_span_id: Optional[str] = None,
+        include_io: bool = True,
+    ) -> None:
+        """Initialize the handle.
+
+        Args:
+            name: Span name.
+            span_type: Normalized span type.
+            span_id: Span identifier (empty for the no-op handle).
+            parent_span_id: Enclosing span, if any.
+            include_io: Whether inputs/outputs are recorded.
+        """
+        self.name = name
+        self.span_type = span_type
+        self.span_id = span_id
+        self.parent_span_id = parent_span_id
+        self.include_io = include_io
+        self.attributes: dict[str, Any] = {}
+        self.inputs: Optional[Any] = None
+        self.outputs: Optional[Any] = None
+        self.status = SpanStatus.OK
+        self.status_message: Optional[str] = None
+        self.model: Optional[ModelInfo] = None
+        self.token_usage: Optional[TokenUsage] = None
+
+    @property
+    def recording(self) -> bool:
+        """Whether this handle belongs to an active tracer."""
+        return bool(self.span_id)
+
+    def set_attributes(self, **attributes: Any) -> None:
+        """Attach metadata attributes (None values are dropped on export)."""
+        if self.recording:
+            self.attributes.update(attributes)
+
+    def set_io(self, inputs: Any = None, outputs: Any = None) -> None:
+        """Record span inputs/outputs unless I/O capture is disabled."""
+        if not (self.recording and self.include_io):
+            return
+        if inputs is not None:
+            self.inputs = inputs
+        if outputs is not None:
+            self.outputs = outputs
+
+    def set_llm(
+        self,
+        *,
+        model: Optional[str] = None,
+        provider: Optional[str] = None,
+        input_tokens: Optional[int] = None,
+        output_tokens: Optional[int] = None,
+    ) -> None:
+        """Record the model identity and token usage of an LLM call."""
+        if not self.recording:
+            return
+        if model is not None or provider is not None:
+            self.model = ModelInfo(name=model, provider=provider)
+        if input_tokens is not None or output_tokens is not None:
+            self.token_usage = TokenUsage(
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                total_tokens=(input_tokens or 0) + (output_tokens or 0),
+            )
+
+    def set_error(self, message: str) -> None:
+        """Mark the span as failed without raising."""
+        if not self.recording:
+            return
+        self.status = SpanStatus.ERROR
+        self.status_message = message
+
+
+class Tracer:
+    """Collects the spans of one evaluation run into a single :class:`Trace`.
+
+    Span recording is thread-safe; conversations record concurrently.
+    """
+
+    def __init__(self, config: Optional[TracingConfig] = None) -> None:
+        """Initialize the tracer.
+
+        Args:
+            config: Tracing options; defaults to an enabled tracer.
+        """
+        self.config = config or TracingConfig(enabled=True)
+        self.trace_id = secrets.token_hex(16)
+        self._spans: list[Span] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        span_type: SpanType = SpanType.CHAIN,
+        **attributes: Any,
+    ) -> Iterator[SpanHandle]:
+        """Record the enclosed block as a child of the current span.
+
+        An exception escaping the block marks the span as failed and is
+        re-raised.
+
+        Args:
+            name: Span name.
+            span_type: Normalized span type.
+            **attributes: Initial metadata attributes.
+
+        Yields:
+            Handle for adding attributes, I/O, tokens and status.
+        """
+        handle = SpanHandle(
+            name,
+            span_type,
+            span_id=secrets.token_hex(8),
+            parent_span_id=_current_span_id.get(),
+            include_io=self.config.include_io,
+        )
+        handle.set_attributes(**attributes)
+        token = _current_span_id.set(handle.span_id)
+        start_time = datetime.now(UTC)
+        try:
+            yield handle
+        except BaseException as e:
+            handle.set_error(f"{type(e).__name__}: {e}")
+            raise
+        finally:
+            _current_span_id.reset(token)
+            self._record(handle, start_time, datetime.now(UTC))
+
+    def _record(
+        self, handle: SpanHandle, start_time: datetime, end_time: datetime
+    ) -> None:
+        """Convert a closed handle into a :class:`Span` and store it."""
+        llm = None
+        if handle.model is not None or handle.token_usage is not None:
+            llm = LLMSpanData(model=handle.model, token_usage=handle.token_usage)
+        span = Span(
+            span_id=handle.span_id,
+            trace_id=self.trace_id,
+            parent_span_id=handle.parent_span_id,
+            name=handle.name,
+            span_type=handle.span_type,
+            status=handle.status,
+            status_message=handle.status_message,
+            start_time=start_time,
+            end_time=end_time,
+            latency=(end_time - start_time).total_seconds(),
+            inputs=handle.inputs,
+            outputs=handle.outputs,
+            metadata={k: v for k, v in handle.attributes.items() if v is not None},
+            llm=llm,
+        )
+        with self._lock:
+            self._spans.append(span)
+
+    @property
+    def spans(self) -> list[Span]:
+        """Snapshot of the spans recorded so far."""
+        with self._lock:
+            return list(self._spans)
+
+    def to_trace(self) -> Trace:
+        """Return the recorded spans as a :class:`Trace`, oldest first."""
+        spans = sorted(
+            self.spans, key=lambda s: s.start_time or datetime.min.replace(tzinfo=UTC)
+        )
+        return Trace(
+            trace_id=self.trace_id,
+            name=SPAN_EVALUATION_RUN,
+            start_time=spans[0].start_time if spans else None,
+            end_time=max((s.end_time for s in spans if s.end_time), default=None),
+            spans=spans,
+        )
+
+    def write(self, output_dir: str, base_filename: str) -> Path:
+        """Write the trace as an OTLP-JSON file.
+
+        Args:
+            output_dir: Directory for the trace file (created if missing).
+            base_filename: Filename prefix.
+
+        Returns:
+            Path of the file written.
+        """
+        out = Path(output_dir)
+        out.mkdir(parents=True, exist_ok=True)
+        trace_file = out / f"{base_filename}_otlp.json"
+        payload = trace_to_otel(self.to_trace(), service_name=self.config.service_name)
+        with open(trace_file, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+        return trace_file
+
+
+_ACTIVE_TRACER: ActiveSession[Tracer] = ActiveSession("lightspeed_eval_active_tracer")
+
+
+def get_active_tracer() -> Optional[Tracer]:
+    """Return the tracer of the running session, if any."""
+    return _ACTIVE_TRACER.get()
+
+
+@contextmanager
+def tracing_session(tracer: Tracer) -> Iterator[Tracer]:
+    """Make ``tracer`` the active tracer for the enclosed block.
+
+    A nested session reuses the already-active tracer so an API call made
+    from a traced CLI run records into the same trace.
+
+    Args:
+        tracer: Tracer to activate.
+
+    Yields:
+        The active tracer.
+    """
+    with _ACTIVE_TRACER.activate(tracer) as active:
+        yield active
+
+
+@contextmanager
+def trace_span(
+    name: str, span_type: SpanType = SpanType.CHAIN, **attributes: Any
+) -> Iterator[SpanHandle]:
+    """Record a span on the active tracer; no-op when tracing is off.
+
+    Args:
+        name: Span name.
+        span_type: Normalized span type.
+        **attributes: Initial metadata attributes.
+
+    Yields:
+        Handle for adding attributes, I/O, tokens and status.
+    """
+    tracer = _ACTIVE_TRACER.get()
+    if tracer is None:
+        yield SpanHandle(name, span_type, include_io=False)
+        return
+    with tracer.span(name, span_type, **attributes) as handle:
+        yield handle
+
+
+@contextmanager
+def traced_run(config: TracingConfig, output_dir: str) -> Iterator[Optional[Tracer]]:
+    """Trace the enclosed run when enabled and write its OTLP-JSON file.
+
+    The trace file is only written by the outermost run; a nested run (e.g.
+    the pipeline inside a traced CLI invocation) records into the active
+    tracer and leaves writing to its owner.
+
+    Args:
+        config: Tracing options; nothing is recorded unless enabled.
+        output_dir: Directory for the trace file.
+
+    Yields:
+        The active tracer, or None when tracing is disabled.
+    """
+    if not config.enabled:
+        yield None
+        return
+
+    outer = get_active_tracer()
+    if outer is not None:
+        yield outer
+        return
+
+    tracer = Tracer(config)
+    try:
+        with tracing_session(tracer):
+            yield tracer
+    finally:
+        timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
+        try:
+            path = tracer.write(output_dir, f"{TRACE_BASE_FILENAME}_{timestamp}")
+            logger.info("Trace: %s", path)
+        except OSError as e:
+            logger.warning("Failed to write trace file: %s", e)
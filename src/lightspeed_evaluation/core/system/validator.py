@@ -1,16 +1,22 @@
 """Data validation of input data before evaluation."""
 
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
 import yaml
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
-from lightspeed_evaluation.core.constants import DEPRECATED_METRIC_NAMES
+from lightspeed_evaluation.core.constants import (
+    DEFAULT_VALIDATION_CHUNK_SIZE,
+    DEPRECATED_METRIC_NAMES,
+)
 from lightspeed_evaluation.core.models import EvaluationData, TurnData
 from lightspeed_evaluation.core.models.data import DatasetMetadata
+from lightspeed_evaluation.core.system.dataset_cache import DatasetCache
 from lightspeed_evaluation.core.system.exceptions import DataValidationError
+from lightspeed_evaluation.core.system.yaml_io import safe_load_yaml
 
 if TYPE_CHECKING:
     from lightspeed_evaluation.core.models import SystemConfig
@@ -98,6 +104,9 @@ _NLP_METRIC_REQUIREMENTS = {
 for _nlp_metric in ["nlp:bleu", "nlp:rouge", "nlp:semantic_similarity_distance"]:
     METRIC_REQUIREMENTS[_nlp_metric] = _NLP_METRIC_REQUIREMENTS
 
+# Batch validator used by process-pool workers
+_EVALUATION_DATA_LIST_ADAPTER = TypeAdapter(list[EvaluationData])
+
 # Fields that may be populated by the API when API is enabled
 API_POPULATED_FIELDS = ("response", "contexts", "tool_calls")
 
@@ -158,7 +167,63 @@ def check_metric_required_data(
     return True, ""
 
 
-class DataValidator:  # pylint: disable=too-few-public-methods
+def _validate_conversation(index: int, data_dict: dict) -> EvaluationData:
+    """Validate a single raw conversation dict.
+
+    Args:
+        index: Zero-based position of the conversation in the data file.
+        data_dict: Raw conversation dict.
+
+    Returns:
+        The validated EvaluationData.
+
+    Raises:
+        DataValidationError: Naming the conversation that failed validation.
+    """
+    try:
+        return EvaluationData(**data_dict)
+    except ValidationError as e:
+        conversation_id = data_dict.get("conversation_group_id", f"item_{index + 1}")
+        error_details = format_pydantic_error(e)
+        raise DataValidationError(
+            f"Validation error in conversation '{conversation_id}': {error_details}"
+        ) from e
+    except Exception as e:
+        raise DataValidationError(
+            f"Failed to parse evaluation data item {index + 1}: {e}"
+        ) from e
+
+
+def _validate_conversation_chunk(
+    start: int, raw_items: list[dict]
+) -> list[EvaluationData]:
+    """Validate a chunk of raw conversations (process pool worker).
+
+    The whole chunk is validated in one ``TypeAdapter`` call. If that fails,
+    the chunk is re-validated item by item so the error names the first
+    failing conversation exactly as inline validation would.
+
+    Args:
+        start: Index of the chunk's first item in the data file.
+        raw_items: Raw conversation dicts.
+
+    Returns:
+        Validated conversations in input order.
+
+    Raises:
+        DataValidationError: Naming the first conversation that failed.
+    """
+    try:
+        return _EVALUATION_DATA_LIST_ADAPTER.validate_python(raw_items)
+    except (ValidationError, TypeError, ValueError):
+        pass
+    return [
+        _validate_conversation(start + offset, data_dict)
+        for offset, data_dict in enumerate(raw_items)
+    ]
+
+
+class DataValidator:  # pylint: disable=too-few-public-methods, too-many-instance-attributes
     """Data validator for evaluation data.
 
     Single entry point: load_evaluation_data() which handles loading,
@@ -170,6 +235,7 @@ class DataValidator:  # pylint: disable=too-few-public-methods
         api_enabled: bool = False,
         fail_on_invalid_data: bool = True,
         system_config: Optional["SystemConfig"] = None,
+        validation_workers: Optional[int] = None,
     ) -> None:
         """Initialize validator.
 
@@ -179,6 +245,9 @@ class DataValidator:  # pylint: disable=too-few-public-methods
             system_config: SystemConfig providing metric name sets. When provided,
                 metric availability is validated against the config's metadata
                 rather than module-level globals.
+            validation_workers: Number of processes used to validate
+                conversations. Defaults to ``core.validation_workers`` from
+                the system config; None or 1 validates inline.
         """
         self.validation_errors: list[str] = []
         self.evaluation_data: Optional[list[EvaluationData]] = None
@@ -187,6 +256,9 @@ class DataValidator:  # pylint: disable=too-few-public-methods
         self.original_data_path: Optional[str] = None
         self.fail_on_invalid_data = fail_on_invalid_data
         self._system_config = system_config
+        if validation_workers is None and system_config is not None:
+            validation_workers = system_config.core.validation_workers
+        self._validation_workers = validation_workers
 
     @property
     def _turn_level_metrics(self) -> set[str]:
@@ -214,6 +286,10 @@ class DataValidator:  # pylint: disable=too-few-public-methods
         When the dict format is used, dataset-level metadata is parsed and
         stored on ``self.dataset_metadata``.
 
+        When ``core.dataset_cache_enabled`` is set, the validated result is
+        cached on disk keyed by the file content, so unchanged datasets skip
+        YAML parsing and model validation on subsequent runs.
+
         Args:
             data_path: Path to the evaluation data YAML file.
 
@@ -225,12 +301,23 @@ class DataValidator:  # pylint: disable=too-few-public-methods
                 contains entries that fail Pydantic validation.
         """
         try:
-            with open(data_path, "r", encoding="utf-8") as f:
-                raw_data = yaml.safe_load(f)
+            with open(data_path, "rb") as f:
+                content = f.read()
         except FileNotFoundError as exc:
             raise DataValidationError(
                 f"Evaluation data file not found: {data_path}"
             ) from exc
+
+        dataset_cache = self._get_dataset_cache()
+        cache_key = DatasetCache.compute_key(content) if dataset_cache else ""
+        if dataset_cache:
+            cached = dataset_cache.load(cache_key)
+            if cached is not None:
+                evaluation_data, self.dataset_metadata = cached
+                return evaluation_data
+
+        try:
+            raw_data = safe_load_yaml(content)
         except yaml.YAMLError as e:
             raise DataValidationError(f"Invalid YAML syntax in {data_path}: {e}") from e
 
@@ -240,25 +327,64 @@ class DataValidator:  # pylint: disable=too-few-public-methods
         self.dataset_metadata = None
         raw_conversations = self._extract_conversations_and_metadata(raw_data)
 
-        evaluation_data = []
-        for i, data_dict in enumerate(raw_conversations):
-            try:
-                eval_data = EvaluationData(**data_dict)
-                evaluation_data.append(eval_data)
-            except ValidationError as e:
-                conversation_id = data_dict.get(
-                    "conversation_group_id", f"item_{i + 1}"
-                )
-                error_details = format_pydantic_error(e)
-                raise DataValidationError(
-                    f"Validation error in conversation '{conversation_id}': {error_details}"
-                ) from e
-            except Exception as e:
-                raise DataValidationError(
-                    f"Failed to parse evaluation data item {i + 1}: {e}"
-                ) from e
+        evaluation_data = self._validate_conversations(raw_conversations)
+
+        if dataset_cache:
+            dataset_cache.store(cache_key, evaluation_data, self.dataset_metadata)
+        return evaluation_data
+
+    def _validate_conversations(
+        self, raw_conversations: list[dict]
+    ) -> list[EvaluationData]:
+        """Validate raw conversation dicts into EvaluationData models.
+
+        With ``validation_workers`` > 1 and more than one chunk of data, chunks
+        are validated in a process pool; otherwise validation runs inline.
+        Either way the first failing conversation (in file order) is reported
+        with the same error message.
+
+        Args:
+            raw_conversations: Raw conversation dicts from the YAML file.
+
+        Returns:
+            Validated conversations in input order.
+
+        Raises:
+            DataValidationError: If any conversation fails validation.
+        """
+        workers = self._validation_workers
+        if (
+            workers is None
+            or workers <= 1
+            or len(raw_conversations) <= DEFAULT_VALIDATION_CHUNK_SIZE
+        ):
+            return [
+                _validate_conversation(i, data_dict)
+                for i, data_dict in enumerate(raw_conversations)
+            ]
+
+        starts = range(0, len(raw_conversations), DEFAULT_VALIDATION_CHUNK_SIZE)
+        chunks = [
+            raw_conversations[start : start + DEFAULT_VALIDATION_CHUNK_SIZE]
+            for start in starts
+        ]
+        evaluation_data: list[EvaluationData] = []
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+            for chunk_result in executor.map(
+                _validate_conversation_chunk, starts, chunks
+            ):
+                evaluation_data.extend(chunk_result)
         return evaluation_data
 
+    def _get_dataset_cache(self) -> Optional[DatasetCache]:
+        """Return the parsed-dataset cache when enabled in the system config."""
+        if self._system_config is None:
+            return None
+        core = self._system_config.core
+        if not (core.cache_enabled and core.dataset_cache_enabled):
+            return None
+        return DatasetCache(core.dataset_cache_dir)
+
     def _extract_conversations_and_metadata(self, raw_data: object) -> list[dict]:
         """Extract conversation list and optional dataset metadata from raw YAML.
 
@@ -0,0 +1,56 @@
+"""YAML load/dump helpers that prefer the libyaml C bindings when available."""
+
+from typing import IO, Any
+
+import yaml
+
+# libyaml-backed loader/dumper are an order of magnitude faster than the
+# pure-Python implementations; fall back transparently when PyYAML was built
+# without libyaml. The C classes do not subclass SafeLoader/SafeDumper (and
+# may not exist), hence the loose annotations.
+SafeYamlLoader: type[Any] = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+SafeYamlDumper: type[Any] = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def has_libyaml() -> bool:
+    """Return True when the libyaml C loader is in use."""
+    return SafeYamlLoader is not yaml.SafeLoader
+
+
+def safe_load_yaml(stream: str | bytes | IO[str] | IO[bytes]) -> Any:
+    """Parse a YAML document with the fastest available safe loader.
+
+    Args:
+        stream: YAML text, bytes or an open file object.
+
+    Returns:
+        The parsed Python object.
+
+    Raises:
+        yaml.YAMLError: If the document is not valid YAML.
+    """
+    return yaml.load(stream, Loader=SafeYamlLoader)  # nosec B506 - safe loader
+
+
+def safe_dump_yaml(data: Any, stream: IO[str]) -> None:
+    """Serialize data as block-style YAML with the fastest available safe dumper.
+
+    Formatting matches what the framework has always written: block style,
+    preserved key order, unicode kept as-is and two-space indentation.
+
+    Args:
+        data: Plain Python data (dicts, lists, scalars) to serialize.
+        stream: Writable text stream.
+
+    Raises:
+        yaml.YAMLError: If the data cannot be represented.
+    """
+    yaml.dump(
+        data,
+        stream,
+        Dumper=SafeYamlDumper,
+        default_flow_style=False,
+        sort_keys=False,
+        allow_unicode=True,
+        indent=2,
+    )
@@ -17,10 +17,13 @@ from typing import Any, Optional
 from lightspeed_evaluation.core.models import EvaluationData, SystemConfig
 from lightspeed_evaluation.core.models.data import DatasetMetadata
 from lightspeed_evaluation.core.system import ConfigLoader
+from lightspeed_evaluation.core.system.cassette import get_active_cassette
 from lightspeed_evaluation.core.system.exceptions import (
     ConfigurationError,
     DataValidationError,
 )
+from lightspeed_evaluation.core.system.profiler import profiled_run
+from lightspeed_evaluation.core.system.tracer import traced_run
 from lightspeed_evaluation.pipeline.behavioral.models import (
     RunContext,
     RunResult,
@@ -88,6 +91,13 @@ def run(
     )
 
     if parallel and len(contexts) > 1:
+        # Worker processes do not share the cassette of this process, so
+        # their interactions would be neither recorded nor replayed
+        if get_active_cassette() is not None:
+            raise ConfigurationError(
+                "Cassette record/replay is not supported with parallel agent "
+                "runs; set agents.default.parallel to false"
+            )
         _warn_resource_usage(len(contexts), system_config)
         results = _run_parallel(contexts)
     else:
@@ -309,15 +319,22 @@ def _run_single(ctx: RunContext) -> RunResult:
             dataset_metadata = DatasetMetadata.model_validate(metadata_dict)
 
         loader = ConfigLoader.from_config(config)
-        pipeline = EvaluationPipeline(loader, ctx.run_output_dir)
-        try:
-            eval_results = pipeline.run_evaluation(
-                pinned,
-                original_data_path=extra.get("original_data_path"),
-                dataset_metadata=dataset_metadata,
-            )
-        finally:
-            pipeline.close()
+        # Records into the caller's profiler/tracer in-process; worker
+        # processes of parallel runs write their own files into the run
+        # directory.
+        with (
+            profiled_run(config.profiling, ctx.run_output_dir),
+            traced_run(config.tracing, ctx.run_output_dir),
+        ):
+            pipeline = EvaluationPipeline(loader, ctx.run_output_dir)
+            try:
+                eval_results = pipeline.run_evaluation(
+                    pinned,
+                    original_data_path=extra.get("original_data_path"),
+                    dataset_metadata=dataset_metadata,
+                )
+            finally:
+                pipeline.close()
 
         return RunResult(
             agent_name=ctx.agent_name,
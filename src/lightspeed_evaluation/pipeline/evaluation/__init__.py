@@ -9,6 +9,7 @@ if TYPE_CHECKING:
     from lightspeed_evaluation.pipeline.evaluation.amender import APIDataAmender
     from lightspeed_evaluation.pipeline.evaluation.driver import (
         AgentDriver,
+        AsyncHttpApiDriver,
         ProposalDriver,
     )
     from lightspeed_evaluation.pipeline.evaluation.errors import EvaluationErrorHandler
@@ -32,6 +33,10 @@ _LAZY_IMPORTS = {
         "lightspeed_evaluation.pipeline.evaluation.driver",
         "AgentDriver",
     ),
+    "AsyncHttpApiDriver": (
+        "lightspeed_evaluation.pipeline.evaluation.driver",
+        "AsyncHttpApiDriver",
+    ),
     "AgentDriverRegistry": (
         "lightspeed_evaluation.pipeline.evaluation.registry",
         "AgentDriverRegistry",
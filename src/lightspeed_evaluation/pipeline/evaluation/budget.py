@@ -0,0 +1,185 @@
+"""Token and cost budget enforcement for evaluation runs.
+
+Spending is charged from evaluation results (judge and embedding tokens) and
+agent calls (API tokens) as they complete. Cost only counts judge tokens,
+priced with the ``input_cost_per_million_tokens`` and
+``output_cost_per_million_tokens`` of the judge's model. Once a budget is
+spent, the processor stops starting new agent and judge calls in its scope
+and records the remaining work as SKIPPED.
+"""
+
+import logging
+import threading
+from collections import defaultdict
+from typing import Optional
+
+from lightspeed_evaluation.core.models import (
+    BudgetConfig,
+    BudgetLimitConfig,
+    EvaluationResult,
+    SystemConfig,
+)
+
+logger = logging.getLogger(__name__)
+
+# Price per million tokens of (input, output); None when the model is unpriced
+TokenPrices = tuple[Optional[float], Optional[float]]
+
+
+class BudgetTracker:
+    """Thread-safe tracker of token and cost spending against budgets."""
+
+    def __init__(self, config: BudgetConfig, prices: dict[str, TokenPrices]):
+        """Initialize the tracker.
+
+        Args:
+            config: Budget limits.
+            prices: Per-million-token (input, output) prices keyed by judge id;
+                the first entry is the primary judge.
+        """
+        self.config = config
+        self._prices = prices
+        self._primary_judge = next(iter(prices), "primary")
+        self._lock = threading.Lock()
+        self._tokens: dict[str, dict[str, int]] = {
+            "run": defaultdict(int),
+            "conversation": defaultdict(int),
+            "metric": defaultdict(int),
+        }
+        self._cost: dict[str, dict[str, float]] = {
+            "run": defaultdict(float),
+            "conversation": defaultdict(float),
+            "metric": defaultdict(float),
+        }
+        self._run_exhausted_logged = False
+
+    @classmethod
+    def from_system_config(cls, config: SystemConfig) -> Optional["BudgetTracker"]:
+        """Create a tracker for the configured budgets, or None without limits."""
+        if not config.budget.enabled:
+            return None
+        prices = {
+            judge_id: (
+                llm_config.input_cost_per_million_tokens,
+                llm_config.output_cost_per_million_tokens,
+            )
+            for judge_id, llm_config in config.get_judge_configs()
+        }
+        limits = (config.budget.run, config.budget.conversation, config.budget.metric)
+        unpriced = [
+            judge_id
+            for judge_id, (input_price, output_price) in prices.items()
+            if input_price is None or output_price is None
+        ]
+        if unpriced and any(limit.max_cost is not None for limit in limits):
+            logger.warning(
+                "Cost budget configured but judge model(s) %s have no prices; "
+                "their tokens count as free",
+                ", ".join(unpriced),
+            )
+        return cls(config.budget, prices)
+
+    def charge_agent(self, conversation_id: str, tokens: int) -> None:
+        """Charge agent API tokens to the run and conversation budgets."""
+        if tokens <= 0:
+            return
+        with self._lock:
+            self._tokens["run"]["run"] += tokens
+            self._tokens["conversation"][conversation_id] += tokens
+
+    def charge_result(self, result: EvaluationResult) -> None:
+        """Charge the judge and embedding usage of an evaluation result."""
+        tokens = (
+            result.judge_llm_input_tokens
+            + result.judge_llm_output_tokens
+            + result.embedding_tokens
+        )
+        if result.judge_scores:
+            cost = sum(
+                self._price(
+                    score.judge_id, score.judge_input_tokens, score.judge_output_tokens
+                )
+                for score in result.judge_scores
+                if score.consulted
+            )
+        else:
+            cost = self._price(
+                self._primary_judge,
+                result.judge_llm_input_tokens,
+                result.judge_llm_output_tokens,
+            )
+        if tokens <= 0 and cost <= 0:
+            return
+        keys = {
+            "run": "run",
+            "conversation": result.conversation_group_id,
+            "metric": result.metric_identifier,
+        }
+        with self._lock:
+            for scope, key in keys.items():
+                self._tokens[scope][key] += tokens
+                self._cost[scope][key] += cost
+
+    def exhausted_reason(
+        self, conversation_id: str, metric_identifier: Optional[str] = None
+    ) -> Optional[str]:
+        """Return why new calls must stop, or None while budget remains.
+
+        Args:
+            conversation_id: Conversation about to make a call.
+            metric_identifier: Metric about to be evaluated; None for agent
+                calls, which only count against the run and conversation.
+        """
+        scopes = [
+            ("run", "run", self.config.run),
+            ("conversation", conversation_id, self.config.conversation),
+        ]
+        if metric_identifier is not None:
+            scopes.append(("metric", metric_identifier, self.config.metric))
+        with self._lock:
+            for scope, key, limit in scopes:
+                reason = self._limit_reached(scope, key, limit)
+                if reason is None:
+                    continue
+                if scope == "run" and not self._run_exhausted_logged:
+                    self._run_exhausted_logged = True
+                    logger.warning("%s; skipping remaining evaluations", reason)
+                return reason
+        return None
+
+    def reset(self) -> None:
+        """Forget all spending, e.g. before evaluating the run again."""
+        with self._lock:
+            for scope, tokens in self._tokens.items():
+                tokens.clear()
+                self._cost[scope].clear()
+            self._run_exhausted_logged = False
+
+    def usage(self) -> dict[str, float]:
+        """Return the run's spent tokens and cost."""
+        with self._lock:
+            return {
+                "tokens": self._tokens["run"]["run"],
+                "cost": self._cost["run"]["run"],
+            }
+
+    def _limit_reached(
+        self, scope: str, key: str, limit: BudgetLimitConfig
+    ) -> Optional[str]:
+        """Return the exhaustion reason of one scope (lock held)."""
+        if limit.max_tokens is not None and self._tokens[scope][key] >= (
+            limit.max_tokens
+        ):
+            return (
+                f"Budget exhausted: {scope} token budget ({limit.max_tokens}) reached"
+            )
+        if limit.max_cost is not None and self._cost[scope][key] >= limit.max_cost:
+            return f"Budget exhausted: {scope} cost budget ({limit.max_cost}) reached"
+        return None
+
+    def _price(self, judge_id: str, input_tokens: int, output_tokens: int) -> float:
+        """Return the cost of a judge's tokens (0 for unpriced models)."""
+        input_price, output_price = self._prices.get(judge_id, (None, None))
+        return (
+            input_tokens * (input_price or 0.0) + output_tokens * (output_price or 0.0)
+        ) / 1_000_000
@@ -2,17 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
+import contextvars
 import logging
 import re
 import shutil
 import subprocess
+import threading
 import time
 import uuid
 from abc import ABC, abstractmethod
+from collections.abc import Coroutine
 from enum import StrEnum
-from typing import Any, Optional, cast
+from typing import Any, Optional, TypeVar, cast
 
-from lightspeed_evaluation.core.api import APIClient
+from lightspeed_evaluation.core.api import APIClient, APIConnectionPool, AsyncAPIClient
 from lightspeed_evaluation.core.models import (
     APIConfig,
     HttpApiAgentConfig,
@@ -21,7 +26,10 @@ from lightspeed_evaluation.core.models import (
 )
 from lightspeed_evaluation.core.proposal import derive_phase
 from lightspeed_evaluation.core.system.exceptions import ConfigurationError
-from lightspeed_evaluation.pipeline.evaluation.amender import APIDataAmender
+from lightspeed_evaluation.pipeline.evaluation.amender import (
+    APIDataAmender,
+    AsyncAPIDataAmender,
+)
 from lightspeed_evaluation.pipeline.evaluation.cli import KubeCLI
 from lightspeed_evaluation.pipeline.evaluation.proposal_amender import (
     ProposalAmender,
@@ -29,13 +37,29 @@ from lightspeed_evaluation.pipeline.evaluation.proposal_amender import (
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 
 class AgentDriver(ABC):
     """Abstract driver interface for agent execution."""
 
-    def __init__(self, config: dict[str, Any], *, enabled: bool = True) -> None:
-        """Initialize the driver with validated config."""
+    def __init__(
+        self,
+        config: dict[str, Any],
+        *,
+        enabled: bool = True,
+        connection_pool: Optional[APIConnectionPool] = None,
+    ) -> None:
+        """Initialize the driver with validated config.
+
+        Args:
+            config: Resolved agent configuration.
+            enabled: Whether the driver should execute.
+            connection_pool: Shared HTTP connections and caches for drivers
+                that call an HTTP API.
+        """
         self._enabled = enabled
+        self._connection_pool = connection_pool
         self._config = self.validate_config(config)
 
     @abstractmethod
@@ -64,9 +88,15 @@ class AgentDriver(ABC):
 class HttpApiDriver(AgentDriver):
     """Driver that enriches turn data via the HTTP API."""
 
-    def __init__(self, config: dict[str, Any], *, enabled: bool = True) -> None:
+    def __init__(
+        self,
+        config: dict[str, Any],
+        *,
+        enabled: bool = True,
+        connection_pool: Optional[APIConnectionPool] = None,
+    ) -> None:
         """Initialize the HTTP API driver with validated config."""
-        super().__init__(config, enabled=enabled)
+        super().__init__(config, enabled=enabled, connection_pool=connection_pool)
         self._api_client = (
             self._create_api_client(cast(HttpApiAgentConfig, self._config))
             if enabled
@@ -97,7 +127,148 @@ class HttpApiDriver(AgentDriver):
 
     def _create_api_client(self, config: HttpApiAgentConfig) -> Optional[APIClient]:
         api_config = APIConfig.model_validate(config.model_dump(exclude={"type"}))
-        return APIClient(api_config)
+        return APIClient(api_config, connection_pool=self._connection_pool)
+
+
+class AsyncHttpApiDriver(AgentDriver):
+    """HTTP API driver on the async API client.
+
+    Async callers await :meth:`aexecute_turn` on their own event loop. The
+    blocking :meth:`execute_turn` runs the turn on an event loop thread
+    private to the driver, so queries from many conversation threads share
+    one loop and its connections instead of holding one socket per thread.
+    Use either the loop of the caller or the private loop, not both.
+
+    Opt in with ``async_client: true`` in the ``http_api`` agent (or ``api``)
+    configuration, or by overriding the ``http_api`` type in
+    :class:`~lightspeed_evaluation.pipeline.evaluation.registry.AgentDriverRegistry`.
+    """
+
+    def __init__(
+        self,
+        config: dict[str, Any],
+        *,
+        enabled: bool = True,
+        connection_pool: Optional[APIConnectionPool] = None,
+    ) -> None:
+        """Initialize the async HTTP API driver with validated config."""
+        super().__init__(config, enabled=enabled, connection_pool=connection_pool)
+        self._api_client = (
+            self._create_api_client(cast(HttpApiAgentConfig, self._config))
+            if enabled
+            else None
+        )
+        self._amender = (
+            AsyncAPIDataAmender(self._api_client) if self._api_client else None
+        )
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+
+    async def aexecute_turn(
+        self, turn_data: TurnData, conversation_id: Optional[str] = None
+    ) -> tuple[Optional[str], Optional[str]]:
+        """Execute the HTTP API driver for a single turn.
+
+        Returns:
+            Tuple of (error_message, updated_conversation_id).
+        """
+        if not self._enabled or self._amender is None:
+            return None, conversation_id
+        return await self._amender.amend_single_turn(turn_data, conversation_id)
+
+    def execute_turn(
+        self, turn_data: TurnData, conversation_id: Optional[str] = None
+    ) -> tuple[Optional[str], Optional[str]]:
+        """Execute a turn on the private event loop and wait for its result."""
+        if not self._enabled or self._amender is None:
+            return None, conversation_id
+        return self._run(self.aexecute_turn(turn_data, conversation_id))
+
+    def validate_config(self, config: dict[str, Any]) -> HttpApiAgentConfig:
+        """Validate HTTP API driver configuration."""
+        return HttpApiAgentConfig.model_validate(config)
+
+    async def aclose(self) -> None:
+        """Close the underlying API client from the caller's event loop."""
+        if self._api_client:
+            await self._api_client.aclose()
+
+    def close(self) -> None:
+        """Close the API client and stop the private event loop.
+
+        Raises:
+            RuntimeError: If the private loop was never started and the
+                caller runs an event loop; await :meth:`aclose` there instead.
+        """
+        with self._loop_lock:
+            loop, self._loop = self._loop, None
+            thread, self._loop_thread = self._loop_thread, None
+        if loop is None or thread is None:
+            if self._api_client:
+                try:
+                    asyncio.get_running_loop()
+                except RuntimeError:
+                    asyncio.run(self._api_client.aclose())
+                else:
+                    raise RuntimeError(
+                        "AsyncHttpApiDriver.close() cannot be called from a "
+                        "running event loop; use 'await driver.aclose()' instead"
+                    )
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self.aclose(), loop).result()
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+    def _create_api_client(
+        self, config: HttpApiAgentConfig
+    ) -> Optional[AsyncAPIClient]:
+        api_config = APIConfig.model_validate(config.model_dump(exclude={"type"}))
+        cache = (
+            self._connection_pool.cache(api_config.cache_dir)
+            if self._connection_pool and api_config.cache_enabled
+            else None
+        )
+        return AsyncAPIClient(api_config, cache=cache)
+
+    def _event_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the private event loop, starting its thread on first use."""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="async-http-api-driver", daemon=True
+                )
+                thread.start()
+                self._loop, self._loop_thread = loop, thread
+            return self._loop
+
+    def _run(self, coro: Coroutine[Any, Any, _T]) -> _T:
+        """Run a coroutine on the private loop in the caller's context.
+
+        The task runs in a copy of the calling thread's context so trace
+        spans and token trackers of the caller see the turn.
+        """
+        loop = self._event_loop()
+        context = contextvars.copy_context()
+        result: concurrent.futures.Future[_T] = concurrent.futures.Future()
+
+        def transfer(task: asyncio.Task[_T]) -> None:
+            if task.cancelled():
+                result.cancel()
+            elif (error := task.exception()) is not None:
+                result.set_exception(error)
+            else:
+                result.set_result(task.result())
+
+        def start() -> None:
+            loop.create_task(coro, context=context).add_done_callback(transfer)
+
+        loop.call_soon_threadsafe(start)
+        return result.result()
 
 
 # ---------------------------------------------------------------------------
@@ -136,9 +307,15 @@ CRD_API_VERSION = f"{CRD_GROUP}/{CRD_VERSION}"
 class ProposalDriver(AgentDriver):
     """Driver that manages Proposal CR lifecycle via oc/kubectl CLI."""
 
-    def __init__(self, config: dict[str, Any], *, enabled: bool = True) -> None:
+    def __init__(
+        self,
+        config: dict[str, Any],
+        *,
+        enabled: bool = True,
+        connection_pool: Optional[APIConnectionPool] = None,
+    ) -> None:
         """Initialize the proposal driver."""
-        super().__init__(config, enabled=enabled)
+        super().__init__(config, enabled=enabled, connection_pool=connection_pool)
         self._cli = self._resolve_cli()
         self._kube_cli = KubeCLI(
             cli_path=self._cli,
@@ -1,9 +1,16 @@
+# pylint: disable=too-many-lines
 """Metrics evaluation module - handles individual metric evaluation."""
 
+import contextvars
 import json
 import logging
+import re
+import sys
+import threading
 import time
-from typing import Any, Optional
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Any, Optional
 
 from lightspeed_evaluation.core.constants import (
     DEFAULT_METRIC_THRESHOLD,
@@ -12,32 +19,150 @@ from lightspeed_evaluation.core.constants import (
 from lightspeed_evaluation.core.embedding.manager import EmbeddingManager
 from lightspeed_evaluation.core.llm.manager import LLMManager
 from lightspeed_evaluation.core.llm.token_tracker import TokenTracker
-from lightspeed_evaluation.core.metrics.custom import CustomMetrics
-from lightspeed_evaluation.core.metrics.deepeval import DeepEvalMetrics
+from lightspeed_evaluation.core.metrics.geval_steps import GEvalStepsCache
 from lightspeed_evaluation.core.metrics.manager import MetricLevel, MetricManager
-from lightspeed_evaluation.core.metrics.nlp import NLPMetrics
-from lightspeed_evaluation.core.metrics.ragas import RagasMetrics
-from lightspeed_evaluation.core.metrics.script import ScriptEvalMetrics
 from lightspeed_evaluation.core.models import (
+    EvaluationData,
     EvaluationRequest,
     EvaluationResult,
     EvaluationScope,
+    JudgeScore,
     MetricResult,
+    TurnData,
 )
+from lightspeed_evaluation.core.models.trace import SpanType
 from lightspeed_evaluation.core.script import ScriptExecutionManager
 from lightspeed_evaluation.core.system import ConfigLoader
 from lightspeed_evaluation.core.system.exceptions import (
     ConfigurationError,
     EvaluationError,
 )
+from lightspeed_evaluation.core.system.lazy_import import create_lazy_getattr
+from lightspeed_evaluation.core.system.profiler import (
+    STAGE_METRIC_PREFIX,
+    profile_span,
+)
+from lightspeed_evaluation.core.system.tracer import (
+    SPAN_METRIC,
+    SpanHandle,
+    trace_span,
+)
 from lightspeed_evaluation.core.system.validator import (
     METRIC_REQUIREMENTS,
     check_metric_required_data,
 )
-from lightspeed_evaluation.pipeline.evaluation.judges import JudgeOrchestrator
+from lightspeed_evaluation.pipeline.evaluation.judges import (
+    JudgeOrchestrator,
+    close_handlers,
+)
+
+if TYPE_CHECKING:
+    # ruff: noqa: F401
+    from lightspeed_evaluation.core.metrics.custom import CustomMetrics
+    from lightspeed_evaluation.core.metrics.deepeval import DeepEvalMetrics
+    from lightspeed_evaluation.core.metrics.nlp import NLPMetrics
+    from lightspeed_evaluation.core.metrics.ragas import RagasMetrics
+    from lightspeed_evaluation.core.metrics.script import ScriptEvalMetrics
 
 logger = logging.getLogger(__name__)
 
+# Metric handlers pull in heavy frameworks (ragas, deepeval, litellm), so they
+# are imported on first use rather than when this module is loaded.
+_LAZY_IMPORTS = {
+    "CustomMetrics": ("lightspeed_evaluation.core.metrics.custom", "CustomMetrics"),
+    "DeepEvalMetrics": (
+        "lightspeed_evaluation.core.metrics.deepeval",
+        "DeepEvalMetrics",
+    ),
+    "NLPMetrics": ("lightspeed_evaluation.core.metrics.nlp", "NLPMetrics"),
+    "RagasMetrics": ("lightspeed_evaluation.core.metrics.ragas", "RagasMetrics"),
+    "ScriptEvalMetrics": (
+        "lightspeed_evaluation.core.metrics.script",
+        "ScriptEvalMetrics",
+    ),
+}
+
+__getattr__ = create_lazy_getattr(_LAZY_IMPORTS, __name__)
+
+# Frameworks with a default handler, in registration order
+HANDLER_FRAMEWORKS = ("nlp", "ragas", "deepeval", "geval", "custom", "script")
+
+
+def _handler_class(name: str) -> Any:
+    """Resolve a metric handler class through this module's lazy attributes."""
+    return getattr(sys.modules[__name__], name)
+
+
+class MetricHandlerRegistry(Mapping[str, Any]):
+    """Read-only mapping of framework name to metric handler, built on first use.
+
+    Every supported framework is always a key, but its handler (and therefore
+    the framework's import) is only created the first time it is looked up or
+    explicitly prepared. Construction is serialized so concurrent evaluation
+    threads share a single handler per framework.
+    """
+
+    def __init__(
+        self, frameworks: Iterable[str], factory: Callable[[str], Any]
+    ) -> None:
+        """Initialize the registry.
+
+        Args:
+            frameworks: Supported framework names.
+            factory: Callable building the handler for a framework name.
+        """
+        self._frameworks = tuple(frameworks)
+        self._factory = factory
+        self._handlers: dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, framework: str) -> Any:
+        """Return the handler for a framework, creating it if needed."""
+        handler = self._handlers.get(framework)
+        if handler is not None:
+            return handler
+        if framework not in self._frameworks:
+            raise KeyError(framework)
+        with self._lock:
+            if framework not in self._handlers:
+                logger.debug("Initializing %s metric handler", framework)
+                self._handlers[framework] = self._factory(framework)
+            return self._handlers[framework]
+
+    def __contains__(self, framework: object) -> bool:
+        """Check support without creating the handler."""
+        return framework in self._frameworks
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over supported framework names."""
+        return iter(self._frameworks)
+
+    def __len__(self) -> int:
+        """Return the number of supported frameworks."""
+        return len(self._frameworks)
+
+    def prepare(self, frameworks: Iterable[str]) -> None:
+        """Create handlers up front for the given frameworks.
+
+        Unknown framework names are ignored; they are reported as unsupported
+        when a metric using them is evaluated.
+
+        Args:
+            frameworks: Framework names the upcoming evaluation will use.
+        """
+        for framework in frameworks:
+            if framework in self._frameworks:
+                _ = self[framework]
+
+    @property
+    def initialized(self) -> list[str]:
+        """Frameworks whose handler has been created."""
+        return [name for name in self._frameworks if name in self._handlers]
+
+    def close(self) -> None:
+        """Release the resources of the created handlers that hold any."""
+        close_handlers(self._handlers.values())
+
 
 def _to_json_str(value: Any) -> Optional[str]:
     """Convert any value to JSON string. Returns None for empty values."""
@@ -86,12 +211,54 @@ def _compute_agent_latency_per_request(request: EvaluationRequest) -> float:
     return sum(latencies)
 
 
+def _annotate_metric_span(span: SpanHandle, result: EvaluationResult) -> None:
+    """Copy the outcome and judge token usage of a metric onto its trace span."""
+    span.set_attributes(
+        result=result.result,
+        score=result.score,
+        threshold=result.threshold,
+        judges=(
+            sum(1 for js in result.judge_scores if js.consulted)
+            if result.judge_scores
+            else None
+        ),
+    )
+    span.set_llm(
+        input_tokens=result.judge_llm_input_tokens,
+        output_tokens=result.judge_llm_output_tokens,
+    )
+    span.set_io(outputs={"reason": result.reason})
+    if result.result == "ERROR":
+        span.set_error(result.reason or "Metric evaluation failed")
+
+
+def _lexical_similarity(text: str, other: str) -> float:
+    """Jaccard similarity of the lower-cased word sets of two texts."""
+    words = set(re.findall(r"\w+", text.lower()))
+    other_words = set(re.findall(r"\w+", other.lower()))
+    if not words or not other_words:
+        return 0.0
+    return len(words & other_words) / len(words | other_words)
+
+
+# Outcome of scoring one expected response alternative: the metric result (or
+# the evaluation error it raised) and the (judge input, judge output, judge
+# cached input, embedding) tokens its evaluation used
+_AlternativeOutcome = tuple["MetricResult | EvaluationError", tuple[int, int, int, int]]
+
+
+def _split_evenly(total: int, parts: int) -> list[int]:
+    """Split a token count into near-equal integer shares (remainder goes first)."""
+    share, remainder = divmod(total, parts)
+    return [share + (1 if i < remainder else 0) for i in range(parts)]
+
+
 def _measure_latency(start_time: float) -> float:
     """Calculate evaluation latency given start time."""
     return time.perf_counter() - start_time
 
 
-class MetricsEvaluator:
+class MetricsEvaluator:  # pylint: disable=too-many-instance-attributes
     """Handles individual metric evaluation with proper scoring and status determination."""
 
     def __init__(
@@ -99,10 +266,15 @@ class MetricsEvaluator:
         config_loader: ConfigLoader,
         metric_manager: MetricManager,
         script_manager: ScriptExecutionManager,
+        geval_steps_cache: Optional[GEvalStepsCache] = None,
     ) -> None:
         """Initialize Metric Evaluator."""
         self.config_loader = config_loader
         self.metric_manager = metric_manager
+        # Generated GEval steps, shared by the handlers of every judge
+        self.geval_steps_cache = (
+            geval_steps_cache if geval_steps_cache is not None else GEvalStepsCache()
+        )
 
         if config_loader.system_config is None:
             raise RuntimeError("Uninitialized system_config")
@@ -112,18 +284,17 @@ class MetricsEvaluator:
         self.embedding_manager = EmbeddingManager.from_system_config(
             config_loader.system_config
         )
+        # The litellm disk cache is set up with the first LLM-backed handler
+        self._judge_cache_ready = False
+        self._judge_cache_lock = threading.Lock()
 
-        # Initialize default metric handlers (used for primary judge or non-panel metrics)
-        self.handlers = {
-            "nlp": NLPMetrics(),
-            "ragas": RagasMetrics(self.llm_manager, self.embedding_manager),
-            "deepeval": DeepEvalMetrics(
-                self.llm_manager, metric_manager=metric_manager
-            ),
-            "geval": DeepEvalMetrics(self.llm_manager, metric_manager=metric_manager),
-            "custom": CustomMetrics(self.llm_manager, metric_manager=metric_manager),
-            "script": ScriptEvalMetrics(script_manager),
-        }
+        self.script_manager = script_manager
+
+        # Default metric handlers (used for primary judge or non-panel metrics),
+        # created on first use so only the frameworks a run needs are imported
+        self.handlers = MetricHandlerRegistry(
+            HANDLER_FRAMEWORKS, self._create_default_handler
+        )
 
         # Judge orchestrator handles multi-judge evaluation and aggregation
         self.judge_orchestrator = JudgeOrchestrator(
@@ -133,6 +304,52 @@ class MetricsEvaluator:
             status_determiner=self._determine_status,
         )
 
+    def _setup_judge_cache(self) -> None:
+        """Enable the litellm disk cache for judge and embedding calls.
+
+        Called before an LLM-backed handler is created, so every LLM framework
+        honors the cache while runs without LLM metrics never import litellm.
+        """
+        with self._judge_cache_lock:
+            if self._judge_cache_ready:
+                return
+            llm_config = self.llm_manager.get_config()
+            embedding_cache_enabled = self.embedding_manager.config.cache_enabled
+            if llm_config.cache_enabled or embedding_cache_enabled:
+                # pylint: disable=import-outside-toplevel
+                from lightspeed_evaluation.core.llm.litellm_patch import (
+                    setup_litellm_cache,
+                )
+
+                setup_litellm_cache(
+                    llm_config.cache_dir,
+                    llm_cache_enabled=llm_config.cache_enabled,
+                    embedding_cache_enabled=embedding_cache_enabled,
+                )
+            self._judge_cache_ready = True
+
+    def close(self) -> None:
+        """Release the resources held by the metric handlers of every judge."""
+        self.handlers.close()
+        self.judge_orchestrator.close()
+
+    def prepare_handlers(self, frameworks: Iterable[str]) -> None:
+        """Create the default handlers for the frameworks a run will use.
+
+        Args:
+            frameworks: Framework names resolved from the evaluation data.
+        """
+        self.handlers.prepare(frameworks)
+        logger.debug("Metric handlers initialized: %s", self.handlers.initialized)
+
+    def _create_default_handler(self, framework: str) -> Any:
+        """Create the primary-judge handler for a framework."""
+        if framework == "nlp":
+            return _handler_class("NLPMetrics")()
+        if framework == "script":
+            return _handler_class("ScriptEvalMetrics")(self.script_manager)
+        return self._create_handler_for_judge(framework, self.llm_manager)
+
     def _create_handler_for_judge(
         self, framework: str, judge_manager: LLMManager
     ) -> Any:
@@ -140,17 +357,22 @@ class MetricsEvaluator:
 
         Used by JudgeOrchestrator to create handlers for panel judges.
         """
+        self._setup_judge_cache()
         if framework == "ragas":
-            return RagasMetrics(judge_manager, self.embedding_manager)
+            return _handler_class("RagasMetrics")(judge_manager, self.embedding_manager)
         if framework in ("deepeval", "geval"):
-            return DeepEvalMetrics(judge_manager, metric_manager=self.metric_manager)
+            return _handler_class("DeepEvalMetrics")(
+                judge_manager,
+                metric_manager=self.metric_manager,
+                geval_steps_cache=self.geval_steps_cache,
+            )
         if framework == "custom":
-            return CustomMetrics(judge_manager, metric_manager=self.metric_manager)
+            return _handler_class("CustomMetrics")(
+                judge_manager, metric_manager=self.metric_manager
+            )
         raise ConfigurationError(f"Unsupported LLM framework for panel: {framework}")
 
-    def evaluate_metric(  # pylint: disable=too-many-locals
-        self, request: EvaluationRequest
-    ) -> Optional[EvaluationResult]:
+    def evaluate_metric(self, request: EvaluationRequest) -> Optional[EvaluationResult]:
         """Evaluate a single metric and return complete evaluation result.
 
         Args:
@@ -160,6 +382,166 @@ class MetricsEvaluator:
             EvaluationResult with score, result, token usage, and execution time,
             or None if metric should be skipped (e.g., script metrics when API disabled).
         """
+        with trace_span(
+            f"{SPAN_METRIC}:{request.metric_identifier}",
+            SpanType.EVALUATOR,
+            metric=request.metric_identifier,
+            turn_id=request.turn_id,
+        ) as span:
+            result = self._evaluate_metric(request)
+            if result is not None:
+                _annotate_metric_span(span, result)
+            return result
+
+    def evaluate_fused_turn_metrics(  # pylint: disable=too-many-locals
+        self,
+        conv_data: EvaluationData,
+        turn_idx: int,
+        turn_data: TurnData,
+        metric_identifiers: Iterable[str],
+    ) -> dict[str, EvaluationResult]:
+        """Evaluate a turn's LLM-judged custom metrics with one fused judge call.
+
+        Only metrics scored by the primary judge against a single expected
+        response, with all their required data present, are fused, and only
+        when at least two of them qualify. The tokens of the fused call are
+        split evenly across the metrics it scored.
+
+        Args:
+            conv_data: Conversation the turn belongs to.
+            turn_idx: Index of the turn in the conversation.
+            turn_data: Turn to evaluate.
+            metric_identifiers: Turn metrics requested for the turn.
+
+        Returns:
+            Results by metric identifier. Metrics missing from it (not fusable
+            or not parsed from the judge answer) still need
+            :meth:`evaluate_metric`.
+        """
+        requests = {}
+        for metric_identifier in metric_identifiers:
+            request = EvaluationRequest.for_turn(
+                conv_data, metric_identifier, turn_idx, turn_data
+            )
+            if self._is_fusable(request):
+                requests[metric_identifier.split(":", 1)[1]] = request
+        if len(requests) < 2:
+            return {}
+
+        start_time = time.perf_counter()
+        judge_id, handler = self.judge_orchestrator.get_primary_handler("custom")
+        evaluation_scope = EvaluationScope(
+            turn_idx=turn_idx, turn_data=turn_data, is_conversation=False
+        )
+        token_tracker = TokenTracker()
+        token_tracker.start()
+        try:
+            with (
+                trace_span(
+                    f"{SPAN_METRIC}:custom:fused",
+                    SpanType.EVALUATOR,
+                    metric="custom:fused",
+                    fused_metrics=",".join(sorted(requests)),
+                    turn_id=turn_data.turn_id,
+                ),
+                profile_span(
+                    f"{STAGE_METRIC_PREFIX}custom", "metric", metric="custom:fused"
+                ),
+            ):
+                scores, tokens_saved = handler.evaluate_fused(
+                    list(requests), conv_data, evaluation_scope
+                )
+        finally:
+            token_tracker.stop()
+        if not scores:
+            return {}
+
+        evaluation_latency = _measure_latency(start_time)
+        input_tokens, output_tokens = token_tracker.get_judge_counts()
+        shares = zip(
+            _split_evenly(input_tokens, len(scores)),
+            _split_evenly(output_tokens, len(scores)),
+            _split_evenly(token_tracker.get_cached_input_tokens(), len(scores)),
+            _split_evenly(tokens_saved, len(scores)),
+        )
+        results = {}
+        for (metric_name, judged), token_share in zip(scores.items(), shares):
+            request = requests[metric_name]
+            metric_result = self._fused_metric_result(
+                request, judged, judge_id, token_share
+            )
+            results[request.metric_identifier] = self._build_evaluation_result(
+                request, metric_result, evaluation_latency
+            )
+        return results
+
+    def _fused_metric_result(
+        self,
+        request: EvaluationRequest,
+        judged: tuple[float, str],
+        judge_id: str,
+        token_share: tuple[int, int, int, int],
+    ) -> MetricResult:
+        """Build the metric result of one metric scored by a fused call.
+
+        Args:
+            request: Request of the fused metric.
+            judged: Score and reason parsed from the fused answer.
+            judge_id: Judge that made the fused call.
+            token_share: This metric's (input, output, cached input, saved)
+                token share.
+        """
+        score, reason = judged
+        input_tokens, output_tokens, cached_tokens, tokens_saved = token_share
+        threshold = self.metric_manager.get_effective_threshold(
+            request.metric_identifier,
+            MetricLevel.TURN,
+            request.conv_data,
+            request.turn_data,
+        )
+        return MetricResult(
+            result=self._determine_status(score, threshold),
+            score=score,
+            threshold=threshold,
+            reason=reason,
+            judge_llm_input_tokens=input_tokens,
+            judge_llm_output_tokens=output_tokens,
+            judge_llm_input_tokens_saved=tokens_saved,
+            judge_llm_cached_input_tokens=cached_tokens,
+            judge_scores=[
+                JudgeScore(
+                    judge_id=judge_id,
+                    score=score,
+                    reason=reason,
+                    judge_input_tokens=input_tokens,
+                    judge_output_tokens=output_tokens,
+                    judge_cached_input_tokens=cached_tokens,
+                )
+            ],
+        )
+
+    def _is_fusable(self, request: EvaluationRequest) -> bool:
+        """Check whether a turn metric can be scored by a fused custom call."""
+        framework, metric_name = request.metric_identifier.split(":", 1)
+        if framework != "custom":
+            return False
+        if metric_name not in _handler_class("CustomMetrics").FUSABLE_METRICS:
+            return False
+        if self._will_use_panel(request.metric_identifier):
+            return False
+
+        turn_data = request.turn_data
+        if turn_data is None or isinstance(turn_data.expected_response, list):
+            return False
+        if request.metric_identifier in METRIC_REQUIREMENTS:
+            ok, _ = check_metric_required_data(turn_data, request.metric_identifier)
+            return ok
+        return True
+
+    def _evaluate_metric(  # pylint: disable=too-many-locals
+        self, request: EvaluationRequest
+    ) -> Optional[EvaluationResult]:
+        """Evaluate a single metric; see :meth:`evaluate_metric`."""
         start_time = time.perf_counter()
 
         try:
@@ -227,45 +609,8 @@ class MetricsEvaluator:
             # Evaluate metric
             metric_result = self._evaluate_wrapper(request, evaluation_scope, threshold)
 
-            evaluation_latency = _measure_latency(start_time)
-
-            turn_data = request.turn_data
-            api_input_tokens, api_output_tokens = _compute_api_token_counts_per_request(
-                request
-            )
-            agent_latency = _compute_agent_latency_per_request(request)
-            return EvaluationResult(
-                **metric_result.model_dump(),
-                conversation_group_id=request.conv_data.conversation_group_id,
-                tag=request.conv_data.tag,
-                turn_id=request.turn_id,
-                metric_identifier=request.metric_identifier,
-                metric_metadata=self._extract_metadata_for_csv(request),
-                query=(turn_data.query or "") if turn_data else "",
-                response=(turn_data.response or "") if turn_data else "",
-                evaluation_latency=evaluation_latency,
-                agent_latency=agent_latency,
-                execution_time=evaluation_latency + agent_latency,
-                api_input_tokens=api_input_tokens,
-                api_output_tokens=api_output_tokens,
-                # Streaming performance metrics
-                time_to_first_token=(
-                    turn_data.time_to_first_token if turn_data else None
-                ),
-                streaming_duration=(
-                    turn_data.streaming_duration if turn_data else None
-                ),
-                tokens_per_second=(turn_data.tokens_per_second if turn_data else None),
-                tool_calls=_to_json_str(turn_data.tool_calls) if turn_data else None,
-                contexts=_to_json_str(turn_data.contexts) if turn_data else None,
-                expected_response=turn_data.expected_response if turn_data else None,
-                expected_intent=turn_data.expected_intent if turn_data else None,
-                expected_keywords=(
-                    _to_json_str(turn_data.expected_keywords) if turn_data else None
-                ),
-                expected_tool_calls=(
-                    _to_json_str(turn_data.expected_tool_calls) if turn_data else None
-                ),
+            return self._build_evaluation_result(
+                request, metric_result, _measure_latency(start_time)
             )
 
         except EvaluationError as e:
@@ -274,6 +619,48 @@ class MetricsEvaluator:
                 request, f"Evaluation error: {e}", start_time
             )
 
+    def _build_evaluation_result(
+        self,
+        request: EvaluationRequest,
+        metric_result: MetricResult,
+        evaluation_latency: float,
+    ) -> EvaluationResult:
+        """Combine a metric result with the request's turn and agent data."""
+        turn_data = request.turn_data
+        api_input_tokens, api_output_tokens = _compute_api_token_counts_per_request(
+            request
+        )
+        agent_latency = _compute_agent_latency_per_request(request)
+        return EvaluationResult(
+            **metric_result.model_dump(),
+            conversation_group_id=request.conv_data.conversation_group_id,
+            tag=request.conv_data.tag,
+            turn_id=request.turn_id,
+            metric_identifier=request.metric_identifier,
+            metric_metadata=self._extract_metadata_for_csv(request),
+            query=(turn_data.query or "") if turn_data else "",
+            response=(turn_data.response or "") if turn_data else "",
+            evaluation_latency=evaluation_latency,
+            agent_latency=agent_latency,
+            execution_time=evaluation_latency + agent_latency,
+            api_input_tokens=api_input_tokens,
+            api_output_tokens=api_output_tokens,
+            # Streaming performance metrics
+            time_to_first_token=(turn_data.time_to_first_token if turn_data else None),
+            streaming_duration=(turn_data.streaming_duration if turn_data else None),
+            tokens_per_second=(turn_data.tokens_per_second if turn_data else None),
+            tool_calls=_to_json_str(turn_data.tool_calls) if turn_data else None,
+            contexts=_to_json_str(turn_data.contexts) if turn_data else None,
+            expected_response=turn_data.expected_response if turn_data else None,
+            expected_intent=turn_data.expected_intent if turn_data else None,
+            expected_keywords=(
+                _to_json_str(turn_data.expected_keywords) if turn_data else None
+            ),
+            expected_tool_calls=(
+                _to_json_str(turn_data.expected_tool_calls) if turn_data else None
+            ),
+        )
+
     def _will_use_panel(self, metric_identifier: str) -> bool:
         """Check if panel of judges will be used for this metric.
 
@@ -384,6 +771,9 @@ class MetricsEvaluator:
                         reason=f"Evaluation error: {e}",
                         judge_llm_input_tokens=input_tokens,
                         judge_llm_output_tokens=output_tokens,
+                        judge_llm_cached_input_tokens=(
+                            token_tracker.get_cached_input_tokens()
+                        ),
                         embedding_tokens=embedding_tokens,
                     )
         finally:
@@ -392,7 +782,7 @@ class MetricsEvaluator:
 
         return metric_result
 
-    def _evaluate_multiple_expected_responses(
+    def _evaluate_multiple_expected_responses(  # pylint: disable=too-many-locals
         self,
         request: EvaluationRequest,
         evaluation_scope: EvaluationScope,
@@ -414,7 +804,7 @@ class MetricsEvaluator:
             MetricResult with highest score or first PASS, with accumulated judge llm token counts.
         """
         # Initialize helper variables - use dict to reduce local variable count
-        tokens = {"judge_in": 0, "judge_out": 0, "embedding": 0}
+        tokens = {"judge_in": 0, "judge_out": 0, "judge_cached": 0, "embedding": 0}
 
         # This check satisfies the linter but is logically redundant
         if (
@@ -425,17 +815,21 @@ class MetricsEvaluator:
                 f"Metric '{request.metric_identifier}' requires 'expected_response' field. "
                 f"Could not proceed with evaluation."
             )
+        alternatives = self._order_expected_responses(evaluation_scope.turn_data)
+        if self.system_config.core.expected_response_concurrency > 1:
+            return self._evaluate_expected_responses_concurrently(
+                request, evaluation_scope, alternatives, threshold
+            )
+
         score_max = -float("inf")
         reason_acc = ""
         metric_result = None
 
-        for idx, expected_response in enumerate(
-            evaluation_scope.turn_data.expected_response
-        ):
+        for idx, expected_response in enumerate(alternatives):
             logger.debug(
                 "Running evaluation with expected_response %d/%d: %s",
                 idx + 1,
-                len(evaluation_scope.turn_data.expected_response),
+                len(alternatives),
                 expected_response,
             )
             alt_scope = EvaluationScope(
@@ -450,6 +844,7 @@ class MetricsEvaluator:
             before_tokens = (
                 *token_tracker.get_judge_counts(),
                 token_tracker.get_embedding_counts(),
+                token_tracker.get_cached_input_tokens(),
             )
             try:
                 metric_result = self._evaluate(
@@ -460,12 +855,14 @@ class MetricsEvaluator:
                 after_tokens = (
                     *token_tracker.get_judge_counts(),
                     token_tracker.get_embedding_counts(),
+                    token_tracker.get_cached_input_tokens(),
                 )
                 # Include tokens from failing call (LLM may have used tokens before error)
                 # Add current iteration's tokens to accumulated total
                 tokens["judge_in"] += after_tokens[0] - before_tokens[0]
                 tokens["judge_out"] += after_tokens[1] - before_tokens[1]
                 tokens["embedding"] += after_tokens[2] - before_tokens[2]
+                tokens["judge_cached"] += after_tokens[3] - before_tokens[3]
                 logger.error(
                     "Conv %s: Error during evaluation iteration %d: %s",
                     request.conv_data.conversation_group_id,
@@ -479,12 +876,16 @@ class MetricsEvaluator:
                     reason=f"Evaluation error at iteration {idx + 1}: {e}",
                     judge_llm_input_tokens=tokens["judge_in"],
                     judge_llm_output_tokens=tokens["judge_out"],
+                    judge_llm_cached_input_tokens=tokens["judge_cached"],
                     embedding_tokens=tokens["embedding"],
+                    expected_responses_evaluated=idx + 1,
                 )
 
             # Accumulate token counts
+            metric_result.expected_responses_evaluated = idx + 1
             tokens["judge_in"] += metric_result.judge_llm_input_tokens
             tokens["judge_out"] += metric_result.judge_llm_output_tokens
+            tokens["judge_cached"] += metric_result.judge_llm_cached_input_tokens
             tokens["embedding"] += metric_result.embedding_tokens
             logger.debug(
                 "Conv %s: Cumulative judge input tokens: %s, Cumulative judge output tokens: %s",
@@ -521,10 +922,224 @@ class MetricsEvaluator:
         # Update token counts in final result
         metric_result.judge_llm_input_tokens = tokens["judge_in"]
         metric_result.judge_llm_output_tokens = tokens["judge_out"]
+        metric_result.judge_llm_cached_input_tokens = tokens["judge_cached"]
         metric_result.embedding_tokens = tokens["embedding"]
 
         return metric_result
 
+    def _order_expected_responses(self, turn_data: TurnData) -> list[str]:
+        """Return the expected response alternatives in evaluation order.
+
+        With ``core.order_expected_responses`` the alternatives most similar
+        to the actual response (by word overlap) come first, so the likely
+        PASS is scored before the others; ties keep their configured order.
+        """
+        alternatives = list(turn_data.expected_response or [])
+        if not self.system_config.core.order_expected_responses:
+            return alternatives
+        response = turn_data.response or ""
+        return sorted(
+            alternatives,
+            key=lambda alternative: _lexical_similarity(response, alternative),
+            reverse=True,
+        )
+
+    def _evaluate_expected_responses_concurrently(
+        self,
+        request: EvaluationRequest,
+        evaluation_scope: EvaluationScope,
+        alternatives: list[str],
+        threshold: Optional[float],
+    ) -> MetricResult:
+        """Score expected response alternatives in parallel until one passes.
+
+        Up to ``core.expected_response_concurrency`` alternatives are scored
+        at once. When one passes or raises, the alternatives not started yet
+        are cancelled; those already running are awaited so their judge
+        tokens are counted.
+
+        Args:
+            request: Evaluation request with conversation and metric data.
+            evaluation_scope: Scope with turn data containing list of expected responses.
+            alternatives: Expected responses in evaluation order.
+            threshold: Optional score threshold for pass/fail determination.
+
+        Returns:
+            MetricResult combined as in the sequential path, see
+            :meth:`_combine_alternative_outcomes`.
+        """
+        turn_data = evaluation_scope.turn_data
+        if turn_data is None:
+            raise RuntimeError(
+                f"Metric '{request.metric_identifier}' requires 'expected_response' field. "
+                f"Could not proceed with evaluation."
+            )
+
+        outcomes: dict[int, _AlternativeOutcome] = {}
+        executor = ThreadPoolExecutor(
+            max_workers=min(
+                self.system_config.core.expected_response_concurrency,
+                len(alternatives),
+            ),
+            thread_name_prefix="expected-response",
+        )
+        futures: dict[Future[_AlternativeOutcome], int] = {}
+        try:
+            for position, expected_response in enumerate(alternatives):
+                alt_scope = EvaluationScope(
+                    turn_idx=evaluation_scope.turn_idx,
+                    turn_data=turn_data.model_copy(
+                        update={"expected_response": expected_response}
+                    ),
+                    is_conversation=evaluation_scope.is_conversation,
+                )
+                # Each alternative runs in a copy of the caller's context so
+                # its spans nest under the metric span
+                future = executor.submit(
+                    contextvars.copy_context().run,
+                    self._evaluate_alternative,
+                    request,
+                    alt_scope,
+                    threshold,
+                )
+                futures[future] = position
+            for future in as_completed(futures):
+                outcome = future.result()
+                outcomes[futures[future]] = outcome
+                result = outcome[0]
+                if isinstance(result, EvaluationError) or result.result == "PASS":
+                    break
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        # Alternatives that were already running when the loop stopped
+        for future, position in futures.items():
+            if position not in outcomes and not future.cancelled():
+                outcomes[position] = future.result()
+
+        logger.debug(
+            "Conv %s: %s scored %d of %d expected responses",
+            request.conv_data.conversation_group_id,
+            request.metric_identifier,
+            len(outcomes),
+            len(alternatives),
+        )
+        return self._combine_alternative_outcomes(outcomes, threshold)
+
+    def _evaluate_alternative(
+        self,
+        request: EvaluationRequest,
+        alt_scope: EvaluationScope,
+        threshold: Optional[float],
+    ) -> _AlternativeOutcome:
+        """Score one expected response alternative with its own token tracker."""
+        token_tracker = TokenTracker()
+        token_tracker.start()
+        try:
+            result: MetricResult | EvaluationError = self._evaluate(
+                request, alt_scope, token_tracker, threshold
+            )
+        except EvaluationError as e:
+            result = e
+        finally:
+            token_tracker.stop()
+        return result, (
+            *token_tracker.get_judge_counts(),
+            token_tracker.get_cached_input_tokens(),
+            token_tracker.get_embedding_counts(),
+        )
+
+    @staticmethod
+    def _alternative_tokens(outcome: _AlternativeOutcome) -> tuple[int, int, int, int]:
+        """Return judge input, output, cached input and embedding tokens of one.
+
+        Args:
+            outcome: Scored expected response alternative.
+
+        Returns:
+            Token counts, in the order of the tracker counts of the outcome.
+        """
+        result, tracker_counts = outcome
+        if isinstance(result, EvaluationError):
+            # Failed calls only report their usage through the tracker
+            return tracker_counts
+        return (
+            result.judge_llm_input_tokens,
+            result.judge_llm_output_tokens,
+            result.judge_llm_cached_input_tokens,
+            result.embedding_tokens,
+        )
+
+    @classmethod
+    def _combine_alternative_outcomes(
+        cls, outcomes: dict[int, _AlternativeOutcome], threshold: Optional[float]
+    ) -> MetricResult:
+        """Combine scored alternatives the way the sequential path does.
+
+        The first PASS in evaluation order wins. Without a PASS, an evaluation
+        error yields ERROR; otherwise the last result is returned with the
+        highest score and the accumulated scores and reasons. Tokens of every
+        scored alternative are summed.
+
+        Args:
+            outcomes: Outcome by position in evaluation order.
+            threshold: Optional score threshold for pass/fail determination.
+
+        Returns:
+            Combined MetricResult.
+        """
+        passed: Optional[MetricResult] = None
+        error: Optional[tuple[int, EvaluationError]] = None
+        last: Optional[MetricResult] = None
+        score_max: Optional[float] = None
+        reasons = []
+
+        for position in sorted(outcomes):
+            result = outcomes[position][0]
+            if isinstance(result, EvaluationError):
+                error = error or (position, result)
+                continue
+            if result.result == "PASS":
+                passed = passed or result
+                continue
+            last = result
+            if result.score is not None:
+                score_max = (
+                    result.score if score_max is None else max(score_max, result.score)
+                )
+            reasons.append(f"{result.score}; {result.reason}")
+
+        if passed is not None:
+            combined = passed.model_copy()
+        elif error is not None:
+            position, exc = error
+            combined = MetricResult(
+                result="ERROR",
+                score=None,
+                threshold=threshold,
+                reason=f"Evaluation error at iteration {position + 1}: {exc}",
+            )
+        elif last is not None:
+            combined = last.model_copy(
+                update={"score": score_max, "reason": "\n".join(reasons)}
+            )
+        else:
+            raise RuntimeError("No expected response alternative was scored")
+
+        (
+            combined.judge_llm_input_tokens,
+            combined.judge_llm_output_tokens,
+            combined.judge_llm_cached_input_tokens,
+            combined.embedding_tokens,
+        ) = (
+            sum(counts)
+            for counts in zip(
+                *(cls._alternative_tokens(outcome) for outcome in outcomes.values())
+            )
+        )
+        combined.expected_responses_evaluated = len(outcomes)
+        return combined
+
     def _evaluate_multiple_expected_responses_not_supported(
         self,
         request: EvaluationRequest,
@@ -584,6 +1199,7 @@ class MetricsEvaluator:
                 reason=f"Evaluation error: {e}",
                 judge_llm_input_tokens=input_tokens,
                 judge_llm_output_tokens=output_tokens,
+                judge_llm_cached_input_tokens=token_tracker.get_cached_input_tokens(),
                 embedding_tokens=embedding_tokens,
             )
 
@@ -652,6 +1268,7 @@ class MetricsEvaluator:
                 reason=f"Panel evaluation error: {e}",
                 judge_llm_input_tokens=input_tokens,
                 judge_llm_output_tokens=output_tokens,
+                judge_llm_cached_input_tokens=token_tracker.get_cached_input_tokens(),
                 embedding_tokens=embedding_tokens,
             )
 
@@ -681,14 +1298,19 @@ class MetricsEvaluator:
         """
         framework = request.metric_identifier.split(":", 1)[0]
 
-        # Non-LLM metrics: no judge LLM involved (nlp, script)
-        if framework in NON_LLM_FRAMEWORKS:
-            return self._evaluate_non_llm(request, evaluation_scope, threshold)
+        with profile_span(
+            f"{STAGE_METRIC_PREFIX}{framework}",
+            "metric",
+            metric=request.metric_identifier,
+        ):
+            # Non-LLM metrics: no judge LLM involved (nlp, script)
+            if framework in NON_LLM_FRAMEWORKS:
+                return self._evaluate_non_llm(request, evaluation_scope, threshold)
 
-        # LLM metrics: delegate to judge orchestrator
-        return self.judge_orchestrator.evaluate_with_judges(
-            request, evaluation_scope, token_tracker, threshold
-        )
+            # LLM metrics: delegate to judge orchestrator
+            return self.judge_orchestrator.evaluate_with_judges(
+                request, evaluation_scope, token_tracker, threshold
+            )
 
     def _evaluate_non_llm(
         self,
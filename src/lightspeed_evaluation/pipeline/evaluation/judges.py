@@ -1,7 +1,7 @@
 """Judge orchestration module - handles multi-judge evaluation and aggregation."""
 
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from statistics import mean
 from typing import Any, Optional
 
@@ -11,10 +11,14 @@ from lightspeed_evaluation.core.llm.token_tracker import TokenTracker
 from lightspeed_evaluation.core.models import (
     EvaluationRequest,
     EvaluationScope,
+    JudgePanelConfig,
     JudgeScore,
     MetricResult,
 )
+from lightspeed_evaluation.core.models.trace import SpanType
 from lightspeed_evaluation.core.system.exceptions import EvaluationError
+from lightspeed_evaluation.core.system.profiler import STAGE_JUDGE_CALL, profile_span
+from lightspeed_evaluation.core.system.tracer import SPAN_JUDGE_CALL, trace_span
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +27,14 @@ HandlerFactory = Callable[[str, LLMManager], Any]
 StatusDeterminer = Callable[[float, Optional[float]], str]
 
 
+def close_handlers(handlers: Iterable[Any]) -> None:
+    """Call ``close()`` on every metric handler that defines it."""
+    for handler in handlers:
+        close = getattr(handler, "close", None)
+        if callable(close):
+            close()
+
+
 class JudgeOrchestrator:
     """Orchestrates evaluation across single or multiple judges.
 
@@ -36,7 +48,7 @@ class JudgeOrchestrator:
     def __init__(
         self,
         llm_manager: LLMManager,
-        primary_handlers: dict[str, Any],
+        primary_handlers: Mapping[str, Any],
         handler_factory: HandlerFactory,
         status_determiner: StatusDeterminer,
     ) -> None:
@@ -44,7 +56,7 @@ class JudgeOrchestrator:
 
         Args:
             llm_manager: Primary LLM manager (may have judge panel configured)
-            primary_handlers: Pre-initialized handlers for primary judge
+            primary_handlers: Handlers for the primary judge, keyed by framework
             handler_factory: Function to create handlers for non-primary judges
             status_determiner: Function to determine pass/fail from score and threshold
         """
@@ -91,14 +103,15 @@ class JudgeOrchestrator:
             len(judge_managers),
         )
 
-        # Evaluate with each judge
-        judge_scores, token_totals = self._evaluate_all_judges(
+        # Evaluate with each judge (or escalate from the leading judges)
+        judge_scores, token_totals = self._evaluate_panel(
             judge_managers,
             framework,
             metric_name,
             request,
             evaluation_scope,
             token_tracker,
+            threshold,
         )
 
         # Aggregate scores (majority_vote sets PASS/FAIL without re-applying threshold to mean)
@@ -120,10 +133,113 @@ class JudgeOrchestrator:
             reason=aggregated_reason,
             judge_llm_input_tokens=token_totals["judge_input_tokens"],
             judge_llm_output_tokens=token_totals["judge_output_tokens"],
+            judge_llm_cached_input_tokens=token_totals["judge_cached_input_tokens"],
             embedding_tokens=token_totals["embedding_tokens"],
             judge_scores=judge_scores,
         )
 
+    def _evaluate_panel(  # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+        self,
+        judge_managers: list[LLMManager],
+        framework: str,
+        metric_name: str,
+        request: EvaluationRequest,
+        evaluation_scope: EvaluationScope,
+        token_tracker: TokenTracker,
+        threshold: Optional[float],
+    ) -> tuple[list[JudgeScore], dict[str, int]]:
+        """Evaluate with the panel, escalating from the leading judges if configured.
+
+        Without escalation every judge is called. With escalation, the
+        leading judges are called first and the rest only when
+        :meth:`_escalation_reason` finds their opinion uncertain; judges
+        that were not called are recorded with ``consulted=False``.
+
+        Returns:
+            Tuple of (judge_scores, token_totals) as for _evaluate_all_judges.
+        """
+        panel = self._panel_config()
+        escalation = panel.escalation if panel else None
+        if escalation is None or len(judge_managers) <= escalation.initial_judges:
+            return self._evaluate_all_judges(
+                judge_managers,
+                framework,
+                metric_name,
+                request,
+                evaluation_scope,
+                token_tracker,
+                threshold,
+            )
+
+        split = escalation.initial_judges
+        judge_scores, token_totals = self._evaluate_all_judges(
+            judge_managers[:split],
+            framework,
+            metric_name,
+            request,
+            evaluation_scope,
+            token_tracker,
+            threshold,
+        )
+        reason = self._escalation_reason(judge_scores, threshold, escalation.margin)
+        if reason is None:
+            logger.debug(
+                "%s settled by %d initial judge(s)", request.metric_identifier, split
+            )
+            judge_scores.extend(
+                self._not_consulted(
+                    judge_managers[split:],
+                    "Not consulted: initial judges were confident",
+                )
+            )
+            return judge_scores, token_totals
+
+        logger.debug(
+            "Escalating %s to %d more judge(s): %s",
+            request.metric_identifier,
+            len(judge_managers) - split,
+            reason,
+        )
+        escalated_scores, escalated_totals = self._evaluate_all_judges(
+            judge_managers[split:],
+            framework,
+            metric_name,
+            request,
+            evaluation_scope,
+            token_tracker,
+            threshold,
+            prior_scores=judge_scores,
+        )
+        return judge_scores + escalated_scores, {
+            key: value + escalated_totals[key] for key, value in token_totals.items()
+        }
+
+    @staticmethod
+    def _escalation_reason(
+        judge_scores: list[JudgeScore], threshold: Optional[float], margin: float
+    ) -> Optional[str]:
+        """Explain why the initial judges' opinion needs more judges, if it does.
+
+        Args:
+            judge_scores: Scores of the initial judges.
+            threshold: Metric pass threshold. Defaults to 0.5 when not set.
+            margin: Distance from the threshold considered uncertain.
+
+        Returns:
+            Escalation reason, or None when the initial judges settle the result.
+        """
+        effective_threshold = (
+            float(threshold) if threshold is not None else DEFAULT_METRIC_THRESHOLD
+        )
+        scores = [js.score for js in judge_scores if js.score is not None]
+        if len(scores) < len(judge_scores):
+            return "an initial judge failed"
+        if len({score >= effective_threshold for score in scores}) > 1:
+            return "initial judges disagree"
+        if any(abs(score - effective_threshold) < margin for score in scores):
+            return f"score within {margin} of threshold {effective_threshold}"
+        return None
+
     def _evaluate_all_judges(  # pylint: disable=too-many-arguments,too-many-positional-arguments
         self,
         judge_managers: list[LLMManager],
@@ -132,9 +248,15 @@ class JudgeOrchestrator:
         request: EvaluationRequest,
         evaluation_scope: EvaluationScope,
         token_tracker: TokenTracker,
+        threshold: Optional[float] = None,
+        prior_scores: Sequence[JudgeScore] = (),
     ) -> tuple[list[JudgeScore], dict[str, int]]:
         """Evaluate metric with all judges and collect results.
 
+        Judges are called in order and the remaining ones are skipped
+        (recorded with ``consulted=False``) as soon as :meth:`_outcome_settled`
+        shows they cannot change the aggregated outcome.
+
         Args:
             judge_managers: LLM managers for each judge to evaluate with.
             framework: Metric framework name (e.g. ragas, deepeval).
@@ -142,20 +264,24 @@ class JudgeOrchestrator:
             request: Contains conversation data for evaluation.
             evaluation_scope: Turn or conversation context.
             token_tracker: Tracks token usage per judge call.
+            threshold: Metric pass threshold, used to detect a settled outcome.
+            prior_scores: Scores already collected for this metric from other
+                judges of the panel (e.g. before escalation).
 
         Returns:
             Tuple of (judge_scores, token_totals) where token_totals is a dict
-                containing judge_input_tokens, judge_output_tokens, and
-                embedding_tokens.
+                containing judge_input_tokens, judge_output_tokens,
+                judge_cached_input_tokens, and embedding_tokens.
         """
         judge_scores: list[JudgeScore] = []
         token_totals = {
             "judge_input_tokens": 0,
             "judge_output_tokens": 0,
+            "judge_cached_input_tokens": 0,
             "embedding_tokens": 0,
         }
 
-        for judge_manager in judge_managers:
+        for idx, judge_manager in enumerate(judge_managers):
             score_entry = self._evaluate_single_judge(
                 judge_manager,
                 framework,
@@ -167,10 +293,82 @@ class JudgeOrchestrator:
             judge_scores.append(score_entry)
             token_totals["judge_input_tokens"] += score_entry.judge_input_tokens
             token_totals["judge_output_tokens"] += score_entry.judge_output_tokens
+            token_totals[
+                "judge_cached_input_tokens"
+            ] += score_entry.judge_cached_input_tokens
             token_totals["embedding_tokens"] += score_entry.embedding_tokens
 
+            remaining = judge_managers[idx + 1 :]
+            if remaining and self._outcome_settled(
+                [*prior_scores, *judge_scores], len(remaining), threshold
+            ):
+                logger.debug(
+                    "%s decided after %d judge(s), skipping %d",
+                    request.metric_identifier,
+                    len(prior_scores) + len(judge_scores),
+                    len(remaining),
+                )
+                judge_scores.extend(
+                    self._not_consulted(
+                        remaining, "Not consulted: outcome already decided"
+                    )
+                )
+                break
+
         return judge_scores, token_totals
 
+    def _outcome_settled(
+        self,
+        judge_scores: list[JudgeScore],
+        remaining: int,
+        threshold: Optional[float],
+    ) -> bool:
+        """Check whether the remaining judges can still change the outcome.
+
+        - majority_vote: settled once the pass votes already form a strict
+          majority even if every remaining judge fails, or can no longer
+          form one even if every remaining judge passes.
+        - max: settled once a judge gives the maximum score of 1.0.
+        - average: never settled early.
+
+        Disabled by ``judge_panel.early_stopping: false``.
+
+        Args:
+            judge_scores: Scores collected so far.
+            remaining: Number of judges not called yet.
+            threshold: Metric pass threshold. Defaults to 0.5 when not set.
+
+        Returns:
+            True if further judge calls cannot change the outcome.
+        """
+        panel = self._panel_config()
+        if panel is None or not panel.early_stopping:
+            return False
+        scores = [js.score for js in judge_scores if js.score is not None]
+
+        if panel.aggregation_strategy == "majority_vote":
+            effective_threshold = (
+                float(threshold) if threshold is not None else DEFAULT_METRIC_THRESHOLD
+            )
+            passes = sum(1 for score in scores if score >= effective_threshold)
+            voters = len(scores) + remaining
+            return passes * 2 > voters or (passes + remaining) * 2 <= voters
+
+        if panel.aggregation_strategy == "max":
+            return any(score >= 1.0 for score in scores)
+
+        return False
+
+    @staticmethod
+    def _not_consulted(
+        judge_managers: Sequence[LLMManager], reason: str
+    ) -> list[JudgeScore]:
+        """Record judges that were skipped without being called."""
+        return [
+            JudgeScore(judge_id=judge_manager.judge_id, reason=reason, consulted=False)
+            for judge_manager in judge_managers
+        ]
+
     def _evaluate_single_judge(  # pylint: disable=too-many-arguments,too-many-positional-arguments
         self,
         judge_manager: LLMManager,
@@ -199,13 +397,61 @@ class JudgeOrchestrator:
         # Use judge_id from manager (pool key) - ensures uniqueness even when
         # multiple pool entries use the same underlying model
         judge_id = judge_manager.judge_id
+        with trace_span(
+            SPAN_JUDGE_CALL,
+            SpanType.GENERATION,
+            judge_id=judge_id,
+            metric=request.metric_identifier,
+        ) as span:
+            score_entry = self._score_with_judge(
+                judge_manager,
+                framework,
+                metric_name,
+                request,
+                evaluation_scope,
+                token_tracker,
+            )
+            span.set_attributes(
+                score=score_entry.score,
+                embedding_tokens=score_entry.embedding_tokens,
+                cached_input_tokens=score_entry.judge_cached_input_tokens,
+                cache_hits=token_tracker.get_cache_hits(),
+            )
+            span.set_llm(
+                model=judge_manager.model_name,
+                provider=judge_manager.config.provider,
+                input_tokens=score_entry.judge_input_tokens,
+                output_tokens=score_entry.judge_output_tokens,
+            )
+            span.set_io(outputs={"reason": score_entry.reason})
+            if score_entry.score is None:
+                span.set_error(score_entry.reason or "Judge produced no score")
+            return score_entry
+
+    def _score_with_judge(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        judge_manager: LLMManager,
+        framework: str,
+        metric_name: str,
+        request: EvaluationRequest,
+        evaluation_scope: EvaluationScope,
+        token_tracker: TokenTracker,
+    ) -> JudgeScore:
+        """Run one judge's handler and collect its score and token usage."""
+        judge_id = judge_manager.judge_id
         token_tracker.reset()
 
         try:
             handler = self._get_handler_for_judge(framework, judge_manager)
-            score, reason = handler.evaluate(
-                metric_name, request.conv_data, evaluation_scope
-            )
+            with profile_span(
+                STAGE_JUDGE_CALL,
+                "judge",
+                judge_id=judge_id,
+                metric=request.metric_identifier,
+            ):
+                score, reason = handler.evaluate(
+                    metric_name, request.conv_data, evaluation_scope
+                )
             judge_input_tokens, judge_output_tokens = token_tracker.get_judge_counts()
             embedding_tokens = token_tracker.get_embedding_counts()
 
@@ -224,6 +470,7 @@ class JudgeOrchestrator:
                 reason=reason,
                 judge_input_tokens=judge_input_tokens,
                 judge_output_tokens=judge_output_tokens,
+                judge_cached_input_tokens=token_tracker.get_cached_input_tokens(),
                 embedding_tokens=embedding_tokens,
             )
 
@@ -240,9 +487,24 @@ class JudgeOrchestrator:
                 reason=f"Evaluation error: {e}",
                 judge_input_tokens=judge_input_tokens,
                 judge_output_tokens=judge_output_tokens,
+                judge_cached_input_tokens=token_tracker.get_cached_input_tokens(),
                 embedding_tokens=embedding_tokens,
             )
 
+    def get_primary_handler(self, framework: str) -> tuple[str, Any]:
+        """Get the primary judge's id and its handler for a framework.
+
+        Args:
+            framework: Metric framework name (e.g. custom).
+
+        Returns:
+            Tuple of (judge_id, handler) used for metrics outside the panel.
+        """
+        judge_manager = self.llm_manager.get_primary_judge()
+        return judge_manager.judge_id, self._get_handler_for_judge(
+            framework, judge_manager
+        )
+
     def _get_handler_for_judge(self, framework: str, judge_manager: LLMManager) -> Any:
         """Get or create a metric handler for a specific judge.
 
@@ -276,6 +538,11 @@ class JudgeOrchestrator:
         self._judge_handlers[judge_id][framework] = handler
         return handler
 
+    def close(self) -> None:
+        """Release the resources held by the handlers of non-primary judges."""
+        for handlers in self._judge_handlers.values():
+            close_handlers(handlers.values())
+
     def aggregate_scores(
         self,
         judge_scores: list[JudgeScore],
@@ -283,8 +550,9 @@ class JudgeOrchestrator:
     ) -> tuple[Optional[float], str, Optional[str]]:
         """Aggregate scores from multiple judges based on the panel strategy.
 
-        Judges that errored (score is None) are excluded from aggregation.
-        With a single judge, its score and reason are returned directly.
+        Judges that errored (score is None) or were not consulted are excluded
+        from aggregation. With a single judge, its score and reason are
+        returned directly.
 
         Strategies for multiple judges:
             - max: uses the highest valid score.
@@ -301,12 +569,9 @@ class JudgeOrchestrator:
             status_override is only set for majority_vote (PASS/FAIL);
             None for other strategies.
         """
-        panel = (
-            self.llm_manager.system_config.judge_panel
-            if self.llm_manager.system_config
-            else None
-        )
+        panel = self._panel_config()
         strategy = panel.aggregation_strategy if panel else "max"
+        judge_scores = [js for js in judge_scores if js.consulted]
 
         # Single judge: return its score and reason directly (even if None)
         if len(judge_scores) == 1:
@@ -339,6 +604,12 @@ class JudgeOrchestrator:
             None,
         )
 
+    def _panel_config(self) -> Optional[JudgePanelConfig]:
+        """Get the judge panel configuration, if any."""
+        if self.llm_manager.system_config:
+            return self.llm_manager.system_config.judge_panel
+        return None
+
     def _aggregate_majority_vote(
         self,
         scores: list[float],
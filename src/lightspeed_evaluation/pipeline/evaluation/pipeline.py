@@ -2,18 +2,27 @@
 
 import asyncio
 import concurrent.futures
+import contextvars
 import logging
+import random
+import sys
 from collections.abc import Callable, Coroutine
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional, cast
 
-import litellm
 import tqdm
 
-from lightspeed_evaluation.core.llm.litellm_patch import litellm_state_lock
+from lightspeed_evaluation.core.api import APIConnectionPool
+from lightspeed_evaluation.core.llm.batch import BatchJudge, batch_judge_session
+from lightspeed_evaluation.core.metrics.geval_steps import (
+    GEVAL_STEPS_FILENAME,
+    GEvalStepsCache,
+)
 from lightspeed_evaluation.core.metrics.manager import MetricManager
 from lightspeed_evaluation.core.models import (
     EvaluationData,
     EvaluationResult,
+    SequentialTestResult,
     SystemConfig,
 )
 from lightspeed_evaluation.core.output.data_persistence import save_evaluation_data
@@ -29,6 +38,19 @@ from lightspeed_evaluation.core.system.exceptions import (
     ConfigurationError,
     StorageError,
 )
+from lightspeed_evaluation.core.system.profiler import (
+    STAGE_EVALUATION,
+    STAGE_HANDLER_SETUP,
+    STAGE_STORAGE_FINALIZE,
+    STAGE_STORAGE_WRITE,
+    profile_span,
+)
+from lightspeed_evaluation.core.system.sequential import (
+    SequentialProbabilityRatioTest,
+    write_sequential_report,
+)
+from lightspeed_evaluation.core.system.tracer import SPAN_EVALUATION_RUN, trace_span
+from lightspeed_evaluation.pipeline.evaluation.budget import BudgetTracker
 from lightspeed_evaluation.pipeline.evaluation.driver import AgentDriver
 from lightspeed_evaluation.pipeline.evaluation.errors import EvaluationErrorHandler
 from lightspeed_evaluation.pipeline.evaluation.evaluator import MetricsEvaluator
@@ -36,7 +58,10 @@ from lightspeed_evaluation.pipeline.evaluation.processor import (
     ConversationProcessor,
     ProcessorComponents,
 )
-from lightspeed_evaluation.pipeline.evaluation.registry import AgentDriverRegistry
+from lightspeed_evaluation.pipeline.evaluation.registry import (
+    AgentDriverPool,
+    AgentDriverRegistry,
+)
 
 if TYPE_CHECKING:
     from lightspeed_evaluation.core.models.data import DatasetMetadata
@@ -44,6 +69,16 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _loaded_litellm() -> Any:
+    """Return the litellm module if something in this process imported it.
+
+    litellm is only imported by the LLM-backed metric handlers, so a run that
+    never built one has no litellm state to tear down and should not pay for
+    importing it.
+    """
+    return sys.modules.get("litellm")
+
+
 def _resolve_eval_data_agent_config(
     agent_config: Optional[dict[str, Any]],
     agent_name: Optional[str],
@@ -83,6 +118,7 @@ class EvaluationPipeline:  # pylint: disable=too-many-instance-attributes
 
         self.system_config: SystemConfig = config_loader.system_config
         self.original_data_path: Optional[str] = None
+        self.sequential_result: Optional[SequentialTestResult] = None
         file_config = get_file_config(config_loader.system_config.storage)
         self.output_dir = output_dir or file_config.output_dir
 
@@ -103,30 +139,48 @@ class EvaluationPipeline:  # pylint: disable=too-many-instance-attributes
             raise ValueError(
                 "SystemConfig must be loaded before initializing components"
             )
+        self._check_batch_judge_config(config)
 
         # Metric manager
         metric_manager = MetricManager(config)
 
-        # Create agent driver registry and default driver
-        self._registry = AgentDriverRegistry()
+        # Create agent driver registry, default driver and the pool of drivers
+        # for per-conversation overrides, all sharing HTTP connections
+        self._connection_pool = APIConnectionPool()
+        self._registry = AgentDriverRegistry(connection_pool=self._connection_pool)
         self._default_driver = self._create_default_driver()
+        self._driver_pool = AgentDriverPool(self._registry)
 
         error_handler = EvaluationErrorHandler()
 
         # Create script execution manager
         script_manager = ScriptExecutionManager()
 
+        # Generated GEval steps persist in the output directory for later runs
+        self.geval_steps_cache = GEvalStepsCache()
+
         # Create metrics evaluator with script manager
-        metrics_evaluator = MetricsEvaluator(
-            self.config_loader, metric_manager, script_manager
+        self.metric_manager = metric_manager
+        self.metrics_evaluator = MetricsEvaluator(
+            self.config_loader,
+            metric_manager,
+            script_manager,
+            geval_steps_cache=self.geval_steps_cache,
         )
 
+        # Token and cost budgets (None when no limits are configured)
+        self.budget = BudgetTracker.from_system_config(config)
+
+        # Batch-API judge mode (None when judge calls are interactive)
+        self.batch_judge = BatchJudge.from_system_config(config)
+
         # Create processor components
         processor_components = ProcessorComponents(
-            metrics_evaluator=metrics_evaluator,
+            metrics_evaluator=self.metrics_evaluator,
             error_handler=error_handler,
             metric_manager=metric_manager,
             script_manager=script_manager,
+            budget=self.budget,
         )
 
         # Conversation processor
@@ -135,6 +189,34 @@ class EvaluationPipeline:  # pylint: disable=too-many-instance-attributes
             processor_components,
         )
 
+    @staticmethod
+    def _check_batch_judge_config(config: SystemConfig) -> None:
+        """Reject settings that cannot be evaluated in batch judge rounds.
+
+        Raises:
+            ConfigurationError: If batch judge mode is combined with the
+                sequential test or with agents whose responses are not cached.
+        """
+        if not config.batch_judge.enabled:
+            return
+        if config.sequential_test.enabled:
+            raise ConfigurationError(
+                "batch_judge cannot be combined with sequential_test, which "
+                "needs each conversation's results as soon as it is evaluated"
+            )
+        if config.agents is not None and config.agents.enabled:
+            uncached = sorted(
+                name
+                for name, agent in config.agents.agents.items()
+                if not agent.cache_enabled
+            )
+            if uncached:
+                raise ConfigurationError(
+                    "batch_judge evaluates conversations in several rounds and "
+                    "needs cached agent responses so each query is sent once; "
+                    f"enable core.cache_enabled (uncached agents: {uncached})"
+                )
+
     def _create_default_driver(self) -> AgentDriver:
         """Create the default agent driver from system config."""
         _name, agent_config = self._resolve_default_agent_config()
@@ -154,18 +236,17 @@ class EvaluationPipeline:  # pylint: disable=too-many-instance-attributes
             return config.agents.resolve_agent_config()
         return ("http_api", {"type": "http_api"})
 
-    def _resolve_driver_for_conversation(
+    def _resolve_agent_config_for_conversation(
         self, conv_data: EvaluationData
-    ) -> tuple[AgentDriver, bool]:
-        """Resolve the agent driver for a conversation.
+    ) -> Optional[dict[str, Any]]:
+        """Resolve the agent configuration overridden by a conversation.
 
         Returns:
-            Tuple of (driver, is_per_conversation). The boolean indicates whether
-            the driver was created specifically for this conversation and should
-            be closed after use.
+            The resolved agent configuration of the conversation's driver, or
+            None when the conversation uses the default driver.
         """
         if not conv_data.agent and not conv_data.agent_config:
-            return self._default_driver, False
+            return None
 
         if self.system_config.agents is None:
             raise ConfigurationError(
@@ -174,7 +255,7 @@ class EvaluationPipeline:  # pylint: disable=too-many-instance-attributes
             )
 
         if not self.system_config.agents.enabled:
-            return self._default_driver, False
+            return None
 
         agent_name = conv_data.agent[0] if conv_data.agent else None
         agent_config_override = _resolve_eval_data_agent_config(
@@ -185,12 +266,7 @@ class EvaluationPipeline:  # pylint: disable=too-many-instance-attributes
             agent_name=agent_name,
             agent_config_override=agent_config_override,
         )
-        return (
-            self._registry.create_driver(
-                agent_config, enabled=self.system_config.agents.enabled
-            ),
-            True,
-        )
+        return agent_config
 
     def run_evaluation(
         self,
@@ -214,36 +290,78 @@ class EvaluationPipeline:  # pylint: disable=too-many-instance-attributes
 
         run_name = original_data_path or "evaluation"
         self.storage_backend.initialize(RunInfo(name=run_name))
+        self.geval_steps_cache.load(self._geval_steps_path)
+
+        # Import and build only the metric frameworks this dataset uses
+        with profile_span(STAGE_HANDLER_SETUP, "setup"):
+            self.metrics_evaluator.prepare_handlers(
+                self.metric_manager.resolve_frameworks(evaluation_data)
+            )
 
         eval_succeeded = False
         try:
             # Process each conversation
             logger.info("Processing conversations")
-            results = self._process_eval_data(evaluation_data)
+            with (
+                profile_span(STAGE_EVALUATION, "pipeline"),
+                trace_span(
+                    SPAN_EVALUATION_RUN,
+                    run_name=run_name,
+                    conversations=len(evaluation_data),
+                ) as span,
+            ):
+                if self.system_config.sequential_test.enabled:
+                    results = self._process_eval_data_sequentially(evaluation_data)
+                elif self.batch_judge is not None:
+                    results = self._process_eval_data_in_rounds(
+                        evaluation_data, self.batch_judge
+                    )
+                else:
+                    results = self._process_eval_data(evaluation_data)
+                span.set_attributes(results=len(results))
             eval_succeeded = True
         finally:
             self.storage_backend.set_evaluation_context(evaluation_data)
             # Pass success so backends (e.g. MLflow) can mark complete vs failed
             # while still writing final aggregation / reports from incremental data.
-            self.storage_backend.finalize(success=eval_succeeded)
+            with profile_span(STAGE_STORAGE_FINALIZE, "io"):
+                self.storage_backend.finalize(success=eval_succeeded)
             self.storage_backend.close()
+            self._save_geval_steps()
 
         if self.system_config.agents is not None and self.system_config.agents.enabled:
             logger.info("Saving amended evaluation data")
             self._save_amended_data(evaluation_data, dataset_metadata)
 
+        if self.budget is not None:
+            usage = self.budget.usage()
+            logger.info(
+                "Budget usage: %d tokens, cost %.4f",
+                usage["tokens"],
+                usage["cost"],
+            )
         logger.info("Evaluation complete: %d results generated", len(results))
         return results
 
     def _process_eval_data(
-        self, evaluation_data: list[EvaluationData]
+        self, evaluation_data: list[EvaluationData], save: bool = True
     ) -> list[EvaluationResult]:
-        """Process the conversations from the evaluation_data."""
+        """Process the conversations from the evaluation_data.
+
+        Args:
+            evaluation_data: Conversations to evaluate.
+            save: Whether to save each conversation's results to storage as
+                soon as it completes.
+        """
         with concurrent.futures.ThreadPoolExecutor(
             max_workers=self.system_config.core.max_threads
         ) as executor:
+            # Each task runs in a copy of the caller's context so its trace
+            # spans nest under the evaluation run span
             futures = {
-                executor.submit(self._process_conversation, c): c
+                executor.submit(
+                    contextvars.copy_context().run, self._process_conversation, c
+                ): c
                 for c in evaluation_data
             }
             results: list[EvaluationResult] = []
@@ -251,25 +369,134 @@ class EvaluationPipeline:  # pylint: disable=too-many-instance-attributes
                 concurrent.futures.as_completed(futures), total=len(evaluation_data)
             ):
                 conversation_results = future.result()
-                # Batch save results per conversation (more efficient than individual saves)
-                if conversation_results:
-                    try:
-                        self.storage_backend.save_run(conversation_results)
-                    except StorageError as e:
-                        logger.warning("Failed to save results to storage: %s", e)
+                if save:
+                    self._save_conversation_results(conversation_results)
                 results.extend(conversation_results)
             return results
 
+    def _process_eval_data_in_rounds(
+        self, evaluation_data: list[EvaluationData], batch_judge: BatchJudge
+    ) -> list[EvaluationResult]:
+        """Process the conversations with judge calls sent as provider batches.
+
+        Every round evaluates all conversations; judge calls without a batch
+        response are queued and their round's results discarded. The queued
+        calls are then submitted and awaited, until a round queues nothing.
+        Only the results of that final round are saved.
+        """
+        max_rounds = batch_judge.config.max_rounds
+        results: list[EvaluationResult] = []
+        with batch_judge_session(batch_judge):
+            for round_number in range(1, max_rounds + 1):
+                batch_judge.start_round()
+                if self.budget is not None:
+                    self.budget.reset()
+                results = self._process_eval_data(evaluation_data, save=False)
+                deferred = batch_judge.pending
+                if not deferred:
+                    break
+                if round_number == max_rounds:
+                    logger.warning(
+                        "%d judge requests still deferred after %d batch rounds; "
+                        "their metrics are reported as errors",
+                        deferred,
+                        max_rounds,
+                    )
+                    break
+                logger.info(
+                    "Batch judge round %d: waiting for %d deferred judge requests",
+                    round_number,
+                    deferred,
+                )
+                batch_judge.run_batches()
+
+        self._save_conversation_results(results)
+        return results
+
+    def _process_eval_data_sequentially(
+        self, evaluation_data: list[EvaluationData]
+    ) -> list[EvaluationResult]:
+        """Process conversations in random order until the sequential test decides.
+
+        Results enter the test in the shuffled submission order, not in
+        completion order, so slow (e.g. timing out) conversations cannot bias
+        the verdict. Once it is reached, queued conversations are cancelled
+        and the results of those still in flight are discarded.
+        """
+        config = self.system_config.sequential_test
+        order = list(evaluation_data)
+        random.Random(config.seed).shuffle(order)
+        sprt = SequentialProbabilityRatioTest(config, len(order))
+
+        results: list[EvaluationResult] = []
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.system_config.core.max_threads
+        )
+        try:
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run, self._process_conversation, c
+                )
+                for c in order
+            ]
+            for future in tqdm.tqdm(futures, total=len(order)):
+                conversation_results = future.result()
+                self._save_conversation_results(conversation_results)
+                results.extend(conversation_results)
+                if sprt.update(conversation_results) is not None:
+                    break
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        self.sequential_result = sprt.outcome()
+        logger.info(
+            "Sequential test: %s after %d of %d conversations",
+            self.sequential_result.decision,
+            self.sequential_result.conversations_consumed,
+            self.sequential_result.conversations_total,
+        )
+        try:
+            write_sequential_report(self.sequential_result, self.output_dir)
+        except OSError as e:
+            logger.warning("Failed to save sequential test report: %s", e)
+        return results
+
+    def _save_conversation_results(
+        self, conversation_results: list[EvaluationResult]
+    ) -> None:
+        """Batch save results per conversation (more efficient than individual saves)."""
+        if not conversation_results:
+            return
+        try:
+            with profile_span(STAGE_STORAGE_WRITE, "io"):
+                self.storage_backend.save_run(conversation_results)
+        except StorageError as e:
+            logger.warning("Failed to save results to storage: %s", e)
+
     def _process_conversation(
         self, conv_data: EvaluationData
     ) -> list[EvaluationResult]:
         """Resolve driver and process a single conversation."""
-        driver, is_per_conversation = self._resolve_driver_for_conversation(conv_data)
-        try:
+        agent_config = self._resolve_agent_config_for_conversation(conv_data)
+        if agent_config is None:
+            return self.conversation_processor.process_conversation(
+                conv_data, self._default_driver
+            )
+        with self._driver_pool.driver(agent_config) as driver:
             return self.conversation_processor.process_conversation(conv_data, driver)
-        finally:
-            if is_per_conversation:
-                driver.close()
+
+    @property
+    def _geval_steps_path(self) -> Path:
+        """File holding the GEval evaluation steps generated by earlier runs."""
+        return Path(self.output_dir) / GEVAL_STEPS_FILENAME
+
+    def _save_geval_steps(self) -> None:
+        """Persist newly generated GEval evaluation steps for later runs."""
+        try:
+            if self.geval_steps_cache.save(self._geval_steps_path):
+                logger.info("GEval evaluation steps saved: %s", self._geval_steps_path)
+        except OSError as e:
+            logger.warning("Failed to save GEval evaluation steps: %s", e)
 
     def _save_amended_data(
         self,
@@ -306,8 +533,18 @@ class EvaluationPipeline:  # pylint: disable=too-many-instance-attributes
         pipelines, since ``litellm.cache`` is process-global state.
         """
         self._default_driver.close()
+        self._driver_pool.close()
+        self._connection_pool.close()
 
         self.storage_backend.close()
+        self.metrics_evaluator.close()
+
+        litellm = _loaded_litellm()
+        if litellm is None:
+            return
+
+        # pylint: disable=import-outside-toplevel
+        from lightspeed_evaluation.core.llm.litellm_patch import litellm_state_lock
 
         with litellm_state_lock:
             cache = litellm.cache
@@ -4,6 +4,7 @@ import logging
 from dataclasses import dataclass
 from typing import Optional
 
+from lightspeed_evaluation.core.constants import NON_LLM_FRAMEWORKS
 from lightspeed_evaluation.core.metrics.manager import MetricLevel, MetricManager
 from lightspeed_evaluation.core.models import (
     EvaluationData,
@@ -11,11 +12,26 @@ from lightspeed_evaluation.core.models import (
     EvaluationResult,
     TurnData,
 )
+from lightspeed_evaluation.core.models.trace import SpanType
 from lightspeed_evaluation.core.script import (
     ScriptExecutionError,
     ScriptExecutionManager,
 )
 from lightspeed_evaluation.core.system import ConfigLoader
+from lightspeed_evaluation.core.system.cassette import cassette_scope
+from lightspeed_evaluation.core.system.profiler import (
+    STAGE_AGENT_CALL,
+    STAGE_CLEANUP_SCRIPT,
+    STAGE_SETUP_SCRIPT,
+    profile_span,
+)
+from lightspeed_evaluation.core.system.tracer import (
+    SPAN_AGENT_CALL,
+    SPAN_CONVERSATION,
+    SPAN_TURN,
+    trace_span,
+)
+from lightspeed_evaluation.pipeline.evaluation.budget import BudgetTracker
 from lightspeed_evaluation.pipeline.evaluation.driver import AgentDriver
 from lightspeed_evaluation.pipeline.evaluation.errors import EvaluationErrorHandler
 from lightspeed_evaluation.pipeline.evaluation.evaluator import MetricsEvaluator
@@ -31,6 +47,7 @@ class ProcessorComponents:
     error_handler: EvaluationErrorHandler
     metric_manager: MetricManager
     script_manager: ScriptExecutionManager
+    budget: Optional[BudgetTracker] = None
 
 
 @dataclass
@@ -67,6 +84,21 @@ class ConversationProcessor:
         """
         logger.info("Evaluating conversation: %s", conv_data.conversation_group_id)
 
+        with (
+            cassette_scope(conv_data.conversation_group_id),
+            trace_span(
+                SPAN_CONVERSATION,
+                conversation_group_id=conv_data.conversation_group_id,
+                tag=sorted(conv_data.tag),
+                turns=len(conv_data.turns),
+            ),
+        ):
+            return self._process_conversation(conv_data, agent_driver)
+
+    def _process_conversation(
+        self, conv_data: EvaluationData, agent_driver: AgentDriver
+    ) -> list[EvaluationResult]:
+        """Run scripts, turns and conversation metrics for one conversation."""
         # Build processing context with resolved metrics
         ctx = self._build_processing_context(conv_data, agent_driver)
 
@@ -145,29 +177,50 @@ class ConversationProcessor:
         for turn_idx, (turn_data, turn_metrics) in enumerate(
             zip(ctx.conv_data.turns, ctx.resolved_turn_metrics)
         ):
-            # Handle agent execution if enabled
-            if ctx.agent_driver.enabled:
-                api_error = self._process_turn_api(ctx, turn_idx, turn_data)
-                if api_error:
-                    # API failure - mark current turn and cascade to remaining
-                    api_error_results = self._handle_api_error(ctx, turn_idx, api_error)
-                    results.extend(api_error_results)
-                    return results
-
-            # Evaluate turn-level metrics
-            if turn_metrics:
-                logger.debug("Processing turn %d metrics: %s", turn_idx, turn_metrics)
-                turn_results = self._evaluate_turn(
-                    ctx.conv_data, turn_idx, turn_data, turn_metrics
-                )
-                results.extend(turn_results)
+            with trace_span(
+                SPAN_TURN, turn_id=turn_data.turn_id, turn_idx=turn_idx
+            ) as span:
+                # Handle agent execution if enabled
+                if ctx.agent_driver.enabled:
+                    budget_reason = self._budget_exhausted_reason(ctx.conv_data)
+                    if budget_reason:
+                        # Budget spent - skip this turn onwards without calling
+                        results.extend(
+                            self.components.error_handler.mark_cascade_skipped(
+                                ctx.conv_data,
+                                turn_idx - 1,
+                                ctx.resolved_turn_metrics,
+                                ctx.resolved_conversation_metrics,
+                                budget_reason,
+                            )
+                        )
+                        return results
+                    api_error = self._process_turn_api(ctx, turn_idx, turn_data)
+                    if api_error:
+                        span.set_error(api_error)
+                        # API failure - mark current turn and cascade to remaining
+                        api_error_results = self._handle_api_error(
+                            ctx, turn_idx, api_error
+                        )
+                        results.extend(api_error_results)
+                        return results
+
+                # Evaluate turn-level metrics
+                if turn_metrics:
+                    logger.debug(
+                        "Processing turn %d metrics: %s", turn_idx, turn_metrics
+                    )
+                    turn_results = self._evaluate_turn(
+                        ctx.conv_data, turn_idx, turn_data, turn_metrics
+                    )
+                    results.extend(turn_results)
 
-                # Check for evaluation metric failures and skip remaining if enabled
-                # Note: API/Script failure/error is handled differently
-                if skip_on_failure and self._has_failure(turn_results):
-                    skip_results = self._handle_skip_on_failure(ctx, turn_idx)
-                    results.extend(skip_results)
-                    return results
+                    # Check for evaluation metric failures and skip remaining if enabled
+                    # Note: API/Script failure/error is handled differently
+                    if skip_on_failure and self._has_failure(turn_results):
+                        skip_results = self._handle_skip_on_failure(ctx, turn_idx)
+                        results.extend(skip_results)
+                        return results
 
         # Process conversation-level metrics
         if ctx.resolved_conversation_metrics:
@@ -217,9 +270,30 @@ class ConversationProcessor:
     ) -> Optional[str]:
         """Process agent call for a single turn. Returns error message if failed."""
         logger.debug("Processing turn %d: %s", turn_idx, turn_data.turn_id)
-        api_error_message, ctx.conversation_id = ctx.agent_driver.execute_turn(
-            turn_data, ctx.conversation_id
-        )
+        with (
+            profile_span(STAGE_AGENT_CALL, "agent", turn_id=turn_data.turn_id),
+            trace_span(
+                SPAN_AGENT_CALL, SpanType.AGENT, turn_id=turn_data.turn_id
+            ) as span,
+        ):
+            span.set_io(inputs={"query": turn_data.query})
+            api_error_message, ctx.conversation_id = ctx.agent_driver.execute_turn(
+                turn_data, ctx.conversation_id
+            )
+            span.set_attributes(conversation_id=ctx.conversation_id)
+            span.set_llm(
+                input_tokens=turn_data.api_input_tokens,
+                output_tokens=turn_data.api_output_tokens,
+            )
+            if self.components.budget is not None:
+                self.components.budget.charge_agent(
+                    ctx.conv_data.conversation_group_id,
+                    turn_data.api_input_tokens + turn_data.api_output_tokens,
+                )
+            if api_error_message:
+                span.set_error(api_error_message)
+            else:
+                span.set_io(outputs={"response": turn_data.response})
         logger.debug(
             "Agent call completed for turn %d: %s", turn_idx, turn_data.turn_id
         )
@@ -273,8 +347,50 @@ class ConversationProcessor:
     ) -> list[EvaluationResult]:
         """Evaluate single turn with specified turn metrics."""
         results = []
+        gates = {
+            metric: self.components.metric_manager.get_metric_gates(
+                metric, MetricLevel.TURN, conv_data, turn_data
+            )
+            for metric in turn_metrics
+        }
+        turn_metrics = self.components.metric_manager.order_by_gates(
+            turn_metrics, MetricLevel.TURN, conv_data, turn_data
+        )
+        fused_results = self._evaluate_fused_turn_metrics(
+            conv_data,
+            turn_idx,
+            turn_data,
+            [
+                m
+                for m in turn_metrics
+                if not set(gates[m]).intersection(turn_metrics)
+                and not self._budget_exhausted_reason(conv_data, m)
+            ],
+        )
+        statuses: dict[str, str] = {}
 
         for metric_identifier in turn_metrics:
+            if metric_identifier in fused_results:
+                self._charge_budget(fused_results[metric_identifier])
+                results.append(fused_results[metric_identifier])
+                statuses[metric_identifier] = results[-1].result
+                continue
+            skip_reason = self._gated_out_reason(
+                metric_identifier, gates[metric_identifier], statuses
+            ) or self._budget_exhausted_reason(conv_data, metric_identifier)
+            if skip_reason:
+                results.append(
+                    self.components.error_handler.create_skipped_result(
+                        conv_data.conversation_group_id,
+                        metric_identifier,
+                        skip_reason,
+                        tag=conv_data.tag,
+                        turn_id=turn_data.turn_id,
+                        query=turn_data.query or "",
+                    )
+                )
+                statuses[metric_identifier] = "SKIPPED"
+                continue
             if turn_data.is_metric_invalid(metric_identifier):
                 error_reason = f"Invalid turn metric '{metric_identifier}', check Validation Errors"
                 logger.error(error_reason)
@@ -288,6 +404,7 @@ class ConversationProcessor:
                         query=turn_data.query or "",
                     )
                 )
+                statuses[metric_identifier] = "ERROR"
                 continue
 
             request = EvaluationRequest.for_turn(
@@ -313,16 +430,71 @@ class ConversationProcessor:
                     query=turn_data.query or "",
                 )
             if result:
+                self._charge_budget(result)
                 results.append(result)
+                statuses[metric_identifier] = result.result
         return results
 
+    def _evaluate_fused_turn_metrics(
+        self,
+        conv_data: EvaluationData,
+        turn_idx: int,
+        turn_data: TurnData,
+        turn_metrics: list[str],
+    ) -> dict[str, EvaluationResult]:
+        """Score fusable custom metrics with one judge call when enabled.
+
+        Any failure falls back to evaluating every metric on its own.
+        """
+        if self.config is None or not self.config.core.fuse_custom_metrics:
+            return {}
+        try:
+            return self.components.metrics_evaluator.evaluate_fused_turn_metrics(
+                conv_data,
+                turn_idx,
+                turn_data,
+                [m for m in turn_metrics if not turn_data.is_metric_invalid(m)],
+            )
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.warning(
+                "Fused custom metric evaluation failed for conversation %s turn %d, "
+                "using per-metric calls: %s",
+                conv_data.conversation_group_id,
+                turn_idx,
+                e,
+            )
+            return {}
+
     def _evaluate_conversation(
         self, conv_data: EvaluationData, conversation_metrics: list[str]
     ) -> list[EvaluationResult]:
         """Evaluate conversation-level metrics."""
         results = []
+        metric_manager = self.components.metric_manager
+        conversation_metrics = metric_manager.order_by_gates(
+            conversation_metrics, MetricLevel.CONVERSATION, conv_data
+        )
+        statuses: dict[str, str] = {}
 
         for metric_identifier in conversation_metrics:
+            skip_reason = self._gated_out_reason(
+                metric_identifier,
+                metric_manager.get_metric_gates(
+                    metric_identifier, MetricLevel.CONVERSATION, conv_data
+                ),
+                statuses,
+            ) or self._budget_exhausted_reason(conv_data, metric_identifier)
+            if skip_reason:
+                results.append(
+                    self.components.error_handler.create_skipped_result(
+                        conv_data.conversation_group_id,
+                        metric_identifier,
+                        skip_reason,
+                        tag=conv_data.tag,
+                    )
+                )
+                statuses[metric_identifier] = "SKIPPED"
+                continue
             if conv_data.is_metric_invalid(metric_identifier):
                 error_reason = (
                     f"Invalid metric '{metric_identifier}', check Validation Errors"
@@ -336,6 +508,7 @@ class ConversationProcessor:
                         tag=conv_data.tag,
                     )
                 )
+                statuses[metric_identifier] = "ERROR"
                 continue
 
             request = EvaluationRequest.for_conversation(conv_data, metric_identifier)
@@ -356,9 +529,50 @@ class ConversationProcessor:
                     tag=conv_data.tag,
                 )
             if result:
+                self._charge_budget(result)
                 results.append(result)
+                statuses[metric_identifier] = result.result
         return results
 
+    def _budget_exhausted_reason(
+        self, conv_data: EvaluationData, metric_identifier: Optional[str] = None
+    ) -> Optional[str]:
+        """Return why a budget blocks the next agent or judge call, if it does.
+
+        Metrics of frameworks that make no LLM calls are never blocked.
+        """
+        if self.components.budget is None:
+            return None
+        if (
+            metric_identifier is not None
+            and metric_identifier.split(":", 1)[0] in NON_LLM_FRAMEWORKS
+        ):
+            return None
+        return self.components.budget.exhausted_reason(
+            conv_data.conversation_group_id, metric_identifier
+        )
+
+    def _charge_budget(self, result: EvaluationResult) -> None:
+        """Charge an evaluation result's token usage to the budgets."""
+        if self.components.budget is not None:
+            self.components.budget.charge_result(result)
+
+    @staticmethod
+    def _gated_out_reason(
+        metric_identifier: str, gates: list[str], statuses: dict[str, str]
+    ) -> Optional[str]:
+        """Return why a metric is gated out, or None if it should run.
+
+        A gate only applies when it was evaluated earlier at the same level;
+        any status other than PASS closes it.
+        """
+        for gate in gates:
+            status = statuses.get(gate)
+            if status is not None and status != "PASS":
+                logger.debug("%s gated out by %s (%s)", metric_identifier, gate, status)
+                return f"Gated out: {gate} did not pass ({status})"
+        return None
+
     def _run_setup_script(
         self, conv_data: EvaluationData, skip_setup: bool = False
     ) -> Optional[str]:
@@ -373,7 +587,8 @@ class ConversationProcessor:
 
         try:
             logger.debug("Running setup script: %s", setup_script)
-            success = self.components.script_manager.run_script(setup_script)
+            with profile_span(STAGE_SETUP_SCRIPT, "script", script=setup_script):
+                success = self.components.script_manager.run_script(setup_script)
             if not success:
                 error_msg = f"Setup script returned non-zero exit code: {setup_script}"
                 logger.error(error_msg)
@@ -401,7 +616,8 @@ class ConversationProcessor:
 
         logger.debug("Running cleanup script: %s", cleanup_script)
         try:
-            success = self.components.script_manager.run_script(cleanup_script)
+            with profile_span(STAGE_CLEANUP_SCRIPT, "script", script=cleanup_script):
+                success = self.components.script_manager.run_script(cleanup_script)
             if success:
                 logger.debug(
                     "Cleanup script completed successfully: %s", cleanup_script
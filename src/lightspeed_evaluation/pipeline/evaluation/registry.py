@@ -2,15 +2,27 @@
 
 from __future__ import annotations
 
+import json
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
 from typing import Any, Optional
 
+from lightspeed_evaluation.core.api import APIConnectionPool
+from lightspeed_evaluation.core.constants import DEFAULT_AGENT_DRIVER_POOL_SIZE
 from lightspeed_evaluation.core.system.exceptions import ConfigurationError
 from lightspeed_evaluation.pipeline.evaluation.driver import (
     AgentDriver,
+    AsyncHttpApiDriver,
     HttpApiDriver,
     ProposalDriver,
 )
 
+logger = logging.getLogger(__name__)
+
 AGENT_DRIVERS: dict[str, type[AgentDriver]] = {
     "http_api": HttpApiDriver,
     "proposal": ProposalDriver,
@@ -20,9 +32,20 @@ AGENT_DRIVERS: dict[str, type[AgentDriver]] = {
 class AgentDriverRegistry:  # pylint: disable=too-few-public-methods
     """Registry for creating agent drivers."""
 
-    def __init__(self, drivers: Optional[dict[str, type[AgentDriver]]] = None) -> None:
-        """Initialize the driver registry."""
+    def __init__(
+        self,
+        drivers: Optional[dict[str, type[AgentDriver]]] = None,
+        connection_pool: Optional[APIConnectionPool] = None,
+    ) -> None:
+        """Initialize the driver registry.
+
+        Args:
+            drivers: Driver classes by agent type; defaults to AGENT_DRIVERS.
+            connection_pool: Shared HTTP connections and caches passed to the
+                drivers created by the registry.
+        """
         self._drivers = AGENT_DRIVERS if drivers is None else drivers
+        self._connection_pool = connection_pool
 
     def create_driver(
         self, agent_config: dict[str, Any], *, enabled: bool = True
@@ -38,4 +61,124 @@ class AgentDriverRegistry:  # pylint: disable=too-few-public-methods
                 f"Unsupported agent type '{agent_type}'. "
                 f"Supported types: {sorted(self._drivers)}"
             )
+        if driver_cls is HttpApiDriver and agent_config.get("async_client"):
+            driver_cls = AsyncHttpApiDriver
+        if self._connection_pool is not None:
+            return driver_cls(
+                agent_config, enabled=enabled, connection_pool=self._connection_pool
+            )
         return driver_cls(agent_config, enabled=enabled)
+
+
+@dataclass
+class _PooledDriver:
+    """A pooled driver and the number of conversations using it."""
+
+    driver: AgentDriver
+    users: int = 0
+    evicted: bool = False
+
+
+class AgentDriverPool:
+    """Bounded LRU pool of drivers for per-conversation agent overrides.
+
+    Conversations resolving to the same agent configuration (endpoint, auth,
+    cache settings, ...) share one driver instead of each creating and closing
+    its own. When the pool is full the least recently used idle driver is
+    closed; a driver evicted while in use is closed once released.
+    """
+
+    def __init__(
+        self,
+        registry: AgentDriverRegistry,
+        max_size: int = DEFAULT_AGENT_DRIVER_POOL_SIZE,
+    ) -> None:
+        """Initialize an empty pool.
+
+        Args:
+            registry: Registry creating the pooled drivers.
+            max_size: Maximum number of drivers kept open.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self._registry = registry
+        self._max_size = max_size
+        self._entries: OrderedDict[str, _PooledDriver] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of open pooled drivers."""
+        with self._lock:
+            return len(self._entries)
+
+    @staticmethod
+    def _key(agent_config: dict[str, Any], enabled: bool) -> str:
+        return json.dumps(
+            {"enabled": enabled, "config": agent_config}, sort_keys=True, default=str
+        )
+
+    @contextmanager
+    def driver(
+        self, agent_config: dict[str, Any], *, enabled: bool = True
+    ) -> Iterator[AgentDriver]:
+        """Borrow the pooled driver of an agent configuration.
+
+        Args:
+            agent_config: Resolved agent configuration.
+            enabled: Whether the driver should execute.
+
+        Yields:
+            The driver shared by every conversation with this configuration.
+        """
+        key = self._key(agent_config, enabled)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = _PooledDriver(
+                    self._registry.create_driver(agent_config, enabled=enabled)
+                )
+                self._entries[key] = entry
+            self._entries.move_to_end(key)
+            entry.users += 1
+            idle = self._evict()
+        self._close_all(idle)
+        try:
+            yield entry.driver
+        finally:
+            with self._lock:
+                entry.users -= 1
+                release = entry.evicted and entry.users == 0
+            if release:
+                self._close_all([entry.driver])
+
+    def _evict(self) -> list[AgentDriver]:
+        """Drop least recently used drivers beyond the size limit.
+
+        Must be called with the lock held. Returns the idle drivers to close;
+        drivers still in use are closed by their last user.
+        """
+        idle: list[AgentDriver] = []
+        while len(self._entries) > self._max_size:
+            _key, entry = self._entries.popitem(last=False)
+            entry.evicted = True
+            if entry.users == 0:
+                idle.append(entry.driver)
+        return idle
+
+    def close(self) -> None:
+        """Close all pooled drivers."""
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+            for entry in entries:
+                entry.evicted = True
+            idle = [entry.driver for entry in entries if entry.users == 0]
+        self._close_all(idle)
+
+    @staticmethod
+    def _close_all(drivers: list[AgentDriver]) -> None:
+        for driver in drivers:
+            try:
+                driver.close()
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.warning("Failed to close agent driver: %s", e)
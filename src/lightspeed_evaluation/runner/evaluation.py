@@ -6,22 +6,52 @@ import os
 import shutil
 import sys
 import traceback
+from contextlib import ExitStack
 from pathlib import Path
 from typing import Optional
 
+from lightspeed_evaluation.core.constants import SUPPORTED_PROFILE_EXTRAS
+from lightspeed_evaluation.core.metrics.manager import MetricManager
 from lightspeed_evaluation.core.models import (
     LLMPoolConfig,
+    SampledPassRates,
+    SamplingPlan,
+    SequentialTestConfig,
     SystemConfig,
 )
 
 # Import only lightweight modules at top level
 from lightspeed_evaluation.core.storage import get_file_config
 from lightspeed_evaluation.core.system import ConfigLoader
+from lightspeed_evaluation.core.system.cassette import (
+    cassette_run,
+    default_cassette_path,
+)
 from lightspeed_evaluation.core.system.exceptions import (
+    BatchJudgeError,
+    CassetteMissError,
     ConfigurationError,
     DataValidationError,
     StorageError,
 )
+from lightspeed_evaluation.core.system.profiler import (
+    STAGE_CONFIG_LOAD,
+    STAGE_DATA_VALIDATION,
+    Profiler,
+    format_timing_table,
+    profile_span,
+    profiled_run,
+)
+from lightspeed_evaluation.core.system.sampling import (
+    parse_sample_spec,
+    sample_conversations,
+    write_sampling_report,
+)
+from lightspeed_evaluation.core.system.sequential import (
+    load_sequential_report,
+    parse_baseline,
+)
+from lightspeed_evaluation.core.system.tracer import traced_run
 
 logger = logging.getLogger(__name__)
 
@@ -149,7 +179,187 @@ def _copy_flat_output(run_results: list, output_dir: str) -> None:
         logger.warning("Failed to copy flat output from %s to %s", nested, output_dir)
 
 
-def run_evaluation(  # pylint: disable=too-many-locals
+def _apply_profile_args(
+    system_config: SystemConfig, profile_extras: Optional[list[str]]
+) -> None:
+    """Enable profiling in the system config from the ``--profile`` flag.
+
+    Args:
+        system_config: Loaded system configuration (updated in place).
+        profile_extras: Values passed to ``--profile`` (None when absent).
+    """
+    if profile_extras is None:
+        return
+    system_config.profiling = system_config.profiling.model_copy(
+        update={
+            "enabled": True,
+            "cprofile": system_config.profiling.cprofile
+            or "cprofile" in profile_extras,
+            "tracemalloc": system_config.profiling.tracemalloc
+            or "tracemalloc" in profile_extras,
+        }
+    )
+
+
+def _apply_sequential_args(
+    system_config: SystemConfig,
+    baseline: Optional[float],
+    max_drop: Optional[float],
+) -> None:
+    """Enable the sequential test in the system config from ``--sequential``.
+
+    Args:
+        system_config: Loaded system configuration (updated in place).
+        baseline: Baseline pass rate passed to ``--sequential`` (None when absent).
+        max_drop: Value of ``--max-drop`` (None keeps the configured drop).
+    """
+    if baseline is None:
+        return
+    update: dict[str, object] = {"enabled": True, "baseline_pass_rate": baseline}
+    if max_drop is not None:
+        update["max_drop"] = max_drop
+    system_config.sequential_test = SequentialTestConfig.model_validate(
+        {**system_config.sequential_test.model_dump(), **update}
+    )
+
+
+def _report_sequential(output_dirs: list[str]) -> None:
+    """Print the sequential test decision recorded in each run output dir."""
+    for output_dir in output_dirs:
+        result = load_sequential_report(output_dir)
+        if result is None:
+            continue
+        print(
+            f"🧪 Sequential test: {result.decision.replace('_', ' ')} after "
+            f"{result.conversations_consumed} of {result.conversations_total} "
+            f"conversations ({result.results_consumed} results, observed pass "
+            f"rate {result.observed_pass_rate:.1f}% vs baseline "
+            f"{result.baseline_pass_rate:.1f}%; alpha={result.alpha}, "
+            f"beta={result.beta})"
+        )
+
+
+def _cassette_paths(
+    eval_args: argparse.Namespace, system_config: SystemConfig
+) -> tuple[Optional[str], Optional[str]]:
+    """Resolve the ``--record`` / ``--replay`` cassette paths.
+
+    A bare ``--record`` writes a timestamped cassette to the output directory.
+    """
+    record = getattr(eval_args, "record", None)
+    if record == "":
+        record = default_cassette_path(
+            eval_args.output_dir or get_file_config(system_config.storage).output_dir
+        )
+    return record, getattr(eval_args, "replay", None)
+
+
+def _print_profile(profiler: Profiler) -> None:
+    """Print the per-stage timing breakdown of a profiled run."""
+    timings = profiler.timing_breakdown()
+    if not timings:
+        return
+    print("\n⏱️ Timing breakdown (span totals; concurrent stages overlap):")
+    print(format_timing_table(timings), end="")
+
+
+def _sample_evaluation_data(
+    eval_args: argparse.Namespace,
+    system_config: SystemConfig,
+    evaluation_data: list,
+) -> tuple[list, Optional[SamplingPlan]]:
+    """Draw the ``--sample`` subset of the evaluation data, if requested."""
+    sample = getattr(eval_args, "sample", None)
+    if sample is None:
+        return evaluation_data, None
+    sampled, plan = sample_conversations(
+        evaluation_data,
+        sample,
+        seed=getattr(eval_args, "sample_seed", 0),
+        metric_manager=MetricManager(system_config),
+    )
+    print(
+        f"🎲 Sampled {plan.sampled} of {plan.population} conversations "
+        f"from {len(plan.strata)} strata (seed {plan.seed})"
+    )
+    return sampled, plan
+
+
+def _report_sample(
+    plan: SamplingPlan, results: Optional[list], output_dir: str
+) -> None:
+    """Write the sampling report and print the extrapolated pass rate.
+
+    Agent runs do not hand their raw results back, so only the plan is
+    recorded for them.
+    """
+    # pylint: disable=import-outside-toplevel
+    from lightspeed_evaluation.core.output.statistics import (
+        estimate_sampled_pass_rates,
+    )
+
+    report = (
+        estimate_sampled_pass_rates(results, plan)
+        if results is not None
+        else SampledPassRates(plan=plan)
+    )
+    path = write_sampling_report(report, output_dir)
+    if report.overall is not None:
+        ci = report.overall.confidence_interval
+        print(
+            f"🎲 Estimated full-suite pass rate: {report.overall.pass_rate:.1f}% "
+            f"({ci.confidence_level:.0f}% CI {ci.low:.1f}%-{ci.high:.1f}%)"
+        )
+    print(f"🎲 Sampling plan recorded in: {path}")
+
+
+def _plan_evaluation(
+    eval_args: argparse.Namespace, system_config: SystemConfig
+) -> dict[str, int]:
+    """Print and record the ``--plan`` estimate of a run without running it.
+
+    Args:
+        eval_args: Parsed command line arguments
+        system_config: Loaded system configuration
+
+    Returns:
+        dict: All-zero summary statistics, as nothing is evaluated.
+    """
+    # pylint: disable=import-outside-toplevel
+    from lightspeed_evaluation.core.system import DataValidator
+    from lightspeed_evaluation.core.system.planner import (
+        format_run_plan,
+        plan_run,
+        write_run_plan,
+    )
+
+    # pylint: enable=import-outside-toplevel
+    data_validator = DataValidator(
+        api_enabled=system_config.agents is not None and system_config.agents.enabled,
+        fail_on_invalid_data=system_config.core.fail_on_invalid_data,
+        system_config=system_config,
+    )
+    evaluation_data = data_validator.load_evaluation_data(
+        eval_args.eval_data,
+        tags=eval_args.tags,
+        conv_ids=eval_args.conv_ids,
+        metrics=eval_args.metrics,
+    )
+    evaluation_data, _sampling_plan = _sample_evaluation_data(
+        eval_args, system_config, evaluation_data
+    )
+    output_dir = (
+        eval_args.output_dir or get_file_config(system_config.storage).output_dir
+    )
+    plan = plan_run(evaluation_data, system_config, output_dir)
+
+    print("\n🧮 Run plan (dry run, nothing was called):")
+    print(format_run_plan(plan), end="")
+    print(f"🧮 Run plan recorded in: {write_run_plan(plan, output_dir)}")
+    return {"TOTAL": 0, "PASS": 0, "FAIL": 0, "ERROR": 0, "SKIPPED": 0}
+
+
+def run_evaluation(  # pylint: disable=too-many-locals,too-many-statements
     eval_args: argparse.Namespace,
 ) -> Optional[dict[str, int]]:
     """Run the complete evaluation pipeline.
@@ -163,133 +373,196 @@ def run_evaluation(  # pylint: disable=too-many-locals
     print("🚀 Lightspeed Evaluation Framework")
     print("=" * 50)
 
+    # Created up front so configuration loading is timed; only kept when
+    # profiling turns out to be enabled.
+    profiler = Profiler()
+
     try:
         print("🔧 Loading Configuration & Setting up environment...")
         loader = ConfigLoader()
-        system_config = loader.load_system_config(eval_args.system_config)
-
-        # Clear caches if cache warmup mode is enabled
-        if eval_args.cache_warmup:
-            print("\n🔥 Cache warmup mode: Clearing existing caches...")
-            _clear_caches(system_config)
-
-        # Import heavy modules after environment is configured
-        print("\n📋 Loading Heavy Modules...")
-        # pylint: disable=import-outside-toplevel
-        from lightspeed_evaluation.api import evaluate
-        from lightspeed_evaluation.core.output import OutputHandler
-        from lightspeed_evaluation.core.output.statistics import compute_overall_stats
-        from lightspeed_evaluation.core.storage import FileBackendConfig
-        from lightspeed_evaluation.core.system import DataValidator
-        from lightspeed_evaluation.pipeline.behavioral.orchestrator import (
-            run as orchestrator_run,
+        with profiler.span(STAGE_CONFIG_LOAD, "setup"):
+            system_config = loader.load_system_config(eval_args.system_config)
+        _apply_profile_args(system_config, getattr(eval_args, "profile", None))
+        _apply_sequential_args(
+            system_config,
+            getattr(eval_args, "sequential", None),
+            getattr(eval_args, "max_drop", None),
         )
+        if getattr(eval_args, "trace", False):
+            system_config.tracing = system_config.tracing.model_copy(
+                update={"enabled": True}
+            )
+        if getattr(eval_args, "batch_judge", False):
+            system_config.batch_judge = system_config.batch_judge.model_copy(
+                update={"enabled": True}
+            )
+        if getattr(eval_args, "plan", False):
+            return _plan_evaluation(eval_args, system_config)
+
+        with ExitStack() as stack:
+            if system_config.profiling.enabled or system_config.tracing.enabled:
+                output_dir = (
+                    eval_args.output_dir
+                    or get_file_config(system_config.storage).output_dir
+                )
+                if system_config.profiling.enabled:
+                    stack.enter_context(
+                        profiled_run(
+                            system_config.profiling, output_dir, profiler=profiler
+                        )
+                    )
+                    stack.callback(_print_profile, profiler)
+                stack.enter_context(traced_run(system_config.tracing, output_dir))
+            record, replay = _cassette_paths(eval_args, system_config)
+            stack.enter_context(cassette_run(record=record, replay=replay))
+            return _run_loaded_evaluation(eval_args, system_config)
+
+    except (
+        FileNotFoundError,
+        ValueError,
+        RuntimeError,
+        BatchJudgeError,
+        CassetteMissError,
+        ConfigurationError,
+        DataValidationError,
+        StorageError,
+    ) as e:
+        print(f"\n❌ Evaluation failed: {e}")
+        traceback.print_exc()
+        return None
 
-        # pylint: enable=import-outside-toplevel
-        print("✅ Configuration loaded & Setup is done !")
 
-        # Load, filter, and validate evaluation data
-        data_validator = DataValidator(
-            api_enabled=system_config.agents is not None
-            and system_config.agents.enabled,
-            fail_on_invalid_data=system_config.core.fail_on_invalid_data,
-            system_config=system_config,
-        )
+def _run_loaded_evaluation(  # pylint: disable=too-many-locals
+    eval_args: argparse.Namespace, system_config: SystemConfig
+) -> dict[str, int]:
+    """Validate data and run the evaluation once configuration is loaded.
+
+    Args:
+        eval_args: Parsed command line arguments
+        system_config: Loaded system configuration
+
+    Returns:
+        dict: Summary statistics with keys TOTAL, PASS, FAIL, ERROR, SKIPPED.
+    """
+    # Clear caches if cache warmup mode is enabled
+    if eval_args.cache_warmup:
+        print("\n🔥 Cache warmup mode: Clearing existing caches...")
+        _clear_caches(system_config)
+
+    # Import heavy modules after environment is configured
+    print("\n📋 Loading Heavy Modules...")
+    # pylint: disable=import-outside-toplevel
+    from lightspeed_evaluation.api import evaluate
+    from lightspeed_evaluation.core.output import OutputHandler
+    from lightspeed_evaluation.core.output.statistics import compute_overall_stats
+    from lightspeed_evaluation.core.storage import FileBackendConfig
+    from lightspeed_evaluation.core.system import DataValidator
+    from lightspeed_evaluation.pipeline.behavioral.orchestrator import (
+        run as orchestrator_run,
+    )
+
+    # pylint: enable=import-outside-toplevel
+    print("✅ Configuration loaded & Setup is done !")
+
+    # Load, filter, and validate evaluation data
+    data_validator = DataValidator(
+        api_enabled=system_config.agents is not None and system_config.agents.enabled,
+        fail_on_invalid_data=system_config.core.fail_on_invalid_data,
+        system_config=system_config,
+    )
+    with profile_span(STAGE_DATA_VALIDATION, "setup"):
         evaluation_data = data_validator.load_evaluation_data(
             eval_args.eval_data,
             tags=eval_args.tags,
             conv_ids=eval_args.conv_ids,
             metrics=eval_args.metrics,
         )
-        dataset_metadata = data_validator.dataset_metadata
+    dataset_metadata = data_validator.dataset_metadata
 
-        print(
-            f"✅ System config: {system_config.llm.provider}/{system_config.llm.model}"
-        )
+    print(f"✅ System config: {system_config.llm.provider}/{system_config.llm.model}")
 
-        # Handle case where no conversations match the filter
-        if len(evaluation_data) == 0:
-            print("\n⚠️ No conversation groups matched the filter criteria")
-            print("   Nothing to evaluate - returning empty results")
-            return {"TOTAL": 0, "PASS": 0, "FAIL": 0, "ERROR": 0, "SKIPPED": 0}
-
-        # Run evaluation
-        print("\n🔄 Running Evaluation...")
-        has_agents = (
-            system_config.agents is not None
-            and system_config.agents.enabled
-            and system_config.agents.default.agent
-        )
+    # Handle case where no conversations match the filter
+    if len(evaluation_data) == 0:
+        print("\n⚠️ No conversation groups matched the filter criteria")
+        print("   Nothing to evaluate - returning empty results")
+        return {"TOTAL": 0, "PASS": 0, "FAIL": 0, "ERROR": 0, "SKIPPED": 0}
 
-        if not has_agents:
-            # Offline mode: run pipeline directly (no agents to orchestrate)
-            results = evaluate(
-                system_config,
-                evaluation_data,
-                output_dir=eval_args.output_dir,
-                original_data_path=eval_args.eval_data,
-                dataset_metadata=dataset_metadata,
-            )
-            file_entries = [
-                c for c in system_config.storage if isinstance(c, FileBackendConfig)
-            ]
-            if not file_entries:
-                file_config = get_file_config(system_config.storage)
-                handler = OutputHandler(
-                    output_dir=eval_args.output_dir or file_config.output_dir,
-                    base_filename=file_config.base_filename,
-                    system_config=system_config,
-                    file_config=file_config,
-                )
-                handler.generate_reports(results, evaluation_data)
-            summary = compute_overall_stats(results)
-            out_dir = (
-                eval_args.output_dir
-                or get_file_config(system_config.storage).output_dir
-            )
-            totals: dict[str, int] = {
-                "TOTAL": summary.total,
-                "PASS": summary.passed,
-                "FAIL": summary.failed,
-                "ERROR": summary.error,
-                "SKIPPED": summary.skipped,
-            }
-            print("\n🎉 Evaluation Complete!")
-            _print_run_summary(totals, output_dir=out_dir)
-            return totals
-
-        # Agent mode: run via orchestrator
-        output_dir = (
-            eval_args.output_dir or get_file_config(system_config.storage).output_dir
-        )
-        run_results = orchestrator_run(
+    evaluation_data, sampling_plan = _sample_evaluation_data(
+        eval_args, system_config, evaluation_data
+    )
+
+    # Run evaluation
+    print("\n🔄 Running Evaluation...")
+    has_agents = (
+        system_config.agents is not None
+        and system_config.agents.enabled
+        and system_config.agents.default.agent
+    )
+
+    if not has_agents:
+        # Offline mode: run pipeline directly (no agents to orchestrate)
+        results = evaluate(
             system_config,
             evaluation_data,
-            output_dir,
+            output_dir=eval_args.output_dir,
             original_data_path=eval_args.eval_data,
-            dataset_metadata_dict=(
-                dataset_metadata.model_dump() if dataset_metadata else None
-            ),
+            dataset_metadata=dataset_metadata,
         )
-        totals = _aggregate_totals(run_results)
-        _copy_flat_output(run_results, output_dir)
-
+        file_entries = [
+            c for c in system_config.storage if isinstance(c, FileBackendConfig)
+        ]
+        if not file_entries:
+            file_config = get_file_config(system_config.storage)
+            handler = OutputHandler(
+                output_dir=eval_args.output_dir or file_config.output_dir,
+                base_filename=file_config.base_filename,
+                system_config=system_config,
+                file_config=file_config,
+            )
+            handler.generate_reports(results, evaluation_data)
+        summary = compute_overall_stats(results)
+        out_dir = (
+            eval_args.output_dir or get_file_config(system_config.storage).output_dir
+        )
+        totals: dict[str, int] = {
+            "TOTAL": summary.total,
+            "PASS": summary.passed,
+            "FAIL": summary.failed,
+            "ERROR": summary.error,
+            "SKIPPED": summary.skipped,
+        }
         print("\n🎉 Evaluation Complete!")
-        _print_run_summary(totals, run_results=run_results)
-
+        _print_run_summary(totals, output_dir=out_dir)
+        if sampling_plan is not None:
+            _report_sample(sampling_plan, results, out_dir)
+        if system_config.sequential_test.enabled:
+            _report_sequential([out_dir])
         return totals
 
-    except (
-        FileNotFoundError,
-        ValueError,
-        RuntimeError,
-        ConfigurationError,
-        DataValidationError,
-        StorageError,
-    ) as e:
-        print(f"\n❌ Evaluation failed: {e}")
-        traceback.print_exc()
-        return None
+    # Agent mode: run via orchestrator
+    output_dir = (
+        eval_args.output_dir or get_file_config(system_config.storage).output_dir
+    )
+    run_results = orchestrator_run(
+        system_config,
+        evaluation_data,
+        output_dir,
+        original_data_path=eval_args.eval_data,
+        dataset_metadata_dict=(
+            dataset_metadata.model_dump() if dataset_metadata else None
+        ),
+    )
+    totals = _aggregate_totals(run_results)
+    _copy_flat_output(run_results, output_dir)
+
+    print("\n🎉 Evaluation Complete!")
+    _print_run_summary(totals, run_results=run_results)
+    if sampling_plan is not None:
+        _report_sample(sampling_plan, None, output_dir)
+    if system_config.sequential_test.enabled:
+        _report_sequential([rr.output_dir for rr in run_results if rr.output_dir])
+
+    return totals
 
 
 def create_eval_parser() -> argparse.ArgumentParser:
@@ -331,6 +604,99 @@ def create_eval_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Enable cache warmup mode - rebuild caches without reading existing entries",
     )
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        help=(
+            "Write the run's own conversation/turn/agent/metric/judge spans "
+            "as an OTLP-JSON trace file to the output directory"
+        ),
+    )
+    parser.add_argument(
+        "--batch-judge",
+        action="store_true",
+        help=(
+            "Send judge LLM calls through the provider batch API (cheaper, "
+            "higher limits, results within the batch completion window); "
+            "an interrupted run resumes waiting for its batches"
+        ),
+    )
+    cassette = parser.add_mutually_exclusive_group()
+    cassette.add_argument(
+        "--record",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="CASSETTE",
+        help=(
+            "Record every agent and LLM/embedding call into a cassette archive "
+            "(default: cassette_<timestamp>.zip in the output directory)"
+        ),
+    )
+    cassette.add_argument(
+        "--replay",
+        default=None,
+        metavar="CASSETTE",
+        help="Replay a recorded cassette offline instead of calling the agent/LLMs",
+    )
+    parser.add_argument(
+        "--sample",
+        type=parse_sample_spec,
+        default=None,
+        metavar="SIZE|FRACTION",
+        help=(
+            "Evaluate a stratified random sample of the conversations (by tags "
+            "and metric mix): a count (40), fraction (0.05) or percentage (5%%). "
+            "Pass rates extrapolated to the full suite are written to "
+            "sampling_report.json"
+        ),
+    )
+    parser.add_argument(
+        "--sample-seed",
+        type=int,
+        default=0,
+        help="Random seed of --sample (default: 0)",
+    )
+    parser.add_argument(
+        "--sequential",
+        type=parse_baseline,
+        default=None,
+        metavar="BASELINE",
+        help=(
+            "Release gating: evaluate conversations in random order and stop as "
+            "soon as a sequential test decides whether the pass rate dropped "
+            "below BASELINE, a pass rate in percent or a previous *_summary.json"
+        ),
+    )
+    parser.add_argument(
+        "--max-drop",
+        type=float,
+        default=None,
+        help=(
+            "Pass-rate drop (percentage points) that --sequential treats as a "
+            "regression (default: sequential_test.max_drop, 5)"
+        ),
+    )
+    parser.add_argument(
+        "--plan",
+        action="store_true",
+        help=(
+            "Dry run: estimate the agent and judge calls, tokens, cost and "
+            "duration of the run without calling anything"
+        ),
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="*",
+        choices=SUPPORTED_PROFILE_EXTRAS,
+        default=None,
+        metavar="EXTRA",
+        help=(
+            "Record a per-stage timing breakdown and Chrome trace; optionally "
+            f"also capture {' / '.join(SUPPORTED_PROFILE_EXTRAS)} "
+            "(e.g. --profile cprofile)"
+        ),
+    )
     return parser
 
 
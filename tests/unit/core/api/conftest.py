@@ -65,6 +65,13 @@ def basic_api_config_responses_endpoint() -> APIConfig:
 
 @pytest.fixture
 def mock_response(mocker: MockerFixture) -> Any:
-    """Create a mock streaming response."""
+    """Create a mock streaming response.
+
+    Tests set the SSE lines as ``iter_lines.return_value``; the parsers read
+    them as the body bytes of ``iter_bytes``.
+    """
     response = mocker.Mock()
+    response.iter_bytes.side_effect = lambda: (
+        f"{line}\n".encode() for line in response.iter_lines.return_value
+    )
     return response
@@ -10,9 +10,15 @@ import pytest
 from pydantic import ValidationError
 from pytest_mock import MockerFixture
 
-from lightspeed_evaluation.core.api.client import APIClient, _is_retryable_server_error
+from lightspeed_evaluation.core.api.client import (
+    APIClient,
+    APIConnectionPool,
+    PoolWaitTransport,
+    _is_retryable_server_error,
+)
 from lightspeed_evaluation.core.models import APIConfig, APIResponse
 from lightspeed_evaluation.core.system.exceptions import APIError
+from lightspeed_evaluation.core.system.profiler import Profiler, profiling_session
 
 
 class TestAPIClient:
@@ -436,6 +442,100 @@ class TestAPIClientConfiguration:
 
         mock_http_client.close.assert_called_once()
 
+    def test_pooled_clients_share_transport_and_cache(
+        self,
+        basic_api_config_streaming_endpoint: APIConfig,
+        tmp_path: Path,
+    ) -> None:
+        """Test clients from one pool share connections and the disk cache."""
+        config = basic_api_config_streaming_endpoint.model_copy(
+            update={"cache_enabled": True, "cache_dir": str(tmp_path / "cache")}
+        )
+        pool = APIConnectionPool()
+
+        first = APIClient(config, connection_pool=pool)
+        second = APIClient(config, connection_pool=pool)
+        other = APIClient(
+            config.model_copy(update={"max_connections": 5}), connection_pool=pool
+        )
+
+        assert first.cache is second.cache
+        assert first.client is not None and second.client is not None
+        assert other.client is not None
+        assert first.client._transport is second.client._transport
+        assert first.client._transport is pool.transport(config)
+        assert other.client._transport is not first.client._transport
+
+        first.close()
+        assert not first.client.is_closed
+        pool.close()
+
+    def test_connection_settings(
+        self, basic_api_config_streaming_endpoint: APIConfig
+    ) -> None:
+        """Test timeouts and connection limits are applied to the HTTP client."""
+        config = basic_api_config_streaming_endpoint.model_copy(
+            update={
+                "timeout": 60,
+                "connect_timeout": 2.5,
+                "max_connections": 7,
+                "max_keepalive_connections": 3,
+                "keepalive_expiry": 30.0,
+            }
+        )
+
+        client = APIClient(config)
+
+        assert client.client is not None
+        timeout = client.client.timeout
+        assert (timeout.connect, timeout.read, timeout.pool) == (2.5, 60, 60)
+        transport = client.client._transport
+        assert isinstance(transport, PoolWaitTransport)
+        connection_pool = transport._transport._pool  # type: ignore[attr-defined]
+        assert connection_pool._max_connections == 7
+        assert connection_pool._max_keepalive_connections == 3
+        assert connection_pool._keepalive_expiry == 30.0
+        client.close()
+
+    def test_http2_requires_h2(
+        self, basic_api_config_streaming_endpoint: APIConfig, mocker: MockerFixture
+    ) -> None:
+        """Test HTTP/2 without the 'h2' package fails with an install hint."""
+        mocker.patch(
+            "lightspeed_evaluation.core.api.client.importlib.util.find_spec",
+            return_value=None,
+        )
+        config = basic_api_config_streaming_endpoint.model_copy(update={"http2": True})
+
+        with pytest.raises(APIError, match=r"httpx\[http2\]"):
+            APIClient(config)
+
+    def test_pool_wait_recorded_while_profiling(self) -> None:
+        """Test the wait for a connection is recorded as a profiler stage."""
+        events = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            request.extensions["trace"]("connection.connect_tcp.started", {})
+            request.extensions["trace"]("http11.send_request_headers.started", {})
+            return httpx.Response(200)
+
+        transport = PoolWaitTransport(httpx.MockTransport(handler))
+        request = httpx.Request(
+            "GET",
+            "http://localhost/",
+            extensions={"trace": lambda name, _info: events.append(name)},
+        )
+
+        profiler = Profiler()
+        with profiling_session(profiler):
+            transport.handle_request(request)
+
+        assert [span.name for span in profiler.spans] == ["agent_pool_wait"]
+        assert events == [
+            "connection.connect_tcp.started",
+            "http11.send_request_headers.started",
+        ]
+
     def test_get_cache_key_generates_consistent_hash(
         self,
         basic_api_config_streaming_endpoint: APIConfig,
@@ -0,0 +1,197 @@
+# pylint: disable=protected-access
+
+"""Unit tests for the async API client."""
+
+import json
+from collections.abc import Callable
+from pathlib import Path
+
+import httpx
+import pytest
+from pytest_mock import MockerFixture
+
+from lightspeed_evaluation.core.api.client import (
+    AsyncAPIClient,
+    AsyncPoolWaitTransport,
+)
+from lightspeed_evaluation.core.models import APIConfig
+from lightspeed_evaluation.core.system.exceptions import APIError
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+
+def _client(
+    config: APIConfig, handler: Handler, mocker: MockerFixture
+) -> AsyncAPIClient:
+    """Create an async client whose requests are answered by a handler."""
+    mocker.patch(
+        "lightspeed_evaluation.core.api.client.create_async_transport",
+        return_value=httpx.MockTransport(handler),
+    )
+    return AsyncAPIClient(config)
+
+
+class TestAsyncAPIClient:
+    """Unit tests for AsyncAPIClient."""
+
+    def test_setup_uses_async_transport(
+        self, basic_api_config_query_endpoint: APIConfig
+    ) -> None:
+        """Test the client sends requests through the pool-wait transport."""
+        client = AsyncAPIClient(basic_api_config_query_endpoint)
+
+        assert client.client is not None
+        assert isinstance(client.client._transport, AsyncPoolWaitTransport)
+        assert client.client.headers["Content-Type"] == "application/json"
+
+    @pytest.mark.asyncio
+    async def test_standard_query(
+        self, basic_api_config_query_endpoint: APIConfig, mocker: MockerFixture
+    ) -> None:
+        """Test a standard query posts the request and parses the response."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(
+                200,
+                json={
+                    "response": "Pods are running",
+                    "conversation_id": "conv-1",
+                    "input_tokens": 12,
+                    "output_tokens": 4,
+                },
+            )
+
+        client = _client(basic_api_config_query_endpoint, handler, mocker)
+        response = await client.query("How are the pods?", conversation_id="conv-1")
+        await client.aclose()
+
+        assert response.response == "Pods are running"
+        assert response.conversation_id == "conv-1"
+        assert (response.input_tokens, response.output_tokens) == (12, 4)
+        assert requests[0].url.path == "/v1/query"
+        body = json.loads(requests[0].content)
+        assert body["query"] == "How are the pods?"
+        assert body["conversation_id"] == "conv-1"
+
+    @pytest.mark.asyncio
+    async def test_streaming_query(
+        self, basic_api_config_streaming_endpoint: APIConfig, mocker: MockerFixture
+    ) -> None:
+        """Test a streaming query parses the SSE events."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.path == "/v1/streaming_query"
+            return httpx.Response(
+                200,
+                text=(
+                    'data: {"event": "start", "data": {"conversation_id": "c1"}}\n\n'
+                    'data: {"event": "turn_complete", "data": {"token": "Done"}}\n\n'
+                ),
+            )
+
+        client = _client(basic_api_config_streaming_endpoint, handler, mocker)
+        response = await client.query("Scale the deployment")
+        await client.aclose()
+
+        assert response.response == "Done"
+        assert response.conversation_id == "c1"
+        assert response.time_to_first_token is not None
+
+    @pytest.mark.asyncio
+    async def test_streaming_error_status(
+        self, basic_api_config_streaming_endpoint: APIConfig, mocker: MockerFixture
+    ) -> None:
+        """Test a failed stream reports the error body of the response."""
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            return httpx.Response(400, json={"detail": "Bad query"})
+
+        client = _client(basic_api_config_streaming_endpoint, handler, mocker)
+        with pytest.raises(APIError, match="Bad query"):
+            await client.query("test")
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_retries_on_429_then_succeeds(
+        self, basic_api_config_query_endpoint: APIConfig, mocker: MockerFixture
+    ) -> None:
+        """Test rate-limited queries are retried with the shared retry policy."""
+        mocker.patch("asyncio.sleep", new_callable=mocker.AsyncMock)
+        statuses = iter([429, 200])
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            status = next(statuses)
+            if status == 429:
+                return httpx.Response(429, json={"detail": "slow down"})
+            return httpx.Response(200, json={"response": "ok", "conversation_id": "c"})
+
+        client = _client(basic_api_config_query_endpoint, handler, mocker)
+        response = await client.query("test")
+        await client.aclose()
+
+        assert response.response == "ok"
+
+    @pytest.mark.asyncio
+    async def test_retries_exhausted(
+        self, basic_api_config_query_endpoint: APIConfig, mocker: MockerFixture
+    ) -> None:
+        """Test an endpoint that keeps rate limiting raises APIError."""
+        mocker.patch("asyncio.sleep", new_callable=mocker.AsyncMock)
+        config = basic_api_config_query_endpoint.model_copy(update={"num_retries": 1})
+        calls: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(429, json={"detail": "slow down"})
+
+        client = _client(config, handler, mocker)
+        with pytest.raises(APIError, match="Maximum retry attempts"):
+            await client.query("test")
+        await client.aclose()
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_timeout_error(
+        self, basic_api_config_query_endpoint: APIConfig, mocker: MockerFixture
+    ) -> None:
+        """Test timeouts are reported as APIError."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        client = _client(basic_api_config_query_endpoint, handler, mocker)
+        with pytest.raises(APIError, match="timeout"):
+            await client.query("test")
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_cached_response_skips_request(
+        self,
+        basic_api_config_query_endpoint: APIConfig,
+        tmp_path: Path,
+        mocker: MockerFixture,
+    ) -> None:
+        """Test a cached query is served without calling the endpoint."""
+        config = basic_api_config_query_endpoint.model_copy(
+            update={"cache_enabled": True, "cache_dir": str(tmp_path / "cache")}
+        )
+        calls: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(
+                200,
+                json={"response": "cached", "conversation_id": "c", "input_tokens": 3},
+            )
+
+        client = _client(config, handler, mocker)
+        first = await client.query("test")
+        second = await client.query("test")
+        await client.aclose()
+
+        assert len(calls) == 1
+        assert first.response == second.response == "cached"
+        assert second.input_tokens == 0
@@ -1,15 +1,23 @@
+# pylint: disable=protected-access
+
 """Unit tests for streaming parser."""
 
 import json
-from typing import Any
+from typing import Any, Optional
 
+import httpx
 import pytest
+from pytest_mock import MockerFixture
 
+from lightspeed_evaluation.core.api import streaming_parser
 from lightspeed_evaluation.core.api.streaming_parser import (
     _format_tool_sequences,
+    _iter_lines,
     _normalize_mcp_item,
     _parse_sse_line,
     _parse_tool_call,
+    aparse_responses_streaming,
+    aparse_streaming_response,
     parse_responses_streaming,
     parse_streaming_response,
 )
@@ -686,3 +694,184 @@ class TestParseResponsesStreaming:
 
         with pytest.raises(ValueError, match="No final response"):
             parse_responses_streaming(mock_response)
+
+
+class TestFastPath:
+    """Unit tests for byte line splitting and skipping undecoded events."""
+
+    def test_iter_lines_joins_chunks(self) -> None:
+        """Test lines split across chunks are joined."""
+        chunks = [b"data: a", b"bc\r\n\nda", b"ta: d", b"ef\n", b"", b"data: tail"]
+
+        assert list(_iter_lines(chunks)) == [
+            b"data: abc",
+            b"",
+            b"data: def",
+            b"data: tail",
+        ]
+
+    def test_iter_lines_splits_on_cr(self) -> None:
+        """Test CR and CRLF end lines, also when CRLF is split across chunks."""
+        chunks = [b"data: a\r\rdata: b\r", b"\ndata: c\r\n\r\n"]
+
+        assert [line for line in _iter_lines(chunks) if line] == [
+            b"data: a",
+            b"data: b",
+            b"data: c",
+        ]
+
+    def test_parse_cr_separated_body(self, mocker: MockerFixture) -> None:
+        """Test a body with CR-only event separators is parsed."""
+        response = mocker.Mock()
+        response.iter_bytes.return_value = [
+            b'data: {"event": "start", "data": {"conversation_id": "c1"}}\r\r'
+            b'data: {"event": "turn_complete", "data": {"token": "Done"}}\r\r'
+        ]
+
+        result = parse_streaming_response(response)
+
+        assert result["response"] == "Done"
+        assert result["conversation_id"] == "c1"
+
+    @pytest.mark.parametrize(
+        "line,expected",
+        [
+            (b'data: {"event": "token", "data": {}}', b"token"),
+            (b'data: {"event":"tool_call","data":{}}', b"tool_call"),
+            (b'data: {"data": {}, "event": "token"}', None),
+            (b'data: {"event": "tok', None),
+            (b'data: {"event": "to\\"ken"}', None),
+            (b'{"event": "token"}', None),
+        ],
+    )
+    def test_event_type_read_from_prefix(
+        self, line: bytes, expected: Optional[bytes]
+    ) -> None:
+        """Test the event type is only read when it is the first key."""
+        match = streaming_parser._STREAMING_EVENT_TYPE.match(line)
+        assert (match[1] if match else None) == expected
+
+    def test_token_events_not_decoded(
+        self, mock_response: Any, mocker: MockerFixture
+    ) -> None:
+        """Test only events with kept data are decoded."""
+        decode = mocker.spy(streaming_parser, "_json_loads")
+        mock_response.iter_lines.return_value = [
+            'data: {"event": "start", "data": {"conversation_id": "c1"}}',
+            *(
+                f'data: {{"event":"token","data":{{"id":{i},"token":"w"}}}}'
+                for i in range(50)
+            ),
+            'data: {"event": "turn_complete", "data": {"token": "Done"}}',
+            'data: {"event": "end", "data": {"input_tokens": 1, "output_tokens": 50}}',
+        ]
+
+        result = parse_streaming_response(mock_response)
+
+        assert decode.call_count == 3
+        assert result["response"] == "Done"
+        assert result["output_tokens"] == 50
+        assert result["time_to_first_token"] is not None
+
+    def test_responses_deltas_not_decoded(
+        self, mock_response: Any, mocker: MockerFixture
+    ) -> None:
+        """Test text deltas only capture TTFT and unordered keys are decoded."""
+        decode = mocker.spy(streaming_parser, "_json_loads")
+        mock_response.iter_lines.return_value = [
+            'data: {"response": {"conversation": "c1"}, "type": "response.created"}',
+            *['data: {"type":"response.output_text.delta","delta":"w"}'] * 20,
+            'data: {"type": "response.output_text.done", "text": "Done"}',
+            'data: {"type": "response.completed", "response": {"output_text": "Done"}}',
+        ]
+
+        result = parse_responses_streaming(mock_response)
+
+        assert decode.call_count == 2
+        assert result["conversation_id"] == "c1"
+        assert result["response"] == "Done"
+        assert result["time_to_first_token"] is not None
+
+    def test_json_fallback(self, mock_response: Any, mocker: MockerFixture) -> None:
+        """Test parsing works with the standard library decoder."""
+        mocker.patch.object(streaming_parser, "_json_loads", json.loads)
+        mock_response.iter_lines.return_value = [
+            'data: {"event": "start", "data": {"conversation_id": "c1"}}',
+            'data: {"event": "turn_complete", "data": {"token": "Done"}}',
+        ]
+
+        assert parse_streaming_response(mock_response)["response"] == "Done"
+
+
+def _async_stream(lines: list[str]) -> httpx.Response:
+    """Build a response whose body is streamed asynchronously line by line."""
+
+    class LineStream(httpx.AsyncByteStream):
+        """Async byte stream yielding one SSE line per chunk."""
+
+        async def __aiter__(self) -> Any:
+            for line in lines:
+                yield f"{line}\n".encode()
+
+    return httpx.Response(200, stream=LineStream())
+
+
+class TestAsyncParsers:
+    """Unit tests for the async streaming parsers."""
+
+    @pytest.mark.asyncio
+    async def test_aparse_streaming_response(self) -> None:
+        """Test the async parser matches the blocking /streaming parser."""
+        response = _async_stream(
+            [
+                'data: {"event": "start", "data": {"conversation_id": "conv_123"}}',
+                "",
+                'data: {"event": "tool_call", "data": {"token": '
+                '{"tool_name": "search", "arguments": {"q": "pods"}}}}',
+                'data: {"event": "turn_complete", "data": {"token": "Done"}}',
+            ]
+        )
+
+        result = await aparse_streaming_response(response)
+
+        assert result["response"] == "Done"
+        assert result["conversation_id"] == "conv_123"
+        assert result["tool_calls"] == [
+            [{"tool_name": "search", "arguments": {"q": "pods"}}]
+        ]
+        assert result["time_to_first_token"] is not None
+
+    @pytest.mark.asyncio
+    async def test_aparse_streaming_response_missing_final_response(self) -> None:
+        """Test the async parser rejects a stream without a final response."""
+        response = _async_stream(
+            ['data: {"event": "start", "data": {"conversation_id": "conv_123"}}']
+        )
+
+        with pytest.raises(ValueError, match="No final response"):
+            await aparse_streaming_response(response)
+
+    @pytest.mark.asyncio
+    async def test_aparse_responses_streaming_stops_at_done(self) -> None:
+        """Test the async /responses parser stops reading at [DONE]."""
+        events = [
+            {"type": "response.created", "response": {"conversation": "conv-abc"}},
+            {"type": "response.output_text.delta", "delta": "Hello"},
+            {
+                "type": "response.completed",
+                "response": {
+                    "output_text": "Hello",
+                    "usage": {"input_tokens": 10, "output_tokens": 1},
+                },
+            },
+        ]
+        response = _async_stream(
+            [f"data: {json.dumps(e)}" for e in events]
+            + ["data: [DONE]", 'data: {"type": "response.output_text.delta"']
+        )
+
+        result = await aparse_responses_streaming(response)
+
+        assert result["response"] == "Hello"
+        assert result["conversation_id"] == "conv-abc"
+        assert (result["input_tokens"], result["output_tokens"]) == (10, 1)
@@ -0,0 +1,345 @@
+# pylint: disable=protected-access,redefined-outer-name
+
+"""Unit tests for the batch-API judge mode."""
+
+import json
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, Optional
+
+import litellm
+import pytest
+from pydantic import BaseModel
+
+# Importing the patch routes litellm.completion through the batch judge
+from lightspeed_evaluation.core.llm import (  # noqa: F401 pylint: disable=unused-import
+    litellm_patch,
+)
+from lightspeed_evaluation.core.llm.batch import (
+    BATCHES_FILENAME,
+    BatchJudge,
+    BatchStatus,
+    batch_judge_session,
+    batch_request_body,
+    get_active_batch_judge,
+)
+from lightspeed_evaluation.core.llm.token_tracker import TokenTracker
+from lightspeed_evaluation.core.models import BatchJudgeConfig, SystemConfig
+from lightspeed_evaluation.core.system.exceptions import (
+    BatchJudgeError,
+    BatchPendingError,
+)
+
+MODEL = "openai/gpt-4o-mini"
+
+
+def _request(content: str, model: str = MODEL) -> dict[str, Any]:
+    """Build the recorded request of a judge completion."""
+    return {"model": model, "messages": [{"role": "user", "content": content}]}
+
+
+def _chat_completion(body: dict[str, Any]) -> dict[str, Any]:
+    """Answer a chat completion request by echoing its last message."""
+    return {
+        "id": "chatcmpl-1",
+        "object": "chat.completion",
+        "created": 0,
+        "model": body["model"],
+        "choices": [
+            {
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {
+                    "role": "assistant",
+                    "content": f"echo: {body['messages'][-1]['content']}",
+                },
+            }
+        ],
+        "usage": {"prompt_tokens": 12, "completion_tokens": 3, "total_tokens": 15},
+    }
+
+
+class LocalBatchEndpoint:
+    """Local stand-in for a provider batch endpoint.
+
+    Batches run to completion after ``polls_to_finish`` status checks; a
+    request whose last message contains "fail" gets an error result.
+    """
+
+    def __init__(self, polls_to_finish: int = 1) -> None:
+        """Initialize an endpoint without batches."""
+        self.polls_to_finish = polls_to_finish
+        self.submitted: list[tuple[str, list[dict[str, Any]]]] = []
+        self._polls: dict[str, int] = {}
+        self._files: dict[str, list[dict[str, Any]]] = {}
+
+    def submit(self, provider: str, requests: list[dict[str, Any]]) -> str:
+        """Accept a batch of JSONL request lines."""
+        self.submitted.append((provider, requests))
+        batch_id = f"batch_{len(self.submitted)}"
+        self._polls[batch_id] = 0
+        output, errors = [], []
+        for line in requests:
+            body = line["body"]
+            if "fail" in body["messages"][-1]["content"]:
+                errors.append(
+                    {
+                        "custom_id": line["custom_id"],
+                        "response": None,
+                        "error": {"code": "invalid", "message": "Invalid request"},
+                    }
+                )
+            else:
+                output.append(
+                    {
+                        "custom_id": line["custom_id"],
+                        "response": {
+                            "status_code": 200,
+                            "body": _chat_completion(body),
+                        },
+                        "error": None,
+                    }
+                )
+        self._files[f"{batch_id}_output"] = output
+        self._files[f"{batch_id}_errors"] = errors
+        return batch_id
+
+    def status(self, provider: str, batch_id: str) -> BatchStatus:
+        """Report a batch as running until it has been polled enough."""
+        assert provider
+        self._polls[batch_id] += 1
+        if self._polls[batch_id] < self.polls_to_finish:
+            return BatchStatus("in_progress")
+        return BatchStatus(
+            "completed",
+            output_file_id=f"{batch_id}_output",
+            error_file_id=f"{batch_id}_errors",
+        )
+
+    def output(self, provider: str, file_id: str) -> list[dict[str, Any]]:
+        """Return the result lines of a batch file."""
+        assert provider
+        return self._files[file_id]
+
+
+def _config(**overrides: Any) -> BatchJudgeConfig:
+    """Build a batch judge configuration that polls without waiting."""
+    return BatchJudgeConfig(**{"enabled": True, "poll_interval": 0.001, **overrides})
+
+
+@pytest.fixture
+def endpoint() -> LocalBatchEndpoint:
+    """Create a local batch endpoint."""
+    return LocalBatchEndpoint()
+
+
+@pytest.fixture
+def make_judge(
+    tmp_path: Path, endpoint: LocalBatchEndpoint
+) -> Callable[..., BatchJudge]:
+    """Create batch judges sharing a state directory and endpoint."""
+
+    def make(config: Optional[BatchJudgeConfig] = None) -> BatchJudge:
+        return BatchJudge(config or _config(), str(tmp_path / "batch"), endpoint)
+
+    return make
+
+
+class TestBatchJudge:
+    """Tests for BatchJudge."""
+
+    def test_from_system_config(self, tmp_path: Path) -> None:
+        """Test the judge exists only when enabled and defaults to the cache dir."""
+        config = SystemConfig()
+        assert BatchJudge.from_system_config(config) is None
+
+        config.core.cache_base_dir = str(tmp_path)
+        config.batch_judge = BatchJudgeConfig(enabled=True)
+        judge = BatchJudge.from_system_config(config)
+
+        assert judge is not None
+        assert judge.state_dir == tmp_path / "batch"
+
+    def test_defers_then_serves_batch_response(
+        self, make_judge: Callable[..., BatchJudge], endpoint: LocalBatchEndpoint
+    ) -> None:
+        """Test a request is queued, batched once and then answered."""
+        judge = make_judge()
+
+        for _ in range(2):
+            with pytest.raises(BatchPendingError):
+                judge.completion(_request("q1"))
+        assert judge.pending == 1
+
+        judge.run_batches()
+
+        assert len(endpoint.submitted) == 1
+        provider, lines = endpoint.submitted[0]
+        assert provider == "openai"
+        assert lines[0]["url"] == "/v1/chat/completions"
+        assert lines[0]["body"]["model"] == "gpt-4o-mini"
+        response = judge.completion(_request("q1"))
+        assert response["choices"][0]["message"]["content"] == "echo: q1"
+        assert judge.in_flight == 0
+
+    def test_requests_grouped_by_provider(
+        self, make_judge: Callable[..., BatchJudge], endpoint: LocalBatchEndpoint
+    ) -> None:
+        """Test one batch is submitted per provider."""
+        judge = make_judge()
+        for request in (
+            _request("a"),
+            _request("b"),
+            _request("c", model="azure/judge"),
+        ):
+            with pytest.raises(BatchPendingError):
+                judge.completion(request)
+
+        judge.run_batches()
+
+        assert sorted((p, len(lines)) for p, lines in endpoint.submitted) == [
+            ("azure", 1),
+            ("openai", 2),
+        ]
+
+    def test_responses_persist_across_runs(
+        self, make_judge: Callable[..., BatchJudge], endpoint: LocalBatchEndpoint
+    ) -> None:
+        """Test a later run is served from stored responses without batching."""
+        first = make_judge()
+        with pytest.raises(BatchPendingError):
+            first.completion(_request("q1"))
+        first.run_batches()
+
+        second = make_judge()
+        assert second.completion(_request("q1"))["choices"]
+        assert second.pending == 0
+        assert len(endpoint.submitted) == 1
+
+    def test_interrupted_run_resumes_in_flight_batch(
+        self,
+        make_judge: Callable[..., BatchJudge],
+        endpoint: LocalBatchEndpoint,
+        tmp_path: Path,
+    ) -> None:
+        """Test a batch still running when the process stopped is not resubmitted."""
+        endpoint.polls_to_finish = 3
+        first = make_judge(_config(timeout=0.01, poll_interval=0.02))
+        with pytest.raises(BatchPendingError):
+            first.completion(_request("q1"))
+        with pytest.raises(BatchJudgeError, match="still running"):
+            first.run_batches()
+        saved = json.loads((tmp_path / "batch" / BATCHES_FILENAME).read_text())
+        assert [batch["id"] for batch in saved] == ["batch_1"]
+
+        second = make_judge()
+        assert second.in_flight == 1
+        with pytest.raises(BatchPendingError):
+            second.completion(_request("q1"))
+        second.run_batches()
+
+        assert len(endpoint.submitted) == 1
+        assert second.completion(_request("q1"))["choices"]
+        assert json.loads((tmp_path / "batch" / BATCHES_FILENAME).read_text()) == []
+
+    def test_failed_request_raises_and_is_retried_later(
+        self, make_judge: Callable[..., BatchJudge], endpoint: LocalBatchEndpoint
+    ) -> None:
+        """Test failed batch requests error out in this run only."""
+        judge = make_judge()
+        with pytest.raises(BatchPendingError):
+            judge.completion(_request("please fail"))
+        judge.run_batches()
+
+        judge.start_round()
+        with pytest.raises(BatchJudgeError, match="Invalid request"):
+            judge.completion(_request("please fail"))
+        assert judge.pending == 0
+
+        with pytest.raises(BatchPendingError):
+            make_judge().completion(_request("please fail"))
+        assert len(endpoint.submitted) == 1
+
+    def test_submit_failure(self, make_judge: Callable[..., BatchJudge]) -> None:
+        """Test provider errors on submission are reported as BatchJudgeError."""
+        judge = make_judge()
+        judge.client.submit = _raise_connection_error  # type: ignore[method-assign]
+        with pytest.raises(BatchPendingError):
+            judge.completion(_request("q1"))
+
+        with pytest.raises(BatchJudgeError, match="Failed to submit 1 judge"):
+            judge.run_batches()
+        assert judge.in_flight == 0
+
+
+def _raise_connection_error(*_args: Any) -> str:
+    """Stand in for a batch endpoint that cannot be reached."""
+    raise ConnectionError("unreachable")
+
+
+class TestBatchRequestBody:
+    """Tests for batch_request_body."""
+
+    def test_strips_provider_prefix(self) -> None:
+        """Test the body names the provider's model."""
+        provider, body = batch_request_body({**_request("q"), "temperature": 0.0})
+
+        assert provider == "openai"
+        assert body == {
+            "model": "gpt-4o-mini",
+            "messages": [{"role": "user", "content": "q"}],
+            "temperature": 0.0,
+        }
+
+    def test_converts_pydantic_response_format(self) -> None:
+        """Test structured output models are sent as JSON schema."""
+
+        class Verdict(BaseModel):
+            """Structured judge answer."""
+
+            score: float
+
+        _provider, body = batch_request_body(
+            {**_request("q"), "response_format": Verdict}
+        )
+
+        assert body["response_format"]["type"] == "json_schema"
+        schema = body["response_format"]["json_schema"]["schema"]
+        assert "score" in schema["properties"]
+
+
+class TestBatchJudgeSession:
+    """Tests for batch_judge_session and the litellm patch."""
+
+    def test_session_serves_litellm_completion(
+        self, make_judge: Callable[..., BatchJudge]
+    ) -> None:
+        """Test patched litellm calls are deferred, then served and tracked."""
+        judge = make_judge()
+        messages = [{"role": "user", "content": "q1"}]
+
+        with batch_judge_session(judge):
+            assert get_active_batch_judge() is judge
+            with pytest.raises(BatchPendingError):
+                litellm.completion(model=MODEL, messages=messages)
+            judge.run_batches()
+
+            tracker = TokenTracker()
+            tracker.start()
+            try:
+                response = litellm.completion(model=MODEL, messages=messages)
+            finally:
+                tracker.stop()
+
+        assert get_active_batch_judge() is None
+        assert response.choices[0].message.content == "echo: q1"
+        assert tracker.get_judge_counts() == (12, 3)
+
+    def test_nested_session_rejected(
+        self, make_judge: Callable[..., BatchJudge]
+    ) -> None:
+        """Test only one batch judge can be active."""
+        with batch_judge_session(make_judge()):
+            with pytest.raises(BatchJudgeError, match="already active"):
+                with batch_judge_session(make_judge()):
+                    pass
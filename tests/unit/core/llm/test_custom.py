@@ -70,6 +70,24 @@ class TestBaseCustomLLM:
 
         assert result == "Test response"
 
+    def test_call_sends_instructions_as_system_message(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Test static instructions are sent first, as the system message."""
+        mock_litellm = mocker.patch("lightspeed_evaluation.core.llm.custom.litellm")
+        mocker.patch.dict("os.environ", {})
+        mock_choice = mocker.Mock()
+        mock_choice.message.content = "Score: 1"
+        mock_litellm.completion.return_value.choices = [mock_choice]
+
+        llm = BaseCustomLLM("gpt-4", {})
+        llm.call("Question: q", instructions="Rate the answer.")
+
+        assert mock_litellm.completion.call_args.kwargs["messages"] == [
+            {"role": "system", "content": "Rate the answer."},
+            {"role": "user", "content": "Question: q"},
+        ]
+
     def test_call_raises_llm_error_on_failure(self, mocker: MockerFixture) -> None:
         """Test call raises LLMError on failure."""
         mock_litellm = mocker.patch("lightspeed_evaluation.core.llm.custom.litellm")
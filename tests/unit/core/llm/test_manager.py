@@ -97,6 +97,7 @@ class TestLLMManager:
             "timeout": 60,
             "num_retries": 3,
             "ssl_verify": True,
+            "prompt_caching": True,
             "parameters": {
                 "temperature": 0.7,
                 "max_completion_tokens": 1000,
@@ -125,6 +126,7 @@ class TestLLMManager:
             "timeout": 30,
             "num_retries": 2,
             "ssl_verify": False,
+            "prompt_caching": True,
             "parameters": {
                 "temperature": 0.5,
                 "max_completion_tokens": 512,
@@ -0,0 +1,145 @@
+# pylint: disable=protected-access
+
+"""Unit tests for provider prompt-caching hints."""
+
+from typing import Any
+
+import pytest
+from pytest_mock import MockerFixture
+
+from lightspeed_evaluation.core.constants import PROMPT_CACHE_MIN_PREFIX_CHARS
+from lightspeed_evaluation.core.llm import prompt_cache
+from lightspeed_evaluation.core.llm.prompt_cache import (
+    add_cache_hints,
+    setup_prompt_caching,
+    uses_cache_control,
+    with_cache_hints,
+)
+
+CLAUDE = "anthropic/claude-sonnet-4"
+STATIC = "Rubric line\n" * (PROMPT_CACHE_MIN_PREFIX_CHARS // 12 + 1)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_state(mocker: MockerFixture) -> None:
+    """Give every test its own model registry and prompt history."""
+    mocker.patch.object(prompt_cache, "_enabled_models", set())
+    mocker.patch.object(prompt_cache, "_history", prompt_cache._PromptHistory(size=4))
+
+
+class TestUsesCacheControl:
+    """Tests for uses_cache_control."""
+
+    @pytest.mark.parametrize(
+        "model",
+        [CLAUDE, "bedrock/anthropic.claude-3-haiku", "vertex_ai/claude-opus-4"],
+    )
+    def test_anthropic_models(self, model: str) -> None:
+        """Test Claude models need explicit cache breakpoints."""
+        assert uses_cache_control(model)
+
+    @pytest.mark.parametrize("model", ["openai/gpt-4o-mini", "gemini/gemini-2.5"])
+    def test_automatic_caching_models(self, model: str) -> None:
+        """Test models with automatic prefix caching get no hints."""
+        assert not uses_cache_control(model)
+
+
+class TestAddCacheHints:
+    """Tests for add_cache_hints."""
+
+    def test_marks_system_message(self) -> None:
+        """Test the static system message is marked as cacheable."""
+        setup_prompt_caching(CLAUDE, {})
+        messages = [
+            {"role": "system", "content": "Instructions"},
+            {"role": "user", "content": "Question: q"},
+        ]
+
+        hinted = add_cache_hints(CLAUDE, messages)
+
+        assert hinted[0] == {
+            "role": "system",
+            "content": [
+                {
+                    "type": "text",
+                    "text": "Instructions",
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ],
+        }
+        assert hinted[1] == messages[1]
+        assert messages[0]["content"] == "Instructions"
+
+    def test_unregistered_or_disabled_model_unchanged(self) -> None:
+        """Test models not enabled for prompt caching are left alone."""
+        messages = [{"role": "system", "content": "Instructions"}]
+        assert add_cache_hints(CLAUDE, messages) is messages
+
+        setup_prompt_caching(CLAUDE, {"prompt_caching": True})
+        setup_prompt_caching(CLAUDE, {"prompt_caching": False})
+        assert add_cache_hints(CLAUDE, messages) is messages
+
+    def test_openai_model_unchanged(self) -> None:
+        """Test OpenAI models rely on automatic caching of the static prefix."""
+        setup_prompt_caching("openai/gpt-4o-mini", {})
+        messages = [{"role": "system", "content": "Instructions"}]
+        assert add_cache_hints("openai/gpt-4o-mini", messages) is messages
+
+    def test_splits_single_prompt_at_learned_prefix(self) -> None:
+        """Test a single-message prompt is split after the shared static prefix."""
+        setup_prompt_caching(CLAUDE, {})
+        first = [{"role": "user", "content": STATIC + "Question: first"}]
+        second = [{"role": "user", "content": STATIC + "Question: second"}]
+
+        assert add_cache_hints(CLAUDE, first) is first
+        hinted = add_cache_hints(CLAUDE, second)
+
+        blocks = hinted[0]["content"]
+        assert blocks[0]["text"] == STATIC
+        assert blocks[0]["cache_control"] == {"type": "ephemeral"}
+        assert blocks[1] == {"type": "text", "text": "Question: second"}
+
+    def test_short_shared_prefix_not_split(self) -> None:
+        """Test prefixes below the provider's minimum are not marked."""
+        setup_prompt_caching(CLAUDE, {})
+        add_cache_hints(CLAUDE, [{"role": "user", "content": "Rubric\nQuestion: a"}])
+        messages = [{"role": "user", "content": "Rubric\nQuestion: b"}]
+
+        assert add_cache_hints(CLAUDE, messages) is messages
+
+    def test_no_split_when_disabled(self) -> None:
+        """Test learned splits are skipped while responses are cached."""
+        setup_prompt_caching(CLAUDE, {})
+        add_cache_hints(CLAUDE, [{"role": "user", "content": STATIC + "a"}])
+        messages = [{"role": "user", "content": STATIC + "b"}]
+
+        assert add_cache_hints(CLAUDE, messages, split_prompts=False) is messages
+
+
+class TestWithCacheHints:
+    """Tests for with_cache_hints."""
+
+    def test_keyword_messages(self) -> None:
+        """Test hints are added to keyword messages without touching the input."""
+        setup_prompt_caching(CLAUDE, {})
+        kwargs: dict[str, Any] = {
+            "model": CLAUDE,
+            "messages": [{"role": "system", "content": "S"}],
+        }
+
+        args, hinted = with_cache_hints((), kwargs)
+
+        assert args == ()
+        assert hinted["messages"][0]["content"][0]["cache_control"]
+        assert kwargs["messages"][0]["content"] == "S"
+
+    def test_positional_messages(self) -> None:
+        """Test hints are added to positional messages."""
+        setup_prompt_caching(CLAUDE, {})
+
+        args, kwargs = with_cache_hints(
+            (CLAUDE, [{"role": "system", "content": "S"}]), {"n": 1}
+        )
+
+        assert args[1][0]["content"][0]["cache_control"]
+        assert kwargs == {"n": 1}
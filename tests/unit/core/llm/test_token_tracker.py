@@ -9,10 +9,11 @@ import pytest
 from pytest_mock import MockerFixture
 
 # Simulate litellm completion call through patch
-from lightspeed_evaluation.core.llm import litellm_patch
+from lightspeed_evaluation.core.llm import litellm_patch, prompt_cache
 from lightspeed_evaluation.core.llm.token_tracker import (
     TokenTracker,
     _extract_tokens_if_not_cached,
+    track_judge_tokens,
 )
 
 
@@ -36,7 +37,7 @@ class TestTokenTracker:
     def test_reset_clears_counts(self) -> None:
         """Test that reset clears token counts."""
         tracker = TokenTracker()
-        tracker.add_judge_tokens(100, 200)
+        tracker.add_judge_tokens(100, 200, cached_tokens=80)
         tracker.add_embedding_tokens(75)
 
         tracker.reset()
@@ -46,6 +47,7 @@ class TestTokenTracker:
         assert judge_input_tokens == 0
         assert judge_output_tokens == 0
         assert embed_input_tokens == 0
+        assert tracker.get_cached_input_tokens() == 0
 
     def test_start_sets_active_tracker(self) -> None:
         """Test that start sets the tracker as active for current thread."""
@@ -199,6 +201,32 @@ class TestTokenTrackerCacheHandling:
         # Tokens are not counted for cache hit
         assert not tokens
 
+    def test_track_judge_tokens_counts_cache_hits(
+        self, mock_judge_llm_response: Callable[..., Any]
+    ) -> None:
+        """Cached judge responses are counted as cache hits, not tokens."""
+        tracker = TokenTracker()
+        tracker.start()
+        try:
+            track_judge_tokens(
+                mock_judge_llm_response(
+                    prompt_tokens=200, completion_tokens=100, cache_hit=True, content=""
+                )
+            )
+            track_judge_tokens(
+                mock_judge_llm_response(
+                    prompt_tokens=20, completion_tokens=10, cache_hit=False, content=""
+                )
+            )
+        finally:
+            tracker.stop()
+
+        assert tracker.get_cache_hits() == 1
+        assert tracker.get_judge_counts() == (20, 10)
+
+        tracker.reset()
+        assert tracker.get_cache_hits() == 0
+
 
 class TestLiteLLMCompletionPatchWithTokenTracker:
     """Test LiteLLM completion/acompletion patch integration with TokenTracker."""
@@ -264,6 +292,42 @@ class TestLiteLLMCompletionPatchWithTokenTracker:
         finally:
             tracker.stop()
 
+    def test_tracks_cached_tokens_reported_by_provider(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Test cached input tokens of a caching stand-in provider are recorded."""
+        mocker.patch.object(prompt_cache, "_enabled_models", set())
+        prompt_cache.setup_prompt_caching("anthropic/claude-sonnet-4", {})
+        # Local stand-in that reports a prompt-cache read, as providers do
+        mock_completion = mocker.patch(f"{litellm_patch.__name__}._original_completion")
+        mock_completion.return_value = litellm.ModelResponse(
+            choices=[{"message": {"role": "assistant", "content": "Score: 1"}}],
+            usage={
+                "prompt_tokens": 1200,
+                "completion_tokens": 20,
+                "total_tokens": 1220,
+                "prompt_tokens_details": {"cached_tokens": 1100},
+            },
+        )
+
+        tracker = TokenTracker()
+        tracker.start()
+        try:
+            litellm.completion(
+                model="anthropic/claude-sonnet-4",
+                messages=[
+                    {"role": "system", "content": "Instructions"},
+                    {"role": "user", "content": "Question: q"},
+                ],
+            )
+        finally:
+            tracker.stop()
+
+        assert tracker.get_judge_counts() == (1200, 20)
+        assert tracker.get_cached_input_tokens() == 1100
+        sent = mock_completion.call_args.kwargs["messages"]
+        assert sent[0]["content"][0]["cache_control"] == {"type": "ephemeral"}
+
     def test_track_judge_tokens_exception_does_not_break_response(
         self, mocker: MockerFixture, mock_judge_llm_response: Callable[..., Any]
     ) -> None:
@@ -182,6 +182,126 @@ class TestCustomMetricsToolEval:
         assert "unordered" in reason
 
 
+class TestCustomMetricsLazyLLM:
+    """The judge LLM client is only created when an LLM metric needs it."""
+
+    def test_non_llm_metric_does_not_create_llm(self, mocker: MockerFixture) -> None:
+        """Keyword evaluation never constructs the LLM client."""
+        llm_cls = mocker.patch("lightspeed_evaluation.core.llm.custom.BaseCustomLLM")
+        custom_metrics = _make_custom_metrics(mocker)
+        turn_data = TurnData(
+            turn_id="1",
+            query="Q",
+            response="use oc scale",
+            expected_keywords=[["oc scale"]],
+        )
+
+        score, _ = custom_metrics.evaluate(
+            "keywords_eval", None, _make_scope(turn_data)
+        )
+
+        assert score == 1.0
+        llm_cls.assert_not_called()
+
+    def test_llm_created_once_on_first_use(self, mocker: MockerFixture) -> None:
+        """The client is built on first access and then reused."""
+        llm_cls = mocker.patch("lightspeed_evaluation.core.llm.custom.BaseCustomLLM")
+        custom_metrics = _make_custom_metrics(mocker)
+
+        first = custom_metrics.llm
+        assert custom_metrics.llm is first
+        llm_cls.assert_called_once_with("test-model", {"parameters": {}})
+
+
+_FUSED_TURN = TurnData(
+    turn_id="1",
+    query="How do I scale a deployment?",
+    response="Use oc scale deployment/web --replicas=3.",
+    expected_response="Run oc scale with the replica count.",
+    expected_intent="provide instructions",
+)
+
+_FUSED_METRICS = ["answer_correctness", "intent_eval", "keywords_eval"]
+
+
+class TestCustomMetricsFused:
+    """Fused scoring of several LLM-judged custom metrics in one call."""
+
+    def test_scores_all_rubrics_with_one_call(self, mocker: MockerFixture) -> None:
+        """One judge call yields a score per fusable metric and reports savings."""
+        cm = _make_custom_metrics(mocker)
+        answer = json.dumps(
+            {
+                "answer_correctness": {"score": 8, "reason": "Mostly correct"},
+                "intent_eval": {"score": 1, "reason": "Gives instructions"},
+            }
+        )
+        call_llm = mocker.patch.object(
+            cm, "_call_llm", return_value=f"```json\n{answer}\n```"
+        )
+        mocker.patch.object(cm, "_llm", mocker.Mock())
+        cm.llm.count_tokens.side_effect = lambda prompt: len(prompt) // 4
+
+        results, saved = cm.evaluate_fused(
+            _FUSED_METRICS, None, _make_scope(_FUSED_TURN)
+        )
+
+        call_llm.assert_called_once()
+        prompt = call_llm.call_args.args[0]
+        assert prompt.count(_FUSED_TURN.query) == 1
+        assert "Rubric id: answer_correctness" in prompt
+        assert "Rubric id: intent_eval" in prompt
+        assert results == {
+            "answer_correctness": (
+                0.8,
+                "Custom answer correctness: 0.80 - Mostly correct",
+            ),
+            "intent_eval": (1.0, "Gives instructions"),
+        }
+        assert saved > 0
+
+    def test_unparseable_rubrics_are_left_out(self, mocker: MockerFixture) -> None:
+        """Only rubrics with a valid score are returned; the rest fall back."""
+        cm = _make_custom_metrics(mocker)
+        mocker.patch.object(
+            cm,
+            "_call_llm",
+            return_value=json.dumps(
+                {
+                    "answer_correctness": {"score": "n/a"},
+                    "intent_eval": {"score": 0, "reason": "Declines"},
+                }
+            ),
+        )
+        mocker.patch.object(cm, "_llm", mocker.Mock())
+        cm.llm.count_tokens.return_value = 10
+
+        results, _ = cm.evaluate_fused(_FUSED_METRICS, None, _make_scope(_FUSED_TURN))
+
+        assert results == {"intent_eval": (0.0, "Declines")}
+
+    def test_invalid_answer_or_llm_error_returns_nothing(
+        self, mocker: MockerFixture
+    ) -> None:
+        """A non-JSON answer or a failed call leaves every metric to fall back."""
+        cm = _make_custom_metrics(mocker)
+        scope = _make_scope(_FUSED_TURN)
+        mocker.patch.object(cm, "_call_llm", return_value="Score: 0.9")
+        assert cm.evaluate_fused(_FUSED_METRICS, None, scope) == ({}, 0)
+
+        mocker.patch.object(cm, "_call_llm", side_effect=LLMError("timeout"))
+        assert cm.evaluate_fused(_FUSED_METRICS, None, scope) == ({}, 0)
+
+    def test_needs_two_applicable_rubrics(self, mocker: MockerFixture) -> None:
+        """A turn without an expected intent has nothing to fuse."""
+        cm = _make_custom_metrics(mocker)
+        call_llm = mocker.patch.object(cm, "_call_llm")
+        turn = _FUSED_TURN.model_copy(update={"expected_intent": None})
+
+        assert cm.evaluate_fused(_FUSED_METRICS, None, _make_scope(turn)) == ({}, 0)
+        call_llm.assert_not_called()
+
+
 def _make_custom_metrics(mocker: MockerFixture) -> CustomMetrics:
     """Create a CustomMetrics instance with mocked LLM manager."""
     mock_llm_manager = mocker.Mock()
@@ -395,8 +515,8 @@ class TestProposalEvaluationCorrectness:
         assert "Diagnosis: memory too low" in prompt
         assert "Increase memory limit to 512Mi" in prompt
 
-    def test_prompt_contains_sre_persona(self, mocker: MockerFixture) -> None:
-        """Test that the prompt includes the SRE persona."""
+    def test_instructions_contain_sre_persona(self, mocker: MockerFixture) -> None:
+        """Test that the static instructions, not the data prompt, hold the SRE persona."""
         cm = _make_custom_metrics(mocker)
         call_spy = mocker.patch.object(
             cm, "_call_llm", return_value=_LLM_RESPONSE_ALL_DIMS
@@ -410,10 +530,11 @@ class TestProposalEvaluationCorrectness:
         )
         cm.evaluate(METRIC_NAME, None, _make_scope(turn))
 
-        prompt: str = call_spy.call_args[0][0]
-        assert "automated remediation workflow" in prompt
-        assert "OpenShift/Kubernetes" in prompt
-        assert "strict, objective, and critical" in prompt
+        prompt, instructions = call_spy.call_args[0]
+        assert "automated remediation workflow" in instructions
+        assert "OpenShift/Kubernetes" in instructions
+        assert "strict, objective, and critical" in instructions
+        assert "automated remediation workflow" not in prompt
 
     def test_prompt_contains_workflow_phases(self, mocker: MockerFixture) -> None:
         """Test that the prompt includes workflow phases when set."""
@@ -8,7 +8,7 @@ import pytest
 from pytest_mock import MockerFixture
 
 from lightspeed_evaluation.core.metrics.deepeval import DeepEvalMetrics
-from lightspeed_evaluation.core.models import EvaluationScope
+from lightspeed_evaluation.core.models import EvaluationScope, TurnData
 
 
 class TestDeepEvalMetrics:
@@ -96,34 +96,6 @@ class TestDeepEvalMetrics:
 
         assert reason == "No score returned"
 
-    def test_initialization_with_cache(
-        self,
-        mock_llm_manager: Any,
-        mock_metric_manager: Any,
-        mocker: MockerFixture,
-    ) -> None:
-        """Test initialization when cache is enabled."""
-        mock_config = mocker.MagicMock()
-        mock_config.cache_enabled = True
-        mock_config.cache_dir = "/tmp/test_cache"
-        mock_llm_manager.get_config.return_value = mock_config
-
-        mock_litellm = mocker.patch(
-            "lightspeed_evaluation.core.metrics.deepeval.litellm"
-        )
-        mock_litellm.cache = None
-        mock_cache_class = mocker.patch(
-            "lightspeed_evaluation.core.metrics.deepeval.Cache"
-        )
-        mocker.patch("lightspeed_evaluation.core.metrics.deepeval.DeepEvalLLMManager")
-        mocker.patch("lightspeed_evaluation.core.metrics.deepeval.GEvalHandler")
-
-        DeepEvalMetrics(
-            llm_manager=mock_llm_manager, metric_manager=mock_metric_manager
-        )
-
-        mock_cache_class.assert_called_once()
-
     def test_evaluate_conversation_completeness(
         self,
         deepeval_metrics: DeepEvalMetrics,
@@ -241,3 +213,176 @@ class TestDeepEvalMetrics:
             turn_data=None,
             is_conversation=True,
         )
+
+    def test_evaluate_batch_routes_turn_geval_to_batch(
+        self,
+        deepeval_metrics: DeepEvalMetrics,
+        mock_conv_data: Any,
+        mocker: MockerFixture,
+    ) -> None:
+        """Turn-level GEval batches go to the concurrent GEval batch path."""
+        mock_geval = mocker.MagicMock()
+        mock_geval.evaluate_batch.return_value = [(0.9, "a"), (0.8, "b")]
+        deepeval_metrics.geval_handler = mock_geval
+        turns = [TurnData(turn_id=str(i), query=f"Q{i}") for i in range(2)]
+        scopes = [
+            EvaluationScope(turn_idx=i, turn_data=turn, is_conversation=False)
+            for i, turn in enumerate(turns)
+        ]
+
+        results = deepeval_metrics.evaluate_batch(
+            "geval:custom_metric", mock_conv_data, scopes, max_concurrency=2
+        )
+
+        assert results == [(0.9, "a"), (0.8, "b")]
+        mock_geval.evaluate_batch.assert_called_once_with(
+            "custom_metric", mock_conv_data, turns, max_concurrency=2
+        )
+
+    def test_evaluate_batch_falls_back_for_standard_metrics(
+        self,
+        deepeval_metrics: DeepEvalMetrics,
+        mock_conv_data: Any,
+        mocker: MockerFixture,
+    ) -> None:
+        """Standard metrics are evaluated one scope at a time."""
+        evaluate = mocker.patch.object(
+            deepeval_metrics, "evaluate", return_value=(0.7, "ok")
+        )
+        scope = EvaluationScope(turn_idx=None, turn_data=None, is_conversation=True)
+
+        results = deepeval_metrics.evaluate_batch(
+            "conversation_completeness", mock_conv_data, [scope, scope]
+        )
+
+        assert results == [(0.7, "ok"), (0.7, "ok")]
+        assert evaluate.call_count == 2
+
+
+class TestWindowedConversationMetrics:
+    """Tests for sliding-window evaluation of conversation metrics."""
+
+    @staticmethod
+    def _conversation(mocker: MockerFixture, turn_count: int) -> Any:
+        """Build conversation data with numbered turns."""
+        conv_data = mocker.MagicMock()
+        conv_data.turns = [
+            TurnData(turn_id=str(i), query=f"Q{i}", response=f"A{i}")
+            for i in range(1, turn_count + 1)
+        ]
+        return conv_data
+
+    @staticmethod
+    def _mock_metric_class(
+        mocker: MockerFixture, name: str, scores: dict[str, float]
+    ) -> Any:
+        """Patch a DeepEval metric whose score depends on the window's first query."""
+        metric_cls = mocker.patch(f"lightspeed_evaluation.core.metrics.deepeval.{name}")
+
+        def build(**_kwargs: Any) -> Any:
+            metric = mocker.MagicMock()
+
+            async def a_measure(test_case: Any, **_kw: Any) -> None:
+                first_query = test_case.turns[0].content
+                if first_query not in scores:
+                    raise RuntimeError(f"judge failed on {first_query}")
+                metric.score = scores[first_query]
+                metric.reason = f"window from {first_query}"
+
+            metric.a_measure = a_measure
+            return metric
+
+        metric_cls.side_effect = build
+        return metric_cls
+
+    def test_windows_scored_and_reduced(
+        self,
+        deepeval_metrics: DeepEvalMetrics,
+        mock_metric_manager: Any,
+        mocker: MockerFixture,
+    ) -> None:
+        """Each window is scored separately and the reducer combines them."""
+        mock_metric_manager.get_metric_metadata.return_value = {
+            "threshold": 0.7,
+            "window": {"size": 4, "stride": 2, "reducer": "min"},
+        }
+        metric_cls = self._mock_metric_class(
+            mocker,
+            "ConversationCompletenessMetric",
+            {"Q1": 0.9, "Q3": 0.6, "Q5": 0.8},
+        )
+        scope = EvaluationScope(turn_idx=None, turn_data=None, is_conversation=True)
+
+        score, reason = deepeval_metrics.evaluate(
+            "conversation_completeness", self._conversation(mocker, 8), scope
+        )
+
+        assert score == 0.6
+        assert metric_cls.call_count == 3
+        assert "min of 3 windows (size 4, stride 2): 0.60" in reason
+        assert "turns 1-4: 0.90; turns 3-6: 0.60; turns 5-8: 0.80" in reason
+        assert "Lowest window (turns 3-6, 0.60): window from Q3" in reason
+
+    def test_short_conversation_uses_single_evaluation(
+        self,
+        deepeval_metrics: DeepEvalMetrics,
+        mock_metric_manager: Any,
+        mocker: MockerFixture,
+    ) -> None:
+        """Conversations that fit in one window are scored as before."""
+        mock_metric_manager.get_metric_metadata.return_value = {"window": {"size": 10}}
+        mocker.patch("lightspeed_evaluation.core.metrics.deepeval.TurnRelevancyMetric")
+        evaluate_metric = mocker.patch.object(
+            deepeval_metrics, "_evaluate_metric", return_value=(0.8, "Relevant")
+        )
+        scope = EvaluationScope(turn_idx=None, turn_data=None, is_conversation=True)
+
+        result = deepeval_metrics.evaluate(
+            "conversation_relevancy", self._conversation(mocker, 3), scope
+        )
+
+        assert result == (0.8, "Relevant")
+        evaluate_metric.assert_called_once()
+
+    def test_failed_window_fails_metric(
+        self,
+        deepeval_metrics: DeepEvalMetrics,
+        mock_metric_manager: Any,
+        mocker: MockerFixture,
+    ) -> None:
+        """A window that fails to score makes the whole metric fail."""
+        mock_metric_manager.get_metric_metadata.return_value = {"window": {"size": 2}}
+        self._mock_metric_class(mocker, "KnowledgeRetentionMetric", {"Q1": 0.9})
+        scope = EvaluationScope(turn_idx=None, turn_data=None, is_conversation=True)
+
+        score, reason = deepeval_metrics.evaluate(
+            "knowledge_retention", self._conversation(mocker, 4), scope
+        )
+
+        assert score is None
+        assert "window turns 3-4" in reason
+        assert "judge failed on Q3" in reason
+
+    def test_invalid_window_reported(
+        self,
+        deepeval_metrics: DeepEvalMetrics,
+        mock_metric_manager: Any,
+        mocker: MockerFixture,
+    ) -> None:
+        """Invalid windows and single-turn retention windows are rejected."""
+        scope = EvaluationScope(turn_idx=None, turn_data=None, is_conversation=True)
+        conv_data = self._conversation(mocker, 4)
+
+        mock_metric_manager.get_metric_metadata.return_value = {"window": {"size": 0}}
+        score, reason = deepeval_metrics.evaluate(
+            "conversation_completeness", conv_data, scope
+        )
+        assert score is None
+        assert "Invalid window configuration" in reason
+
+        mock_metric_manager.get_metric_metadata.return_value = {"window": {"size": 1}}
+        score, reason = deepeval_metrics.evaluate(
+            "knowledge_retention", conv_data, scope
+        )
+        assert score is None
+        assert reason == "Knowledge retention windows require at least 2 turns"
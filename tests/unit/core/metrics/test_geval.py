@@ -1,7 +1,8 @@
-# pylint: disable=too-many-public-methods,protected-access
+# pylint: disable=too-many-public-methods,protected-access,too-many-lines
 
 """Tests for GEval metrics handler."""
 
+import asyncio
 import logging
 from typing import Any
 
@@ -11,6 +12,7 @@ from deepeval.test_case import LLMTestCaseParams
 from pytest_mock import MockerFixture
 
 from lightspeed_evaluation.core.metrics.geval import GEvalHandler
+from lightspeed_evaluation.core.metrics.geval_steps import steps_key
 from lightspeed_evaluation.core.metrics.manager import MetricLevel
 
 
@@ -875,3 +877,187 @@ class TestGEvalHandler:
             is_conversation=False,
         )
         assert score == 0.85
+
+
+class TestGEvalStepsReuse:
+    """Test reuse of generated evaluation steps and batched a_measure."""
+
+    @pytest.fixture
+    def mock_llm_manager(self, mocker: MockerFixture) -> Any:
+        """Create a mock DeepEvalLLMManager for a named judge model."""
+        mock_manager = mocker.MagicMock()
+        mock_manager.model_name = "openai/gpt-4o-mini"
+        return mock_manager
+
+    @pytest.fixture
+    def handler(self, mock_llm_manager: Any, mocker: MockerFixture) -> GEvalHandler:
+        """Create a handler whose metric config has criteria but no steps."""
+        metric_manager = mocker.MagicMock()
+        metric_manager.get_metric_metadata.return_value = {
+            "criteria": "Is the answer correct?",
+            "evaluation_params": ["query", "response"],
+            "threshold": 0.5,
+        }
+        return GEvalHandler(
+            deepeval_llm_manager=mock_llm_manager,
+            metric_manager=metric_manager,
+        )
+
+    @staticmethod
+    def _turn(mocker: MockerFixture, query: str) -> Any:
+        """Build turn data with only a query and response."""
+        turn_data = mocker.MagicMock()
+        turn_data.query = query
+        turn_data.response = "R"
+        turn_data.expected_response = None
+        turn_data.contexts = None
+        return turn_data
+
+    @staticmethod
+    def _mock_geval(mocker: MockerFixture) -> Any:
+        """Patch GEval so each instance "generates" steps unless given some."""
+        created: list[Any] = []
+
+        def build(**kwargs: Any) -> Any:
+            metric = mocker.MagicMock()
+            metric.evaluation_steps = kwargs.get("evaluation_steps")
+            metric.score = 0.75
+            metric.reason = "Fine"
+
+            def generate(*_args: Any, **_kwargs: Any) -> None:
+                if metric.evaluation_steps is None:
+                    metric.evaluation_steps = ["Generated step"]
+
+            metric.measure.side_effect = generate
+            metric.a_measure = mocker.AsyncMock(side_effect=generate)
+            created.append(metric)
+            return metric
+
+        mock_geval_class = mocker.patch(
+            "lightspeed_evaluation.core.metrics.geval.GEval", side_effect=build
+        )
+        mock_geval_class.created = created
+        return mock_geval_class
+
+    def test_generated_steps_reused_for_later_turns(
+        self, handler: GEvalHandler, mocker: MockerFixture
+    ) -> None:
+        """Only the first turn generates steps; later turns receive them."""
+        mock_geval_class = self._mock_geval(mocker)
+
+        for query in ("Q1", "Q2", "Q3"):
+            score, _ = handler.evaluate(
+                "correctness", mocker.MagicMock(), 0, self._turn(mocker, query), False
+            )
+            assert score == 0.75
+
+        calls = mock_geval_class.call_args_list
+        assert "evaluation_steps" not in calls[0].kwargs
+        assert all(
+            c.kwargs["evaluation_steps"] == ["Generated step"] for c in calls[1:]
+        )
+        assert len(handler.steps_cache) == 1
+
+    def test_configured_steps_bypass_cache(
+        self, handler: GEvalHandler, mocker: MockerFixture
+    ) -> None:
+        """Metrics with explicit evaluation_steps never touch the cache."""
+        self._mock_geval(mocker)
+        handler.metric_manager.get_metric_metadata.return_value = {
+            "criteria": "Is the answer correct?",
+            "evaluation_steps": ["Explicit step"],
+            "threshold": 0.5,
+        }
+
+        handler.evaluate("m", mocker.MagicMock(), 0, self._turn(mocker, "Q"), False)
+
+        assert len(handler.steps_cache) == 0
+
+    def test_batch_generates_steps_once_and_keeps_order(
+        self, handler: GEvalHandler, mocker: MockerFixture
+    ) -> None:
+        """A batch generates steps with one turn and scores the rest with them."""
+        mock_geval_class = self._mock_geval(mocker)
+        turns = [self._turn(mocker, f"Q{i}") for i in range(4)] + [None]
+
+        results = handler.evaluate_batch(
+            "correctness", mocker.MagicMock(), turns, max_concurrency=2
+        )
+
+        assert results[:4] == [(0.75, "Fine")] * 4
+        assert results[4] == (None, "Turn data required for turn-level GEval")
+        calls = mock_geval_class.call_args_list
+        assert sum("evaluation_steps" not in c.kwargs for c in calls) == 1
+        assert all(m.a_measure.await_count == 1 for m in mock_geval_class.created)
+
+    def test_batch_reports_failures_per_turn(
+        self, handler: GEvalHandler, mocker: MockerFixture
+    ) -> None:
+        """A failing a_measure only fails its own turn."""
+        mock_geval_class = self._mock_geval(mocker)
+        handler.steps_cache.put(
+            steps_key(
+                "openai/gpt-4o-mini",
+                "Is the answer correct?",
+                ["input", "actual_output"],
+            ),
+            ["Cached step"],
+        )
+        original = mock_geval_class.side_effect
+
+        def build(**kwargs: Any) -> Any:
+            metric = original(**kwargs)
+            if len(mock_geval_class.created) == 2:
+                metric.a_measure.side_effect = RuntimeError("judge timeout")
+            return metric
+
+        mock_geval_class.side_effect = build
+
+        results = handler.evaluate_batch(
+            "correctness",
+            mocker.MagicMock(),
+            [self._turn(mocker, "Q1"), self._turn(mocker, "Q2")],
+        )
+
+        assert results[0] == (0.75, "Fine")
+        assert results[1] == (None, "GEval evaluation error: judge timeout")
+        assert all(
+            c.kwargs["evaluation_steps"] == ["Cached step"]
+            for c in mock_geval_class.call_args_list
+        )
+
+    def test_batch_concurrency_is_bounded(
+        self, handler: GEvalHandler, mocker: MockerFixture
+    ) -> None:
+        """No more than max_concurrency a_measure calls run at the same time."""
+        mock_geval_class = self._mock_geval(mocker)
+        original = mock_geval_class.side_effect
+        in_flight = 0
+        peak = 0
+
+        async def a_measure(*_args: Any, **_kwargs: Any) -> None:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        def build(**kwargs: Any) -> Any:
+            metric = original(**kwargs)
+            metric.evaluation_steps = ["Step"]
+            metric.a_measure = a_measure
+            return metric
+
+        mock_geval_class.side_effect = build
+
+        results = handler.evaluate_batch(
+            "correctness",
+            mocker.MagicMock(),
+            [self._turn(mocker, f"Q{i}") for i in range(8)],
+            max_concurrency=3,
+        )
+
+        assert results == [(0.75, "Fine")] * 8
+        assert peak == 3
+        with pytest.raises(ValueError, match="max_concurrency"):
+            handler.evaluate_batch("correctness", mocker.MagicMock(), [], 0)
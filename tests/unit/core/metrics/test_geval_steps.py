@@ -0,0 +1,81 @@
+"""Unit tests for the GEval evaluation steps cache."""
+
+import json
+from pathlib import Path
+
+from lightspeed_evaluation.core.metrics.geval_steps import (
+    GEvalStepsCache,
+    steps_key,
+)
+
+KEY = steps_key("openai/gpt-4o-mini", "Is it correct?", ["input", "actual_output"])
+
+
+class TestGEvalStepsCache:
+    """Unit tests for GEvalStepsCache."""
+
+    def test_put_ignores_invalid_steps(self) -> None:
+        """Only non-empty lists of strings are cached."""
+        cache = GEvalStepsCache()
+
+        assert not cache.put(KEY, None)
+        assert not cache.put(KEY, [])
+        assert not cache.put(KEY, ["ok", 3])
+        assert cache.put(KEY, ["Check facts"])
+        assert cache.get(KEY) == ["Check facts"]
+
+    def test_key_distinguishes_model_criteria_and_params(self) -> None:
+        """Each input of the generation prompt is part of the key."""
+        keys = {
+            KEY,
+            steps_key("openai/gpt-4o", "Is it correct?", ["input", "actual_output"]),
+            steps_key(
+                "openai/gpt-4o-mini", "Is it polite?", ["input", "actual_output"]
+            ),
+            steps_key("openai/gpt-4o-mini", "Is it correct?", ["input"]),
+            steps_key("openai/gpt-4o-mini", "Is it correct?", None),
+        }
+        assert len(keys) == 5
+
+    def test_round_trip_through_file(self, tmp_path: Path) -> None:
+        """Saved steps are loaded by a later cache."""
+        path = tmp_path / "out" / "geval_steps.json"
+        cache = GEvalStepsCache()
+        cache.put(KEY, ["Step 1", "Step 2"])
+        cache.put(steps_key("m", "c", None), ["Only step"])
+
+        assert cache.save(path)
+
+        later = GEvalStepsCache()
+        assert later.load(path) == 2
+        assert later.get(KEY) == ["Step 1", "Step 2"]
+        assert later.get(steps_key("m", "c", None)) == ["Only step"]
+
+    def test_save_only_when_new_steps(self, tmp_path: Path) -> None:
+        """Nothing is written unless steps were generated since loading."""
+        path = tmp_path / "geval_steps.json"
+        cache = GEvalStepsCache()
+        assert not cache.save(path)
+        assert not path.exists()
+
+        cache.put(KEY, ["Step"])
+        assert cache.save(path)
+        assert not cache.save(path)
+
+        later = GEvalStepsCache()
+        later.load(path)
+        assert not later.save(path)
+
+    def test_unreadable_file_is_ignored(self, tmp_path: Path) -> None:
+        """Missing, corrupt or foreign files load nothing without raising."""
+        cache = GEvalStepsCache()
+        assert cache.load(tmp_path / "missing.json") == 0
+
+        corrupt = tmp_path / "corrupt.json"
+        corrupt.write_text("{not json", encoding="utf-8")
+        assert cache.load(corrupt) == 0
+
+        foreign = tmp_path / "foreign.json"
+        foreign.write_text(json.dumps({"version": 99, "entries": []}), encoding="utf-8")
+        assert cache.load(foreign) == 0
+        assert len(cache) == 0
@@ -420,3 +420,82 @@ class TestMetricManager:
 
         # Should use turn-level override, not system default
         assert threshold == 0.95
+
+    def test_resolve_frameworks_collects_turn_and_conversation_metrics(
+        self, system_config: SystemConfig
+    ) -> None:
+        """Frameworks come from explicit and default metrics at both levels."""
+        manager = MetricManager(system_config)
+        conv_data = EvaluationData(
+            conversation_group_id="conv",
+            turns=[
+                TurnData(turn_id="1", query="Q", turn_metrics=["nlp:bleu"]),
+                TurnData(turn_id="2", query="Q", turn_metrics=[]),
+            ],
+            conversation_metrics=["deepeval:conversation_completeness"],
+        )
+
+        assert manager.resolve_frameworks([conv_data]) == {"nlp", "deepeval"}
+
+    def test_resolve_frameworks_empty_data(self, system_config: SystemConfig) -> None:
+        """No conversations means no frameworks to prepare."""
+        assert not MetricManager(system_config).resolve_frameworks([])
+
+    def test_get_metric_gates_merges_turn_override(
+        self, system_config: SystemConfig
+    ) -> None:
+        """Gates come from effective metadata; a single gate becomes a list."""
+        manager = MetricManager(system_config)
+        turn_data = TurnData(
+            turn_id="1",
+            query="Q",
+            turn_metrics_metadata={"ragas:faithfulness": {"gated_by": "nlp:rouge"}},
+        )
+
+        assert manager.get_metric_gates(
+            "ragas:faithfulness", MetricLevel.TURN, turn_data=turn_data
+        ) == ["nlp:rouge"]
+        assert not manager.get_metric_gates("ragas:faithfulness", MetricLevel.TURN)
+
+    def test_order_by_gates_puts_gates_first(self, system_config: SystemConfig) -> None:
+        """Gates move ahead of gated metrics; other metrics keep their order."""
+        manager = MetricManager(system_config)
+        turn_data = TurnData(
+            turn_id="1",
+            query="Q",
+            turn_metrics_metadata={
+                "ragas:faithfulness": {"gated_by": ["nlp:rouge", "nlp:bleu"]},
+                "custom:answer_correctness": {"gated_by": "ragas:faithfulness"},
+            },
+        )
+        metrics = [
+            "custom:answer_correctness",
+            "ragas:faithfulness",
+            "custom:keywords_eval",
+            "nlp:rouge",
+        ]
+
+        assert manager.order_by_gates(metrics, MetricLevel.TURN, None, turn_data) == [
+            "custom:keywords_eval",
+            "nlp:rouge",
+            "ragas:faithfulness",
+            "custom:answer_correctness",
+        ]
+
+    def test_order_by_gates_keeps_cycles_in_order(
+        self, system_config: SystemConfig
+    ) -> None:
+        """Metrics gating each other are left in their configured order."""
+        manager = MetricManager(system_config)
+        turn_data = TurnData(
+            turn_id="1",
+            query="Q",
+            turn_metrics_metadata={
+                "nlp:rouge": {"gated_by": "nlp:bleu"},
+                "nlp:bleu": {"gated_by": "nlp:rouge"},
+            },
+        )
+
+        assert manager.order_by_gates(
+            ["nlp:rouge", "nlp:bleu"], MetricLevel.TURN, None, turn_data
+        ) == ["nlp:rouge", "nlp:bleu"]
@@ -1,13 +1,17 @@
 """Unit tests for RagasMetrics."""
 
+import asyncio
 import concurrent.futures
+import threading
+from typing import Any
 
 import pytest
 from pytest_mock import MockerFixture
 
 from lightspeed_evaluation.core.embedding.manager import EmbeddingError
-from lightspeed_evaluation.core.metrics.ragas import RagasMetrics
-from lightspeed_evaluation.core.models import EvaluationScope
+from lightspeed_evaluation.core.llm.token_tracker import TokenTracker
+from lightspeed_evaluation.core.metrics.ragas import RagasMetrics, _ScoringLoop
+from lightspeed_evaluation.core.models import EvaluationScope, TurnData
 from lightspeed_evaluation.core.system.exceptions import (
     ConfigurationError,
     EvaluationError,
@@ -112,3 +116,260 @@ class TestEvaluateExceptionHandling:
 
         assert score is None
         assert "Unsupported Ragas metric" in reason
+
+
+def _scope(query: str) -> EvaluationScope:
+    """Build a turn-level scope for the given query."""
+    return EvaluationScope(
+        turn_idx=0,
+        turn_data=TurnData(turn_id="t", query=query, response="r", contexts=["c"]),
+        is_conversation=False,
+    )
+
+
+def _mock_metric_class(mocker: MockerFixture, name: str, value: float) -> Any:
+    """Patch a Ragas metric class whose instances score ``value`` via ascore."""
+    mock_cls = mocker.patch(f"lightspeed_evaluation.core.metrics.ragas.{name}")
+    mock_cls.return_value.ascore = mocker.AsyncMock(
+        return_value=mocker.MagicMock(value=value)
+    )
+    return mock_cls
+
+
+class TestMetricReuse:
+    """Test that metric instances are built once and scored asynchronously."""
+
+    def test_metric_instance_reused_across_turns(
+        self,
+        ragas_metrics: RagasMetrics,
+        turn_scope: EvaluationScope,
+        mocker: MockerFixture,
+    ) -> None:
+        """Repeated evaluations should reuse one metric object via ascore()."""
+        mock_cls = _mock_metric_class(mocker, "Faithfulness", 0.8)
+
+        for _ in range(3):
+            score, reason = ragas_metrics.evaluate(
+                "faithfulness", mocker.MagicMock(), turn_scope
+            )
+
+        assert score == 0.8
+        assert reason == "Ragas faithfulness: 0.80"
+        mock_cls.assert_called_once()
+        assert mock_cls.return_value.ascore.await_count == 3
+
+    def test_instances_cached_per_metric(
+        self,
+        ragas_metrics: RagasMetrics,
+        turn_scope: EvaluationScope,
+        mocker: MockerFixture,
+    ) -> None:
+        """Each metric gets its own instance; embeddings load only when needed."""
+        embedding_cls = mocker.patch(
+            "lightspeed_evaluation.core.metrics.ragas.RagasEmbeddingManager",
+        )
+        faithfulness_cls = _mock_metric_class(mocker, "Faithfulness", 0.7)
+        relevancy_cls = _mock_metric_class(mocker, "AnswerRelevancy", 0.6)
+
+        ragas_metrics.evaluate("faithfulness", mocker.MagicMock(), turn_scope)
+        embedding_cls.assert_not_called()
+
+        for _ in range(2):
+            score, _ = ragas_metrics.evaluate(
+                "response_relevancy", mocker.MagicMock(), turn_scope
+            )
+
+        assert score == 0.6
+        faithfulness_cls.assert_called_once()
+        relevancy_cls.assert_called_once()
+        embedding_cls.assert_called_once()
+
+
+class TestEvaluateBatch:
+    """Test scoring many turns at once."""
+
+    def test_results_in_scope_order(
+        self, ragas_metrics: RagasMetrics, mocker: MockerFixture
+    ) -> None:
+        """Batch results line up with the scopes they were given."""
+        mock_cls = mocker.patch(
+            "lightspeed_evaluation.core.metrics.ragas.ContextRecall",
+        )
+
+        async def ascore(**kwargs: Any) -> Any:
+            return mocker.MagicMock(value=len(kwargs["user_input"]) / 10)
+
+        mock_cls.return_value.ascore = ascore
+        scopes = [_scope("a" * n) for n in (1, 5, 3)]
+
+        results = ragas_metrics.evaluate_batch(
+            "context_recall", mocker.MagicMock(), scopes
+        )
+
+        assert [score for score, _ in results] == [0.1, 0.5, 0.3]
+        mock_cls.assert_called_once()
+
+    def test_concurrency_is_bounded(
+        self, ragas_metrics: RagasMetrics, mocker: MockerFixture
+    ) -> None:
+        """No more than max_concurrency turns are scored at the same time."""
+        mock_cls = mocker.patch(
+            "lightspeed_evaluation.core.metrics.ragas.Faithfulness",
+        )
+        in_flight = 0
+        peak = 0
+
+        async def ascore(**_kwargs: Any) -> Any:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return mocker.MagicMock(value=1.0)
+
+        mock_cls.return_value.ascore = ascore
+
+        results = ragas_metrics.evaluate_batch(
+            "faithfulness",
+            mocker.MagicMock(),
+            [_scope(str(i)) for i in range(10)],
+            max_concurrency=3,
+        )
+
+        assert len(results) == 10
+        assert peak == 3
+
+    def test_batch_runs_on_handler_loop(
+        self, ragas_metrics: RagasMetrics, mocker: MockerFixture
+    ) -> None:
+        """Batches use the handler's scoring loop, which close() stops."""
+        mock_cls = mocker.patch(
+            "lightspeed_evaluation.core.metrics.ragas.Faithfulness",
+        )
+        threads: set[int] = set()
+
+        async def ascore(**_kwargs: Any) -> Any:
+            threads.add(threading.get_ident())
+            return mocker.MagicMock(value=1.0)
+
+        mock_cls.return_value.ascore = ascore
+
+        ragas_metrics.evaluate_batch(
+            "faithfulness", mocker.MagicMock(), [_scope("a"), _scope("b")]
+        )
+        thread = ragas_metrics._scoring_loop._thread  # pylint: disable=protected-access
+        ragas_metrics.close()
+
+        assert thread is not None
+        assert threads == {thread.ident}
+
+    def test_failures_are_per_turn(
+        self, ragas_metrics: RagasMetrics, mocker: MockerFixture
+    ) -> None:
+        """One failing turn does not affect the rest of the batch."""
+        mock_cls = mocker.patch(
+            "lightspeed_evaluation.core.metrics.ragas.Faithfulness",
+        )
+
+        async def ascore(**kwargs: Any) -> Any:
+            if kwargs["user_input"] == "bad":
+                raise ValueError("judge returned garbage")
+            return mocker.MagicMock(value=0.9)
+
+        mock_cls.return_value.ascore = ascore
+
+        results = ragas_metrics.evaluate_batch(
+            "faithfulness", mocker.MagicMock(), [_scope("ok"), _scope("bad")]
+        )
+
+        assert results[0] == (0.9, "Ragas faithfulness: 0.90")
+        assert results[1][0] is None
+        assert "judge returned garbage" in results[1][1]
+
+    def test_unsupported_metric_and_invalid_concurrency(
+        self, ragas_metrics: RagasMetrics, mocker: MockerFixture
+    ) -> None:
+        """Unsupported metrics fail per scope; a concurrency below 1 is rejected."""
+        results = ragas_metrics.evaluate_batch(
+            "nonexistent_metric", mocker.MagicMock(), [_scope("a"), _scope("b")]
+        )
+        assert [score for score, _ in results] == [None, None]
+
+        with pytest.raises(ValueError, match="max_concurrency"):
+            ragas_metrics.evaluate_batch(
+                "faithfulness", mocker.MagicMock(), [], max_concurrency=0
+            )
+
+
+class TestClose:
+    """Test releasing the handler's scoring loop."""
+
+    def test_close_stops_loop_and_allows_reuse(
+        self, ragas_metrics: RagasMetrics, mocker: MockerFixture
+    ) -> None:
+        """close() joins the loop thread; a later evaluation restarts it."""
+        mock_cls = mocker.patch(
+            "lightspeed_evaluation.core.metrics.ragas.Faithfulness",
+        )
+
+        async def ascore(**_kwargs: Any) -> Any:
+            return mocker.MagicMock(value=0.9)
+
+        mock_cls.return_value.ascore = ascore
+
+        ragas_metrics.evaluate("faithfulness", mocker.MagicMock(), _scope("q"))
+        thread = ragas_metrics._scoring_loop._thread  # pylint: disable=protected-access
+        assert thread is not None and thread.is_alive()
+
+        ragas_metrics.close()
+
+        assert not thread.is_alive()
+        score, _ = ragas_metrics.evaluate(
+            "faithfulness", mocker.MagicMock(), _scope("q")
+        )
+        assert score == 0.9
+        ragas_metrics.close()
+
+    def test_close_without_evaluation(self, ragas_metrics: RagasMetrics) -> None:
+        """close() on a handler that never scored starts no loop."""
+        ragas_metrics.close()
+
+        thread = ragas_metrics._scoring_loop._thread  # pylint: disable=protected-access
+        assert thread is None
+
+
+class TestScoringLoop:
+    """Test the persistent event loop that runs Ragas coroutines."""
+
+    def test_loop_is_reused_and_caller_context_propagates(self) -> None:
+        """Calls share one loop thread and see the caller's token tracker."""
+        scoring_loop = _ScoringLoop()
+        tracker = TokenTracker()
+
+        async def observe() -> tuple[int, Any]:
+            return threading.get_ident(), TokenTracker.get_active()
+
+        tracker.start()
+        try:
+            first_thread, first_tracker = scoring_loop.run(observe())
+            second_thread, _ = scoring_loop.run(observe())
+        finally:
+            tracker.stop()
+            scoring_loop.close()
+
+        assert first_thread == second_thread != threading.get_ident()
+        assert first_tracker is tracker
+
+    def test_restarts_after_close(self) -> None:
+        """A closed loop is started again on next use."""
+        scoring_loop = _ScoringLoop()
+
+        async def answer() -> int:
+            return 42
+
+        scoring_loop.run(answer())
+        scoring_loop.close()
+        try:
+            assert scoring_loop.run(answer()) == 42
+        finally:
+            scoring_loop.close()
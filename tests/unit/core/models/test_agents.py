@@ -65,6 +65,21 @@ class TestHttpApiAgentConfig:
         with pytest.raises(ValidationError):
             HttpApiAgentConfig(timeout=0)
 
+    @pytest.mark.parametrize(
+        "settings",
+        [
+            {"connect_timeout": 0},
+            {"read_timeout": -1},
+            {"max_connections": 0},
+            {"max_keepalive_connections": -1},
+            {"keepalive_expiry": -0.5},
+        ],
+    )
+    def test_connection_settings_validation(self, settings: dict[str, float]) -> None:
+        """Test invalid connection pool and timeout settings are rejected."""
+        with pytest.raises(ValidationError):
+            HttpApiAgentConfig(**settings)
+
     def test_num_retries_must_be_non_negative(self) -> None:
         """Test num_retries must be >= 0."""
         with pytest.raises(ValidationError):
@@ -3,6 +3,7 @@
 
 import os
 import tempfile
+from typing import Any
 
 import pytest
 from pydantic import ValidationError
@@ -24,6 +25,7 @@ from lightspeed_evaluation.core.models.agents import (
     HttpApiAgentConfig,
 )
 from lightspeed_evaluation.core.models.llm import (
+    ConversationWindowConfig,
     GEvalConfig,
     GEvalRubricConfig,
     LLMDefaultsConfig,
@@ -33,6 +35,7 @@ from lightspeed_evaluation.core.models.llm import (
 from lightspeed_evaluation.core.models.system import (
     LoggingConfig,
     QualityScoreConfig,
+    SequentialTestConfig,
 )
 from lightspeed_evaluation.core.storage import FileBackendConfig
 from lightspeed_evaluation.core.system.exceptions import ConfigurationError
@@ -320,6 +323,23 @@ class TestLLMPoolConfig:
         with pytest.raises(ConfigurationError, match="Model 'unknown' not found"):
             pool.resolve_llm_config("unknown")
 
+    def test_resolve_llm_config_carries_prices(self) -> None:
+        """Model prices flow into the resolved LLMConfig."""
+        pool = LLMPoolConfig(
+            models={
+                "gpt-4o": LLMProviderConfig(
+                    provider="openai",
+                    input_cost_per_million_tokens=2.5,
+                    output_cost_per_million_tokens=10.0,
+                ),
+            },
+        )
+
+        resolved = pool.resolve_llm_config("gpt-4o")
+
+        assert resolved.input_cost_per_million_tokens == 2.5
+        assert resolved.output_cost_per_million_tokens == 10.0
+
     def test_resolve_llm_config_passes_extras(self) -> None:
         """Extra parameters from LLMParametersConfig flow into LLMConfig.parameters."""
         pool = LLMPoolConfig(
@@ -823,6 +843,86 @@ class TestGEvalRubricValidation:
             )
 
 
+class TestConversationWindowConfig:
+    """Tests for windowed conversation metric configuration."""
+
+    @pytest.mark.parametrize(
+        "size,stride,turns,expected",
+        [
+            (10, 5, 23, [(0, 10), (5, 15), (10, 20), (13, 23)]),
+            (4, None, 10, [(0, 4), (4, 8), (6, 10)]),
+            (10, 5, 3, [(0, 3)]),
+            (3, 1, 5, [(0, 3), (1, 4), (2, 5)]),
+        ],
+    )
+    def test_bounds_cover_every_turn(
+        self,
+        size: int,
+        stride: int | None,
+        turns: int,
+        expected: list[tuple[int, int]],
+    ) -> None:
+        """Windows start every stride turns and the last one ends at the final turn."""
+        assert ConversationWindowConfig(size=size, stride=stride).bounds(turns) == (
+            expected
+        )
+
+    def test_stride_larger_than_size_rejected(self) -> None:
+        """A stride that would skip turns is invalid."""
+        with pytest.raises(ValidationError, match="must not exceed size"):
+            ConversationWindowConfig(size=4, stride=5)
+
+    def test_system_config_rejects_invalid_window(self) -> None:
+        """Invalid windows on deepeval conversation metrics fail at load."""
+        with pytest.raises(
+            ConfigurationError,
+            match="Invalid window config for 'deepeval:knowledge_retention'",
+        ):
+            SystemConfig(
+                default_conversation_metrics_metadata={
+                    "deepeval:knowledge_retention": {
+                        "threshold": 0.7,
+                        "window": {"size": 10, "reducer": "average"},
+                    },
+                }
+            )
+
+
+class TestMetricGatesValidation:
+    """Tests for gated_by rules in metrics metadata."""
+
+    def test_valid_gates_accepted(self) -> None:
+        """A single gate or a list of gates is accepted as configured."""
+        config = SystemConfig(
+            default_turn_metrics_metadata={
+                "ragas:faithfulness": {"gated_by": "nlp:rouge"},
+                "custom:answer_correctness": {
+                    "gated_by": ["nlp:rouge", "custom:keywords_eval"]
+                },
+            }
+        )
+        assert config.default_turn_metrics_metadata["ragas:faithfulness"] == {
+            "gated_by": "nlp:rouge"
+        }
+
+    @pytest.mark.parametrize(
+        "gated_by,match",
+        [
+            ("rouge", "Invalid gated_by for 'ragas:faithfulness'"),
+            ({"nlp:rouge": True}, "Invalid gated_by for 'ragas:faithfulness'"),
+            (["ragas:faithfulness"], "cannot gate itself"),
+        ],
+    )
+    def test_invalid_gates_rejected(self, gated_by: Any, match: str) -> None:
+        """Malformed and self-referencing gates fail at load."""
+        with pytest.raises(ConfigurationError, match=match):
+            SystemConfig(
+                default_turn_metrics_metadata={
+                    "ragas:faithfulness": {"gated_by": gated_by}
+                }
+            )
+
+
 class TestSystemConfigMetricNameProperties:
     """Tests for SystemConfig.turn_level_metric_names and conversation_level_metric_names."""
 
@@ -977,6 +1077,36 @@ class TestQualityScoreConfig:
             )
 
 
+class TestSequentialTestConfig:
+    """Tests for SequentialTestConfig model."""
+
+    def test_disabled_by_default(self) -> None:
+        """The sequential test is off and needs no baseline by default."""
+        config = SystemConfig().sequential_test
+        assert config.enabled is False
+        assert config.baseline_pass_rate is None
+        assert (config.max_drop, config.alpha, config.beta) == (5.0, 0.05, 0.1)
+
+    def test_enabled_requires_baseline(self) -> None:
+        """Enabling the test without a baseline fails."""
+        with pytest.raises(ValidationError, match="requires baseline_pass_rate"):
+            SequentialTestConfig(enabled=True)
+
+    def test_drop_must_leave_positive_rate(self) -> None:
+        """The regression pass rate must stay above zero."""
+        with pytest.raises(ValidationError, match="must be smaller than"):
+            SequentialTestConfig(enabled=True, baseline_pass_rate=4, max_drop=5)
+
+    @pytest.mark.parametrize(
+        "field, value",
+        [("baseline_pass_rate", 100), ("alpha", 0.5), ("beta", 0), ("max_drop", 0)],
+    )
+    def test_out_of_range_values(self, field: str, value: float) -> None:
+        """Rates and error probabilities are bounded."""
+        with pytest.raises(ValidationError):
+            SequentialTestConfig(**{"baseline_pass_rate": 90, field: value})
+
+
 class TestAgentsMigration:
     """Tests for api: -> agents: auto-migration on SystemConfig."""
 
@@ -6,6 +6,7 @@ import pytest
 from pydantic import ValidationError
 
 from lightspeed_evaluation.core.models.trace import (
+    LLMSpanData,
     ModelInfo,
     Span,
     SpanStatus,
@@ -25,6 +26,7 @@ from lightspeed_evaluation.core.models.trace_adapters import (
     trace_from_langfuse,
     trace_from_mlflow,
     trace_from_otel,
+    trace_to_otel,
 )
 from lightspeed_evaluation.core.system.exceptions import DataValidationError
 
@@ -610,3 +612,84 @@ class TestOtelAdapter:
         assert span.metadata["tags"] == ["a", "b"]
         assert span.metadata["meta"] == {"env": "test", "count": 2}
         assert span.metadata["payload"] == "aGVsbG8="
+
+
+class TestOtelExport:
+    """Tests for exporting internal traces as OTLP/JSON."""
+
+    def test_trace_to_otel_round_trips(self) -> None:
+        """Exported traces read back through trace_from_otel unchanged."""
+        start = datetime(2026, 1, 1, 12, 0, 0, tzinfo=UTC)
+        end = datetime(2026, 1, 1, 12, 0, 2, tzinfo=UTC)
+        trace = Trace(
+            trace_id="a" * 32,
+            name="evaluation_run",
+            spans=[
+                Span(
+                    span_id="1" * 16,
+                    trace_id="a" * 32,
+                    name="turn",
+                    span_type=SpanType.CHAIN,
+                    status=SpanStatus.OK,
+                    start_time=start,
+                    end_time=end,
+                    latency=2.0,
+                    metadata={"turn_id": "t1"},
+                ),
+                Span(
+                    span_id="2" * 16,
+                    trace_id="a" * 32,
+                    parent_span_id="1" * 16,
+                    name="judge_call",
+                    span_type=SpanType.GENERATION,
+                    status=SpanStatus.ERROR,
+                    status_message="timeout",
+                    start_time=start,
+                    end_time=end,
+                    latency=1.5,
+                    outputs={"reason": "ok"},
+                    metadata={"cache_hits": 1},
+                    llm=LLMSpanData(
+                        model=ModelInfo(name="gpt-4o-mini", provider="openai"),
+                        token_usage=TokenUsage(
+                            input_tokens=10, output_tokens=5, total_tokens=15
+                        ),
+                    ),
+                ),
+            ],
+        )
+
+        payload = trace_to_otel(trace, service_name="svc")
+        restored = trace_from_otel(payload)
+
+        resource = payload["resourceSpans"][0]["resource"]["attributes"]
+        assert {"key": "service.name", "value": {"stringValue": "svc"}} in resource
+        assert restored.trace_id == trace.trace_id
+        assert restored.name == "evaluation_run"
+        assert len(restored.spans) == 2
+        turn, judge = restored.spans[0], restored.spans[1]
+        assert turn.span_type == SpanType.CHAIN
+        assert turn.start_time == start and turn.end_time == end
+        assert turn.metadata["turn_id"] == "t1"
+        assert judge.parent_span_id == turn.span_id
+        assert judge.span_type == SpanType.GENERATION
+        assert judge.status == SpanStatus.ERROR
+        assert judge.status_message == "timeout"
+        assert judge.latency == 1.5
+        assert judge.outputs == {"reason": "ok"}
+        assert judge.metadata["cache_hits"] == 1
+        assert judge.llm is not None and judge.llm.token_usage is not None
+        assert judge.llm.token_usage.input_tokens == 10
+        assert judge.llm.token_usage.total_tokens == 15
+        assert judge.llm.model is not None
+        assert judge.llm.model.name == "gpt-4o-mini"
+
+    def test_trace_to_otel_session_resource(self) -> None:
+        """The session id is exported as a resource attribute."""
+        trace = Trace(trace_id="b" * 32, name="run", session_id="session-1")
+
+        payload = trace_to_otel(trace)
+
+        resource = payload["resourceSpans"][0]["resource"]["attributes"]
+        assert {"key": "session.id", "value": {"stringValue": "session-1"}} in resource
+        assert payload["resourceSpans"][0]["scopeSpans"][0]["spans"] == []
@@ -8,7 +8,7 @@ from pathlib import Path
 
 from pytest_mock import MockerFixture
 
-from lightspeed_evaluation.core.models import EvaluationResult
+from lightspeed_evaluation.core.models import EvaluationResult, StageTiming
 from lightspeed_evaluation.core.models.quality import QualityReport
 from lightspeed_evaluation.core.models.summary import EvaluationSummary
 from lightspeed_evaluation.core.output.generator import OutputHandler
@@ -63,6 +63,45 @@ class TestOutputHandler:
         # Verify API token usage is included
         assert "Token Usage (API Calls)" in content
 
+    def test_summaries_include_timing_breakdown(
+        self, tmp_path: Path, sample_results: list[EvaluationResult]
+    ) -> None:
+        """Profiled runs add the timing breakdown to the TXT and JSON summaries."""
+        handler = OutputHandler(output_dir=str(tmp_path))
+        summary = EvaluationSummary.from_results(sample_results)
+        summary.timing_breakdown = [
+            StageTiming(
+                stage="agent_call",
+                category="agent",
+                count=2,
+                total_seconds=3.0,
+                mean_seconds=1.5,
+                max_seconds=2.0,
+            )
+        ]
+
+        txt_file = handler._generate_text_summary_from_model(summary, "test")
+        json_file = handler._generate_json_summary_from_model(summary, "test")
+
+        assert "Timing Breakdown" in txt_file.read_text()
+        assert "agent_call" in txt_file.read_text()
+        data = json.loads(json_file.read_text())
+        assert data["timing_breakdown"][0]["stage"] == "agent_call"
+        assert data["timing_breakdown"][0]["total_seconds"] == 3.0
+
+    def test_summaries_omit_timing_breakdown_when_not_profiling(
+        self, tmp_path: Path, sample_results: list[EvaluationResult]
+    ) -> None:
+        """Without profiling, no timing section is written."""
+        handler = OutputHandler(output_dir=str(tmp_path))
+        summary = EvaluationSummary.from_results(sample_results)
+
+        txt_file = handler._generate_text_summary_from_model(summary, "test")
+        json_file = handler._generate_json_summary_from_model(summary, "test")
+
+        assert "Timing Breakdown" not in txt_file.read_text()
+        assert "timing_breakdown" not in json.loads(json_file.read_text())
+
     def test_get_output_directory(self, tmp_path: Path) -> None:
         """Test get output directory."""
         handler = OutputHandler(output_dir=str(tmp_path))
@@ -6,11 +6,13 @@ import pytest
 from lightspeed_evaluation.core.models.data import (
     EvaluationResult,
 )
+from lightspeed_evaluation.core.models.sampling import SamplingPlan, SamplingStratum
 from lightspeed_evaluation.core.models.statistics import OverallStats
 from lightspeed_evaluation.core.output.statistics import (
     bootstrap_intervals,
     compute_overall_stats,
     compute_score_statistics,
+    estimate_sampled_pass_rates,
 )
 
 
@@ -342,3 +344,109 @@ class TestCalculateBasicStats:
             total_embedding_tokens=0,
         )
         assert stats == expected
+
+
+def _result(conv_id: str, metric: str, passed: bool) -> EvaluationResult:
+    """Build a PASS/FAIL result for a conversation and metric."""
+    return EvaluationResult(
+        conversation_group_id=conv_id,
+        metric_identifier=metric,
+        result="PASS" if passed else "FAIL",
+        score=1.0 if passed else 0.0,
+        threshold=0.5,
+    )
+
+
+def _plan(strata: dict[str, tuple[int, list[str]]]) -> SamplingPlan:
+    """Build a plan from {key: (population, sampled conversation IDs)}."""
+    return SamplingPlan(
+        seed=0,
+        population=sum(population for population, _ in strata.values()),
+        strata=[
+            SamplingStratum(key=key, population=population, conversation_ids=ids)
+            for key, (population, ids) in strata.items()
+        ],
+    )
+
+
+class TestEstimateSampledPassRates:
+    """Tests for estimate_sampled_pass_rates function."""
+
+    def test_census_is_exact(self) -> None:
+        """Sampling every conversation gives the exact rate with no uncertainty."""
+        plan = _plan({"a": (2, ["a1", "a2"]), "b": (2, ["b1", "b2"])})
+        results = [
+            _result("a1", "m1", True),
+            _result("a2", "m1", True),
+            _result("b1", "m1", False),
+            _result("b2", "m1", True),
+        ]
+
+        estimate = estimate_sampled_pass_rates(results, plan)
+
+        assert estimate.overall is not None
+        assert estimate.overall.pass_rate == pytest.approx(75.0)
+        ci = estimate.overall.confidence_interval
+        assert ci.low == pytest.approx(75.0)
+        assert ci.high == pytest.approx(75.0)
+        assert estimate.overall.results == 4
+
+    def test_strata_are_weighted_by_population(self) -> None:
+        """A stratum stands in for its whole population, not just its sample."""
+        plan = _plan({"a": (90, ["a1", "a2"]), "b": (10, ["b1", "b2"])})
+        results = [
+            _result("a1", "m1", True),
+            _result("a2", "m1", True),
+            _result("b1", "m1", False),
+            _result("b2", "m1", False),
+        ]
+
+        estimate = estimate_sampled_pass_rates(results, plan)
+
+        assert estimate.overall is not None
+        assert estimate.overall.pass_rate == pytest.approx(90.0)
+
+    def test_interval_covers_estimate(self) -> None:
+        """Partial samples produce an interval around the estimate within 0-100."""
+        plan = _plan({"a": (50, ["a1", "a2", "a3", "a4"])})
+        results = [
+            _result("a1", "m1", True),
+            _result("a2", "m1", False),
+            _result("a3", "m1", True),
+            _result("a4", "m1", True),
+        ]
+
+        estimate = estimate_sampled_pass_rates(results, plan, confidence_level=90)
+
+        assert estimate.overall is not None
+        ci = estimate.overall.confidence_interval
+        assert 0.0 <= ci.low < estimate.overall.pass_rate < ci.high <= 100.0
+        assert ci.confidence_level == 90
+
+    def test_per_metric_estimates(self) -> None:
+        """Every metric gets its own estimate."""
+        plan = _plan({"a": (4, ["a1", "a2"])})
+        results = [
+            _result("a1", "m1", True),
+            _result("a2", "m1", True),
+            _result("a1", "m2", False),
+            _result("a2", "m2", True),
+        ]
+
+        estimate = estimate_sampled_pass_rates(results, plan)
+
+        assert set(estimate.by_metric) == {"m1", "m2"}
+        assert estimate.by_metric["m1"].pass_rate == pytest.approx(100.0)
+        assert estimate.by_metric["m2"].pass_rate == pytest.approx(50.0)
+
+    def test_no_results(self) -> None:
+        """Without results there is nothing to estimate."""
+        estimate = estimate_sampled_pass_rates([], _plan({"a": (3, ["a1"])}))
+
+        assert estimate.overall is None
+        assert not estimate.by_metric
+
+    def test_invalid_confidence(self) -> None:
+        """Confidence levels outside (0, 100) are rejected."""
+        with pytest.raises(ValueError, match="Invalid confidence"):
+            estimate_sampled_pass_rates([], _plan({}), confidence_level=100)
@@ -216,6 +216,8 @@ class TestCalculateBasicStatsWithTokens:
                 threshold=0.7,
                 judge_llm_input_tokens=100,
                 judge_llm_output_tokens=50,
+                judge_llm_input_tokens_saved=40,
+                judge_llm_cached_input_tokens=60,
                 embedding_tokens=100,
             ),
             EvaluationResult(
@@ -234,6 +236,8 @@ class TestCalculateBasicStatsWithTokens:
         assert stats.total_judge_llm_input_tokens == 300
         assert stats.total_judge_llm_output_tokens == 150
         assert stats.total_judge_llm_tokens == 450
+        assert stats.total_judge_llm_input_tokens_saved == 40
+        assert stats.total_judge_llm_cached_input_tokens == 60
 
         assert stats.total_embedding_tokens == 350
         assert stats.total_embedding_tokens == 350
@@ -0,0 +1,219 @@
+"""Unit tests for record/replay cassettes."""
+
+import zipfile
+from pathlib import Path
+
+import litellm
+import pytest
+from pytest_mock import MockerFixture
+
+from lightspeed_evaluation.core.api.client import APIClient
+from lightspeed_evaluation.core.llm import litellm_patch
+from lightspeed_evaluation.core.models import APIConfig
+from lightspeed_evaluation.core.system.cassette import (
+    KIND_AGENT,
+    KIND_COMPLETION,
+    Cassette,
+    agent_request,
+    cassette_run,
+    cassette_scope,
+    get_active_cassette,
+    is_replaying,
+    llm_request,
+    recorded_call,
+    request_key,
+)
+from lightspeed_evaluation.core.system.exceptions import APIError, CassetteMissError
+
+
+def _completion(content: str) -> litellm.ModelResponse:
+    """Build a litellm completion response."""
+    return litellm.ModelResponse(
+        choices=[{"message": {"role": "assistant", "content": content}}],
+        usage={"prompt_tokens": 10, "completion_tokens": 2, "total_tokens": 12},
+    )
+
+
+class TestCassette:
+    """Unit tests for Cassette storage and lookup."""
+
+    def test_round_trip_through_archive(self, tmp_path: Path) -> None:
+        """Recorded responses are served in order after save/load."""
+        path = str(tmp_path / "run.zip")
+        recording = Cassette(path, "record")
+        recording.record(KIND_COMPLETION, {"model": "m", "messages": [1]}, "first")
+        recording.record(KIND_COMPLETION, {"model": "m", "messages": [1]}, "second")
+        recording.record(KIND_AGENT, {"payload": {"query": "q"}}, {"response": "r"})
+        recording.save()
+
+        replaying = Cassette(path, "replay")
+        request = {"messages": [1], "model": "m"}
+        assert replaying.replay(KIND_COMPLETION, request) == "first"
+        assert replaying.replay(KIND_COMPLETION, request) == "second"
+        assert replaying.replay(KIND_COMPLETION, request) == "second"
+        assert replaying.replay(KIND_AGENT, {"payload": {"query": "q"}}) == {
+            "response": "r"
+        }
+
+    def test_archive_is_content_addressed(self, tmp_path: Path) -> None:
+        """Each interaction is stored under the hash of its request."""
+        path = tmp_path / "run.zip"
+        recording = Cassette(str(path), "record")
+        recording.record(KIND_COMPLETION, {"model": "m"}, "answer")
+        recording.save()
+
+        with zipfile.ZipFile(path) as archive:
+            names = archive.namelist()
+        key = request_key(KIND_COMPLETION, {"model": "m"})
+        assert set(names) == {"manifest.json", f"interactions/{key}.json"}
+
+    def test_replay_miss_raises_and_is_counted(self, tmp_path: Path) -> None:
+        """An unrecorded request fails with a descriptive error."""
+        path = str(tmp_path / "run.zip")
+        Cassette(path, "record").save()
+        replaying = Cassette(path, "replay")
+
+        with pytest.raises(CassetteMissError, match="No recorded completion"):
+            replaying.replay(KIND_COMPLETION, {"model": "gpt-4o-mini"})
+        assert replaying.misses == ["model 'gpt-4o-mini'"]
+
+    def test_unreadable_archive_raises(self, tmp_path: Path) -> None:
+        """A missing or foreign archive is rejected up front."""
+        with pytest.raises(CassetteMissError, match="Cannot read cassette"):
+            Cassette(str(tmp_path / "missing.zip"), "replay")
+
+        foreign = tmp_path / "foreign.zip"
+        with zipfile.ZipFile(foreign, "w") as archive:
+            archive.writestr("manifest.json", '{"format": "other"}')
+        with pytest.raises(CassetteMissError, match="not a cassette"):
+            Cassette(str(foreign), "replay")
+
+    def test_llm_request_ignores_connection_settings(self) -> None:
+        """Positional arguments count; keys, retries and timeouts do not."""
+        request = llm_request(
+            ("gpt-4o-mini",),
+            {"messages": [{"role": "user"}], "api_key": "k", "num_retries": 3},
+            ("model", "messages"),
+        )
+        assert request == {"model": "gpt-4o-mini", "messages": [{"role": "user"}]}
+
+    def test_agent_request_includes_conversation_scope(self) -> None:
+        """Identical agent requests in different conversations get distinct keys."""
+        with cassette_scope("conv_1"):
+            first = agent_request({"payload": {"query": "hi"}})
+        with cassette_scope("conv_2"):
+            second = agent_request({"payload": {"query": "hi"}})
+        assert request_key(KIND_AGENT, first) != request_key(KIND_AGENT, second)
+
+
+class TestCassetteRun:
+    """Unit tests for the module-level cassette session helpers."""
+
+    def test_recorded_call_passes_through_without_cassette(self) -> None:
+        """Instrumented calls run unchanged when no cassette is active."""
+        assert get_active_cassette() is None
+        result = recorded_call(
+            KIND_COMPLETION, dict, lambda: "live", str, lambda data: "replayed"
+        )
+        assert result == "live"
+
+    def test_record_then_replay_run(self, tmp_path: Path) -> None:
+        """A recorded run is replayed without making the real call."""
+        path = str(tmp_path / "run.zip")
+        with cassette_run(record=path):
+            assert not is_replaying()
+            recorded_call(KIND_COMPLETION, lambda: {"model": "m"}, lambda: 1, str, int)
+
+        def fail() -> int:
+            raise AssertionError("real call made during replay")
+
+        with cassette_run(replay=path):
+            assert is_replaying()
+            assert (
+                recorded_call(KIND_COMPLETION, lambda: {"model": "m"}, fail, str, int)
+                == 1
+            )
+        assert get_active_cassette() is None
+
+    def test_disabled_and_conflicting_options(self, tmp_path: Path) -> None:
+        """No options yield no cassette; both options are rejected."""
+        with cassette_run() as cassette:
+            assert cassette is None
+
+        with pytest.raises(ValueError, match="Cannot record and replay"):
+            with cassette_run(record="a.zip", replay="b.zip"):
+                pass
+        assert not list(tmp_path.iterdir())
+
+    def test_nested_run_reuses_outer_cassette(self, tmp_path: Path) -> None:
+        """Only the outermost run owns and writes the cassette."""
+        outer_path = tmp_path / "outer.zip"
+        inner_path = tmp_path / "inner.zip"
+        with cassette_run(record=str(outer_path)) as outer:
+            with cassette_run(record=str(inner_path)) as inner:
+                assert inner is outer
+
+        assert outer_path.exists()
+        assert not inner_path.exists()
+
+
+class TestCassetteInterception:
+    """Record/replay through the litellm patch and the agent API client."""
+
+    def test_litellm_completion_replays_recorded_response(
+        self, tmp_path: Path, mocker: MockerFixture
+    ) -> None:
+        """Judge completions are replayed with their recorded usage."""
+        path = str(tmp_path / "run.zip")
+        messages = [{"role": "user", "content": "Score this"}]
+        mocker.patch.object(
+            litellm_patch, "_original_completion", return_value=_completion("0.9")
+        )
+        with cassette_run(record=path):
+            litellm.completion(model="gpt-4o-mini", messages=messages, api_key="k")
+
+        live = mocker.patch.object(litellm_patch, "_original_completion")
+        with cassette_run(replay=path):
+            response = litellm.completion(model="gpt-4o-mini", messages=messages)
+
+        live.assert_not_called()
+        assert response.choices[0].message.content == "0.9"
+        assert response.usage.total_tokens == 12
+
+    def test_agent_query_replays_and_reports_miss(
+        self, tmp_path: Path, mocker: MockerFixture
+    ) -> None:
+        """Agent responses are replayed offline; unknown queries raise APIError."""
+        path = str(tmp_path / "run.zip")
+        mock_response = mocker.Mock()
+        mock_response.json.return_value = {
+            "response": "Recorded answer",
+            "conversation_id": "conv_123",
+        }
+        mock_client = mocker.Mock()
+        mock_client.post.return_value = mock_response
+        mock_client.headers = {}
+        mocker.patch(
+            "lightspeed_evaluation.core.api.client.httpx.Client",
+            return_value=mock_client,
+        )
+        client = APIClient(
+            APIConfig(
+                api_base="http://localhost:8080",
+                endpoint_type="query",
+                cache_enabled=False,
+            )
+        )
+
+        with cassette_run(record=path), cassette_scope("conv_a"):
+            client.query("What is OpenShift?")
+        mock_client.post.reset_mock()
+
+        with cassette_run(replay=path), cassette_scope("conv_a"):
+            result = client.query("What is OpenShift?")
+            with pytest.raises(APIError, match="No recorded agent response"):
+                client.query("Something else")
+
+        mock_client.post.assert_not_called()
+        assert result.response == "Recorded answer"
+        assert result.conversation_id == "conv_123"
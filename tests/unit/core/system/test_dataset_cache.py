@@ -0,0 +1,143 @@
+"""Unit tests for the parsed-dataset cache."""
+
+from pathlib import Path
+
+from pytest_mock import MockerFixture
+
+from lightspeed_evaluation.core.models import (
+    CoreConfig,
+    EvaluationData,
+    SystemConfig,
+    TurnData,
+)
+from lightspeed_evaluation.core.models.data import DatasetMetadata
+from lightspeed_evaluation.core.system.dataset_cache import DatasetCache
+from lightspeed_evaluation.core.system.validator import DataValidator
+
+DATASET_YAML = """\
+metadata:
+  description: sample
+conversations:
+  - conversation_group_id: conv_1
+    turns:
+      - turn_id: t1
+        query: What is OpenShift?
+        response: A Kubernetes platform.
+"""
+
+
+def _sample_data() -> list[EvaluationData]:
+    """Build a minimal validated dataset."""
+    return [
+        EvaluationData(
+            conversation_group_id="conv_1",
+            turns=[TurnData(turn_id="t1", query="Q", response="A")],
+        )
+    ]
+
+
+class TestDatasetCache:
+    """Unit tests for DatasetCache."""
+
+    def test_compute_key_depends_on_content(self) -> None:
+        """Different content yields different keys; same content is stable."""
+        key_a = DatasetCache.compute_key(b"a")
+        assert key_a == DatasetCache.compute_key(b"a")
+        assert key_a != DatasetCache.compute_key(b"b")
+
+    def test_compute_key_depends_on_framework_version(
+        self, mocker: MockerFixture
+    ) -> None:
+        """A framework upgrade invalidates existing entries."""
+        key_before = DatasetCache.compute_key(b"data")
+        mocker.patch(
+            "lightspeed_evaluation.core.system.dataset_cache._framework_version",
+            return_value="999.0.0",
+        )
+        assert DatasetCache.compute_key(b"data") != key_before
+
+    def test_store_and_load_round_trip(self, tmp_path: Path) -> None:
+        """Stored datasets load back equal, including metadata."""
+        cache = DatasetCache(str(tmp_path / "dataset"))
+        metadata = DatasetMetadata(description="sample")
+
+        cache.store("key", _sample_data(), metadata)
+        loaded = cache.load("key")
+
+        assert loaded is not None
+        data, loaded_metadata = loaded
+        assert data == _sample_data()
+        assert loaded_metadata == metadata
+
+    def test_load_miss_returns_none(self, tmp_path: Path) -> None:
+        """Missing entries are reported as a miss."""
+        assert DatasetCache(str(tmp_path)).load("missing") is None
+
+    def test_load_corrupted_entry_returns_none(self, tmp_path: Path) -> None:
+        """Corrupted entries are ignored rather than raising."""
+        (tmp_path / "broken.pkl").write_bytes(b"not a pickle")
+        assert DatasetCache(str(tmp_path)).load("broken") is None
+
+
+class TestDataValidatorDatasetCache:
+    """Integration of DatasetCache with DataValidator."""
+
+    def _validator(self, tmp_path: Path, enabled: bool) -> DataValidator:
+        """Create a validator whose cache lives under tmp_path."""
+        config = SystemConfig(
+            core=CoreConfig(
+                cache_base_dir=str(tmp_path / "caches"),
+                dataset_cache_enabled=enabled,
+            )
+        )
+        return DataValidator(system_config=config)
+
+    def test_second_load_skips_yaml_parsing(
+        self, tmp_path: Path, mocker: MockerFixture
+    ) -> None:
+        """An unchanged dataset is served from the cache without parsing."""
+        data_file = tmp_path / "data.yaml"
+        data_file.write_text(DATASET_YAML, encoding="utf-8")
+
+        first = self._validator(tmp_path, enabled=True)
+        first_data = first._load_and_parse_yaml(  # pylint: disable=protected-access
+            str(data_file)
+        )
+
+        parse_spy = mocker.patch(
+            "lightspeed_evaluation.core.system.validator.safe_load_yaml"
+        )
+        second = self._validator(tmp_path, enabled=True)
+        second_data = second._load_and_parse_yaml(  # pylint: disable=protected-access
+            str(data_file)
+        )
+
+        parse_spy.assert_not_called()
+        assert second_data == first_data
+        assert second.dataset_metadata is not None
+        assert second.dataset_metadata.description == "sample"
+
+    def test_changed_dataset_is_reparsed(self, tmp_path: Path) -> None:
+        """Editing the file invalidates the cached entry."""
+        data_file = tmp_path / "data.yaml"
+        data_file.write_text(DATASET_YAML, encoding="utf-8")
+        self._validator(tmp_path, enabled=True).load_evaluation_data(str(data_file))
+
+        data_file.write_text(
+            DATASET_YAML.replace("A Kubernetes platform.", "Changed."),
+            encoding="utf-8",
+        )
+        result = self._validator(tmp_path, enabled=True).load_evaluation_data(
+            str(data_file)
+        )
+
+        assert result[0].turns[0].response == "Changed."
+
+    def test_cache_disabled_by_default(self, tmp_path: Path) -> None:
+        """No cache entries are written unless explicitly enabled."""
+        data_file = tmp_path / "data.yaml"
+        data_file.write_text(DATASET_YAML, encoding="utf-8")
+
+        self._validator(tmp_path, enabled=False).load_evaluation_data(str(data_file))
+
+        assert not (tmp_path / "caches" / "dataset").exists()
@@ -0,0 +1,330 @@
+"""Unit tests for dry-run run planning."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from diskcache import Cache
+
+from lightspeed_evaluation.core.api.client import api_cache_key, build_api_request
+from lightspeed_evaluation.core.constants import (
+    DEFAULT_PLAN_AGENT_LATENCY,
+    DEFAULT_PLAN_JUDGE_LATENCY,
+    DEFAULT_PLAN_JUDGE_OUTPUT_TOKENS,
+)
+from lightspeed_evaluation.core.metrics.geval_steps import (
+    GEVAL_STEPS_FILENAME,
+    GEVAL_STEPS_VERSION,
+)
+from lightspeed_evaluation.core.models import (
+    APIConfig,
+    EvaluationData,
+    JudgePanelConfig,
+    LLMConfig,
+    LLMPoolConfig,
+    RunPlan,
+    SystemConfig,
+    TurnData,
+)
+from lightspeed_evaluation.core.models.llm import LLMProviderConfig
+from lightspeed_evaluation.core.system.planner import (
+    RUN_PLAN_FILENAME,
+    estimate_tokens,
+    format_run_plan,
+    load_measured_latencies,
+    plan_run,
+    write_run_plan,
+)
+
+
+def _config(tmp_path: Path, **kwargs: Any) -> SystemConfig:
+    """Build a system config whose caches live under tmp_path."""
+    core = {"cache_base_dir": str(tmp_path / "cache"), "max_threads": 2}
+    core.update(kwargs.pop("core", {}))
+    return SystemConfig(core=core, **kwargs)
+
+
+def _conversation(
+    conv_id: str = "conv", metrics: list[str] | None = None, **turn: Any
+) -> EvaluationData:
+    """Build a single-turn conversation with a filled-in response."""
+    turn = {"query": "q" * 40, "response": "r" * 40, **turn}
+    return EvaluationData(
+        conversation_group_id=conv_id,
+        turns=[TurnData(turn_id="t1", turn_metrics=metrics, **turn)],
+    )
+
+
+def _metric(plan: RunPlan, metric_identifier: str) -> Any:
+    """Return the plan of one metric."""
+    return next(m for m in plan.metrics if m.metric_identifier == metric_identifier)
+
+
+def _write_trace(output_dir: Path, events: list[dict[str, Any]]) -> Path:
+    """Write a profile trace with the given complete events."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    path = output_dir / "profile_20260101_000000_trace.json"
+    path.write_text(
+        json.dumps({"traceEvents": [{"ph": "X", **e} for e in events]}),
+        encoding="utf-8",
+    )
+    return path
+
+
+def test_estimate_tokens_counts_characters() -> None:
+    """Four characters make a token; lists are summed and None is empty."""
+    assert estimate_tokens("a" * 40, ["b" * 8, "c" * 4], None) == 13
+
+
+class TestPlanRun:
+    """Tests for plan_run."""
+
+    def test_counts_judge_calls_per_metric(self, tmp_path: Path) -> None:
+        """LLM metrics cost one judge call; non-LLM metrics none."""
+        data = [
+            _conversation(
+                "a",
+                ["custom:answer_correctness", "ragas:faithfulness", "nlp:bleu"],
+                expected_response="e" * 40,
+                contexts=["c" * 40],
+            )
+        ]
+
+        plan = plan_run(data, _config(tmp_path), str(tmp_path))
+
+        assert (plan.conversations, plan.turns, plan.evaluations) == (1, 1, 3)
+        assert plan.agent.calls == 0
+        assert plan.judge.calls == 2
+        assert _metric(plan, "nlp:bleu").calls == 0
+        assert _metric(plan, "nlp:bleu").evaluations == 1
+        ragas = _metric(plan, "ragas:faithfulness")
+        # 800 template tokens + query, response, context and expected response
+        assert ragas.input_tokens == 840
+        assert ragas.output_tokens == DEFAULT_PLAN_JUDGE_OUTPUT_TOKENS
+
+    def test_panel_judges(self, tmp_path: Path) -> None:
+        """Panel metrics call every judge; others only the primary judge."""
+        config = _config(
+            tmp_path,
+            llm_pool=LLMPoolConfig(
+                models={
+                    "a": LLMProviderConfig(provider="openai", model="gpt-4o"),
+                    "b": LLMProviderConfig(provider="openai", model="gpt-4o-mini"),
+                }
+            ),
+            judge_panel=JudgePanelConfig(
+                judges=["a", "b"], enabled_metrics=["ragas:faithfulness"]
+            ),
+        )
+        data = [_conversation(metrics=["ragas:faithfulness", "ragas:context_recall"])]
+
+        plan = plan_run(data, config, str(tmp_path))
+
+        assert _metric(plan, "ragas:faithfulness").calls == 2
+        assert _metric(plan, "ragas:context_recall").calls == 1
+
+    def test_multiple_expected_responses(self, tmp_path: Path) -> None:
+        """Metrics comparing against expected responses score every alternative."""
+        data = [
+            _conversation(
+                metrics=["custom:answer_correctness", "ragas:response_relevancy"],
+                expected_response=["e1", "e2", "e3"],
+            )
+        ]
+
+        plan = plan_run(data, _config(tmp_path), str(tmp_path))
+
+        assert _metric(plan, "custom:answer_correctness").calls == 3
+        assert _metric(plan, "ragas:response_relevancy").calls == 1
+
+    def test_fused_custom_metrics(self, tmp_path: Path) -> None:
+        """Fusable custom metrics share one judge call per turn."""
+        config = _config(tmp_path, core={"fuse_custom_metrics": True})
+        data = [
+            _conversation(
+                metrics=["custom:answer_correctness", "custom:intent_eval"],
+                expected_response="e",
+                expected_intent="i",
+            )
+        ]
+
+        plan = plan_run(data, config, str(tmp_path))
+
+        assert plan.judge.calls == 1
+        assert _metric(plan, "custom:fused").calls == 1
+        assert _metric(plan, "custom:intent_eval").calls == 0
+        assert _metric(plan, "custom:intent_eval").evaluations == 1
+
+    def test_geval_step_generation(self, tmp_path: Path) -> None:
+        """Criteria without steps are generated once per judge model."""
+        config = _config(
+            tmp_path,
+            default_turn_metrics_metadata={
+                "geval:tone": {"criteria": "Is it polite?", "threshold": 0.5},
+                "geval:steps": {
+                    "criteria": "Is it short?",
+                    "evaluation_steps": ["Count words"],
+                    "threshold": 0.5,
+                },
+            },
+        )
+        data = [_conversation(f"c{i}", ["geval:tone", "geval:steps"]) for i in range(3)]
+
+        plan = plan_run(data, config, str(tmp_path))
+
+        assert plan.geval_step_generations == 1
+        assert _metric(plan, "geval:tone").calls == 4
+        assert _metric(plan, "geval:steps").calls == 3
+
+    def test_persisted_geval_steps_are_not_generated(self, tmp_path: Path) -> None:
+        """Steps in geval_steps.json need no generation."""
+        config = _config(
+            tmp_path,
+            llm=LLMConfig(provider="openai", model="gpt-4o-mini"),
+            default_turn_metrics_metadata={
+                "geval:tone": {"criteria": "Is it polite?", "threshold": 0.5}
+            },
+        )
+        (tmp_path / GEVAL_STEPS_FILENAME).write_text(
+            json.dumps(
+                {
+                    "version": GEVAL_STEPS_VERSION,
+                    "entries": [
+                        {
+                            "model": "openai/gpt-4o-mini",
+                            "criteria": "Is it polite?",
+                            "evaluation_params": None,
+                            "steps": ["Check tone"],
+                        }
+                    ],
+                }
+            ),
+            encoding="utf-8",
+        )
+
+        plan = plan_run([_conversation(metrics=["geval:tone"])], config, str(tmp_path))
+
+        assert plan.geval_step_generations == 0
+        assert plan.judge.calls == 1
+
+    def test_agent_calls_and_cache_hits(self, tmp_path: Path) -> None:
+        """Agent calls are cache hits when their request is cached."""
+        cache_dir = tmp_path / "agent_cache"
+        config = _config(
+            tmp_path,
+            agents={
+                "enabled": True,
+                "default": {"agent": ["agent"]},
+                "agent": {"type": "http_api", "cache_dir": str(cache_dir)},
+            },
+        )
+        cached = _conversation("cached", ["custom:answer_correctness"])
+        fresh = _conversation("fresh", ["custom:answer_correctness"], query="new")
+        with Cache(str(cache_dir)) as cache:
+            request = build_api_request(APIConfig(), cached.turns[0].query)
+            cache[api_cache_key(request)] = "response"
+
+        plan = plan_run([cached, fresh], config, str(tmp_path))
+
+        assert (plan.agent.calls, plan.agent.likely_cached) == (2, 1)
+        assert plan.agent.input_tokens == estimate_tokens("new")
+
+    def test_warm_judge_cache_with_fixed_inputs(self, tmp_path: Path) -> None:
+        """Judge calls over data-provided responses hit a populated cache."""
+        config = _config(tmp_path)
+        with Cache(config.llm.cache_dir) as cache:
+            cache["entry"] = "value"
+
+        plan = plan_run(
+            [_conversation(metrics=["ragas:faithfulness"])], config, str(tmp_path)
+        )
+
+        assert (plan.judge.calls, plan.judge.likely_cached) == (1, 1)
+        assert plan.judge.input_tokens == 0
+        assert plan.estimated_duration == 0
+
+    def test_cost_and_duration(self, tmp_path: Path) -> None:
+        """Cost uses judge prices; duration spreads conversations over workers."""
+        config = _config(
+            tmp_path,
+            llm=LLMConfig(
+                input_cost_per_million_tokens=1.0, output_cost_per_million_tokens=2.0
+            ),
+        )
+        data = [_conversation(f"c{i}", ["ragas:faithfulness"]) for i in range(4)]
+
+        plan = plan_run(data, config, str(tmp_path))
+
+        assert plan.estimated_cost == pytest.approx(
+            4 * (820 * 1.0 + DEFAULT_PLAN_JUDGE_OUTPUT_TOKENS * 2.0) / 1_000_000
+        )
+        assert plan.workers == 2
+        assert plan.estimated_duration == pytest.approx(2 * DEFAULT_PLAN_JUDGE_LATENCY)
+
+    def test_unpriced_judges_have_unknown_cost(self, tmp_path: Path) -> None:
+        """Without prices the cost is unknown rather than zero."""
+        plan = plan_run(
+            [_conversation(metrics=["ragas:faithfulness"])],
+            _config(tmp_path),
+            str(tmp_path),
+        )
+
+        assert plan.estimated_cost is None
+        assert "unknown" in format_run_plan(plan)
+
+
+class TestMeasuredLatencies:
+    """Tests for latencies measured from profile traces."""
+
+    def test_defaults_without_trace(self, tmp_path: Path) -> None:
+        """Without a trace the default latencies apply."""
+        plan = plan_run([], _config(tmp_path), str(tmp_path))
+
+        assert plan.agent_latency == DEFAULT_PLAN_AGENT_LATENCY
+        assert plan.judge_latency == DEFAULT_PLAN_JUDGE_LATENCY
+        assert plan.latency_source == "default"
+
+    def test_mean_span_durations(self, tmp_path: Path) -> None:
+        """Span durations (microseconds) are averaged per name."""
+        path = _write_trace(
+            tmp_path,
+            [
+                {"name": "agent_call", "dur": 1_000_000},
+                {"name": "agent_call", "dur": 3_000_000},
+                {"name": "metric:ragas", "dur": 4_000_000},
+                {"name": "metric:nlp", "dur": 10},
+            ],
+        )
+
+        latencies, source = load_measured_latencies(str(tmp_path))
+        plan = plan_run([], _config(tmp_path), str(tmp_path))
+
+        assert latencies["agent_call"] == pytest.approx(2.0)
+        assert source == str(path)
+        assert plan.agent_latency == pytest.approx(2.0)
+        # No judge_call spans: LLM metric spans stand in for them
+        assert plan.judge_latency == pytest.approx(4.0)
+
+    def test_unreadable_trace_is_ignored(self, tmp_path: Path) -> None:
+        """A corrupt trace falls back to the defaults."""
+        (tmp_path / "profile_1_trace.json").write_text("{", encoding="utf-8")
+
+        assert load_measured_latencies(str(tmp_path)) == ({}, "")
+
+
+def test_format_and_write_run_plan(tmp_path: Path) -> None:
+    """The report lists per-metric calls and the plan round-trips as JSON."""
+    plan = plan_run(
+        [_conversation(metrics=["ragas:faithfulness"])],
+        _config(tmp_path),
+        str(tmp_path),
+    )
+
+    report = format_run_plan(plan)
+    path = write_run_plan(plan, str(tmp_path / "out"))
+
+    assert "ragas:faithfulness" in report
+    assert "2 workers" in report
+    assert path.name == RUN_PLAN_FILENAME
+    assert RunPlan.model_validate_json(path.read_text(encoding="utf-8")) == plan
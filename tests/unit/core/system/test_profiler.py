@@ -0,0 +1,181 @@
+"""Unit tests for the built-in profiler."""
+
+import json
+import threading
+from pathlib import Path
+
+from lightspeed_evaluation.core.models.system import ProfilingConfig
+from lightspeed_evaluation.core.system.profiler import (
+    Profiler,
+    format_timing_table,
+    get_active_profiler,
+    profile_span,
+    profiled_run,
+    profiling_session,
+    record_span,
+)
+
+
+class TestProfiler:
+    """Unit tests for Profiler span recording and export."""
+
+    def test_timing_breakdown_aggregates_per_stage(self) -> None:
+        """Spans with the same name are aggregated into one stage."""
+        profiler = Profiler()
+        for _ in range(3):
+            with profiler.span("metric:nlp", "metric"):
+                pass
+        with profiler.span("agent_call", "agent"):
+            pass
+
+        breakdown = {t.stage: t for t in profiler.timing_breakdown()}
+
+        assert breakdown["metric:nlp"].count == 3
+        assert breakdown["metric:nlp"].category == "metric"
+        assert breakdown["agent_call"].count == 1
+        assert (
+            breakdown["metric:nlp"].max_seconds <= breakdown["metric:nlp"].total_seconds
+        )
+
+    def test_span_recorded_when_block_raises(self) -> None:
+        """Failed stages still contribute their duration."""
+        profiler = Profiler()
+        try:
+            with profiler.span("setup_script"):
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+
+        assert [s.name for s in profiler.spans] == ["setup_script"]
+
+    def test_spans_from_threads(self) -> None:
+        """Spans recorded on worker threads keep their thread id."""
+        profiler = Profiler()
+
+        def work() -> None:
+            with profiler.span("judge_call", "judge"):
+                pass
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(profiler.spans) == 4
+        assert len({s.thread_id for s in profiler.spans}) >= 1
+
+    def test_chrome_trace_format(self) -> None:
+        """Spans export as complete events plus thread-name metadata."""
+        profiler = Profiler()
+        with profiler.span("agent_call", "agent", turn_id="t1"):
+            pass
+
+        trace = profiler.chrome_trace()
+        complete = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+        metadata = [e for e in trace["traceEvents"] if e["ph"] == "M"]
+
+        assert complete[0]["name"] == "agent_call"
+        assert complete[0]["cat"] == "agent"
+        assert complete[0]["dur"] >= 0
+        assert complete[0]["args"] == {"turn_id": "t1"}
+        assert metadata[0]["name"] == "thread_name"
+
+    def test_write_artifacts_with_snapshots(self, tmp_path: Path) -> None:
+        """cProfile and tracemalloc reports are written when enabled."""
+        profiler = Profiler(
+            ProfilingConfig(enabled=True, cprofile=True, tracemalloc=True, top_n=5)
+        )
+        profiler.start()
+        with profiler.span("evaluation"):
+            _ = [str(i) for i in range(1000)]
+        profiler.stop()
+
+        paths = profiler.write_artifacts(str(tmp_path), "profile")
+
+        names = sorted(p.name for p in paths)
+        assert names == [
+            "profile_cprofile.prof",
+            "profile_cprofile.txt",
+            "profile_trace.json",
+            "profile_tracemalloc.txt",
+        ]
+        trace = json.loads((tmp_path / "profile_trace.json").read_text())
+        assert trace["traceEvents"]
+
+    def test_format_timing_table(self) -> None:
+        """The text table lists each stage."""
+        profiler = Profiler()
+        with profiler.span("report_generation", "output"):
+            pass
+
+        table = format_timing_table(profiler.timing_breakdown())
+
+        assert "Stage" in table
+        assert "report_generation" in table
+
+
+class TestProfilingSession:
+    """Unit tests for the active-profiler helpers."""
+
+    def test_profile_span_is_noop_without_session(self) -> None:
+        """Without an active profiler nothing is recorded."""
+        assert get_active_profiler() is None
+        with profile_span("agent_call"):
+            pass
+        assert get_active_profiler() is None
+
+    def test_profile_span_records_on_active_profiler(self) -> None:
+        """profile_span records into the active session's profiler."""
+        profiler = Profiler()
+        with profiling_session(profiler):
+            assert get_active_profiler() is profiler
+            with profile_span("storage_write", "io"):
+                pass
+
+        assert get_active_profiler() is None
+        assert [s.name for s in profiler.spans] == ["storage_write"]
+
+    def test_record_span_on_active_profiler(self) -> None:
+        """record_span stores a caller-measured span only while profiling."""
+        record_span("agent_pool_wait", 0, 1000)
+        profiler = Profiler()
+        with profiling_session(profiler):
+            record_span("agent_pool_wait", 0, 2_000_000_000, "agent")
+
+        timings = profiler.timing_breakdown()
+        assert len(timings) == 1
+        timing = timings[0]
+        assert timing.stage == "agent_pool_wait"
+        assert timing.category == "agent"
+        assert timing.total_seconds == 2.0
+
+    def test_nested_session_reuses_outer_profiler(self) -> None:
+        """A nested session records into the outer profiler."""
+        outer = Profiler()
+        inner = Profiler()
+        with profiling_session(outer):
+            with profiling_session(inner) as active:
+                assert active is outer
+            assert get_active_profiler() is outer
+
+    def test_profiled_run_disabled(self, tmp_path: Path) -> None:
+        """Disabled profiling yields None and writes nothing."""
+        with profiled_run(ProfilingConfig(), str(tmp_path)) as profiler:
+            assert profiler is None
+
+        assert not list(tmp_path.iterdir())
+
+    def test_profiled_run_writes_trace(self, tmp_path: Path) -> None:
+        """The outermost profiled run writes its Chrome trace."""
+        config = ProfilingConfig(enabled=True)
+        with profiled_run(config, str(tmp_path)) as profiler:
+            assert profiler is not None
+            with profiled_run(config, str(tmp_path / "nested")) as nested:
+                assert nested is profiler
+            with profile_span("evaluation"):
+                pass
+
+        traces = list(tmp_path.glob("profile_*_trace.json"))
+        assert len(traces) == 1
+        assert not (tmp_path / "nested").exists()
@@ -0,0 +1,155 @@
+"""Unit tests for stratified conversation sampling."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from lightspeed_evaluation.core.metrics.manager import MetricManager
+from lightspeed_evaluation.core.models import (
+    EvaluationData,
+    SampledPassRates,
+    SystemConfig,
+    TurnData,
+)
+from lightspeed_evaluation.core.system.sampling import (
+    SAMPLING_REPORT_FILENAME,
+    parse_sample_spec,
+    sample_conversations,
+    write_sampling_report,
+)
+
+
+def _conversation(
+    conv_id: str, tag: str = "eval", metrics: list[str] | None = None
+) -> EvaluationData:
+    """Build a single-turn conversation with the given tag and turn metrics."""
+    return EvaluationData(
+        conversation_group_id=conv_id,
+        tag=tag,
+        turns=[TurnData(turn_id="t1", query="q", turn_metrics=metrics)],
+    )
+
+
+def _suite() -> list[EvaluationData]:
+    """Return a suite of 30 conversations split 20/10 across two tags."""
+    return [
+        _conversation(f"a{i}", tag="alpha", metrics=["custom:answer_correctness"])
+        for i in range(20)
+    ] + [
+        _conversation(f"b{i}", tag="beta", metrics=["custom:answer_correctness"])
+        for i in range(10)
+    ]
+
+
+class TestParseSampleSpec:
+    """Tests for parse_sample_spec."""
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("40", 40),
+            ("0.05", 0.05),
+            ("5%", 0.05),
+            ("1", 1),
+            ("1.0", 1.0),
+            (12, 12),
+            (0.5, 0.5),
+        ],
+    )
+    def test_valid_specs(self, value: str | int | float, expected: float) -> None:
+        """Counts stay ints; fractions and percentages become floats."""
+        parsed = parse_sample_spec(value)
+        assert parsed == pytest.approx(expected)
+        assert isinstance(parsed, type(expected))
+
+    @pytest.mark.parametrize("value", ["0", "-3", "1.5", "150%", "abc", 0, True])
+    def test_invalid_specs(self, value: str | int) -> None:
+        """Non-positive sizes, fractions above 1 and garbage are rejected."""
+        with pytest.raises(ValueError):
+            parse_sample_spec(value)
+
+
+class TestSampleConversations:
+    """Tests for sample_conversations."""
+
+    def test_allocates_proportionally_to_strata(self) -> None:
+        """Each stratum contributes in proportion to its size."""
+        sampled, plan = sample_conversations(_suite(), 6)
+
+        assert plan.population == 30
+        assert plan.sampled == len(sampled) == 6
+        assert {s.tags[0]: s.sampled for s in plan.strata} == {"alpha": 4, "beta": 2}
+        assert {c.conversation_group_id for c in sampled} == plan.conversation_ids()
+
+    def test_fraction_keeps_every_stratum(self) -> None:
+        """A small fraction still draws one conversation from every stratum."""
+        data = _suite() + [_conversation("c0", tag="gamma")]
+
+        _, plan = sample_conversations(data, 0.1)
+
+        assert plan.fraction == pytest.approx(0.1)
+        assert plan.size is None
+        assert plan.sampled == 3
+        assert all(stratum.sampled == 1 for stratum in plan.strata)
+
+    def test_strata_split_by_metric_mix(self) -> None:
+        """Conversations sharing a tag but not metrics land in separate strata."""
+        data = [
+            _conversation("x1", metrics=["ragas:faithfulness"]),
+            _conversation("x2", metrics=["custom:answer_correctness"]),
+        ]
+
+        _, plan = sample_conversations(data, 2)
+
+        assert sorted(s.key for s in plan.strata) == [
+            "eval | custom:answer_correctness",
+            "eval | ragas:faithfulness",
+        ]
+
+    def test_default_metrics_are_resolved(self) -> None:
+        """With a metric manager, default metrics join the metric mix."""
+        config = SystemConfig(
+            default_turn_metrics_metadata={
+                "ragas:faithfulness": {"threshold": 0.7, "default": True}
+            }
+        )
+        data = [_conversation("x1"), _conversation("x2", metrics=[])]
+
+        _, plan = sample_conversations(data, 2, metric_manager=MetricManager(config))
+
+        assert sorted(tuple(s.metrics) for s in plan.strata) == [
+            (),
+            ("ragas:faithfulness",),
+        ]
+
+    def test_same_seed_same_sample(self) -> None:
+        """A seed reproduces the sample; the original order is preserved."""
+        first, _ = sample_conversations(_suite(), 10, seed=7)
+        second, _ = sample_conversations(_suite(), 10, seed=7)
+
+        ids = [c.conversation_group_id for c in first]
+        assert ids == [c.conversation_group_id for c in second]
+        suite_ids = [c.conversation_group_id for c in _suite()]
+        assert ids == [cid for cid in suite_ids if cid in ids]
+
+    def test_size_larger_than_suite_takes_everything(self) -> None:
+        """Oversized samples degrade to a census."""
+        sampled, plan = sample_conversations(_suite(), 100)
+
+        assert len(sampled) == 30
+        assert plan.size == 100
+        assert all(s.sampled == s.population for s in plan.strata)
+
+
+def test_write_sampling_report_writes_json(tmp_path: Path) -> None:
+    """The plan is written as JSON into the output directory."""
+    _, plan = sample_conversations(_suite(), 3, seed=1)
+
+    path = write_sampling_report(SampledPassRates(plan=plan), str(tmp_path / "out"))
+
+    assert path == tmp_path / "out" / SAMPLING_REPORT_FILENAME
+    report = json.loads(path.read_text(encoding="utf-8"))
+    assert report["plan"]["seed"] == 1
+    assert report["overall"] is None
+    assert sum(len(s["conversation_ids"]) for s in report["plan"]["strata"]) == 3
@@ -0,0 +1,153 @@
+"""Unit tests for the sequential probability ratio test."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from lightspeed_evaluation.core.models import (
+    EvaluationResult,
+    SequentialTestConfig,
+)
+from lightspeed_evaluation.core.system.sequential import (
+    SEQUENTIAL_REPORT_FILENAME,
+    SequentialProbabilityRatioTest,
+    load_sequential_report,
+    parse_baseline,
+    write_sequential_report,
+)
+
+
+def _results(*outcomes: str) -> list[EvaluationResult]:
+    """Build one conversation's results with the given PASS/FAIL/ERROR outcomes."""
+    return [
+        EvaluationResult(
+            conversation_group_id="conv",
+            turn_id=f"t{i}",
+            metric_identifier="custom:answer_correctness",
+            result=outcome,
+            threshold=0.5,
+        )
+        for i, outcome in enumerate(outcomes)
+    ]
+
+
+def _sprt(
+    baseline: float = 90.0, max_drop: float = 10.0
+) -> SequentialProbabilityRatioTest:
+    """Build a test with alpha=0.05 and beta=0.1."""
+    return SequentialProbabilityRatioTest(
+        SequentialTestConfig(
+            enabled=True, baseline_pass_rate=baseline, max_drop=max_drop
+        ),
+        conversations_total=100,
+    )
+
+
+class TestParseBaseline:
+    """Tests for parse_baseline."""
+
+    def test_number(self) -> None:
+        """A plain number is a pass rate in percent."""
+        assert parse_baseline("92.5") == pytest.approx(92.5)
+
+    def test_summary_file(self, tmp_path: Path) -> None:
+        """A previous summary report provides its overall pass rate."""
+        path = tmp_path / "run_summary.json"
+        path.write_text(
+            json.dumps({"summary_stats": {"overall": {"pass_rate": 87.5}}}),
+            encoding="utf-8",
+        )
+
+        assert parse_baseline(str(path)) == pytest.approx(87.5)
+
+    def test_invalid_summary_file(self, tmp_path: Path) -> None:
+        """A file without an overall pass rate is rejected."""
+        path = tmp_path / "other.json"
+        path.write_text("{}", encoding="utf-8")
+
+        with pytest.raises(ValueError, match="Cannot read baseline"):
+            parse_baseline(str(path))
+
+    def test_garbage(self) -> None:
+        """Neither a number nor a file."""
+        with pytest.raises(ValueError):
+            parse_baseline("not-a-rate")
+
+
+class TestSequentialProbabilityRatioTest:
+    """Tests for SequentialProbabilityRatioTest."""
+
+    def test_bounds_follow_error_rates(self) -> None:
+        """Wald's acceptance bounds come from alpha and beta."""
+        sprt = _sprt()
+
+        assert sprt.upper_bound == pytest.approx(2.8904, abs=1e-4)
+        assert sprt.lower_bound == pytest.approx(-2.2513, abs=1e-4)
+
+    def test_passing_run_accepts_no_regression(self) -> None:
+        """A run passing at baseline stops with no regression."""
+        sprt = _sprt()
+
+        decision = None
+        while decision is None:
+            decision = sprt.update(_results("PASS"))
+
+        assert decision == "no_regression"
+        # Each pass adds log(0.8 / 0.9); 20 of them cross log(0.1 / 0.95)
+        assert sprt.conversations == 20
+
+    def test_failing_run_accepts_regression(self) -> None:
+        """Failures and errors both count against the pass rate."""
+        sprt = _sprt()
+
+        # Each failure adds log(0.2 / 0.1); five of them cross log(0.9 / 0.05)
+        assert sprt.update(_results("FAIL", "FAIL", "FAIL", "FAIL")) is None
+        assert sprt.update(_results("ERROR")) == "regression"
+        assert sprt.outcome().passed == 0
+
+    def test_stops_within_a_conversation(self) -> None:
+        """Results after the verdict are not consumed."""
+        sprt = _sprt()
+
+        assert sprt.update(_results(*["FAIL"] * 7)) == "regression"
+        assert sprt.results == 5
+        assert sprt.update(_results("PASS")) == "regression"
+        assert sprt.conversations == 1
+
+    def test_outcome_inconclusive_without_verdict(self) -> None:
+        """A suite that runs out before a verdict is inconclusive."""
+        sprt = _sprt()
+        sprt.update(_results("PASS", "FAIL"))
+
+        outcome = sprt.outcome()
+
+        assert outcome.decision == "inconclusive"
+        assert outcome.baseline_pass_rate == pytest.approx(90.0)
+        assert outcome.regression_pass_rate == pytest.approx(80.0)
+        assert outcome.conversations_consumed == 1
+        assert outcome.conversations_total == 100
+        assert outcome.observed_pass_rate == pytest.approx(50.0)
+
+    def test_requires_baseline(self) -> None:
+        """A disabled configuration without a baseline cannot be tested."""
+        with pytest.raises(ValueError, match="baseline"):
+            SequentialProbabilityRatioTest(SequentialTestConfig())
+
+
+class TestSequentialReport:
+    """Tests for writing and loading the sequential report."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """The written report loads back unchanged."""
+        sprt = _sprt()
+        sprt.update(_results("FAIL", "FAIL"))
+
+        path = write_sequential_report(sprt.outcome(), str(tmp_path))
+
+        assert path.name == SEQUENTIAL_REPORT_FILENAME
+        assert load_sequential_report(str(tmp_path)) == sprt.outcome()
+
+    def test_missing_report(self, tmp_path: Path) -> None:
+        """Directories without a report load as None."""
+        assert load_sequential_report(str(tmp_path)) is None
@@ -0,0 +1,47 @@
+"""Unit tests for the active session slot."""
+
+import contextvars
+import threading
+
+from lightspeed_evaluation.core.system.session import ActiveSession
+
+
+def test_activate_sets_and_clears_value() -> None:
+    """The value is active only inside the block."""
+    session: ActiveSession[str] = ActiveSession("test_session")
+
+    with session.activate("run") as active:
+        assert active == "run"
+        assert session.get() == "run"
+
+    assert session.get() is None
+
+
+def test_nested_activate_reuses_outer_value() -> None:
+    """A nested session yields the outer value and keeps it afterwards."""
+    session: ActiveSession[str] = ActiveSession("test_session")
+
+    with session.activate("outer"):
+        with session.activate("inner") as active:
+            assert active == "outer"
+        assert session.get() == "outer"
+
+
+def test_value_follows_copied_context_into_threads() -> None:
+    """Worker threads see the session through a copied context only."""
+    session: ActiveSession[str] = ActiveSession("test_session")
+    seen: list[object] = []
+
+    with session.activate("run"):
+        threads = [
+            threading.Thread(
+                target=contextvars.copy_context().run,
+                args=(lambda: seen.append(session.get()),),
+            ),
+            threading.Thread(target=lambda: seen.append(session.get())),
+        ]
+        for thread in threads:
+            thread.start()
+            thread.join()
+
+    assert seen == ["run", None]
@@ -0,0 +1,152 @@
+"""Unit tests for self-tracing of the evaluation pipeline."""
+
+import contextvars
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from lightspeed_evaluation.core.models.system import TracingConfig
+from lightspeed_evaluation.core.models.trace import SpanStatus, SpanType
+from lightspeed_evaluation.core.models.trace_adapters import trace_from_otel
+from lightspeed_evaluation.core.system.tracer import (
+    Tracer,
+    get_active_tracer,
+    trace_span,
+    traced_run,
+)
+
+
+class TestTracer:
+    """Unit tests for Tracer span recording."""
+
+    def test_spans_nest_under_enclosing_span(self) -> None:
+        """Spans opened inside another span record it as their parent."""
+        tracer = Tracer()
+        with tracer.span("conversation") as conversation:
+            with tracer.span("turn") as turn:
+                with tracer.span("judge_call", SpanType.GENERATION):
+                    pass
+
+        spans = {s.name: s for s in tracer.spans}
+        assert spans["conversation"].parent_span_id is None
+        assert spans["turn"].parent_span_id == conversation.span_id
+        assert spans["judge_call"].parent_span_id == turn.span_id
+        assert spans["judge_call"].span_type == SpanType.GENERATION
+        assert {s.trace_id for s in tracer.spans} == {tracer.trace_id}
+
+    def test_handle_details_are_recorded(self) -> None:
+        """Attributes, I/O and LLM fields set on the handle end up on the span."""
+        tracer = Tracer()
+        with tracer.span("judge_call", SpanType.GENERATION, judge_id="j1") as span:
+            span.set_attributes(cache_hits=2, score=None)
+            span.set_io(outputs={"reason": "fine"})
+            span.set_llm(model="gpt-4o-mini", input_tokens=10, output_tokens=4)
+
+        recorded = tracer.spans[0]
+        assert recorded.metadata == {"judge_id": "j1", "cache_hits": 2}
+        assert recorded.outputs == {"reason": "fine"}
+        assert recorded.status == SpanStatus.OK
+        assert recorded.latency is not None and recorded.latency >= 0
+        assert recorded.llm is not None and recorded.llm.token_usage is not None
+        assert recorded.llm.token_usage.total_tokens == 14
+
+    def test_include_io_false_drops_inputs_and_outputs(self) -> None:
+        """Queries and responses are not recorded when I/O capture is off."""
+        tracer = Tracer(TracingConfig(enabled=True, include_io=False))
+        with tracer.span("agent_call") as span:
+            span.set_io(inputs={"query": "q"}, outputs={"response": "r"})
+
+        assert tracer.spans[0].inputs is None
+        assert tracer.spans[0].outputs is None
+
+    def test_exception_marks_span_as_error(self) -> None:
+        """A failing block is recorded with ERROR status and re-raised."""
+        tracer = Tracer()
+        with pytest.raises(RuntimeError):
+            with tracer.span("agent_call"):
+                raise RuntimeError("boom")
+
+        assert tracer.spans[0].status == SpanStatus.ERROR
+        assert tracer.spans[0].status_message == "RuntimeError: boom"
+
+    def test_copied_context_keeps_parent_across_threads(self) -> None:
+        """Work run through copy_context().run nests under the submitting span."""
+        tracer = Tracer()
+
+        def work() -> None:
+            with tracer.span("conversation"):
+                pass
+
+        with tracer.span("evaluation_run") as root:
+            threads = [
+                threading.Thread(target=contextvars.copy_context().run, args=(work,))
+                for _ in range(3)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        conversations = [s for s in tracer.spans if s.name == "conversation"]
+        assert len(conversations) == 3
+        assert all(s.parent_span_id == root.span_id for s in conversations)
+
+
+class TestTracedRun:
+    """Unit tests for the module-level tracing session helpers."""
+
+    def test_trace_span_is_noop_without_tracer(self) -> None:
+        """Instrumented code runs unchanged when tracing is off."""
+        assert get_active_tracer() is None
+        with trace_span("metric") as span:
+            span.set_attributes(result="PASS")
+            span.set_llm(model="m", input_tokens=1)
+            span.set_error("ignored")
+
+        assert not span.recording
+        assert not span.attributes
+
+    def test_disabled_config_records_nothing(self, tmp_path: Path) -> None:
+        """A disabled config yields no tracer and writes no file."""
+        with traced_run(TracingConfig(), str(tmp_path)) as tracer:
+            assert tracer is None
+            assert get_active_tracer() is None
+
+        assert not list(tmp_path.iterdir())
+
+    def test_writes_otlp_file_readable_by_adapter(self, tmp_path: Path) -> None:
+        """The trace file round-trips through trace_from_otel."""
+        config = TracingConfig(enabled=True, service_name="eval-test")
+        with traced_run(config, str(tmp_path)) as tracer:
+            assert get_active_tracer() is tracer
+            with trace_span("conversation", conversation_group_id="c1"):
+                with trace_span("judge_call", SpanType.GENERATION) as span:
+                    span.set_llm(input_tokens=3, output_tokens=2)
+        assert get_active_tracer() is None
+
+        files = list(tmp_path.glob("trace_*_otlp.json"))
+        assert len(files) == 1
+        payload = json.loads(files[0].read_text(encoding="utf-8"))
+        trace = trace_from_otel(payload)
+
+        assert tracer is not None and trace.trace_id == tracer.trace_id
+        spans = {s.name: s for s in trace.spans}
+        assert spans["judge_call"].parent_span_id == spans["conversation"].span_id
+        assert spans["conversation"].metadata["conversation_group_id"] == "c1"
+        judge_llm = spans["judge_call"].llm
+        assert judge_llm is not None and judge_llm.token_usage is not None
+        assert judge_llm.token_usage.output_tokens == 2
+
+    def test_nested_run_reuses_outer_tracer(self, tmp_path: Path) -> None:
+        """Only the outermost run owns the tracer and writes the file."""
+        outer_dir = tmp_path / "outer"
+        inner_dir = tmp_path / "inner"
+        config = TracingConfig(enabled=True)
+        with traced_run(config, str(outer_dir)) as outer:
+            with traced_run(config, str(inner_dir)) as inner:
+                assert inner is outer
+
+        assert list(outer_dir.glob("trace_*_otlp.json"))
+        assert not inner_dir.exists()
@@ -484,7 +484,10 @@ class TestDataValidator:
             },
         ]
         mocker.patch("builtins.open", mocker.mock_open(read_data=""))
-        mocker.patch("yaml.safe_load", return_value=yaml_data)
+        mocker.patch(
+            "lightspeed_evaluation.core.system.validator.safe_load_yaml",
+            return_value=yaml_data,
+        )
         validator = DataValidator()
         result = validator.load_evaluation_data("dummy.yaml")
         assert len(result) == 2
@@ -500,7 +503,10 @@ class TestDataValidator:
             },
         ]
         mocker.patch("builtins.open", mocker.mock_open(read_data=""))
-        mocker.patch("yaml.safe_load", return_value=yaml_data)
+        mocker.patch(
+            "lightspeed_evaluation.core.system.validator.safe_load_yaml",
+            return_value=yaml_data,
+        )
         validator = DataValidator()
         result = validator.load_evaluation_data("dummy.yaml")
         assert len(result) == 1
@@ -649,7 +655,10 @@ class TestMetricsFilter:
             },
         ]
         mocker.patch("builtins.open", mocker.mock_open(read_data=""))
-        mocker.patch("yaml.safe_load", return_value=yaml_data)
+        mocker.patch(
+            "lightspeed_evaluation.core.system.validator.safe_load_yaml",
+            return_value=yaml_data,
+        )
         config = SystemConfig(
             default_turn_metrics_metadata={
                 "ragas:faithfulness": {"default": True, "threshold": 0.7},
@@ -676,7 +685,10 @@ class TestMetricsFilter:
             },
         ]
         mocker.patch("builtins.open", mocker.mock_open(read_data=""))
-        mocker.patch("yaml.safe_load", return_value=yaml_data)
+        mocker.patch(
+            "lightspeed_evaluation.core.system.validator.safe_load_yaml",
+            return_value=yaml_data,
+        )
         config = SystemConfig(
             default_conversation_metrics_metadata={
                 "deepeval:conversation_completeness": {
@@ -713,7 +725,10 @@ class TestMetricsFilter:
             },
         ]
         mocker.patch("builtins.open", mocker.mock_open(read_data=""))
-        mocker.patch("yaml.safe_load", return_value=yaml_data)
+        mocker.patch(
+            "lightspeed_evaluation.core.system.validator.safe_load_yaml",
+            return_value=yaml_data,
+        )
         config = SystemConfig(
             default_conversation_metrics_metadata={
                 "deepeval:conversation_completeness": {
@@ -767,7 +782,10 @@ class TestMetadataLoading:
             ],
         }
         mocker.patch("builtins.open", mocker.mock_open(read_data=""))
-        mocker.patch("yaml.safe_load", return_value=yaml_data)
+        mocker.patch(
+            "lightspeed_evaluation.core.system.validator.safe_load_yaml",
+            return_value=yaml_data,
+        )
         validator = DataValidator()
         result = validator.load_evaluation_data("dummy.yaml")
 
@@ -788,7 +806,10 @@ class TestMetadataLoading:
             ],
         }
         mocker.patch("builtins.open", mocker.mock_open(read_data=""))
-        mocker.patch("yaml.safe_load", return_value=yaml_data)
+        mocker.patch(
+            "lightspeed_evaluation.core.system.validator.safe_load_yaml",
+            return_value=yaml_data,
+        )
         validator = DataValidator()
         result = validator.load_evaluation_data("dummy.yaml")
 
@@ -807,7 +828,10 @@ class TestMetadataLoading:
             ],
         }
         mocker.patch("builtins.open", mocker.mock_open(read_data=""))
-        mocker.patch("yaml.safe_load", return_value=yaml_data)
+        mocker.patch(
+            "lightspeed_evaluation.core.system.validator.safe_load_yaml",
+            return_value=yaml_data,
+        )
         validator = DataValidator()
         result = validator.load_evaluation_data("dummy.yaml")
 
@@ -826,7 +850,10 @@ class TestMetadataLoading:
             ],
         }
         mocker.patch("builtins.open", mocker.mock_open(read_data=""))
-        mocker.patch("yaml.safe_load", return_value=yaml_data)
+        mocker.patch(
+            "lightspeed_evaluation.core.system.validator.safe_load_yaml",
+            return_value=yaml_data,
+        )
         validator = DataValidator()
         with pytest.raises(DataValidationError, match="'metadata' must be a mapping"):
             validator.load_evaluation_data("dummy.yaml")
@@ -843,7 +870,10 @@ class TestMetadataLoading:
             ],
         }
         mocker.patch("builtins.open", mocker.mock_open(read_data=""))
-        mocker.patch("yaml.safe_load", return_value=yaml_data)
+        mocker.patch(
+            "lightspeed_evaluation.core.system.validator.safe_load_yaml",
+            return_value=yaml_data,
+        )
         validator = DataValidator()
         with pytest.raises(DataValidationError, match="Invalid dataset metadata"):
             validator.load_evaluation_data("dummy.yaml")
@@ -852,7 +882,10 @@ class TestMetadataLoading:
         """Non-list conversations value in dict format raises error."""
         yaml_data = {"conversations": "not a list"}
         mocker.patch("builtins.open", mocker.mock_open(read_data=""))
-        mocker.patch("yaml.safe_load", return_value=yaml_data)
+        mocker.patch(
+            "lightspeed_evaluation.core.system.validator.safe_load_yaml",
+            return_value=yaml_data,
+        )
         validator = DataValidator()
         with pytest.raises(DataValidationError, match="'conversations' must be a list"):
             validator.load_evaluation_data("dummy.yaml")
@@ -879,7 +912,10 @@ class TestMetadataLoading:
             },
         ]
         mocker.patch("builtins.open", mocker.mock_open(read_data=""))
-        mocker.patch("yaml.safe_load", return_value=yaml_data)
+        mocker.patch(
+            "lightspeed_evaluation.core.system.validator.safe_load_yaml",
+            return_value=yaml_data,
+        )
         validator = DataValidator()
         result = validator.load_evaluation_data("dummy.yaml")
 
@@ -915,7 +951,10 @@ class TestMetadataLoading:
             ],
         }
         mocker.patch("builtins.open", mocker.mock_open(read_data=""))
-        mocker.patch("yaml.safe_load", return_value=yaml_data)
+        mocker.patch(
+            "lightspeed_evaluation.core.system.validator.safe_load_yaml",
+            return_value=yaml_data,
+        )
         validator = DataValidator()
         result = validator.load_evaluation_data("dummy.yaml")
 
@@ -935,7 +974,10 @@ class TestMetadataLoading:
             },
         ]
         mocker.patch("builtins.open", mocker.mock_open(read_data=""))
-        mocker.patch("yaml.safe_load", return_value=yaml_data)
+        mocker.patch(
+            "lightspeed_evaluation.core.system.validator.safe_load_yaml",
+            return_value=yaml_data,
+        )
         validator = DataValidator()
         result = validator.load_evaluation_data("dummy.yaml")
 
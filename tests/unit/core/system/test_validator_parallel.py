@@ -0,0 +1,76 @@
+# pylint: disable=protected-access
+
+"""Unit tests for process-pool validation in core/system/validator.py."""
+
+import pytest
+from pytest_mock import MockerFixture
+
+from lightspeed_evaluation.core.models import SystemConfig
+from lightspeed_evaluation.core.system.exceptions import DataValidationError
+from lightspeed_evaluation.core.system.validator import DataValidator
+
+
+class TestParallelValidation:
+    """Unit tests for process-pool validation of conversation chunks."""
+
+    @staticmethod
+    def _raw_conversations(count: int) -> list[dict]:
+        """Build raw conversation dicts."""
+        return [
+            {
+                "conversation_group_id": f"conv_{i}",
+                "turns": [{"turn_id": "t1", "query": f"Q{i}", "response": "A"}],
+            }
+            for i in range(count)
+        ]
+
+    def test_parallel_matches_inline(self, mocker: MockerFixture) -> None:
+        """Chunked validation returns the same conversations in order."""
+        mocker.patch(
+            "lightspeed_evaluation.core.system.validator.DEFAULT_VALIDATION_CHUNK_SIZE",
+            3,
+        )
+        raw = self._raw_conversations(10)
+
+        inline = DataValidator()._validate_conversations(raw)
+        parallel = DataValidator(validation_workers=2)._validate_conversations(raw)
+
+        assert parallel == inline
+        assert [c.conversation_group_id for c in parallel] == [
+            f"conv_{i}" for i in range(10)
+        ]
+
+    def test_parallel_error_names_conversation(self, mocker: MockerFixture) -> None:
+        """Errors raised in workers keep the inline error message."""
+        mocker.patch(
+            "lightspeed_evaluation.core.system.validator.DEFAULT_VALIDATION_CHUNK_SIZE",
+            3,
+        )
+        raw = self._raw_conversations(10)
+        raw[7]["turns"][0]["query"] = ""
+
+        with pytest.raises(DataValidationError) as inline_exc:
+            DataValidator()._validate_conversations(raw)
+        with pytest.raises(DataValidationError) as parallel_exc:
+            DataValidator(validation_workers=2)._validate_conversations(raw)
+
+        assert "Validation error in conversation 'conv_7'" in str(parallel_exc.value)
+        assert str(parallel_exc.value) == str(inline_exc.value)
+
+    def test_parallel_non_dict_item_reports_index(self, mocker: MockerFixture) -> None:
+        """Malformed entries report their position in the file."""
+        mocker.patch(
+            "lightspeed_evaluation.core.system.validator.DEFAULT_VALIDATION_CHUNK_SIZE",
+            3,
+        )
+        raw: list = self._raw_conversations(6)
+        raw[4] = "not a mapping"
+
+        with pytest.raises(DataValidationError, match="evaluation data item 5"):
+            DataValidator(validation_workers=2)._validate_conversations(raw)
+
+    def test_workers_default_from_system_config(self) -> None:
+        """validation_workers falls back to core.validation_workers."""
+        config = SystemConfig(core={"validation_workers": 4})
+        validator = DataValidator(system_config=config)
+        assert validator._validation_workers == 4
@@ -0,0 +1,52 @@
+"""Unit tests for YAML load/dump helpers."""
+
+import io
+
+import pytest
+import yaml
+
+from lightspeed_evaluation.core.system.yaml_io import (
+    SafeYamlLoader,
+    has_libyaml,
+    safe_dump_yaml,
+    safe_load_yaml,
+)
+
+
+class TestYamlIO:
+    """Unit tests for safe_load_yaml / safe_dump_yaml."""
+
+    @pytest.mark.parametrize(
+        "document",
+        [
+            "!!python/object:collections.OrderedDict {}",
+            "!!python/object/apply:os.system ['true']",
+        ],
+    )
+    def test_loader_is_safe(self, document: str) -> None:
+        """The selected loader never constructs arbitrary Python objects."""
+        with pytest.raises(yaml.constructor.ConstructorError):
+            safe_load_yaml(document)
+
+    def test_loader_matches_libyaml_availability(self) -> None:
+        """The C loader is used exactly when PyYAML provides it."""
+        assert has_libyaml() == hasattr(yaml, "CSafeLoader")
+        assert SafeYamlLoader is getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+    def test_load_accepts_text_and_bytes(self) -> None:
+        """Both str and bytes documents are parsed."""
+        assert safe_load_yaml("a: 1") == {"a": 1}
+        assert safe_load_yaml("a: ü".encode("utf-8")) == {"a": "ü"}
+
+    def test_dump_round_trip_preserves_order_and_unicode(self) -> None:
+        """Dumped YAML keeps key order, block style and unicode."""
+        data = {"z": 1, "a": ["x", "y"], "text": "héllo"}
+        stream = io.StringIO()
+
+        safe_dump_yaml(data, stream)
+        output = stream.getvalue()
+
+        assert output.index("z:") < output.index("a:")
+        assert "héllo" in output
+        assert "[" not in output
+        assert safe_load_yaml(output) == data
@@ -3,6 +3,7 @@
 from pathlib import Path
 from typing import Any
 
+import pytest
 from pytest_mock import MockerFixture
 
 from lightspeed_evaluation.core.models.agents import AgentsConfig
@@ -11,6 +12,8 @@ from lightspeed_evaluation.core.models.data import (
     EvaluationResult,
     TurnData,
 )
+from lightspeed_evaluation.core.system.cassette import cassette_run
+from lightspeed_evaluation.core.system.exceptions import ConfigurationError
 from lightspeed_evaluation.pipeline.behavioral.orchestrator import (
     _build_agent_set,
     _clone_config_for_run,
@@ -441,6 +444,31 @@ class TestRunOrchestrator:
         assert output_path.parent.name == "model_a"
         assert output_path.parent.parent.name.startswith("eval_")
 
+    def test_parallel_runs_reject_active_cassette(
+        self, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        """Parallel runs cannot record into the cassette of the parent process."""
+        mock_pipeline = self._mock_pipeline(mocker)
+        config = self._make_config_mock(
+            mocker,
+            {
+                "default": {"agent": ["model_a"], "repeat": 2, "parallel": True},
+                "model_a": {"type": "http_api"},
+            },
+        )
+        data = [
+            EvaluationData(
+                conversation_group_id="c1",
+                turns=[TurnData(turn_id="t1", query="Q")],
+            )
+        ]
+
+        with cassette_run(record=str(tmp_path / "run.zip")):
+            with pytest.raises(ConfigurationError, match="parallel"):
+                run(config, data, str(tmp_path))
+
+        mock_pipeline.run_evaluation.assert_not_called()
+
     def test_failed_run_does_not_stop_others(
         self, mocker: MockerFixture, tmp_path: Path
     ) -> None:
@@ -40,6 +40,7 @@ def create_mock_llm_manager(mocker: MockerFixture) -> Any:
     # Configure for single-judge mode (no panel)
     mock_instance.should_use_panel_for_metric.return_value = False
     mock_instance.has_judge_panel.return_value = False
+    mock_instance.system_config.judge_panel = None
     mock_instance.get_judge_managers.return_value = [mock_instance]
     mock_instance.get_primary_judge.return_value = mock_instance
     # Return list with single judge for any metric
@@ -47,6 +48,8 @@ def create_mock_llm_manager(mocker: MockerFixture) -> Any:
     # Set config.model and judge_id for judge_scores
     mock_instance.config.model = "gpt-4o-mini-mock"
     mock_instance.judge_id = "primary"
+    # Keep the process-global litellm cache untouched
+    mock_instance.get_config.return_value.cache_enabled = False
     mock_llm_manager_class.from_system_config.return_value = mock_instance
     return mock_llm_manager_class
 
@@ -92,6 +95,9 @@ def mock_metric_manager(mocker: MockerFixture) -> MetricManager:
     # Mock get_metric_metadata to return None (no metadata) to support iteration
     # in _extract_metadata_for_csv
     manager.get_metric_metadata.return_value = None
+    # No gating rules: keep the configured metric order
+    manager.get_metric_gates.return_value = []
+    manager.order_by_gates.side_effect = lambda metrics, *_args: list(metrics)
     return manager
 
 
@@ -146,6 +152,8 @@ def processor_components(mocker: MockerFixture) -> ProcessorComponents:
 
     # Default behavior for metric resolution
     metric_manager.resolve_metrics.return_value = ["ragas:faithfulness"]
+    metric_manager.get_metric_gates.return_value = []
+    metric_manager.order_by_gates.side_effect = lambda metrics, *_args: list(metrics)
 
     return ProcessorComponents(
         metrics_evaluator=metrics_evaluator,
@@ -264,7 +272,10 @@ def evaluator(
 ) -> MetricsEvaluator:
     """Create MetricsEvaluator with all handlers mocked."""
     create_mock_llm_manager(mocker)
-    mocker.patch("lightspeed_evaluation.pipeline.evaluation.evaluator.EmbeddingManager")
+    embedding_manager = mocker.patch(
+        "lightspeed_evaluation.pipeline.evaluation.evaluator.EmbeddingManager"
+    )
+    embedding_manager.from_system_config.return_value.config.cache_enabled = False
     mocker.patch("lightspeed_evaluation.pipeline.evaluation.evaluator.RagasMetrics")
     mocker.patch("lightspeed_evaluation.pipeline.evaluation.evaluator.DeepEvalMetrics")
     mocker.patch("lightspeed_evaluation.pipeline.evaluation.evaluator.CustomMetrics")
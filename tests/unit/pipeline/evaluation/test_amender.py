@@ -1,10 +1,14 @@
 """Unit tests for pipeline evaluation amender module."""
 
+import pytest
 from pytest_mock import MockerFixture
 
 from lightspeed_evaluation.core.models import APIResponse, TurnData
 from lightspeed_evaluation.core.system.exceptions import APIError
-from lightspeed_evaluation.pipeline.evaluation.amender import APIDataAmender
+from lightspeed_evaluation.pipeline.evaluation.amender import (
+    APIDataAmender,
+    AsyncAPIDataAmender,
+)
 
 
 class TestAPIDataAmender:
@@ -350,3 +354,61 @@ class TestAPIDataAmender:
         assert turn.agent_latency == 0
         assert turn.api_input_tokens == 0
         assert turn.api_output_tokens == 0
+
+
+class TestAsyncAPIDataAmender:
+    """Unit tests for AsyncAPIDataAmender."""
+
+    @pytest.mark.asyncio
+    async def test_amend_single_turn_no_client(self) -> None:
+        """Test amendment is skipped when no API client is available."""
+        turn = TurnData(turn_id="1", query="Test query", response=None)
+
+        result = await AsyncAPIDataAmender(None).amend_single_turn(turn, "conv_1")
+
+        assert result == (None, "conv_1")
+        assert turn.response is None
+
+    @pytest.mark.asyncio
+    async def test_amend_single_turn_success(self, mocker: MockerFixture) -> None:
+        """Test the awaited API response amends the turn."""
+        mock_client = mocker.Mock()
+        mock_client.query = mocker.AsyncMock(
+            return_value=APIResponse(
+                response="Generated response",
+                conversation_id="conv_123",
+                contexts=["Context 1"],
+                tool_calls=[],
+                input_tokens=10,
+                output_tokens=5,
+            )
+        )
+        turn = TurnData(turn_id="1", query="Test query", response=None)
+
+        result = await AsyncAPIDataAmender(mock_client).amend_single_turn(turn)
+
+        assert result == (None, "conv_123")
+        mock_client.query.assert_awaited_once_with(
+            query="Test query",
+            conversation_id=None,
+            attachments=None,
+            extra_request_params=None,
+        )
+        assert turn.response == "Generated response"
+        assert turn.contexts == ["Context 1"]
+        assert (turn.api_input_tokens, turn.api_output_tokens) == (10, 5)
+        assert turn.agent_latency is not None
+
+    @pytest.mark.asyncio
+    async def test_amend_single_turn_api_error(self, mocker: MockerFixture) -> None:
+        """Test API errors are returned with the previous conversation ID."""
+        mock_client = mocker.Mock()
+        mock_client.query = mocker.AsyncMock(side_effect=APIError("Connection failed"))
+        turn = TurnData(turn_id="5", query="Error query", response=None)
+
+        result = await AsyncAPIDataAmender(mock_client).amend_single_turn(
+            turn, "conv_1"
+        )
+
+        assert result == ("API Error for turn 5: Connection failed", "conv_1")
+        assert turn.response is None
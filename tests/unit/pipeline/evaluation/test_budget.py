@@ -0,0 +1,156 @@
+"""Unit tests for token and cost budget tracking."""
+
+import logging
+
+import pytest
+from _pytest.logging import LogCaptureFixture
+
+from lightspeed_evaluation.core.models import (
+    BudgetConfig,
+    EvaluationResult,
+    JudgeScore,
+    SystemConfig,
+)
+from lightspeed_evaluation.pipeline.evaluation.budget import BudgetTracker
+
+
+def _result(
+    conv_id: str = "conv",
+    metric: str = "custom:answer_correctness",
+    input_tokens: int = 0,
+    output_tokens: int = 0,
+    **kwargs: object,
+) -> EvaluationResult:
+    """Build a PASS result with the given judge token usage."""
+    return EvaluationResult(
+        conversation_group_id=conv_id,
+        turn_id="t1",
+        metric_identifier=metric,
+        result="PASS",
+        threshold=0.5,
+        judge_llm_input_tokens=input_tokens,
+        judge_llm_output_tokens=output_tokens,
+        **kwargs,
+    )
+
+
+class TestBudgetConfig:
+    """Tests for BudgetConfig."""
+
+    def test_disabled_by_default(self) -> None:
+        """Without limits no budget applies."""
+        assert BudgetConfig().enabled is False
+        assert BudgetTracker.from_system_config(SystemConfig()) is None
+
+    @pytest.mark.parametrize(
+        "limits", [{"max_tokens": 0}, {"max_cost": 0}, {"max_calls": 3}]
+    )
+    def test_invalid_limits(self, limits: dict[str, int]) -> None:
+        """Non-positive limits and unknown keys are rejected."""
+        with pytest.raises(ValueError):
+            BudgetConfig(run=limits)
+
+
+class TestBudgetTracker:
+    """Tests for BudgetTracker."""
+
+    def test_run_token_budget(self) -> None:
+        """The run budget counts judge, embedding and agent tokens."""
+        tracker = BudgetTracker(
+            BudgetConfig(run={"max_tokens": 100}), {"primary": (None, None)}
+        )
+        tracker.charge_result(_result(input_tokens=40, output_tokens=10))
+        tracker.charge_agent("conv", 30)
+
+        assert tracker.exhausted_reason("other") is None
+
+        tracker.charge_result(_result(embedding_tokens=20))
+
+        assert tracker.exhausted_reason("other") == (
+            "Budget exhausted: run token budget (100) reached"
+        )
+        assert tracker.usage() == {"tokens": 100, "cost": 0.0}
+
+    def test_reset_forgets_spending(self) -> None:
+        """A reset tracker starts again from an unspent budget."""
+        tracker = BudgetTracker(
+            BudgetConfig(run={"max_tokens": 10}), {"primary": (None, None)}
+        )
+        tracker.charge_result(_result(input_tokens=10))
+        assert tracker.exhausted_reason("conv") is not None
+
+        tracker.reset()
+
+        assert tracker.exhausted_reason("conv") is None
+        assert tracker.usage() == {"tokens": 0, "cost": 0.0}
+
+    def test_conversation_and_metric_scopes(self) -> None:
+        """Conversation and metric budgets only block their own scope."""
+        tracker = BudgetTracker(
+            BudgetConfig(conversation={"max_tokens": 50}, metric={"max_tokens": 80}),
+            {"primary": (None, None)},
+        )
+        tracker.charge_result(_result("a", "ragas:faithfulness", 50))
+        tracker.charge_result(_result("b", "ragas:faithfulness", 30))
+
+        assert tracker.exhausted_reason("a") == (
+            "Budget exhausted: conversation token budget (50) reached"
+        )
+        assert tracker.exhausted_reason("c", "custom:answer_correctness") is None
+        assert tracker.exhausted_reason("c", "ragas:faithfulness") == (
+            "Budget exhausted: metric token budget (80) reached"
+        )
+
+    def test_cost_uses_primary_judge_prices(self) -> None:
+        """Results without judge scores are priced with the primary judge."""
+        tracker = BudgetTracker(
+            BudgetConfig(run={"max_cost": 1.0}), {"primary": (2.0, 10.0)}
+        )
+        tracker.charge_result(_result(input_tokens=250_000, output_tokens=25_000))
+
+        assert tracker.usage()["cost"] == pytest.approx(0.75)
+        assert tracker.exhausted_reason("conv") is None
+
+        tracker.charge_result(_result(input_tokens=125_000))
+
+        assert tracker.exhausted_reason("conv") == (
+            "Budget exhausted: run cost budget (1.0) reached"
+        )
+
+    def test_cost_of_panel_counts_consulted_judges(self) -> None:
+        """Each consulted panel judge is priced with its own model."""
+        tracker = BudgetTracker(
+            BudgetConfig(run={"max_cost": 10.0}),
+            {"cheap": (1.0, 1.0), "strong": (10.0, 30.0), "unused": (100.0, 100.0)},
+        )
+        tracker.charge_result(
+            _result(
+                input_tokens=200_000,
+                output_tokens=20_000,
+                judge_scores=[
+                    JudgeScore(
+                        judge_id="cheap",
+                        judge_input_tokens=100_000,
+                        judge_output_tokens=10_000,
+                    ),
+                    JudgeScore(
+                        judge_id="strong",
+                        judge_input_tokens=100_000,
+                        judge_output_tokens=10_000,
+                    ),
+                    JudgeScore(judge_id="unused", consulted=False),
+                ],
+            )
+        )
+
+        assert tracker.usage()["cost"] == pytest.approx(0.11 + 1.3)
+
+    def test_warns_about_unpriced_judges(self, caplog: LogCaptureFixture) -> None:
+        """A cost budget with unpriced models warns that they count as free."""
+        config = SystemConfig(budget={"run": {"max_cost": 5.0}})
+
+        with caplog.at_level(logging.WARNING):
+            tracker = BudgetTracker.from_system_config(config)
+
+        assert tracker is not None
+        assert "have no prices" in caplog.text
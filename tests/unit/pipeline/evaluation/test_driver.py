@@ -2,6 +2,7 @@
 
 """Unit tests for agent driver module."""
 
+import contextvars
 from typing import Any, Optional
 
 import pytest
@@ -9,14 +10,18 @@ from pydantic import ValidationError
 from pytest_mock import MockerFixture
 
 from lightspeed_evaluation.core.models import TurnData
-from lightspeed_evaluation.core.system.exceptions import ConfigurationError
+from lightspeed_evaluation.core.system.exceptions import APIError, ConfigurationError
 from lightspeed_evaluation.pipeline.evaluation.driver import (
     AgentDriver,
+    AsyncHttpApiDriver,
     HttpApiDriver,
     ProposalDriver,
     TerminalOutcome,
 )
-from lightspeed_evaluation.pipeline.evaluation.registry import AgentDriverRegistry
+from lightspeed_evaluation.pipeline.evaluation.registry import (
+    AgentDriverPool,
+    AgentDriverRegistry,
+)
 
 
 class TestAgentDriverRegistry:
@@ -34,6 +39,20 @@ class TestAgentDriverRegistry:
         assert driver is mock_driver_instance
         mock_driver_cls.assert_called_once_with({"type": "test_type"}, enabled=True)
 
+    def test_create_driver_passes_connection_pool(self, mocker: MockerFixture) -> None:
+        """Test drivers share the registry's connection pool."""
+        mock_driver_cls = mocker.Mock(spec=type)
+        pool = mocker.Mock()
+
+        registry = AgentDriverRegistry(
+            drivers={"test_type": mock_driver_cls}, connection_pool=pool
+        )
+        registry.create_driver({"type": "test_type"})
+
+        mock_driver_cls.assert_called_once_with(
+            {"type": "test_type"}, enabled=True, connection_pool=pool
+        )
+
     def test_create_driver_missing_type(self) -> None:
         """Test creating a driver without type field raises error."""
         registry = AgentDriverRegistry()
@@ -70,6 +89,83 @@ class TestAgentDriverRegistry:
         assert driver.enabled is True
 
 
+class TestAgentDriverPool:
+    """Unit tests for AgentDriverPool."""
+
+    @staticmethod
+    def _pool(mocker: MockerFixture, max_size: int = 2) -> AgentDriverPool:
+        """Build a pool whose registry creates a new mock driver per call."""
+        registry = mocker.Mock(spec=AgentDriverRegistry)
+        registry.create_driver.side_effect = lambda *_a, **_k: mocker.Mock(
+            spec=AgentDriver
+        )
+        return AgentDriverPool(registry, max_size=max_size)
+
+    def test_same_config_reuses_driver(self, mocker: MockerFixture) -> None:
+        """Test equal configurations share one driver regardless of key order."""
+        pool = self._pool(mocker)
+
+        with pool.driver({"type": "http_api", "api_base": "http://a"}) as first:
+            pass
+        with pool.driver({"api_base": "http://a", "type": "http_api"}) as second:
+            pass
+        with pool.driver({"type": "http_api", "api_base": "http://b"}) as third:
+            pass
+
+        assert second is first
+        assert third is not first
+        assert len(pool) == 2
+        first.close.assert_not_called()
+
+    def test_evicts_least_recently_used(self, mocker: MockerFixture) -> None:
+        """Test the pool closes the least recently used driver when full."""
+        pool = self._pool(mocker)
+
+        with pool.driver({"type": "a"}) as driver_a:
+            pass
+        with pool.driver({"type": "b"}) as driver_b:
+            pass
+        with pool.driver({"type": "a"}):
+            pass
+        with pool.driver({"type": "c"}):
+            pass
+
+        assert len(pool) == 2
+        driver_b.close.assert_called_once()
+        driver_a.close.assert_not_called()
+
+    def test_evicted_driver_closed_after_use(self, mocker: MockerFixture) -> None:
+        """Test a driver evicted while in use is closed once released."""
+        pool = self._pool(mocker, max_size=1)
+
+        with pool.driver({"type": "a"}) as driver_a:
+            with pool.driver({"type": "b"}):
+                driver_a.close.assert_not_called()
+            driver_a.close.assert_not_called()
+
+        driver_a.close.assert_called_once()
+        assert len(pool) == 1
+
+    def test_close_closes_all_drivers(self, mocker: MockerFixture) -> None:
+        """Test closing the pool closes every pooled driver."""
+        pool = self._pool(mocker)
+        drivers = []
+        for agent_type in ("a", "b"):
+            with pool.driver({"type": agent_type}) as driver:
+                drivers.append(driver)
+
+        pool.close()
+
+        assert len(pool) == 0
+        for driver in drivers:
+            driver.close.assert_called_once()
+
+    def test_invalid_max_size(self, mocker: MockerFixture) -> None:
+        """Test the pool must hold at least one driver."""
+        with pytest.raises(ValueError, match="at least 1"):
+            self._pool(mocker, max_size=0)
+
+
 class TestHttpApiDriver:
     """Unit tests for HttpApiDriver."""
 
@@ -177,6 +273,141 @@ class TestHttpApiDriver:
             )
 
 
+_caller: contextvars.ContextVar[str] = contextvars.ContextVar("caller", default="")
+
+
+class TestAsyncHttpApiDriver:
+    """Unit tests for AsyncHttpApiDriver."""
+
+    @pytest.fixture
+    def async_client(self, mocker: MockerFixture) -> Any:
+        """Patch the async API client created by the driver."""
+        mocker.patch("lightspeed_evaluation.pipeline.evaluation.driver.APIConfig")
+        client_cls = mocker.patch(
+            "lightspeed_evaluation.pipeline.evaluation.driver.AsyncAPIClient"
+        )
+        client = client_cls.return_value
+        client.aclose = mocker.AsyncMock()
+        return client
+
+    def test_execute_turn_runs_on_private_loop(
+        self, async_client: Any, mocker: MockerFixture
+    ) -> None:
+        """Test blocking calls run the async query in the caller's context."""
+        seen: list[str] = []
+
+        async def query(**_kwargs: Any) -> Any:
+            seen.append(_caller.get())
+            return mocker.Mock(
+                response="Done",
+                conversation_id="conv_123",
+                contexts=None,
+                tool_calls=None,
+                input_tokens=1,
+                output_tokens=1,
+                time_to_first_token=None,
+            )
+
+        async_client.query = query
+        driver = AsyncHttpApiDriver({"type": "http_api"}, enabled=True)
+        turn = TurnData(turn_id="1", query="Q")
+
+        _caller.set("conversation-thread")
+        error, conv_id = driver.execute_turn(turn, "existing_conv")
+        driver.close()
+
+        assert (error, conv_id) == (None, "conv_123")
+        assert turn.response == "Done"
+        assert seen == ["conversation-thread"]
+        async_client.aclose.assert_awaited_once()
+        assert driver._loop is None
+
+    @pytest.mark.asyncio
+    async def test_aexecute_turn(
+        self, async_client: Any, mocker: MockerFixture
+    ) -> None:
+        """Test async callers await the turn on their own loop."""
+        async_client.query = mocker.AsyncMock(side_effect=APIError("down"))
+        driver = AsyncHttpApiDriver({"type": "http_api"}, enabled=True)
+
+        error, conv_id = await driver.aexecute_turn(TurnData(turn_id="1", query="Q"))
+        await driver.aclose()
+
+        assert error == "API Error for turn 1: down"
+        assert conv_id is None
+        assert driver._loop is None
+
+    def test_shares_connection_pool_cache(
+        self, async_client: Any, mocker: MockerFixture
+    ) -> None:
+        """Test a cached driver reuses the disk cache of its connection pool."""
+        api_config_cls = mocker.patch(
+            "lightspeed_evaluation.pipeline.evaluation.driver.APIConfig"
+        )
+        api_config_cls.model_validate.return_value = mocker.Mock(
+            cache_enabled=True, cache_dir="cache"
+        )
+        client_cls = mocker.patch(
+            "lightspeed_evaluation.pipeline.evaluation.driver.AsyncAPIClient",
+            return_value=async_client,
+        )
+        pool = mocker.Mock()
+
+        AsyncHttpApiDriver({"type": "http_api"}, connection_pool=pool)
+
+        pool.cache.assert_called_once_with("cache")
+        assert client_cls.call_args.kwargs["cache"] is pool.cache.return_value
+
+    def test_disabled_driver(self, async_client: Any) -> None:
+        """Test a disabled driver skips turns and creates no client or loop."""
+        del async_client
+        driver = AsyncHttpApiDriver({"type": "http_api"}, enabled=False)
+
+        assert driver.execute_turn(TurnData(turn_id="1", query="Q"), "c") == (
+            None,
+            "c",
+        )
+        driver.close()
+        assert driver._loop is None
+
+    def test_registry_override(self, async_client: Any) -> None:
+        """Test the registry creates the async driver for http_api when asked."""
+        del async_client
+        registry = AgentDriverRegistry(drivers={"http_api": AsyncHttpApiDriver})
+
+        driver = registry.create_driver({"type": "http_api"}, enabled=True)
+
+        assert isinstance(driver, AsyncHttpApiDriver)
+
+    def test_registry_honors_async_client_option(self, async_client: Any) -> None:
+        """Test async_client selects the async driver for the default registry."""
+        del async_client
+        registry = AgentDriverRegistry()
+
+        async_driver = registry.create_driver(
+            {"type": "http_api", "async_client": True}
+        )
+        sync_driver = registry.create_driver({"type": "http_api"}, enabled=False)
+
+        assert isinstance(async_driver, AsyncHttpApiDriver)
+        assert isinstance(sync_driver, HttpApiDriver)
+        assert not isinstance(sync_driver, AsyncHttpApiDriver)
+        async_driver.close()
+
+    @pytest.mark.asyncio
+    async def test_close_in_running_loop_points_to_aclose(
+        self, async_client: Any
+    ) -> None:
+        """Test close() refuses to start a nested event loop."""
+        driver = AsyncHttpApiDriver({"type": "http_api"}, enabled=True)
+
+        with pytest.raises(RuntimeError, match="aclose"):
+            driver.close()
+        await driver.aclose()
+
+        async_client.aclose.assert_awaited_once()
+
+
 class TestProposalDriverExecuteTurn:
     """Unit tests for ProposalDriver.execute_turn outcome routing."""
 
@@ -2,7 +2,14 @@
 
 """Unit tests for pipeline evaluation evaluator module."""
 
-from typing import Optional
+import json
+import os
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, Optional
 
 import pytest
 from pytest_mock import MockerFixture
@@ -19,8 +26,29 @@ from lightspeed_evaluation.core.models import (
 from lightspeed_evaluation.core.script import ScriptExecutionManager
 from lightspeed_evaluation.core.system.exceptions import EvaluationError
 from lightspeed_evaluation.core.system.loader import ConfigLoader
+from lightspeed_evaluation.pipeline.evaluation.evaluator import (
+    MetricHandlerRegistry,
+    MetricsEvaluator,
+)
+
+_NLP_ONLY_PROBE = """
+import json, sys
+from lightspeed_evaluation.core.metrics.manager import MetricManager
+from lightspeed_evaluation.core.script import ScriptExecutionManager
+from lightspeed_evaluation.core.system import ConfigLoader
 from lightspeed_evaluation.pipeline.evaluation.evaluator import MetricsEvaluator
 
+loader = ConfigLoader()
+config = loader.load_system_config(sys.argv[1])
+evaluator = MetricsEvaluator(loader, MetricManager(config), ScriptExecutionManager())
+evaluator.prepare_handlers({"nlp"})
+print(json.dumps({
+    "cache_enabled": config.llm.cache_enabled,
+    "initialized": evaluator.handlers.initialized,
+    "litellm_loaded": "litellm" in sys.modules,
+}))
+"""
+
 
 class TestMetricsEvaluator:
     """Unit tests for MetricsEvaluator."""
@@ -603,3 +631,391 @@ class TestMetricsEvaluator:
         assert result.evaluation_latency > 0.0
         assert result.execution_time == result.evaluation_latency + result.agent_latency
         assert result.execution_time >= 4.0
+
+
+def _scores_by_expected_response(
+    scores: dict[str, float | Exception], delay: float = 0.0
+) -> Callable[[str, EvaluationData, EvaluationScope], tuple[float, str]]:
+    """Handler side effect scoring each expected response alternative."""
+
+    def evaluate(
+        _metric_name: str, _conv_data: EvaluationData, scope: EvaluationScope
+    ) -> tuple[float, str]:
+        assert scope.turn_data is not None
+        expected = str(scope.turn_data.expected_response)
+        outcome = scores[expected]
+        if isinstance(outcome, Exception):
+            raise outcome
+        if outcome < 0.5:
+            time.sleep(delay)
+        return outcome, f"Matched {expected}"
+
+    return evaluate
+
+
+class TestConcurrentExpectedResponses:
+    """Unit tests for concurrent and ordered evaluation of expected responses."""
+
+    @staticmethod
+    def _request(expected: list[str], response: str = "R") -> EvaluationRequest:
+        """Build a context_recall request for a turn with several expected responses."""
+        turn_data = TurnData(
+            turn_id="1",
+            query="Q",
+            response=response,
+            expected_response=expected,
+            contexts=["C"],
+        )
+        conv_data = EvaluationData(conversation_group_id="test_conv", turns=[turn_data])
+        return EvaluationRequest.for_turn(
+            conv_data, "ragas:context_recall", 0, turn_data
+        )
+
+    def test_concurrent_pass_wins(self, evaluator: MetricsEvaluator) -> None:
+        """A passing alternative decides the result whatever order they finish in."""
+        evaluator.system_config.core.expected_response_concurrency = 3
+        evaluator.handlers["ragas"].evaluate.side_effect = _scores_by_expected_response(
+            {"A": 0.2, "B": 0.9, "C": 0.4}
+        )
+
+        result = evaluator.evaluate_metric(self._request(["A", "B", "C"]))
+
+        assert result is not None
+        assert result.result == "PASS"
+        assert result.score == 0.9
+        assert result.reason == "Matched B"
+        assert result.expected_responses_evaluated is not None
+        assert 1 <= result.expected_responses_evaluated <= 3
+
+    def test_concurrent_without_pass_keeps_sequential_result(
+        self, evaluator: MetricsEvaluator
+    ) -> None:
+        """Without a PASS all alternatives are scored and combined in order."""
+        evaluator.system_config.core.expected_response_concurrency = 2
+        evaluator.handlers["ragas"].evaluate.side_effect = _scores_by_expected_response(
+            {"A": 0.3, "B": 0.45, "C": 0.4}
+        )
+
+        result = evaluator.evaluate_metric(self._request(["A", "B", "C"]))
+
+        assert result is not None
+        assert result.result == "FAIL"
+        assert result.score == 0.45
+        assert result.reason == "0.3; Matched A\n0.45; Matched B\n0.4; Matched C"
+        assert result.expected_responses_evaluated == 3
+
+    def test_pending_alternatives_cancelled_after_pass(
+        self, evaluator: MetricsEvaluator
+    ) -> None:
+        """Alternatives that have not started when one passes are never scored."""
+        evaluator.system_config.core.expected_response_concurrency = 2
+        handler = evaluator.handlers["ragas"]
+        handler.evaluate.side_effect = _scores_by_expected_response(
+            {"A": 0.9, "B": 0.1, "C": 0.1, "D": 0.1}, delay=0.2
+        )
+
+        result = evaluator.evaluate_metric(self._request(["A", "B", "C", "D"]))
+
+        scored = [
+            call.args[2].turn_data.expected_response
+            for call in handler.evaluate.call_args_list
+        ]
+        assert result is not None
+        assert result.result == "PASS"
+        assert "D" not in scored
+        assert result.expected_responses_evaluated == len(scored)
+
+    def test_concurrent_error_without_pass(self, evaluator: MetricsEvaluator) -> None:
+        """An evaluation error with no passing alternative yields ERROR."""
+        evaluator.system_config.core.expected_response_concurrency = 2
+        evaluator.handlers["ragas"].evaluate.side_effect = _scores_by_expected_response(
+            {"A": 0.3, "B": EvaluationError("judge down")}
+        )
+
+        result = evaluator.evaluate_metric(self._request(["A", "B"]))
+
+        assert result is not None
+        assert result.result == "ERROR"
+        assert "judge down" in result.reason
+
+    def test_order_by_similarity(self, evaluator: MetricsEvaluator) -> None:
+        """The alternative closest to the response is scored first."""
+        evaluator.system_config.core.order_expected_responses = True
+        handler = evaluator.handlers["ragas"]
+        handler.evaluate.side_effect = _scores_by_expected_response(
+            {"restart the pod": 0.1, "scale the deployment with oc scale": 0.9}
+        )
+
+        result = evaluator.evaluate_metric(
+            self._request(
+                ["restart the pod", "scale the deployment with oc scale"],
+                response="Use oc scale to scale the deployment.",
+            )
+        )
+
+        assert result is not None
+        assert result.result == "PASS"
+        assert result.expected_responses_evaluated == 1
+        handler.evaluate.assert_called_once()
+
+
+class TestFusedTurnMetrics:
+    """Unit tests for fused evaluation of custom turn metrics."""
+
+    @pytest.fixture
+    def fused_turn(self) -> TurnData:
+        """Turn with the data both fusable custom metrics need."""
+        return TurnData(
+            turn_id="1",
+            query="How do I scale?",
+            response="Use oc scale.",
+            expected_response="Run oc scale.",
+            expected_intent="provide instructions",
+        )
+
+    @pytest.fixture
+    def custom_handler(self, evaluator: MetricsEvaluator, mocker: MockerFixture) -> Any:
+        """Primary custom handler advertising the real fusable metrics."""
+        mocker.patch(
+            "lightspeed_evaluation.pipeline.evaluation.evaluator.CustomMetrics.FUSABLE_METRICS",
+            ("answer_correctness", "intent_eval"),
+        )
+        handler = evaluator.handlers["custom"]
+        evaluator.llm_manager.judge_id = "primary"
+        mocker.patch.object(
+            evaluator.judge_orchestrator,
+            "get_primary_handler",
+            return_value=("primary", handler),
+        )
+        return handler
+
+    def test_results_share_one_call(
+        self,
+        evaluator: MetricsEvaluator,
+        custom_handler: Any,
+        fused_turn: TurnData,
+    ) -> None:
+        """Fused scores become results with the call's tokens split evenly."""
+        conv_data = EvaluationData(conversation_group_id="conv", turns=[fused_turn])
+
+        def fused_call(*_args: Any) -> tuple[dict[str, tuple[float, str]], int]:
+            tracker = TokenTracker.get_active()
+            assert tracker is not None
+            tracker.add_judge_tokens(101, 20)
+            return {
+                "answer_correctness": (0.9, "Correct"),
+                "intent_eval": (0.0, "Wrong intent"),
+            }, 50
+
+        custom_handler.evaluate_fused.side_effect = fused_call
+
+        results = evaluator.evaluate_fused_turn_metrics(
+            conv_data,
+            0,
+            fused_turn,
+            [
+                "custom:answer_correctness",
+                "custom:intent_eval",
+                "ragas:faithfulness",
+            ],
+        )
+
+        custom_handler.evaluate_fused.assert_called_once()
+        assert set(results) == {"custom:answer_correctness", "custom:intent_eval"}
+        correctness = results["custom:answer_correctness"]
+        intent = results["custom:intent_eval"]
+        assert (correctness.result, correctness.threshold) == ("PASS", 0.8)
+        assert intent.result == "FAIL"
+        assert correctness.judge_llm_input_tokens == 51
+        assert intent.judge_llm_input_tokens == 50
+        assert correctness.judge_llm_output_tokens == 10
+        assert correctness.judge_llm_input_tokens_saved == 25
+        assert correctness.judge_scores is not None
+        assert correctness.judge_scores[0].judge_id == "primary"
+
+    def test_skips_when_fewer_than_two_fusable(
+        self,
+        evaluator: MetricsEvaluator,
+        custom_handler: Any,
+        fused_turn: TurnData,
+    ) -> None:
+        """Panel metrics and list expected responses are never fused."""
+        conv_data = EvaluationData(conversation_group_id="conv", turns=[fused_turn])
+        metrics = ["custom:answer_correctness", "custom:intent_eval"]
+
+        evaluator.llm_manager.should_use_panel_for_metric.side_effect = (
+            lambda metric: metric == "custom:intent_eval"
+        )
+        assert not evaluator.evaluate_fused_turn_metrics(
+            conv_data, 0, fused_turn, metrics
+        )
+
+        evaluator.llm_manager.should_use_panel_for_metric.side_effect = None
+        listed = fused_turn.model_copy(update={"expected_response": ["a", "b"]})
+        assert not evaluator.evaluate_fused_turn_metrics(conv_data, 0, listed, metrics)
+        custom_handler.evaluate_fused.assert_not_called()
+
+
+class TestMetricHandlerRegistry:
+    """Unit tests for lazy metric handler creation."""
+
+    def test_handlers_created_on_first_access(self, mocker: MockerFixture) -> None:
+        """Only frameworks that are looked up get a handler."""
+        factory = mocker.Mock(side_effect=lambda name: f"{name}-handler")
+        registry = MetricHandlerRegistry(("nlp", "ragas"), factory)
+
+        assert "ragas" in registry
+        assert len(registry) == 2
+        assert list(registry) == ["nlp", "ragas"]
+        factory.assert_not_called()
+
+        assert registry["nlp"] == "nlp-handler"
+        assert registry["nlp"] == "nlp-handler"
+        factory.assert_called_once_with("nlp")
+        assert registry.initialized == ["nlp"]
+
+    def test_unknown_framework_raises_key_error(self, mocker: MockerFixture) -> None:
+        """Unsupported frameworks are not created."""
+        factory = mocker.Mock()
+        registry = MetricHandlerRegistry(("nlp",), factory)
+
+        assert "unknown" not in registry
+        with pytest.raises(KeyError):
+            _ = registry["unknown"]
+        factory.assert_not_called()
+
+    def test_prepare_skips_unknown_frameworks(self, mocker: MockerFixture) -> None:
+        """prepare() builds known frameworks and ignores the rest."""
+        factory = mocker.Mock()
+        registry = MetricHandlerRegistry(("nlp", "ragas"), factory)
+
+        registry.prepare({"ragas", "unknown"})
+
+        factory.assert_called_once_with("ragas")
+        assert registry.initialized == ["ragas"]
+
+    def test_evaluator_prepares_only_requested_frameworks(
+        self, evaluator: MetricsEvaluator, mocker: MockerFixture
+    ) -> None:
+        """Preparing an NLP-only run does not build LLM-backed handlers."""
+        ragas_cls = mocker.patch(
+            "lightspeed_evaluation.pipeline.evaluation.evaluator.RagasMetrics"
+        )
+
+        evaluator.prepare_handlers({"nlp"})
+
+        assert evaluator.handlers.initialized == ["nlp"]
+        ragas_cls.assert_not_called()
+
+    def test_close_closes_created_handlers(self, mocker: MockerFixture) -> None:
+        """close() releases created handlers that define it, and only those."""
+        closable = mocker.Mock()
+        plain = object()
+        handlers = {"ragas": closable, "nlp": plain}
+        registry = MetricHandlerRegistry(("nlp", "ragas", "deepeval"), handlers.get)
+        registry.prepare({"nlp", "ragas"})
+
+        registry.close()
+
+        closable.close.assert_called_once_with()
+        assert registry.initialized == ["nlp", "ragas"]
+
+
+class TestJudgeCache:
+    """Unit tests for enabling the litellm judge cache."""
+
+    @pytest.fixture
+    def no_litellm_cache(self) -> Any:
+        """Run with no process-global litellm cache and restore it afterwards."""
+        import litellm  # pylint: disable=import-outside-toplevel
+
+        original = litellm.cache
+        litellm.cache = None
+        yield litellm
+        litellm.cache = original
+
+    def _evaluator(
+        self,
+        config_loader: ConfigLoader,
+        mock_metric_manager: MetricManager,
+        mock_script_manager: ScriptExecutionManager,
+        mocker: MockerFixture,
+        cache_dir: Optional[str],
+    ) -> MetricsEvaluator:
+        """Create an evaluator whose judge caches into cache_dir when set."""
+        llm_manager = mocker.patch(
+            "lightspeed_evaluation.pipeline.evaluation.evaluator.LLMManager"
+        )
+        llm_config = llm_manager.from_system_config.return_value.get_config()
+        llm_config.cache_enabled = cache_dir is not None
+        llm_config.cache_dir = cache_dir
+        embedding_manager = mocker.patch(
+            "lightspeed_evaluation.pipeline.evaluation.evaluator.EmbeddingManager"
+        )
+        embedding_manager.from_system_config.return_value.config.cache_enabled = False
+        mocker.patch(
+            "lightspeed_evaluation.pipeline.evaluation.evaluator.CustomMetrics"
+        )
+        return MetricsEvaluator(config_loader, mock_metric_manager, mock_script_manager)
+
+    def test_custom_only_run_enables_cache(
+        self,
+        config_loader: ConfigLoader,
+        mock_metric_manager: MetricManager,
+        mock_script_manager: ScriptExecutionManager,
+        mocker: MockerFixture,
+        no_litellm_cache: Any,
+        tmp_path: Path,
+    ) -> None:
+        """A run using only custom metrics still caches judge completions."""
+        evaluator = self._evaluator(
+            config_loader,
+            mock_metric_manager,
+            mock_script_manager,
+            mocker,
+            str(tmp_path / "llm_cache"),
+        )
+
+        evaluator.prepare_handlers({"custom"})
+
+        assert evaluator.handlers.initialized == ["custom"]
+        cache = no_litellm_cache.cache
+        assert cache is not None
+        assert "completion" in cache.supported_call_types
+        assert "embedding" not in cache.supported_call_types
+
+    def test_cache_disabled_leaves_litellm_uncached(
+        self,
+        config_loader: ConfigLoader,
+        mock_metric_manager: MetricManager,
+        mock_script_manager: ScriptExecutionManager,
+        mocker: MockerFixture,
+        no_litellm_cache: Any,
+    ) -> None:
+        """No litellm cache is created when judge and embedding caching are off."""
+        evaluator = self._evaluator(
+            config_loader, mock_metric_manager, mock_script_manager, mocker, None
+        )
+
+        evaluator.prepare_handlers({"custom"})
+
+        assert no_litellm_cache.cache is None
+
+    def test_nlp_only_run_does_not_import_litellm(self, tmp_path: Path) -> None:
+        """Building the evaluator for NLP metrics leaves litellm unimported."""
+        system_yaml = tmp_path / "system.yaml"
+        system_yaml.write_text(
+            f"llm:\n  cache_dir: {tmp_path / 'llm_cache'}\n", encoding="utf-8"
+        )
+        completed = subprocess.run(
+            [sys.executable, "-c", _NLP_ONLY_PROBE, str(system_yaml)],
+            capture_output=True,
+            check=True,
+            text=True,
+            env={**os.environ, "OPENAI_API_KEY": "test-key"},
+        )
+        result = json.loads(completed.stdout.strip().splitlines()[-1])
+
+        assert result["cache_enabled"] is True
+        assert result["initialized"] == ["nlp"]
+        assert result["litellm_loaded"] is False
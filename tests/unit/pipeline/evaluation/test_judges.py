@@ -5,9 +5,15 @@
 from typing import Any
 
 import pytest
+from pydantic import ValidationError
 from pytest_mock import MockerFixture
 
-from lightspeed_evaluation.core.models import JudgeScore
+from lightspeed_evaluation.core.models import (
+    JudgeEscalationConfig,
+    JudgePanelConfig,
+    JudgeScore,
+)
+from lightspeed_evaluation.core.system.exceptions import EvaluationError
 from lightspeed_evaluation.pipeline.evaluation.judges import JudgeOrchestrator
 
 
@@ -27,6 +33,59 @@ def _make_orchestrator(
     )
 
 
+def _run_panel(  # pylint: disable=too-many-arguments
+    mocker: MockerFixture,
+    scores: dict[str, float | None],
+    *,
+    strategy: str = "average",
+    escalation: JudgeEscalationConfig | None = None,
+    threshold: float = 0.7,
+    early_stopping: bool = True,
+) -> tuple[Any, list[str]]:
+    """Evaluate with a panel judging the given scores; None raises an error.
+
+    Returns the metric result and the judges actually called, in order.
+    """
+    called: list[str] = []
+
+    def make_handler(_framework: str, judge_manager: Any) -> Any:
+        def evaluate(*_args: Any) -> tuple[float | None, str]:
+            called.append(judge_manager.judge_id)
+            score = scores[judge_manager.judge_id]
+            if score is None:
+                raise EvaluationError("judge down")
+            return score, f"{judge_manager.judge_id} reason"
+
+        return mocker.MagicMock(evaluate=evaluate)
+
+    judge_ids = list(scores)
+    manager = mocker.MagicMock()
+    manager.system_config.judge_panel = JudgePanelConfig(
+        judges=judge_ids,
+        aggregation_strategy=strategy,
+        early_stopping=early_stopping,
+        escalation=escalation,
+    )
+    manager.get_judges_for_metric.return_value = [
+        mocker.MagicMock(judge_id=judge_id) for judge_id in judge_ids
+    ]
+    token_tracker = mocker.MagicMock()
+    token_tracker.get_judge_counts.return_value = (10, 2)
+    token_tracker.get_embedding_counts.return_value = 0
+    orchestrator = JudgeOrchestrator(
+        llm_manager=manager,
+        primary_handlers={},
+        handler_factory=make_handler,
+        status_determiner=lambda s, t: "PASS" if s >= t else "FAIL",
+    )
+    request = mocker.MagicMock(metric_identifier="ragas:faithfulness")
+
+    result = orchestrator.evaluate_with_judges(
+        request, mocker.MagicMock(), token_tracker, threshold
+    )
+    return result, called
+
+
 class TestAggregateScores:
     """Tests for JudgeOrchestrator.aggregate_scores method."""
 
@@ -300,3 +359,153 @@ class TestHandlerCaching:
         assert handler1 is handler2
         # Factory called only once
         assert handler_factory.call_count == 1
+
+    def test_close_closes_judge_handlers(self, mocker: MockerFixture) -> None:
+        """close() releases the handlers created for non-primary judges."""
+        mock_manager = mocker.MagicMock()
+        mock_manager.judge_id = "primary"
+        primary_handler = mocker.MagicMock()
+        judge_handler = mocker.MagicMock()
+
+        orchestrator = JudgeOrchestrator(
+            llm_manager=mock_manager,
+            primary_handlers={"ragas": primary_handler},
+            handler_factory=mocker.MagicMock(return_value=judge_handler),
+            status_determiner=lambda s, _: "PASS",
+        )
+        judge = mocker.MagicMock()
+        judge.judge_id = "judge-1"
+        orchestrator._get_handler_for_judge("ragas", judge)
+
+        orchestrator.close()
+
+        judge_handler.close.assert_called_once_with()
+        primary_handler.close.assert_not_called()
+
+
+class TestJudgeEscalation:
+    """Tests for cost-aware escalation from the leading panel judges."""
+
+    def test_confident_initial_judge_settles_result(
+        self, mocker: MockerFixture
+    ) -> None:
+        """A score far from the threshold skips the stronger judges."""
+        result, called = _run_panel(
+            mocker,
+            {"cheap": 0.95, "strong-1": 0.2, "strong-2": 0.2},
+            escalation=JudgeEscalationConfig(initial_judges=1),
+        )
+
+        assert called == ["cheap"]
+        assert result.result == "PASS"
+        assert result.score == pytest.approx(0.95)
+        assert result.judge_llm_input_tokens == 10
+        assert [(js.judge_id, js.consulted) for js in result.judge_scores or []] == [
+            ("cheap", True),
+            ("strong-1", False),
+            ("strong-2", False),
+        ]
+
+    @pytest.mark.parametrize(
+        "scores,initial_judges",
+        [
+            ({"cheap": 0.75, "strong-1": 0.2, "strong-2": 0.3}, 1),
+            ({"cheap": 0.95, "cheap-2": 0.1, "strong": 0.2}, 2),
+            ({"cheap": None, "strong-1": 0.2, "strong-2": 0.3}, 1),
+        ],
+        ids=["near-threshold", "disagreement", "judge-error"],
+    )
+    def test_uncertain_initial_opinion_escalates(
+        self,
+        mocker: MockerFixture,
+        scores: dict[str, float | None],
+        initial_judges: int,
+    ) -> None:
+        """Near-threshold, split or failed initial judges consult the whole panel."""
+        result, called = _run_panel(
+            mocker,
+            scores,
+            escalation=JudgeEscalationConfig(initial_judges=initial_judges),
+        )
+
+        assert called == list(scores)
+        assert all(js.consulted for js in result.judge_scores or [])
+        assert result.judge_llm_input_tokens == 30
+
+    def test_initial_judges_must_leave_judges_to_escalate_to(self) -> None:
+        """Escalation cannot start with the whole panel."""
+        with pytest.raises(ValidationError, match="must be less than"):
+            JudgePanelConfig(
+                judges=["a", "b"],
+                escalation=JudgeEscalationConfig(initial_judges=2),
+            )
+
+    def test_aggregation_ignores_judges_not_consulted(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Unconsulted judges do not count towards the aggregated score."""
+        orch = _make_orchestrator(mocker, "average")
+        judge_scores = [
+            JudgeScore(judge_id="j1", score=0.9, reason="A"),
+            JudgeScore(judge_id="j2", consulted=False),
+        ]
+
+        assert orch.aggregate_scores(judge_scores, 0.7) == (0.9, "A", None)
+
+
+class TestEarlyStopping:
+    """Tests for skipping judges once the outcome is decided."""
+
+    @pytest.mark.parametrize(
+        "scores,expected_called,expected_status",
+        [
+            ([0.9, 0.8, 0.9, 0.1, 0.1], 3, "PASS"),
+            ([0.1, 0.2, 0.1, 0.9, 0.9], 3, "FAIL"),
+            ([0.9, 0.1, 0.9, 0.1, 0.9], 5, "PASS"),
+            ([0.9, None, 0.9, 0.9, 0.1], 4, "PASS"),
+        ],
+        ids=["three-passes", "three-fails", "undecided", "error-keeps-voting"],
+    )
+    def test_majority_vote_stops_when_decided(
+        self,
+        mocker: MockerFixture,
+        scores: list[float | None],
+        expected_called: int,
+        expected_status: str,
+    ) -> None:
+        """Judges are skipped once no remaining vote can change the majority."""
+        judges: dict[str, float | None] = {
+            f"j{i}": score for i, score in enumerate(scores, 1)
+        }
+
+        result, called = _run_panel(mocker, judges, strategy="majority_vote")
+
+        assert called == list(judges)[:expected_called]
+        assert result.result == expected_status
+        assert [js.consulted for js in result.judge_scores or []] == [
+            i < expected_called for i in range(len(scores))
+        ]
+        assert result.judge_llm_input_tokens == 10 * expected_called
+
+    def test_max_stops_at_perfect_score(self, mocker: MockerFixture) -> None:
+        """A 1.0 score cannot be beaten, so max stops calling judges."""
+        result, called = _run_panel(
+            mocker, {"j1": 0.4, "j2": 1.0, "j3": 0.5}, strategy="max"
+        )
+
+        assert called == ["j1", "j2"]
+        assert result.score == 1.0
+        assert (result.judge_scores or [])[2].reason == (
+            "Not consulted: outcome already decided"
+        )
+
+    def test_early_stopping_can_be_disabled(self, mocker: MockerFixture) -> None:
+        """early_stopping: false always calls the whole panel."""
+        judges: dict[str, float | None] = {"j1": 1.0, "j2": 0.5, "j3": 0.5}
+
+        result, called = _run_panel(
+            mocker, judges, strategy="max", early_stopping=False
+        )
+
+        assert called == list(judges)
+        assert result.score == 1.0
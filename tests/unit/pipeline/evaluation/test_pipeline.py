@@ -2,15 +2,30 @@
 
 """Unit tests for EvaluationPipeline."""
 
+from pathlib import Path
+
 import pytest
 from pytest_mock import MockerFixture
 
+from lightspeed_evaluation.core.llm.batch import BatchStatus, get_active_batch_judge
+from lightspeed_evaluation.core.metrics.geval_steps import (
+    GEVAL_STEPS_FILENAME,
+    steps_key,
+)
 from lightspeed_evaluation.core.models import (
+    BatchJudgeConfig,
     EvaluationData,
     EvaluationResult,
+    SequentialTestConfig,
+    TurnData,
 )
 from lightspeed_evaluation.core.models.agents import AgentsConfig
+from lightspeed_evaluation.core.system.exceptions import (
+    BatchPendingError,
+    ConfigurationError,
+)
 from lightspeed_evaluation.core.system.loader import ConfigLoader
+from lightspeed_evaluation.core.system.sequential import load_sequential_report
 from lightspeed_evaluation.pipeline.evaluation.pipeline import EvaluationPipeline
 
 
@@ -197,6 +212,66 @@ class TestEvaluationPipeline:
 
         mock_save.assert_called_once()
 
+    def test_conversation_overrides_share_pooled_driver(
+        self,
+        mock_config_loader: ConfigLoader,
+        mocker: MockerFixture,
+    ) -> None:
+        """Conversations with the same agent override reuse one pooled driver."""
+        for name in (
+            "MetricManager",
+            "EvaluationErrorHandler",
+            "ScriptExecutionManager",
+            "MetricsEvaluator",
+        ):
+            mocker.patch(f"lightspeed_evaluation.pipeline.evaluation.pipeline.{name}")
+        mock_registry_cls = mocker.patch(
+            "lightspeed_evaluation.pipeline.evaluation.pipeline.AgentDriverRegistry"
+        )
+        default_driver, override_driver = mocker.Mock(), mocker.Mock()
+        mock_registry_cls.return_value.create_driver.side_effect = [
+            default_driver,
+            override_driver,
+        ]
+        mock_processor = mocker.Mock()
+        mock_processor.process_conversation.return_value = []
+        mocker.patch(
+            "lightspeed_evaluation.pipeline.evaluation.pipeline.ConversationProcessor",
+            return_value=mock_processor,
+        )
+
+        pipeline = EvaluationPipeline(mock_config_loader)
+        mocker.patch.object(
+            pipeline,
+            "_resolve_agent_config_for_conversation",
+            side_effect=lambda conv: (
+                {"type": "http_api", "api_base": "http://override"}
+                if conv.agent_config
+                else None
+            ),
+        )
+        data = [
+            EvaluationData(
+                conversation_group_id=f"conv{i}",
+                turns=[TurnData(turn_id="t1", query="q")],
+                agent_config=({"timeout": 5} if i else None),
+            )
+            for i in range(3)
+        ]
+        for conv in data:
+            pipeline._process_conversation(conv)
+
+        drivers = [
+            c.args[1] for c in mock_processor.process_conversation.call_args_list
+        ]
+        assert drivers == [default_driver, override_driver, override_driver]
+        override_driver.close.assert_not_called()
+
+        pipeline.close()
+
+        override_driver.close.assert_called_once()
+        default_driver.close.assert_called_once()
+
     def test_save_amended_data_handles_exception(
         self,
         mock_config_loader: ConfigLoader,
@@ -269,8 +344,10 @@ class TestEvaluationPipeline:
         )
 
         # Mock litellm.cache
-        mock_litellm = mocker.patch(
-            "lightspeed_evaluation.pipeline.evaluation.pipeline.litellm"
+        mock_litellm = mocker.Mock()
+        mocker.patch(
+            "lightspeed_evaluation.pipeline.evaluation.pipeline._loaded_litellm",
+            return_value=mock_litellm,
         )
         mock_cache = mocker.Mock()
         mock_litellm.cache = mock_cache
@@ -303,8 +380,10 @@ class TestEvaluationPipeline:
             "lightspeed_evaluation.pipeline.evaluation.pipeline.ConversationProcessor"
         )
 
-        mock_litellm = mocker.patch(
-            "lightspeed_evaluation.pipeline.evaluation.pipeline.litellm"
+        mock_litellm = mocker.Mock()
+        mocker.patch(
+            "lightspeed_evaluation.pipeline.evaluation.pipeline._loaded_litellm",
+            return_value=mock_litellm,
         )
         mock_litellm.cache = None
 
@@ -334,8 +413,10 @@ class TestEvaluationPipeline:
         )
 
         # Mock litellm.cache with a disconnect that raises
-        mock_litellm = mocker.patch(
-            "lightspeed_evaluation.pipeline.evaluation.pipeline.litellm"
+        mock_litellm = mocker.Mock()
+        mocker.patch(
+            "lightspeed_evaluation.pipeline.evaluation.pipeline._loaded_litellm",
+            return_value=mock_litellm,
         )
         mock_cache = mocker.Mock()
         mock_litellm.cache = mock_cache
@@ -376,3 +457,189 @@ class TestEvaluationPipeline:
         pipeline = EvaluationPipeline(mock_config_loader, output_dir="/custom/output")
 
         assert pipeline.output_dir == "/custom/output"
+
+    def test_geval_steps_persist_across_runs(
+        self,
+        mock_config_loader: ConfigLoader,
+        sample_evaluation_data: list[EvaluationData],
+        tmp_path: Path,
+        mocker: MockerFixture,
+    ) -> None:
+        """Steps generated in one run are saved and loaded by the next."""
+        for name in (
+            "MetricManager",
+            "AgentDriverRegistry",
+            "EvaluationErrorHandler",
+            "ScriptExecutionManager",
+            "MetricsEvaluator",
+        ):
+            mocker.patch(f"lightspeed_evaluation.pipeline.evaluation.pipeline.{name}")
+        mock_processor = mocker.Mock()
+        mocker.patch(
+            "lightspeed_evaluation.pipeline.evaluation.pipeline.ConversationProcessor",
+            return_value=mock_processor,
+        )
+        key = steps_key("openai/gpt-4o-mini", "Is it correct?", None)
+
+        first = EvaluationPipeline(mock_config_loader, output_dir=str(tmp_path))
+
+        def generate_steps(*_args: object) -> list[EvaluationResult]:
+            first.geval_steps_cache.put(key, ["Generated step"])
+            return []
+
+        mock_processor.process_conversation.side_effect = generate_steps
+        first.run_evaluation(sample_evaluation_data)
+        assert (tmp_path / GEVAL_STEPS_FILENAME).exists()
+
+        mock_processor.process_conversation.side_effect = None
+        mock_processor.process_conversation.return_value = []
+        second = EvaluationPipeline(mock_config_loader, output_dir=str(tmp_path))
+        second.run_evaluation(sample_evaluation_data)
+        assert second.geval_steps_cache.get(key) == ["Generated step"]
+
+    def test_sequential_test_stops_early(
+        self,
+        mock_config_loader: ConfigLoader,
+        tmp_path: Path,
+        mocker: MockerFixture,
+    ) -> None:
+        """A sequential run stops once the test decides and records the verdict."""
+        for name in (
+            "MetricManager",
+            "AgentDriverRegistry",
+            "EvaluationErrorHandler",
+            "ScriptExecutionManager",
+            "MetricsEvaluator",
+        ):
+            mocker.patch(f"lightspeed_evaluation.pipeline.evaluation.pipeline.{name}")
+        mock_processor = mocker.Mock()
+        mock_processor.process_conversation.side_effect = lambda conv, _driver: [
+            EvaluationResult(
+                conversation_group_id=conv.conversation_group_id,
+                metric_identifier="custom:answer_correctness",
+                result="FAIL",
+                threshold=0.5,
+            )
+        ]
+        mocker.patch(
+            "lightspeed_evaluation.pipeline.evaluation.pipeline.ConversationProcessor",
+            return_value=mock_processor,
+        )
+        mock_config_loader.system_config.core.max_threads = 1
+        mock_config_loader.system_config.sequential_test = SequentialTestConfig(
+            enabled=True, baseline_pass_rate=90, max_drop=10
+        )
+        data = [
+            EvaluationData(
+                conversation_group_id=f"conv{i}",
+                turns=[TurnData(turn_id="t1", query="q")],
+            )
+            for i in range(50)
+        ]
+
+        pipeline = EvaluationPipeline(mock_config_loader, output_dir=str(tmp_path))
+        results = pipeline.run_evaluation(data)
+
+        # Five failures cross the regression bound at alpha=0.05, beta=0.1
+        assert len(results) == 5
+        assert pipeline.sequential_result is not None
+        assert pipeline.sequential_result.decision == "regression"
+        assert pipeline.sequential_result.conversations_consumed == 5
+        assert pipeline.sequential_result.conversations_total == 50
+        assert load_sequential_report(str(tmp_path)) == pipeline.sequential_result
+
+    def test_batch_judge_rounds(
+        self,
+        mock_config_loader: ConfigLoader,
+        tmp_path: Path,
+        mocker: MockerFixture,
+    ) -> None:
+        """Deferred judge calls are batched and only the final round is saved."""
+        for name in (
+            "MetricManager",
+            "AgentDriverRegistry",
+            "EvaluationErrorHandler",
+            "ScriptExecutionManager",
+            "MetricsEvaluator",
+        ):
+            mocker.patch(f"lightspeed_evaluation.pipeline.evaluation.pipeline.{name}")
+        mock_storage = mocker.Mock()
+        mocker.patch(
+            "lightspeed_evaluation.pipeline.evaluation.pipeline."
+            "create_pipeline_storage_backend",
+            return_value=mock_storage,
+        )
+
+        def judge(conv: EvaluationData, _driver: object) -> list[EvaluationResult]:
+            batch_judge = get_active_batch_judge()
+            assert batch_judge is not None
+            try:
+                batch_judge.completion(
+                    {
+                        "model": "openai/gpt-4o-mini",
+                        "messages": [
+                            {"role": "user", "content": conv.conversation_group_id}
+                        ],
+                    }
+                )
+                result = "PASS"
+            except BatchPendingError:
+                result = "ERROR"
+            return [
+                EvaluationResult(
+                    conversation_group_id=conv.conversation_group_id,
+                    metric_identifier="custom:answer_correctness",
+                    result=result,
+                    threshold=0.5,
+                )
+            ]
+
+        mock_processor = mocker.Mock()
+        mock_processor.process_conversation.side_effect = judge
+        mocker.patch(
+            "lightspeed_evaluation.pipeline.evaluation.pipeline.ConversationProcessor",
+            return_value=mock_processor,
+        )
+        mock_config_loader.system_config.batch_judge = BatchJudgeConfig(
+            enabled=True, state_dir=str(tmp_path / "batch"), poll_interval=0.001
+        )
+        data = [
+            EvaluationData(
+                conversation_group_id=f"conv{i}",
+                turns=[TurnData(turn_id="t1", query="q")],
+            )
+            for i in range(3)
+        ]
+
+        pipeline = EvaluationPipeline(mock_config_loader, output_dir=str(tmp_path))
+        assert pipeline.batch_judge is not None
+        endpoint = mocker.Mock()
+        endpoint.submit.return_value = "batch_1"
+        endpoint.status.return_value = BatchStatus("completed", "output_1")
+        endpoint.output.side_effect = lambda _provider, _file_id: [
+            {
+                "custom_id": line["custom_id"],
+                "response": {"status_code": 200, "body": {"choices": []}},
+            }
+            for line in endpoint.submit.call_args[0][1]
+        ]
+        pipeline.batch_judge.client = endpoint
+        results = pipeline.run_evaluation(data)
+
+        assert [r.result for r in results] == ["PASS"] * 3
+        assert mock_processor.process_conversation.call_count == 6
+        assert len(endpoint.submit.call_args[0][1]) == 3
+        mock_storage.save_run.assert_called_once_with(results)
+
+    def test_batch_judge_rejects_sequential_test(
+        self, mock_config_loader: ConfigLoader
+    ) -> None:
+        """Batch rounds cannot feed a sequential test."""
+        config = mock_config_loader.system_config
+        config.batch_judge = BatchJudgeConfig(enabled=True)
+        config.sequential_test = SequentialTestConfig(
+            enabled=True, baseline_pass_rate=90
+        )
+
+        with pytest.raises(ConfigurationError, match="sequential_test"):
+            EvaluationPipeline(mock_config_loader)
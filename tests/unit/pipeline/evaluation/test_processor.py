@@ -1,4 +1,4 @@
-# pylint: disable=unused-argument,protected-access,too-many-arguments, too-many-positional-arguments
+# pylint: disable=too-many-lines,unused-argument,protected-access,too-many-arguments, too-many-positional-arguments
 
 """Unit tests for ConversationProcessor."""
 
@@ -9,8 +9,9 @@ import pytest
 from _pytest.logging import LogCaptureFixture
 from pytest_mock import MockerFixture
 
-from lightspeed_evaluation.core.metrics.manager import MetricLevel
+from lightspeed_evaluation.core.metrics.manager import MetricLevel, MetricManager
 from lightspeed_evaluation.core.models import (
+    BudgetConfig,
     EvaluationData,
     EvaluationRequest,
     EvaluationResult,
@@ -19,7 +20,9 @@ from lightspeed_evaluation.core.models import (
 )
 from lightspeed_evaluation.core.script import ScriptExecutionError
 from lightspeed_evaluation.core.system.loader import ConfigLoader
+from lightspeed_evaluation.pipeline.evaluation.budget import BudgetTracker
 from lightspeed_evaluation.pipeline.evaluation.driver import AgentDriver
+from lightspeed_evaluation.pipeline.evaluation.errors import EvaluationErrorHandler
 from lightspeed_evaluation.pipeline.evaluation.evaluator import MetricsEvaluator
 from lightspeed_evaluation.pipeline.evaluation.processor import (
     ConversationProcessor,
@@ -755,6 +758,225 @@ class TestConversationProcessorEvaluateTurn:
         turn_data.add_invalid_metric("ragas:faithfulness")
         assert turn_data.is_metric_invalid("ragas:faithfulness")
 
+    def test_evaluate_turn_uses_fused_results_when_enabled(
+        self,
+        processor: ConversationProcessor,
+        mock_metrics_evaluator: MetricsEvaluator,
+    ) -> None:
+        """Fused custom results replace per-metric calls for the metrics they cover."""
+        assert processor.config is not None
+        processor.config.core.fuse_custom_metrics = True
+        turn_data = TurnData(turn_id="1", query="Q", response="R")
+        conv_data = EvaluationData(conversation_group_id="test_conv", turns=[turn_data])
+        fused = EvaluationResult(
+            conversation_group_id="test_conv",
+            turn_id="1",
+            metric_identifier="custom:intent_eval",
+            result="PASS",
+            score=1.0,
+        )
+        mock_metrics_evaluator.evaluate_fused_turn_metrics.return_value = {
+            "custom:intent_eval": fused
+        }
+
+        results = processor._evaluate_turn(
+            conv_data, 0, turn_data, ["ragas:faithfulness", "custom:intent_eval"]
+        )
+
+        assert [r.metric_identifier for r in results] == [
+            "ragas:faithfulness",
+            "custom:intent_eval",
+        ]
+        assert results[1] is fused
+        assert mock_metrics_evaluator.evaluate_metric.call_count == 1
+
+    def test_evaluate_turn_falls_back_when_fusion_fails(
+        self,
+        processor: ConversationProcessor,
+        mock_metrics_evaluator: MetricsEvaluator,
+    ) -> None:
+        """An error in the fused call evaluates every metric on its own."""
+        assert processor.config is not None
+        processor.config.core.fuse_custom_metrics = True
+        turn_data = TurnData(turn_id="1", query="Q", response="R")
+        conv_data = EvaluationData(conversation_group_id="test_conv", turns=[turn_data])
+        mock_metrics_evaluator.evaluate_fused_turn_metrics.side_effect = RuntimeError(
+            "boom"
+        )
+
+        results = processor._evaluate_turn(
+            conv_data, 0, turn_data, ["custom:answer_correctness", "custom:intent_eval"]
+        )
+
+        assert len(results) == 2
+        assert mock_metrics_evaluator.evaluate_metric.call_count == 2
+
+
+class TestMetricGating:
+    """Unit tests for gated_by rules between metrics."""
+
+    @pytest.fixture
+    def gated_processor(
+        self,
+        config_loader: ConfigLoader,
+        processor_components_pr: ProcessorComponents,
+        mock_metrics_evaluator: MetricsEvaluator,
+    ) -> ConversationProcessor:
+        """Processor with a real metric manager; nlp:rouge fails, others pass."""
+        processor_components_pr.metric_manager = MetricManager(
+            config_loader.system_config
+        )
+        processor_components_pr.error_handler = EvaluationErrorHandler()
+
+        def evaluate_metric(request: EvaluationRequest) -> EvaluationResult:
+            return EvaluationResult(
+                conversation_group_id=request.conv_data.conversation_group_id,
+                turn_id=request.turn_id,
+                metric_identifier=request.metric_identifier,
+                result="FAIL" if request.metric_identifier == "nlp:rouge" else "PASS",
+                score=0.1 if request.metric_identifier == "nlp:rouge" else 0.9,
+                threshold=0.5,
+            )
+
+        mock_metrics_evaluator.evaluate_metric.side_effect = evaluate_metric
+        return ConversationProcessor(config_loader, processor_components_pr)
+
+    def test_failed_gate_skips_gated_metric(
+        self,
+        gated_processor: ConversationProcessor,
+        mock_metrics_evaluator: MetricsEvaluator,
+    ) -> None:
+        """A metric whose gate fails is SKIPPED without being evaluated."""
+        turn_data = TurnData(
+            turn_id="1",
+            query="Q",
+            response="R",
+            turn_metrics_metadata={
+                "ragas:faithfulness": {"gated_by": "nlp:rouge"},
+                "custom:answer_correctness": {"gated_by": "nlp:bleu"},
+            },
+        )
+        conv_data = EvaluationData(conversation_group_id="conv", turns=[turn_data])
+
+        results = gated_processor._evaluate_turn(
+            conv_data,
+            0,
+            turn_data,
+            [
+                "ragas:faithfulness",
+                "nlp:rouge",
+                "custom:answer_correctness",
+                "nlp:bleu",
+            ],
+        )
+
+        by_metric = {r.metric_identifier: r for r in results}
+        assert [r.metric_identifier for r in results] == [
+            "nlp:rouge",
+            "nlp:bleu",
+            "ragas:faithfulness",
+            "custom:answer_correctness",
+        ]
+        assert by_metric["ragas:faithfulness"].result == "SKIPPED"
+        assert by_metric["ragas:faithfulness"].reason == (
+            "Gated out: nlp:rouge did not pass (FAIL)"
+        )
+        assert by_metric["custom:answer_correctness"].result == "PASS"
+        evaluated = [
+            call.args[0].metric_identifier
+            for call in mock_metrics_evaluator.evaluate_metric.call_args_list
+        ]
+        assert "ragas:faithfulness" not in evaluated
+
+    def test_gate_not_evaluated_is_ignored(
+        self,
+        gated_processor: ConversationProcessor,
+        mock_metrics_evaluator: MetricsEvaluator,
+    ) -> None:
+        """A gate that is not part of the evaluated metrics does not block."""
+        turn_data = TurnData(
+            turn_id="1",
+            query="Q",
+            response="R",
+            turn_metrics_metadata={"ragas:faithfulness": {"gated_by": "nlp:rouge"}},
+        )
+        conv_data = EvaluationData(conversation_group_id="conv", turns=[turn_data])
+
+        results = gated_processor._evaluate_turn(
+            conv_data, 0, turn_data, ["ragas:faithfulness"]
+        )
+
+        assert [r.result for r in results] == ["PASS"]
+
+    def test_invalid_gate_closes_gated_metric(
+        self,
+        gated_processor: ConversationProcessor,
+        mock_metrics_evaluator: MetricsEvaluator,
+    ) -> None:
+        """A gate that failed validation is an ERROR and gates its dependents."""
+        turn_data = TurnData(
+            turn_id="1",
+            query="Q",
+            response="R",
+            turn_metrics_metadata={"ragas:faithfulness": {"gated_by": "nlp:bleu"}},
+        )
+        turn_data.add_invalid_metric("nlp:bleu")
+        conv_data = EvaluationData(conversation_group_id="conv", turns=[turn_data])
+
+        results = gated_processor._evaluate_turn(
+            conv_data, 0, turn_data, ["ragas:faithfulness", "nlp:bleu"]
+        )
+
+        assert [(r.metric_identifier, r.result) for r in results] == [
+            ("nlp:bleu", "ERROR"),
+            ("ragas:faithfulness", "SKIPPED"),
+        ]
+        assert results[1].reason == "Gated out: nlp:bleu did not pass (ERROR)"
+        mock_metrics_evaluator.evaluate_metric.assert_not_called()
+
+    def test_invalid_gate_closes_gated_conversation_metric(
+        self, gated_processor: ConversationProcessor
+    ) -> None:
+        """An invalid conversation-level gate also skips its dependents."""
+        conv_data = EvaluationData(
+            conversation_group_id="conv",
+            turns=[TurnData(turn_id="1", query="Q", response="R")],
+            conversation_metrics_metadata={
+                "deepeval:conversation_completeness": {"gated_by": "nlp:rouge"}
+            },
+        )
+        conv_data.add_invalid_metric("nlp:rouge")
+
+        results = gated_processor._evaluate_conversation(
+            conv_data, ["deepeval:conversation_completeness", "nlp:rouge"]
+        )
+
+        assert [(r.metric_identifier, r.result) for r in results] == [
+            ("nlp:rouge", "ERROR"),
+            ("deepeval:conversation_completeness", "SKIPPED"),
+        ]
+
+    def test_gated_conversation_metric(
+        self, gated_processor: ConversationProcessor
+    ) -> None:
+        """Gating applies between conversation-level metrics as well."""
+        conv_data = EvaluationData(
+            conversation_group_id="conv",
+            turns=[TurnData(turn_id="1", query="Q", response="R")],
+            conversation_metrics_metadata={
+                "deepeval:conversation_completeness": {"gated_by": "nlp:rouge"}
+            },
+        )
+
+        results = gated_processor._evaluate_conversation(
+            conv_data, ["deepeval:conversation_completeness", "nlp:rouge"]
+        )
+
+        assert [(r.metric_identifier, r.result) for r in results] == [
+            ("nlp:rouge", "FAIL"),
+            ("deepeval:conversation_completeness", "SKIPPED"),
+        ]
+
 
 class TestSkipOnFailure:
     """Unit tests for skip_on_failure feature."""
@@ -935,3 +1157,88 @@ class TestSkipOnFailure:
         else:
             assert [r.result for r in results] == ["PASS", "FAIL", "PASS", "PASS"]
             processor_components.error_handler.mark_cascade_skipped.assert_not_called()
+
+
+class TestBudgetEnforcement:
+    """Unit tests for token and cost budgets in the processor."""
+
+    @pytest.fixture
+    def budget_processor(
+        self,
+        config_loader: ConfigLoader,
+        processor_components_pr: ProcessorComponents,
+        mock_metrics_evaluator: MetricsEvaluator,
+    ) -> ConversationProcessor:
+        """Processor with a 100-token run budget; every judge call uses 60 tokens."""
+        processor_components_pr.metric_manager = MetricManager(
+            config_loader.system_config
+        )
+        processor_components_pr.error_handler = EvaluationErrorHandler()
+        processor_components_pr.budget = BudgetTracker(
+            BudgetConfig(run={"max_tokens": 100}), {"primary": (None, None)}
+        )
+
+        def evaluate_metric(request: EvaluationRequest) -> EvaluationResult:
+            uses_judge = not request.metric_identifier.startswith("nlp:")
+            return EvaluationResult(
+                conversation_group_id=request.conv_data.conversation_group_id,
+                turn_id=request.turn_id,
+                metric_identifier=request.metric_identifier,
+                result="PASS",
+                score=0.9,
+                threshold=0.5,
+                judge_llm_input_tokens=50 if uses_judge else 0,
+                judge_llm_output_tokens=10 if uses_judge else 0,
+            )
+
+        mock_metrics_evaluator.evaluate_metric.side_effect = evaluate_metric
+        return ConversationProcessor(config_loader, processor_components_pr)
+
+    def test_exhausted_budget_skips_judge_metrics(
+        self, budget_processor: ConversationProcessor
+    ) -> None:
+        """Judge metrics are SKIPPED once spent; non-LLM metrics still run."""
+        turn_data = TurnData(turn_id="1", query="Q", response="R")
+        conv_data = EvaluationData(conversation_group_id="conv", turns=[turn_data])
+        metrics = [
+            "ragas:faithfulness",
+            "custom:answer_correctness",
+            "deepeval:answer_relevancy",
+            "nlp:rouge",
+        ]
+
+        results = budget_processor._evaluate_turn(conv_data, 0, turn_data, metrics)
+
+        assert [r.result for r in results] == ["PASS", "PASS", "SKIPPED", "PASS"]
+        assert results[2].reason == ("Budget exhausted: run token budget (100) reached")
+
+    def test_exhausted_budget_skips_agent_calls(
+        self,
+        budget_processor: ConversationProcessor,
+        mock_agent_driver: AgentDriver,
+    ) -> None:
+        """Remaining turns and conversation metrics are SKIPPED without agent calls."""
+        mock_agent_driver.enabled = True
+        conv_data = EvaluationData(
+            conversation_group_id="conv",
+            turns=[
+                TurnData(
+                    turn_id=f"t{i}",
+                    query="Q",
+                    response="R",
+                    turn_metrics=["custom:answer_correctness"],
+                )
+                for i in range(1, 4)
+            ],
+            conversation_metrics=["deepeval:conversation_completeness"],
+        )
+
+        results = budget_processor.process_conversation(conv_data, mock_agent_driver)
+
+        assert [(r.turn_id, r.result) for r in results] == [
+            ("t1", "PASS"),
+            ("t2", "PASS"),
+            ("t3", "SKIPPED"),
+            (None, "SKIPPED"),
+        ]
+        assert mock_agent_driver.execute_turn.call_count == 2
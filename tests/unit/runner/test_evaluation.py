@@ -9,6 +9,7 @@ from typing import Any
 import pytest
 from pytest_mock import MockerFixture
 
+from lightspeed_evaluation.core.models import RunPlan
 from lightspeed_evaluation.core.models.llm import (
     EmbeddingConfig,
     LLMConfig,
@@ -18,15 +19,23 @@ from lightspeed_evaluation.core.models.llm import (
 )
 from lightspeed_evaluation.core.models.system import (
     APIConfig,
+    BatchJudgeConfig,
+    ProfilingConfig,
+    SequentialTestConfig,
     SystemConfig,
+    TracingConfig,
 )
 from lightspeed_evaluation.core.system.exceptions import (
     DataValidationError,
     StorageError,
 )
+from lightspeed_evaluation.core.system.planner import RUN_PLAN_FILENAME
 from lightspeed_evaluation.pipeline.behavioral.models import RunResult, RunSummary
 from lightspeed_evaluation.runner.evaluation import (
     _aggregate_totals,
+    _apply_profile_args,
+    _apply_sequential_args,
+    _cassette_paths,
     _clear_caches,
     _copy_flat_output,
     main,
@@ -85,6 +94,8 @@ def _setup_runner_mocks(
     """
     mock_loader = mocker.Mock()
     mock_config = mocker.Mock()
+    mock_config.profiling = ProfilingConfig()
+    mock_config.tracing = TracingConfig()
     mock_config.llm.provider = "openai"
     mock_config.llm.model = "gpt-4"
     mock_config.agents.default.agent = ["mock_agent"]
@@ -167,6 +178,8 @@ class TestRunEvaluation:
         """Test successful evaluation run."""
         mock_loader = mocker.Mock()
         mock_config = mocker.Mock()
+        mock_config.profiling = ProfilingConfig()
+        mock_config.tracing = TracingConfig()
         mock_config.llm.provider = "openai"
         mock_config.llm.model = "gpt-4"
         mock_config.agents.default.agent = ["mock_agent"]
@@ -210,6 +223,8 @@ class TestRunEvaluation:
         """Offline mode (no agents) does not call the orchestrator."""
         mock_loader = mocker.Mock()
         mock_config = mocker.Mock()
+        mock_config.profiling = ProfilingConfig()
+        mock_config.tracing = TracingConfig()
         mock_config.llm.provider = "openai"
         mock_config.llm.model = "gpt-4"
         mock_config.agents = None
@@ -269,6 +284,8 @@ class TestRunEvaluation:
         """Test evaluation handles ValueError."""
         mock_loader = mocker.Mock()
         mock_config = mocker.Mock()
+        mock_config.profiling = ProfilingConfig()
+        mock_config.tracing = TracingConfig()
         mock_config.llm.provider = "openai"
         mock_config.llm.model = "gpt-4"
         mock_config.agents = None
@@ -336,6 +353,8 @@ class TestRunEvaluation:
         """Test evaluation returns empty result when filter matches nothing."""
         mock_loader = mocker.Mock()
         mock_config = mocker.Mock()
+        mock_config.profiling = ProfilingConfig()
+        mock_config.tracing = TracingConfig()
         mock_config.llm.provider = "openai"
         mock_config.llm.model = "gpt-4"
         mock_config.agents = None
@@ -441,6 +460,8 @@ class TestClearCaches:
         (llm_cache / "test.db").write_text("test")
 
         mock_config = mocker.Mock()
+        mock_config.profiling = ProfilingConfig()
+        mock_config.tracing = TracingConfig()
         mock_config.llm.cache_enabled = True
         mock_config.llm.cache_dir = str(llm_cache)
         mock_config.agents = None
@@ -461,6 +482,8 @@ class TestClearCaches:
     ) -> None:
         """Test clearing caches when none are enabled."""
         mock_config = mocker.Mock()
+        mock_config.profiling = ProfilingConfig()
+        mock_config.tracing = TracingConfig()
         mock_config.llm.cache_enabled = False
         mock_config.agents = None
         mock_config.api.cache_enabled = False
@@ -478,6 +501,8 @@ class TestClearCaches:
         llm_cache = tmp_path / "new_llm_cache"
 
         mock_config = mocker.Mock()
+        mock_config.profiling = ProfilingConfig()
+        mock_config.tracing = TracingConfig()
         mock_config.llm.cache_enabled = True
         mock_config.llm.cache_dir = str(llm_cache)
         mock_config.agents = None
@@ -496,6 +521,8 @@ class TestClearCaches:
     def test_clear_caches_refuses_root_directory(self, mocker: MockerFixture) -> None:
         """Test that clearing root directory raises DataValidationError."""
         mock_config = mocker.Mock()
+        mock_config.profiling = ProfilingConfig()
+        mock_config.tracing = TracingConfig()
         mock_config.llm.cache_enabled = True
         mock_config.llm.cache_dir = "/"  # Dangerous: root directory
         mock_config.api.cache_enabled = False
@@ -517,6 +544,8 @@ class TestClearCaches:
         cwd = os.getcwd()
 
         mock_config = mocker.Mock()
+        mock_config.profiling = ProfilingConfig()
+        mock_config.tracing = TracingConfig()
         mock_config.llm.cache_enabled = True
         mock_config.llm.cache_dir = "."  # Dangerous: current directory
         mock_config.api.cache_enabled = False
@@ -539,6 +568,8 @@ class TestClearCaches:
         cwd = os.getcwd()
 
         mock_config = mocker.Mock()
+        mock_config.profiling = ProfilingConfig()
+        mock_config.tracing = TracingConfig()
         mock_config.llm.cache_enabled = True
         mock_config.llm.cache_dir = cwd  # Dangerous: current directory as absolute path
         mock_config.api.cache_enabled = False
@@ -564,6 +595,8 @@ class TestClearCaches:
         symlink.symlink_to(cwd)
 
         mock_config = mocker.Mock()
+        mock_config.profiling = ProfilingConfig()
+        mock_config.tracing = TracingConfig()
         mock_config.llm.cache_enabled = True
         mock_config.llm.cache_dir = str(symlink)  # Symlink to current directory
         mock_config.api.cache_enabled = False
@@ -587,6 +620,8 @@ class TestClearCaches:
         symlink.symlink_to("/")
 
         mock_config = mocker.Mock()
+        mock_config.profiling = ProfilingConfig()
+        mock_config.tracing = TracingConfig()
         mock_config.llm.cache_enabled = True
         mock_config.llm.cache_dir = str(symlink)  # Symlink to root
         mock_config.api.cache_enabled = False
@@ -612,6 +647,8 @@ class TestClearCaches:
         (api_cache / "test.db").write_text("test")
 
         mock_config = mocker.Mock()
+        mock_config.profiling = ProfilingConfig()
+        mock_config.tracing = TracingConfig()
         mock_config.llm.cache_enabled = False
         mock_config.api.cache_enabled = True  # Cache enabled
         mock_config.api.cache_dir = str(api_cache)
@@ -642,6 +679,8 @@ class TestRunEvaluationCacheWarmup:
         # Mock ConfigLoader
         mock_loader = mocker.Mock()
         mock_config = mocker.Mock()
+        mock_config.profiling = ProfilingConfig()
+        mock_config.tracing = TracingConfig()
         mock_config.llm.provider = "openai"
         mock_config.llm.model = "gpt-4"
         mock_config.llm.cache_enabled = True
@@ -820,6 +859,290 @@ class TestMain:
         assert ev.conv_ids == expected["conv_ids"]
 
 
+class TestProfileArgs:
+    """Tests for the ``--profile`` flag."""
+
+    @pytest.mark.parametrize(
+        "argv, expected",
+        [
+            (["lightspeed-eval"], None),
+            (["lightspeed-eval", "--profile"], []),
+            (
+                ["lightspeed-eval", "--profile", "cprofile", "tracemalloc"],
+                ["cprofile", "tracemalloc"],
+            ),
+        ],
+    )
+    def test_main_profile_flag(
+        self,
+        mocker: MockerFixture,
+        argv: list[str],
+        expected: list[str] | None,
+    ) -> None:
+        """The flag is absent by default and accepts optional extras."""
+        mock_run = _patch_main_cli(mocker, argv)
+        assert main() == 0
+        assert mock_run.call_args[0][0].profile == expected
+
+    def test_apply_profile_args_enables_profiling(self) -> None:
+        """Passing the flag enables profiling and the requested extras."""
+        system_config = SystemConfig()
+
+        _apply_profile_args(system_config, ["cprofile"])
+
+        assert system_config.profiling.enabled is True
+        assert system_config.profiling.cprofile is True
+        assert system_config.profiling.tracemalloc is False
+
+    def test_apply_profile_args_without_flag(self) -> None:
+        """Without the flag the configured settings are kept."""
+        system_config = SystemConfig()
+
+        _apply_profile_args(system_config, None)
+
+        assert system_config.profiling == ProfilingConfig()
+
+
+class TestTraceArgs:
+    """Tests for the ``--trace`` flag."""
+
+    @pytest.mark.parametrize(
+        "argv, expected",
+        [
+            (["lightspeed-eval"], False),
+            (["lightspeed-eval", "--trace"], True),
+        ],
+    )
+    def test_main_trace_flag(
+        self,
+        mocker: MockerFixture,
+        argv: list[str],
+        expected: bool,
+    ) -> None:
+        """The flag is off by default."""
+        mock_run = _patch_main_cli(mocker, argv)
+        assert main() == 0
+        assert mock_run.call_args[0][0].trace is expected
+
+    def test_run_evaluation_trace_enables_tracing(
+        self, tmp_path: Path, mocker: MockerFixture
+    ) -> None:
+        """The flag turns on tracing and writes the trace to the output dir."""
+        mock_config, _, _ = _setup_runner_mocks(mocker)
+        mock_traced_run = mocker.patch(
+            "lightspeed_evaluation.runner.evaluation.traced_run"
+        )
+
+        run_evaluation(_make_eval_args(trace=True, output_dir=str(tmp_path)))
+
+        assert mock_config.tracing.enabled is True
+        mock_traced_run.assert_called_once_with(mock_config.tracing, str(tmp_path))
+
+
+class TestBatchJudgeArgs:
+    """Tests for the ``--batch-judge`` flag."""
+
+    @pytest.mark.parametrize(
+        "argv, expected",
+        [
+            (["lightspeed-eval"], False),
+            (["lightspeed-eval", "--batch-judge"], True),
+        ],
+    )
+    def test_main_batch_judge_flag(
+        self,
+        mocker: MockerFixture,
+        argv: list[str],
+        expected: bool,
+    ) -> None:
+        """The flag is off by default."""
+        mock_run = _patch_main_cli(mocker, argv)
+        assert main() == 0
+        assert mock_run.call_args[0][0].batch_judge is expected
+
+    def test_run_evaluation_batch_judge_enables_batching(
+        self, mocker: MockerFixture
+    ) -> None:
+        """The flag turns on batch judging in the loaded system config."""
+        mock_config, _, mock_orchestrator = _setup_runner_mocks(mocker)
+        mock_config.batch_judge = BatchJudgeConfig()
+
+        run_evaluation(_make_eval_args(batch_judge=True))
+
+        assert mock_config.batch_judge.enabled is True
+        mock_orchestrator.assert_called_once()
+
+
+class TestCassetteArgs:
+    """Tests for the ``--record`` / ``--replay`` flags."""
+
+    @pytest.mark.parametrize(
+        "argv, record, replay",
+        [
+            (["lightspeed-eval"], None, None),
+            (["lightspeed-eval", "--record"], "", None),
+            (["lightspeed-eval", "--record", "run.zip"], "run.zip", None),
+            (["lightspeed-eval", "--replay", "run.zip"], None, "run.zip"),
+        ],
+    )
+    def test_main_cassette_flags(
+        self,
+        mocker: MockerFixture,
+        argv: list[str],
+        record: Any,
+        replay: Any,
+    ) -> None:
+        """Both flags are off by default; ``--record`` takes an optional path."""
+        mock_run = _patch_main_cli(mocker, argv)
+        assert main() == 0
+        args = mock_run.call_args[0][0]
+        assert (args.record, args.replay) == (record, replay)
+
+    def test_record_and_replay_are_exclusive(self, mocker: MockerFixture) -> None:
+        """Recording and replaying in the same run is rejected by the parser."""
+        _patch_main_cli(
+            mocker, ["lightspeed-eval", "--record", "a.zip", "--replay", "b.zip"]
+        )
+        with pytest.raises(SystemExit):
+            main()
+
+    def test_bare_record_writes_to_output_dir(self) -> None:
+        """A bare ``--record`` resolves to a timestamped file in the output dir."""
+        args = argparse.Namespace(record="", replay=None, output_dir="/tmp/out")
+        record, replay = _cassette_paths(args, SystemConfig())
+
+        assert replay is None
+        assert record is not None
+        assert Path(record).parent == Path("/tmp/out")
+        assert Path(record).name.startswith("cassette_")
+
+
+class TestSampleArgs:
+    """Tests for the ``--sample`` / ``--sample-seed`` flags."""
+
+    @pytest.mark.parametrize(
+        "argv, sample, seed",
+        [
+            (["lightspeed-eval"], None, 0),
+            (["lightspeed-eval", "--sample", "40"], 40, 0),
+            (["lightspeed-eval", "--sample", "5%", "--sample-seed", "3"], 0.05, 3),
+        ],
+    )
+    def test_main_sample_flags(
+        self,
+        mocker: MockerFixture,
+        argv: list[str],
+        sample: Any,
+        seed: int,
+    ) -> None:
+        """Sampling is off by default; sizes and percentages are parsed."""
+        mock_run = _patch_main_cli(mocker, argv)
+        assert main() == 0
+        args = mock_run.call_args[0][0]
+        assert args.sample == pytest.approx(sample)
+        assert args.sample_seed == seed
+
+    def test_invalid_sample_is_rejected(self, mocker: MockerFixture) -> None:
+        """Fractions above one are rejected by the parser."""
+        _patch_main_cli(mocker, ["lightspeed-eval", "--sample", "1.5"])
+        with pytest.raises(SystemExit):
+            main()
+
+
+class TestSequentialArgs:
+    """Tests for the ``--sequential`` / ``--max-drop`` flags."""
+
+    def test_main_sequential_flags(self, mocker: MockerFixture) -> None:
+        """The baseline is parsed as a pass rate in percent."""
+        mock_run = _patch_main_cli(
+            mocker, ["lightspeed-eval", "--sequential", "92.5", "--max-drop", "3"]
+        )
+        assert main() == 0
+        args = mock_run.call_args[0][0]
+        assert (args.sequential, args.max_drop) == (92.5, 3.0)
+
+    def test_apply_sequential_args_enables_test(self) -> None:
+        """The flag enables the test and keeps the configured error rates."""
+        system_config = SystemConfig(
+            sequential_test=SequentialTestConfig(alpha=0.01, max_drop=2)
+        )
+
+        _apply_sequential_args(system_config, 90.0, None)
+
+        config = system_config.sequential_test
+        assert config.enabled is True
+        assert config.baseline_pass_rate == 90.0
+        assert (config.alpha, config.max_drop) == (0.01, 2)
+
+    def test_apply_sequential_args_validates(self) -> None:
+        """A drop larger than the baseline is rejected."""
+        with pytest.raises(ValueError, match="must be smaller than"):
+            _apply_sequential_args(SystemConfig(), 3.0, 5.0)
+
+    def test_apply_sequential_args_without_flag(self) -> None:
+        """Without the flag the configured settings are kept."""
+        system_config = SystemConfig()
+
+        _apply_sequential_args(system_config, None, 3.0)
+
+        assert system_config.sequential_test == SequentialTestConfig()
+
+
+class TestPlanArgs:
+    """Tests for the ``--plan`` flag."""
+
+    @pytest.mark.parametrize(
+        "argv, expected",
+        [
+            (["lightspeed-eval"], False),
+            (["lightspeed-eval", "--plan"], True),
+        ],
+    )
+    def test_main_plan_flag(
+        self,
+        mocker: MockerFixture,
+        argv: list[str],
+        expected: bool,
+    ) -> None:
+        """The flag is off by default."""
+        mock_run = _patch_main_cli(mocker, argv)
+        assert main() == 0
+        assert mock_run.call_args[0][0].plan is expected
+
+    def test_plan_runs_nothing(
+        self, tmp_path: Path, mocker: MockerFixture, capsys: pytest.CaptureFixture
+    ) -> None:
+        """A planned run prints and records the plan without evaluating."""
+        _, mock_validator, mock_orchestrator = _setup_runner_mocks(mocker)
+        plan = RunPlan(
+            conversations=1,
+            turns=1,
+            evaluations=1,
+            workers=1,
+            agent_latency=1.0,
+            judge_latency=1.0,
+            latency_source="default",
+            estimated_duration=2.0,
+        )
+        mock_plan_run = mocker.patch(
+            "lightspeed_evaluation.core.system.planner.plan_run", return_value=plan
+        )
+
+        result = run_evaluation(
+            _make_eval_args(plan=True, output_dir=str(tmp_path), cache_warmup=True)
+        )
+
+        assert result == {"TOTAL": 0, "PASS": 0, "FAIL": 0, "ERROR": 0, "SKIPPED": 0}
+        assert mock_plan_run.call_args[0][0] == (
+            mock_validator.return_value.load_evaluation_data.return_value
+        )
+        mock_orchestrator.assert_not_called()
+        assert (tmp_path / RUN_PLAN_FILENAME).exists()
+        captured = capsys.readouterr()
+        assert "Run plan (dry run" in captured.out
+        assert "Cache warmup mode" not in captured.out
+
+
 class TestAggregateTotals:
     """Tests for _aggregate_totals helper."""
 
@@ -1,5 +1,8 @@
 """Unit tests for the programmatic API module."""
 
+import json
+from pathlib import Path
+
 import pytest
 from pytest_mock import MockerFixture
 
@@ -255,6 +258,96 @@ class TestEvaluateWithSummary:
         assert summary.overall.passed == 1
         assert len(summary.results) == 1
 
+    def test_profile_adds_timing_breakdown(
+        self, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        """Profiled runs attach a timing breakdown and write a trace file."""
+        mocker.patch("lightspeed_evaluation.api.ConfigLoader")
+        mock_pipeline = mocker.Mock()
+        mock_pipeline.run_evaluation.return_value = []
+        mocker.patch(
+            "lightspeed_evaluation.api.EvaluationPipeline",
+            return_value=mock_pipeline,
+        )
+        data = [
+            EvaluationData(
+                conversation_group_id="c1",
+                turns=[TurnData(turn_id="t1", query="hello")],
+            )
+        ]
+
+        summary = evaluate_with_summary(
+            SystemConfig(), data, output_dir=str(tmp_path), profile=True
+        )
+
+        assert summary.timing_breakdown is not None
+        assert list(tmp_path.glob("profile_*_trace.json"))
+
+    def test_trace_writes_otlp_file(
+        self, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        """Traced runs write the pipeline's own spans as an OTLP-JSON file."""
+        mocker.patch("lightspeed_evaluation.api.ConfigLoader")
+        mock_pipeline = mocker.Mock()
+        mock_pipeline.run_evaluation.return_value = []
+        mocker.patch(
+            "lightspeed_evaluation.api.EvaluationPipeline",
+            return_value=mock_pipeline,
+        )
+        data = [
+            EvaluationData(
+                conversation_group_id="c1",
+                turns=[TurnData(turn_id="t1", query="hello")],
+            )
+        ]
+
+        evaluate_with_summary(
+            SystemConfig(), data, output_dir=str(tmp_path), trace=True
+        )
+
+        assert list(tmp_path.glob("trace_*_otlp.json"))
+
+    def test_sample_evaluates_subset_and_extrapolates(
+        self, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        """Only the sample is evaluated; the estimate is attached and written."""
+        mocker.patch("lightspeed_evaluation.api.ConfigLoader")
+        mock_pipeline = mocker.Mock()
+        mock_pipeline.run_evaluation.side_effect = lambda data, **_: [
+            EvaluationResult(
+                conversation_group_id=conv.conversation_group_id,
+                metric_identifier="m:1",
+                result="PASS",
+                score=0.9,
+                threshold=0.7,
+            )
+            for conv in data
+        ]
+        mocker.patch(
+            "lightspeed_evaluation.api.EvaluationPipeline",
+            return_value=mock_pipeline,
+        )
+        data = [
+            EvaluationData(
+                conversation_group_id=f"c{i}",
+                turns=[TurnData(turn_id="t1", query="hello")],
+            )
+            for i in range(10)
+        ]
+
+        summary = evaluate_with_summary(
+            SystemConfig(), data, output_dir=str(tmp_path), sample=3, sample_seed=5
+        )
+
+        evaluated = mock_pipeline.run_evaluation.call_args[0][0]
+        assert len(evaluated) == 3
+        assert summary.sampling is not None
+        assert summary.sampling.plan.population == 10
+        assert summary.sampling.overall is not None
+        assert summary.sampling.overall.pass_rate == pytest.approx(100.0)
+        report = json.loads((tmp_path / "sampling_report.json").read_text())
+        assert report["plan"]["seed"] == 5
+
     def test_empty_data_returns_empty_summary(self) -> None:
         """Test that empty data returns a summary with zero results."""
         config = SystemConfig()
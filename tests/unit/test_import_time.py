@@ -0,0 +1,53 @@
+"""Import-time regression tests for the evaluation package."""
+
+import json
+import subprocess
+import sys
+from typing import Any
+
+# Generous ceiling for the imports in a fresh interpreter; importing litellm
+# and the metric frameworks eagerly used to take many seconds on its own.
+IMPORT_TIME_BUDGET_SECONDS = 5.0
+
+HEAVY_MODULES = ("litellm", "ragas", "deepeval")
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+%s
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "elapsed": elapsed,
+    "loaded": [name for name in %r if name in sys.modules],
+}))
+"""
+
+
+def _probe_imports(imports: str) -> dict[str, Any]:
+    """Run imports in a fresh interpreter; report their duration and heavy loads."""
+    completed = subprocess.run(
+        [sys.executable, "-c", _PROBE % (imports, HEAVY_MODULES)],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def test_package_import_defers_heavy_modules() -> None:
+    """Importing the package loads neither litellm nor the metric frameworks."""
+    result = _probe_imports("import lightspeed_evaluation")
+
+    assert not result["loaded"]
+    assert result["elapsed"] < IMPORT_TIME_BUDGET_SECONDS
+
+
+def test_pipeline_import_defers_heavy_modules() -> None:
+    """litellm, ragas and deepeval are only imported by metric handlers."""
+    result = _probe_imports(
+        "import lightspeed_evaluation.api\n"
+        "import lightspeed_evaluation.pipeline.evaluation.pipeline"
+    )
+
+    assert not result["loaded"]
+    assert result["elapsed"] < IMPORT_TIME_BUDGET_SECONDS